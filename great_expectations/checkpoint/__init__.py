@@ -14,6 +14,7 @@ from .actions import (
     ValidationAction,
 )
 from .checkpoint import Checkpoint, LegacyCheckpoint, SimpleCheckpoint
+from .checkpoint_scheduler import CheckpointScheduler
 from .configurator import SimpleCheckpointConfigurator
 
 for module_name, package_name in [
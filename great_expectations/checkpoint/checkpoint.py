@@ -4,7 +4,19 @@ import copy
 import datetime
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 import great_expectations.exceptions as ge_exceptions
@@ -55,6 +67,7 @@ from great_expectations.validation_operators.types.validation_operator_result im
 from great_expectations.validator.validator import Validator
 
 if TYPE_CHECKING:
+    from great_expectations.core.expectation_suite import ExpectationSuite
     from great_expectations.data_context import AbstractDataContext, DataContext
 
 logger = logging.getLogger(__name__)
@@ -109,6 +122,92 @@ class BaseCheckpoint(ConfigPeer):
         result_format: Optional[Union[str, dict]] = None,
         expectation_suite_ge_cloud_id: Optional[str] = None,
     ) -> CheckpointResult:
+        (
+            substituted_runtime_config,
+            validations,
+            run_id,
+            result_format,
+        ) = self._prepare_run(
+            template_name=template_name,
+            run_name_template=run_name_template,
+            expectation_suite_name=expectation_suite_name,
+            batch_request=batch_request,
+            action_list=action_list,
+            evaluation_parameters=evaluation_parameters,
+            runtime_configuration=runtime_configuration,
+            validations=validations,
+            profilers=profilers,
+            run_id=run_id,
+            run_name=run_name,
+            run_time=run_time,
+            result_format=result_format,
+            expectation_suite_ge_cloud_id=expectation_suite_ge_cloud_id,
+        )
+
+        # Validations, which are CPU bound (e.g., of pandas Batches), are run in parallel in pool of worker processes,
+        # if concurrency mode "process" is enabled in the data context configuration.
+        process_pool: Optional[ProcessPoolExecutor] = None
+        if len(validations) > 1:
+            from great_expectations.checkpoint.validation_process_pool import (
+                get_validation_process_pool,
+            )
+
+            process_pool = get_validation_process_pool(data_context=self.data_context)
+
+        # Use AsyncExecutor to speed up I/O bound validations by running them in parallel with multithreading (if
+        # concurrency is enabled in the data context configuration) -- please see the below arguments used to initialize
+        # AsyncExecutor and the corresponding AsyncExecutor docstring for more details on when multiple threads are
+        # used.
+        with AsyncExecutor(
+            self.data_context.concurrency, max_workers=len(validations)
+        ) as async_executor:
+            # noinspection PyUnresolvedReferences
+            async_validation_operator_results: List[
+                AsyncResult[ValidationOperatorResult]
+            ] = []
+            for idx, validation_dict in enumerate(validations):
+                self._run_validation(
+                    substituted_runtime_config=substituted_runtime_config,
+                    async_validation_operator_results=async_validation_operator_results,
+                    async_executor=async_executor,
+                    result_format=result_format,
+                    run_id=run_id,
+                    idx=idx,
+                    validation_dict=validation_dict,
+                    process_pool=process_pool,
+                )
+
+            return self._get_checkpoint_result(
+                run_id=run_id,
+                run_results_list=[
+                    async_validation_operator_result.result().run_results
+                    for async_validation_operator_result in async_validation_operator_results
+                ],
+            )
+
+    def _prepare_run(
+        self,
+        template_name: Optional[str] = None,
+        run_name_template: Optional[str] = None,
+        expectation_suite_name: Optional[str] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        action_list: Optional[List[dict]] = None,
+        evaluation_parameters: Optional[dict] = None,
+        runtime_configuration: Optional[dict] = None,
+        validations: Optional[List[dict]] = None,
+        profilers: Optional[List[dict]] = None,
+        run_id: Optional[Union[str, RunIdentifier]] = None,
+        run_name: Optional[str] = None,
+        run_time: Optional[Union[str, datetime.datetime]] = None,
+        result_format: Optional[Union[str, dict]] = None,
+        expectation_suite_ge_cloud_id: Optional[str] = None,
+    ) -> Tuple[dict, List[Optional[dict]], RunIdentifier, Optional[Union[str, dict]]]:
+        """Substitutes runtime arguments of "run()" into configuration of Checkpoint.
+
+        Returns:
+            Substituted configuration, validation dictionaries to run (single None, if default validation, given by
+            substituted configuration, is to be run), run_id, and result_format.
+        """
         assert not (run_id and run_name) and not (
             run_id and run_time
         ), "Please provide either a run_id or run_name and/or run_time."
@@ -168,54 +267,30 @@ class BaseCheckpoint(ConfigPeer):
             for validation in validations:
                 validation["id"] = self.config.default_validation_id
 
-        # Use AsyncExecutor to speed up I/O bound validations by running them in parallel with multithreading (if
-        # concurrency is enabled in the data context configuration) -- please see the below arguments used to initialize
-        # AsyncExecutor and the corresponding AsyncExecutor docstring for more details on when multiple threads are
-        # used.
-        with AsyncExecutor(
-            self.data_context.concurrency, max_workers=len(validations)
-        ) as async_executor:
-            # noinspection PyUnresolvedReferences
-            async_validation_operator_results: List[
-                AsyncResult[ValidationOperatorResult]
-            ] = []
-            if len(validations) > 0:
-                for idx, validation_dict in enumerate(validations):
-                    self._run_validation(
-                        substituted_runtime_config=substituted_runtime_config,
-                        async_validation_operator_results=async_validation_operator_results,
-                        async_executor=async_executor,
-                        result_format=result_format,
-                        run_id=run_id,
-                        idx=idx,
-                        validation_dict=validation_dict,
-                    )
-            else:
-                self._run_validation(
-                    substituted_runtime_config=substituted_runtime_config,
-                    async_validation_operator_results=async_validation_operator_results,
-                    async_executor=async_executor,
-                    result_format=result_format,
-                    run_id=run_id,
-                )
-
-            checkpoint_run_results: dict = {}
-            async_validation_operator_result: AsyncResult
-            for async_validation_operator_result in async_validation_operator_results:
-                async_result = async_validation_operator_result.result()
-                run_results = async_result.run_results
-
-                run_result: dict
-                validation_result: Optional[ExpectationSuiteValidationResult]
-                meta: ExpectationSuiteValidationResultMeta
-                for run_result in run_results.values():
-                    validation_result = run_result.get("validation_result")
-                    if validation_result:
-                        meta = validation_result.meta
-                        id = str(self.ge_cloud_id) if self.ge_cloud_id else None
-                        meta["checkpoint_id"] = id
+        return (
+            substituted_runtime_config,
+            validations or [None],
+            run_id,
+            result_format,
+        )
 
-                checkpoint_run_results.update(run_results)
+    def _get_checkpoint_result(
+        self, run_id: RunIdentifier, run_results_list: List[dict]
+    ) -> CheckpointResult:
+        checkpoint_run_results: dict = {}
+        run_results: dict
+        for run_results in run_results_list:
+            run_result: dict
+            validation_result: Optional[ExpectationSuiteValidationResult]
+            meta: ExpectationSuiteValidationResultMeta
+            for run_result in run_results.values():
+                validation_result = run_result.get("validation_result")
+                if validation_result:
+                    meta = validation_result.meta
+                    id = str(self.ge_cloud_id) if self.ge_cloud_id else None
+                    meta["checkpoint_id"] = id
+
+            checkpoint_run_results.update(run_results)
 
         return CheckpointResult(
             run_id=run_id,
@@ -307,27 +382,104 @@ class BaseCheckpoint(ConfigPeer):
         run_id: Optional[Union[str, RunIdentifier]],
         idx: Optional[int] = 0,
         validation_dict: Optional[dict] = None,
+        process_pool: Optional[ProcessPoolExecutor] = None,
     ) -> None:
-        if validation_dict is None:
-            validation_dict = {}
-            validation_dict["id"] = substituted_runtime_config.get(
-                "default_validation_id"
+        substituted_validation_dict: dict = self._get_substituted_validation_dict(
+            substituted_runtime_config=substituted_runtime_config,
+            validation_dict=validation_dict,
+            idx=idx,
+        )
+        run_in_calling_thread: bool = False
+        if process_pool is not None and not batch_request_contains_batch_data(
+            batch_request=substituted_validation_dict.get("batch_request")
+        ):
+            async_validation_operator_result: Optional[
+                AsyncResult[ValidationOperatorResult]
+            ] = self._submit_validation_to_process_pool(
+                substituted_validation_dict=substituted_validation_dict,
+                process_pool=process_pool,
+                result_format=result_format,
+                run_id=run_id,
+                idx=idx,
             )
+            if async_validation_operator_result is not None:
+                async_validation_operator_results.append(
+                    async_validation_operator_result
+                )
+                return
 
-        try:
-            substituted_validation_dict: dict = get_substituted_validation_dict(
-                substituted_runtime_config=substituted_runtime_config,
-                validation_dict=validation_dict,
+            # Validations, which cannot run in worker processes (e.g., because they store or use evaluation parameters
+            # in memory), run one at a time, in order, in calling thread.
+            run_in_calling_thread = True
+
+        with self._validation_errors_as_checkpoint_errors(idx=idx):
+            validator: Validator = self._get_validator_for_validation(
+                substituted_validation_dict=substituted_validation_dict
+            )
+            action_list_validation_operator: ActionListValidationOperator
+            operator_run_kwargs: dict
+            (
+                action_list_validation_operator,
+                operator_run_kwargs,
+            ) = self._get_validation_operator_and_run_kwargs(
+                substituted_validation_dict=substituted_validation_dict,
+                result_format=result_format,
+                run_id=run_id,
+                idx=idx,
             )
-            batch_request: Union[
-                BatchRequest, RuntimeBatchRequest
-            ] = substituted_validation_dict.get("batch_request")
+            if run_in_calling_thread:
+                async_validation_operator_result = AsyncResult(
+                    value=action_list_validation_operator.run(
+                        assets_to_validate=[validator],
+                        **operator_run_kwargs,
+                    )
+                )
+            else:
+                async_validation_operator_result = async_executor.submit(
+                    action_list_validation_operator.run,
+                    assets_to_validate=[validator],
+                    **operator_run_kwargs,
+                )
+            async_validation_operator_results.append(async_validation_operator_result)
+
+    def _submit_validation_to_process_pool(
+        self,
+        substituted_validation_dict: dict,
+        process_pool: ProcessPoolExecutor,
+        result_format: Optional[dict],
+        run_id: Optional[Union[str, RunIdentifier]],
+        idx: Optional[int] = 0,
+    ) -> Optional[AsyncResult[ValidationOperatorResult]]:
+        """Submits validation (given by substituted validation dictionary) to pool of worker processes, which load its
+        Batch, validate it, and run its actions; only Batch request and Expectation Suite are sent to worker process.
+
+        Returns None (without submitting validation), if validation cannot run in worker process (e.g., if it stores or
+        uses evaluation parameters, which are kept in-memory by calling process); it is then run in calling thread.
+        """
+        from great_expectations.checkpoint.validation_process_pool import (
+            can_run_validation_in_worker,
+            run_validation_in_worker,
+        )
+
+        with self._validation_errors_as_checkpoint_errors(idx=idx):
             expectation_suite_name: str = substituted_validation_dict.get(
                 "expectation_suite_name"
             )
-            expectation_suite_ge_cloud_id: str = substituted_validation_dict.get(
-                "expectation_suite_ge_cloud_id"
+            expectation_suite: ExpectationSuite = (
+                self.data_context.get_expectation_suite(
+                    expectation_suite_name=expectation_suite_name
+                )
             )
+            if not can_run_validation_in_worker(
+                data_context=self.data_context,
+                expectation_suite=expectation_suite,
+                action_list=substituted_validation_dict.get("action_list"),
+            ):
+                logger.warning(
+                    f'Validation of Expectation Suite "{expectation_suite_name}" uses in-memory evaluation parameter store; running it in calling process instead of worker process.'
+                )
+                return None
+
             include_rendered_content: Optional[bool] = substituted_validation_dict.get(
                 "include_rendered_content"
             )
@@ -336,70 +488,53 @@ class BaseCheckpoint(ConfigPeer):
                     self._data_context._determine_if_expectation_validation_result_include_rendered_content()
                 )
 
-            validator: Validator = self.data_context.get_validator(
-                batch_request=batch_request,
-                expectation_suite_name=(
-                    expectation_suite_name if not self.data_context.cloud_mode else None
-                ),
-                expectation_suite_ge_cloud_id=(
-                    expectation_suite_ge_cloud_id
-                    if self.data_context.cloud_mode
-                    else None
-                ),
-                include_rendered_content=include_rendered_content,
-            )
-
-            action_list: list = substituted_validation_dict.get("action_list")
-            runtime_configuration_validation = substituted_validation_dict.get(
-                "runtime_configuration", {}
-            )
-            catch_exceptions_validation = runtime_configuration_validation.get(
-                "catch_exceptions"
-            )
-            result_format_validation = runtime_configuration_validation.get(
-                "result_format"
+            action_list_validation_operator: ActionListValidationOperator
+            operator_run_kwargs: dict
+            (
+                action_list_validation_operator,
+                operator_run_kwargs,
+            ) = self._get_validation_operator_and_run_kwargs(
+                substituted_validation_dict=substituted_validation_dict,
+                result_format=result_format,
+                run_id=run_id,
+                idx=idx,
             )
-            result_format = result_format or result_format_validation
-
-            if result_format is None:
-                result_format = {"result_format": "SUMMARY"}
-
-            action_list_validation_operator: ActionListValidationOperator = (
-                ActionListValidationOperator(
-                    data_context=self.data_context,
-                    action_list=action_list,
-                    result_format=result_format,
-                    name=f"{self.name}-checkpoint-validation[{idx}]",
+            return AsyncResult(
+                future=process_pool.submit(
+                    run_validation_in_worker,
+                    batch_request=substituted_validation_dict.get("batch_request"),
+                    expectation_suite_dict=expectation_suite.to_json_dict(),
+                    include_rendered_content=include_rendered_content,
+                    action_list=substituted_validation_dict.get("action_list"),
+                    validation_operator_name=action_list_validation_operator.name,
+                    operator_run_kwargs=operator_run_kwargs,
                 )
             )
-            checkpoint_identifier = None
-            if self.data_context.cloud_mode:
-                checkpoint_identifier = GXCloudIdentifier(
-                    resource_type=GXCloudRESTResource.CHECKPOINT,
-                    cloud_id=str(self.ge_cloud_id),
-                )
-
-            operator_run_kwargs = {}
 
-            if catch_exceptions_validation is not None:
-                operator_run_kwargs["catch_exceptions"] = catch_exceptions_validation
-
-            validation_id: Optional[str] = substituted_validation_dict.get("id")
+    def _get_substituted_validation_dict(
+        self,
+        substituted_runtime_config: dict,
+        validation_dict: Optional[dict],
+        idx: Optional[int] = 0,
+    ) -> dict:
+        if validation_dict is None:
+            validation_dict = {}
+            validation_dict["id"] = substituted_runtime_config.get(
+                "default_validation_id"
+            )
 
-            async_validation_operator_result = async_executor.submit(
-                action_list_validation_operator.run,
-                assets_to_validate=[validator],
-                run_id=run_id,
-                evaluation_parameters=substituted_validation_dict.get(
-                    "evaluation_parameters"
-                ),
-                result_format=result_format,
-                checkpoint_identifier=checkpoint_identifier,
-                checkpoint_name=self.name,
-                validation_id=validation_id,
-                **operator_run_kwargs,
+        with self._validation_errors_as_checkpoint_errors(idx=idx):
+            return get_substituted_validation_dict(
+                substituted_runtime_config=substituted_runtime_config,
+                validation_dict=validation_dict,
             )
-            async_validation_operator_results.append(async_validation_operator_result)
+
+    @contextmanager
+    def _validation_errors_as_checkpoint_errors(
+        self, idx: Optional[int]
+    ) -> Iterator[None]:
+        try:
+            yield
         except (
             ge_exceptions.CheckpointError,
             ge_exceptions.ExecutionEngineError,
@@ -409,6 +544,91 @@ class BaseCheckpoint(ConfigPeer):
                 f"Exception occurred while running validation[{idx}] of Checkpoint '{self.name}': {e.message}."
             ) from e
 
+    def _get_validator_for_validation(
+        self, substituted_validation_dict: dict
+    ) -> Validator:
+        """Loads Batch of validation (given by substituted validation dictionary) into Validator."""
+        batch_request: Union[
+            BatchRequest, RuntimeBatchRequest
+        ] = substituted_validation_dict.get("batch_request")
+        expectation_suite_name: str = substituted_validation_dict.get(
+            "expectation_suite_name"
+        )
+        expectation_suite_ge_cloud_id: str = substituted_validation_dict.get(
+            "expectation_suite_ge_cloud_id"
+        )
+        include_rendered_content: Optional[bool] = substituted_validation_dict.get(
+            "include_rendered_content"
+        )
+        if include_rendered_content is None:
+            include_rendered_content = (
+                self._data_context._determine_if_expectation_validation_result_include_rendered_content()
+            )
+
+        return self.data_context.get_validator(
+            batch_request=batch_request,
+            expectation_suite_name=(
+                expectation_suite_name if not self.data_context.cloud_mode else None
+            ),
+            expectation_suite_ge_cloud_id=(
+                expectation_suite_ge_cloud_id if self.data_context.cloud_mode else None
+            ),
+            include_rendered_content=include_rendered_content,
+        )
+
+    def _get_validation_operator_and_run_kwargs(
+        self,
+        substituted_validation_dict: dict,
+        result_format: Optional[dict],
+        run_id: Optional[Union[str, RunIdentifier]],
+        idx: Optional[int] = 0,
+    ) -> Tuple[ActionListValidationOperator, dict]:
+        """Returns ActionListValidationOperator, which runs actions of validation (given by substituted validation
+        dictionary), and keyword arguments of its "run()" method (other than "assets_to_validate")."""
+        action_list: list = substituted_validation_dict.get("action_list")
+        runtime_configuration_validation = substituted_validation_dict.get(
+            "runtime_configuration", {}
+        )
+        catch_exceptions_validation = runtime_configuration_validation.get(
+            "catch_exceptions"
+        )
+        result_format_validation = runtime_configuration_validation.get("result_format")
+        result_format = result_format or result_format_validation
+
+        if result_format is None:
+            result_format = {"result_format": "SUMMARY"}
+
+        action_list_validation_operator: ActionListValidationOperator = (
+            ActionListValidationOperator(
+                data_context=self.data_context,
+                action_list=action_list,
+                result_format=result_format,
+                name=f"{self.name}-checkpoint-validation[{idx}]",
+            )
+        )
+        checkpoint_identifier = None
+        if self.data_context.cloud_mode:
+            checkpoint_identifier = GXCloudIdentifier(
+                resource_type=GXCloudRESTResource.CHECKPOINT,
+                cloud_id=str(self.ge_cloud_id),
+            )
+
+        operator_run_kwargs = {
+            "run_id": run_id,
+            "evaluation_parameters": substituted_validation_dict.get(
+                "evaluation_parameters"
+            ),
+            "result_format": result_format,
+            "checkpoint_identifier": checkpoint_identifier,
+            "checkpoint_name": self.name,
+            "validation_id": substituted_validation_dict.get("id"),
+        }
+
+        if catch_exceptions_validation is not None:
+            operator_run_kwargs["catch_exceptions"] = catch_exceptions_validation
+
+        return action_list_validation_operator, operator_run_kwargs
+
     def self_check(self, pretty_print=True) -> dict:
         # Provide visibility into parameters that Checkpoint was instantiated with.
         report_object: dict = {"config": self.config.to_json_dict()}
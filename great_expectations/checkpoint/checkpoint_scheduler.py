@@ -0,0 +1,348 @@
+"""
+Scheduler, which runs validations of multiple Checkpoints as pipeline of stages.
+
+WARNING: This module is experimental.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.checkpoint.actions import StoreEvaluationParametersAction
+from great_expectations.checkpoint.checkpoint import BaseCheckpoint, LegacyCheckpoint
+from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core.batch import BatchRequestBase
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
+from great_expectations.core.run_identifier import RunIdentifier
+from great_expectations.validation_operators import ActionListValidationOperator
+from great_expectations.validator.validator import Validator
+
+if TYPE_CHECKING:
+    from great_expectations.data_context import AbstractDataContext
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS: int = 8
+
+DEFAULT_MAX_ACTION_WORKERS: int = 1
+
+
+@dataclass(frozen=True, eq=False)
+class _ScheduledValidation:
+    checkpoint: BaseCheckpoint
+    substituted_validation_dict: dict
+    result_format: Optional[Union[str, dict]]
+    run_id: RunIdentifier
+    idx: int
+
+
+class CheckpointScheduler:
+    """Runs validations of one or more Checkpoints as pipeline of three stages:
+        1. loading of Batch of validation into Validator;
+        2. validation of Batch (resolution of metrics);
+        3. actions (storing of validation result, updating of Data Docs, notifications, etc.).
+
+    Validations of different Datasources are loaded and validated concurrently, by up to "max_workers" threads.
+    Validations of same Datasource share its ExecutionEngine (and Batches loaded into it), and are loaded and validated
+    one at a time, in order of submission (Validator validates Batch, which is active in ExecutionEngine; hence, Batch of
+    one validation must not be loaded, while another validation of same Datasource is being validated).
+
+    Actions of each validation run, in order of configuration, as soon as its validation result is ready, by up to
+    "max_action_workers" threads -- so that I/O of actions does not hold up loading and validation of next Batch.
+    Actions of different validations run concurrently, only if "max_action_workers" is greater than 1; actions, which
+    update shared state (e.g., "UpdateDataDocsAction", which rebuilds index of Data Docs site), may then interleave.
+
+    Evaluation parameters are ordered explicitly: "StoreEvaluationParametersAction" actions of each validation run
+    synchronously, in validation stage (before next validation of same Datasource is loaded), and validations, whose
+    Expectation Suites depend on stored evaluation parameters (of other validations), run one at a time, in order of
+    submission, only after all other validations have been validated.  Hence, evaluation parameters, stored by
+    validation, are visible to every dependent validation, submitted after it (as with sequential "Checkpoint.run()").
+
+    WARNING: This class is experimental.
+    """
+
+    def __init__(
+        self,
+        data_context: AbstractDataContext,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_action_workers: int = DEFAULT_MAX_ACTION_WORKERS,
+    ) -> None:
+        """
+        Args:
+            data_context: DataContext, whose Checkpoints and Datasources are used.
+            max_workers: Maximum number of Datasources, whose validations are loaded and validated concurrently.
+            max_action_workers: Maximum number of validations, whose actions run concurrently.
+        """
+        if max_workers < 1 or max_action_workers < 1:
+            raise ValueError(
+                'Values of "max_workers" and "max_action_workers" for CheckpointScheduler must be positive integers.'
+            )
+
+        self._data_context = data_context
+        self._max_workers = max_workers
+        self._max_action_workers = max_action_workers
+
+    def run(
+        self, checkpoints: List[Union[str, BaseCheckpoint]], **run_kwargs
+    ) -> List[CheckpointResult]:
+        """Runs all validations of given Checkpoints.
+
+        Args:
+            checkpoints: Checkpoints (or names of Checkpoints of DataContext) to run.
+            run_kwargs: Keyword arguments of "Checkpoint.run()", applied to every Checkpoint.
+
+        Returns:
+            CheckpointResult of every Checkpoint (in order of "checkpoints").
+        """
+        scheduled_validations_by_checkpoint: List[List[_ScheduledValidation]] = [
+            self._schedule_validations(
+                checkpoint=self._get_checkpoint(checkpoint=checkpoint),
+                run_kwargs=run_kwargs,
+            )
+            for checkpoint in checkpoints
+        ]
+
+        scheduled_validations_by_datasource_name: Dict[
+            str, List[_ScheduledValidation]
+        ] = OrderedDict()
+        dependent_scheduled_validations: List[_ScheduledValidation] = []
+        scheduled_validations: List[_ScheduledValidation]
+        scheduled_validation: _ScheduledValidation
+        for scheduled_validations in scheduled_validations_by_checkpoint:
+            for scheduled_validation in scheduled_validations:
+                if self._depends_on_evaluation_parameters(
+                    scheduled_validation=scheduled_validation
+                ):
+                    dependent_scheduled_validations.append(scheduled_validation)
+                    continue
+
+                scheduled_validations_by_datasource_name.setdefault(
+                    self._get_datasource_name(
+                        scheduled_validation=scheduled_validation
+                    ),
+                    [],
+                ).append(scheduled_validation)
+
+        action_futures: Dict[_ScheduledValidation, Future] = {}
+        with ThreadPoolExecutor(
+            max_workers=self._max_action_workers
+        ) as action_executor:
+            with ThreadPoolExecutor(
+                max_workers=min(
+                    self._max_workers,
+                    max(len(scheduled_validations_by_datasource_name), 1),
+                )
+            ) as executor:
+                datasource_futures: List[Future] = [
+                    executor.submit(
+                        self._load_and_validate,
+                        scheduled_validations=scheduled_validations,
+                        action_executor=action_executor,
+                    )
+                    for scheduled_validations in scheduled_validations_by_datasource_name.values()
+                ]
+                datasource_future: Future
+                for datasource_future in datasource_futures:
+                    action_futures.update(datasource_future.result())
+
+            # Evaluation parameters of all other validations are stored by now.
+            action_futures.update(
+                self._load_and_validate(
+                    scheduled_validations=dependent_scheduled_validations,
+                    action_executor=action_executor,
+                )
+            )
+
+            checkpoint_results: List[CheckpointResult] = []
+            for scheduled_validations in scheduled_validations_by_checkpoint:
+                run_results_list: List[dict] = []
+                for scheduled_validation in scheduled_validations:
+                    validation_result_id, run_result_obj = action_futures[
+                        scheduled_validation
+                    ].result()
+                    run_results_list.append({validation_result_id: run_result_obj})
+
+                checkpoint_results.append(
+                    scheduled_validations[0].checkpoint._get_checkpoint_result(
+                        run_id=scheduled_validations[0].run_id,
+                        run_results_list=run_results_list,
+                    )
+                )
+
+        return checkpoint_results
+
+    def _get_checkpoint(self, checkpoint: Union[str, BaseCheckpoint]) -> BaseCheckpoint:
+        if isinstance(checkpoint, str):
+            checkpoint = self._data_context.get_checkpoint(name=checkpoint)
+
+        if isinstance(checkpoint, LegacyCheckpoint):
+            raise ge_exceptions.CheckpointError(
+                f'LegacyCheckpoint "{checkpoint.name}" cannot be run by CheckpointScheduler.'
+            )
+
+        return checkpoint
+
+    @staticmethod
+    def _schedule_validations(
+        checkpoint: BaseCheckpoint, run_kwargs: dict
+    ) -> List[_ScheduledValidation]:
+        substituted_runtime_config: dict
+        validations: List[Optional[dict]]
+        run_id: Union[str, RunIdentifier]
+        result_format: Optional[Union[str, dict]]
+        (
+            substituted_runtime_config,
+            validations,
+            run_id,
+            result_format,
+        ) = checkpoint._prepare_run(**run_kwargs)
+        if not isinstance(run_id, RunIdentifier):
+            run_id = (
+                RunIdentifier(**run_id)
+                if isinstance(run_id, dict)
+                else RunIdentifier(run_name=run_id)
+            )
+
+        return [
+            _ScheduledValidation(
+                checkpoint=checkpoint,
+                substituted_validation_dict=checkpoint._get_substituted_validation_dict(
+                    substituted_runtime_config=substituted_runtime_config,
+                    validation_dict=validation_dict,
+                    idx=idx,
+                ),
+                result_format=result_format,
+                run_id=run_id,
+                idx=idx,
+            )
+            for idx, validation_dict in enumerate(validations)
+        ]
+
+    @staticmethod
+    def _get_datasource_name(scheduled_validation: _ScheduledValidation) -> str:
+        batch_request: Optional[
+            Union[BatchRequestBase, dict]
+        ] = scheduled_validation.substituted_validation_dict.get("batch_request")
+        if isinstance(batch_request, dict):
+            return batch_request.get("datasource_name")
+
+        return batch_request.datasource_name if batch_request is not None else None
+
+    def _depends_on_evaluation_parameters(
+        self, scheduled_validation: _ScheduledValidation
+    ) -> bool:
+        """Whether Expectation Suite of validation uses evaluation parameters, stored by other validations."""
+        substituted_validation_dict: dict = (
+            scheduled_validation.substituted_validation_dict
+        )
+        try:
+            if self._data_context.cloud_mode:
+                expectation_suite = self._data_context.get_expectation_suite(
+                    ge_cloud_id=substituted_validation_dict.get(
+                        "expectation_suite_ge_cloud_id"
+                    )
+                )
+            else:
+                expectation_suite = self._data_context.get_expectation_suite(
+                    expectation_suite_name=substituted_validation_dict.get(
+                        "expectation_suite_name"
+                    )
+                )
+        except ge_exceptions.DataContextError:
+            # Error is raised (as CheckpointError) in validation stage.
+            return False
+
+        return bool(expectation_suite.get_evaluation_parameter_dependencies())
+
+    @staticmethod
+    def _load_and_validate(
+        scheduled_validations: List[_ScheduledValidation],
+        action_executor: ThreadPoolExecutor,
+    ) -> Dict[_ScheduledValidation, Future]:
+        """Loads and validates given validations (of same Datasource) one at a time, submitting actions of each
+        validation to "action_executor", as soon as its validation result is ready (after running its
+        "StoreEvaluationParametersAction" actions synchronously)."""
+        action_futures: Dict[_ScheduledValidation, Future] = {}
+
+        scheduled_validation: _ScheduledValidation
+        for scheduled_validation in scheduled_validations:
+            checkpoint: BaseCheckpoint = scheduled_validation.checkpoint
+            with checkpoint._validation_errors_as_checkpoint_errors(
+                idx=scheduled_validation.idx
+            ):
+                validator: Validator = checkpoint._get_validator_for_validation(
+                    substituted_validation_dict=scheduled_validation.substituted_validation_dict
+                )
+                action_list_validation_operator: ActionListValidationOperator
+                operator_run_kwargs: dict
+                (
+                    action_list_validation_operator,
+                    operator_run_kwargs,
+                ) = checkpoint._get_validation_operator_and_run_kwargs(
+                    substituted_validation_dict=scheduled_validation.substituted_validation_dict,
+                    result_format=scheduled_validation.result_format,
+                    run_id=scheduled_validation.run_id,
+                    idx=scheduled_validation.idx,
+                )
+                validation_result: ExpectationSuiteValidationResult = (
+                    validator.validate(
+                        **action_list_validation_operator._get_batch_validate_arguments(
+                            run_id=scheduled_validation.run_id,
+                            result_format=operator_run_kwargs["result_format"],
+                            evaluation_parameters=operator_run_kwargs[
+                                "evaluation_parameters"
+                            ],
+                            catch_exceptions=operator_run_kwargs.get(
+                                "catch_exceptions"
+                            ),
+                            checkpoint_name=operator_run_kwargs["checkpoint_name"],
+                        )
+                    )
+                )
+
+            store_evaluation_parameters_action_names: List[str] = [
+                action["name"]
+                for action in action_list_validation_operator.action_list
+                if isinstance(
+                    action_list_validation_operator.actions[action["name"]],
+                    StoreEvaluationParametersAction,
+                )
+            ]
+            batch_actions_results: Optional[dict] = None
+            if store_evaluation_parameters_action_names:
+                batch_actions_results = (
+                    action_list_validation_operator._run_actions_on_result(
+                        batch=validator,
+                        validation_result=validation_result,
+                        run_id=scheduled_validation.run_id,
+                        checkpoint_identifier=operator_run_kwargs[
+                            "checkpoint_identifier"
+                        ],
+                        validation_id=operator_run_kwargs["validation_id"],
+                        action_names=store_evaluation_parameters_action_names,
+                    )[1]["actions_results"]
+                )
+
+            action_futures[scheduled_validation] = action_executor.submit(
+                action_list_validation_operator._run_actions_on_result,
+                batch=validator,
+                validation_result=validation_result,
+                run_id=scheduled_validation.run_id,
+                checkpoint_identifier=operator_run_kwargs["checkpoint_identifier"],
+                validation_id=operator_run_kwargs["validation_id"],
+                action_names=[
+                    action["name"]
+                    for action in action_list_validation_operator.action_list
+                    if action["name"] not in store_evaluation_parameters_action_names
+                ],
+                batch_actions_results=batch_actions_results,
+            )
+
+        return action_futures
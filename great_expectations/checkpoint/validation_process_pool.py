@@ -0,0 +1,207 @@
+"""
+Pool of worker processes, which load, validate, and act upon Checkpoint validations (for CPU-bound validations, e.g., of
+pandas Batches, which threads cannot run in parallel).
+
+Only Batch requests and Expectation Suites are sent to worker processes; each worker process loads Batches itself,
+using its own DataContext (loaded, once per worker process, from context root directory of calling DataContext).  Pools
+are keyed by fingerprint of configuration files of DataContext (and of its config variables), so that changes to
+Datasources, Stores, or config variables are picked up by new pool (and its worker processes) on next run.
+
+Evaluation parameters, stored in in-memory evaluation parameter store, are not shared between processes; validations,
+which store (by "StoreEvaluationParametersAction") or use evaluation parameters of other validations, are run one at a
+time, in calling thread, instead, unless evaluation parameter store of DataContext is backed by database.
+
+WARNING: This module is experimental.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from great_expectations.checkpoint.actions import StoreEvaluationParametersAction
+from great_expectations.core.batch import BatchRequestBase
+from great_expectations.core.expectation_suite import (
+    ExpectationSuite,
+    expectationSuiteSchema,
+)
+from great_expectations.data_context.store import InMemoryStoreBackend
+from great_expectations.util import load_class
+from great_expectations.validation_operators import ActionListValidationOperator
+from great_expectations.validation_operators.types.validation_operator_result import (
+    ValidationOperatorResult,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.data_context import AbstractDataContext
+
+logger = logging.getLogger(__name__)
+
+# Pools are kept for lifetime of process (so that worker processes, which have imported Great Expectations and loaded
+# DataContext, are reused across Checkpoint runs), until configuration of DataContext changes; remaining pools are shut
+# down at interpreter exit.
+_process_pools: Dict[Tuple[str, int, str], ProcessPoolExecutor] = {}
+
+_process_pools_lock = threading.Lock()
+
+# DataContext of worker process.
+_worker_data_context: Optional[AbstractDataContext] = None
+
+
+def get_validation_process_pool(
+    data_context: AbstractDataContext,
+) -> Optional[ProcessPoolExecutor]:
+    """Returns pool of worker processes for validations of given DataContext, if its concurrency configuration enables
+    "process" mode (None otherwise, or if DataContext cannot be loaded by worker processes).
+    """
+    concurrency = data_context.concurrency
+    if concurrency is None or not concurrency.enabled or concurrency.mode != "process":
+        return None
+
+    root_directory: Optional[str] = data_context.root_directory
+    if root_directory is None or data_context.cloud_mode:
+        logger.warning(
+            'Concurrency mode "process" requires DataContext with context root directory; running validations in threads instead.'
+        )
+        return None
+
+    max_processes: int = concurrency.max_processes or os.cpu_count() or 1
+    key: Tuple[str, int, str] = (
+        os.path.abspath(root_directory),
+        max_processes,
+        _get_config_fingerprint(data_context=data_context),
+    )
+    with _process_pools_lock:
+        if key not in _process_pools:
+            # Worker processes of pools with stale configuration (of same context root directory) are not reused.
+            stale_key: Tuple[str, int, str]
+            for stale_key in [
+                pool_key for pool_key in _process_pools if pool_key[0] == key[0]
+            ]:
+                _process_pools.pop(stale_key).shutdown(wait=False)
+
+            _process_pools[key] = ProcessPoolExecutor(
+                max_workers=max_processes,
+                initializer=_initialize_worker,
+                initargs=(key[0],),
+            )
+
+        return _process_pools[key]
+
+
+def shutdown_validation_process_pools() -> None:
+    """Shuts down all pools of worker processes (these are otherwise kept for reuse, until interpreter exits)."""
+    with _process_pools_lock:
+        process_pool: ProcessPoolExecutor
+        for process_pool in _process_pools.values():
+            process_pool.shutdown()
+
+        _process_pools.clear()
+
+
+def can_run_validation_in_worker(
+    data_context: AbstractDataContext,
+    expectation_suite: ExpectationSuite,
+    action_list: Optional[List[dict]],
+) -> bool:
+    """Whether validation (of given Expectation Suite and actions) can run in worker process: it cannot, if it stores or
+    uses evaluation parameters of other validations, while evaluation parameter store of DataContext is in-memory (and,
+    thus, not shared between processes)."""
+    if not isinstance(
+        data_context.evaluation_parameter_store.store_backend, InMemoryStoreBackend
+    ):
+        return True
+
+    if expectation_suite.get_evaluation_parameter_dependencies():
+        return False
+
+    action_config: dict
+    for action_config in action_list or []:
+        action_class = load_class(
+            class_name=action_config["action"]["class_name"],
+            module_name=action_config["action"].get(
+                "module_name", "great_expectations.checkpoint"
+            ),
+        )
+        if issubclass(action_class, StoreEvaluationParametersAction):
+            return False
+
+    return True
+
+
+def _get_config_fingerprint(data_context: AbstractDataContext) -> str:
+    """Fingerprint of configuration, which worker processes load: configuration file of DataContext and (substituted)
+    config variables."""
+    config_file_path: str = os.path.join(
+        data_context.root_directory, data_context.GX_YML
+    )
+    config_file_contents: str = ""
+    if os.path.isfile(config_file_path):
+        with open(config_file_path) as config_file:
+            config_file_contents = config_file.read()
+
+    return hashlib.md5(
+        json.dumps(
+            [config_file_contents, data_context._load_config_variables()],
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def _initialize_worker(context_root_dir: str) -> None:
+    from great_expectations.data_context import DataContext
+
+    global _worker_data_context
+    _worker_data_context = DataContext(context_root_dir=context_root_dir)
+
+
+def run_validation_in_worker(
+    batch_request: BatchRequestBase,
+    expectation_suite_dict: dict,
+    include_rendered_content: bool,
+    action_list: list,
+    validation_operator_name: str,
+    operator_run_kwargs: dict,
+) -> ValidationOperatorResult:
+    """Loads Batch of given Batch request into Validator (of given Expectation Suite), and runs ActionListValidationOperator
+    on it, in worker process.
+
+    Args:
+        batch_request: Batch request of validation (must not hold in-memory Batch data).
+        expectation_suite_dict: JSON dictionary of Expectation Suite of validation.
+        include_rendered_content: Whether validation results include rendered content.
+        action_list: Actions of validation.
+        validation_operator_name: Name of ActionListValidationOperator.
+        operator_run_kwargs: Keyword arguments of "ActionListValidationOperator.run()" (other than "assets_to_validate").
+    """
+    data_context: AbstractDataContext = _worker_data_context
+    expectation_suite = ExpectationSuite(
+        **expectationSuiteSchema.load(expectation_suite_dict),
+        data_context=data_context,
+    )
+    validator = data_context.get_validator(
+        batch_request=batch_request,
+        expectation_suite=expectation_suite,
+        include_rendered_content=include_rendered_content,
+    )
+    action_list_validation_operator = ActionListValidationOperator(
+        data_context=data_context,
+        action_list=action_list,
+        result_format=operator_run_kwargs["result_format"],
+        name=validation_operator_name,
+    )
+    try:
+        return action_list_validation_operator.run(
+            assets_to_validate=[validator], **operator_run_kwargs
+        )
+    finally:
+        # Batches (and their metrics) are not needed after validation; worker process is reused for other validations.
+        batch_id: str
+        for batch_id in validator.loaded_batch_ids:
+            validator.execution_engine.batch_manager.drop_batch(batch_id=batch_id)
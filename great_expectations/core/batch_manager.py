@@ -10,6 +10,7 @@ from great_expectations.core.batch import (
     BatchDefinition,
     BatchMarkers,
 )
+from great_expectations.execution_engine.metric_cache import get_batch_data_fingerprint
 from great_expectations.experimental.datasources.interfaces import Batch as XBatch
 
 if TYPE_CHECKING:
@@ -160,6 +161,12 @@ class BatchManager:
             self._execution_engine.load_batch_data(
                 batch_id=batch.id, batch_data=batch.data
             )
+            self._execution_engine.metric_cache.set_batch_fingerprint(
+                batch_id=batch.id,
+                fingerprint=get_batch_data_fingerprint(
+                    batch_markers=getattr(batch, "batch_markers", None)
+                ),
+            )
 
             self._batch_cache[batch.id] = batch
             # We set the active_batch_id in each iteration of the loop to keep in sync with the active_batch_data_id
@@ -170,5 +177,33 @@ class BatchManager:
         """
         Updates the data for the specified Batch in the cache
         """
+        if (
+            batch_id in self._batch_data_cache
+            and self._batch_data_cache[batch_id] is not batch_data
+        ):
+            # Metrics and domain records, computed on previous data of this Batch, are no longer valid.
+            self._invalidate_batch_caches(batch_id=batch_id)
+
         self._batch_data_cache[batch_id] = batch_data
         self._active_batch_data_id = batch_id
+
+    def drop_batch(self, batch_id: str) -> None:
+        """
+        Removes the specified Batch and its data from the cache (together with metrics and domain records of this Batch)
+        """
+        self._batch_cache.pop(batch_id, None)
+        self._batch_data_cache.pop(batch_id, None)
+        self._invalidate_batch_caches(batch_id=batch_id)
+
+        if self._active_batch_id == batch_id:
+            self._active_batch_id = None
+
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+    def _invalidate_batch_caches(self, batch_id: str) -> None:
+        self._execution_engine.metric_cache.invalidate_batch(batch_id=batch_id)
+        if self._execution_engine.domain_records_cache is not None:
+            self._execution_engine.domain_records_cache.invalidate_batch(
+                batch_id=batch_id
+            )
@@ -1,6 +1,6 @@
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+from typing import Any, Optional, Set, Tuple, TypeVar, Union
 
 from great_expectations.core.util import convert_to_json_serializable
 
@@ -10,11 +10,32 @@ T = TypeVar("T")
 class IDDict(dict):
     _id_ignore_keys: Set[str] = set()
 
+    # Identifier, computed with default "id_keys" and "id_ignore_keys"; it is memoized, because it is requested very many
+    # times for same objects (e.g., by "MetricConfiguration.id" and "__hash__()"), and reset whenever contents change.
+    # It is accessed through "object" methods, since "DotDict" subclasses (e.g., "Attributes") map attributes to keys.
+    _cached_id: Optional[Union[str, Tuple]] = None
+
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is None and id_ignore_keys is None:
+            cached_id: Optional[Union[str, Tuple]] = object.__getattribute__(
+                self, "_cached_id"
+            )
+            if cached_id is None:
+                cached_id = self._compute_id(
+                    id_keys=self.keys(), id_ignore_keys=self._id_ignore_keys
+                )
+                object.__setattr__(self, "_cached_id", cached_id)
+
+            return cached_id
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
+
+        return self._compute_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+    def _compute_id(self, id_keys, id_ignore_keys) -> Union[str, Tuple]:
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
             return tuple()
@@ -27,11 +48,49 @@ class IDDict(dict):
             json.dumps(_id_dict, sort_keys=True).encode("utf-8")
         ).hexdigest()
 
+    def _reset_cached_id(self) -> None:
+        object.__setattr__(self, "_cached_id", None)
+
     def __hash__(self) -> int:  # type: ignore[override]
         """Overrides the default implementation"""
         _result_hash: int = hash(self.to_id())
         return _result_hash
 
+    # All mutating "dict" methods invalidate memoized identifier.  Note: in-place mutation of nested values (e.g.,
+    # appending to list, stored under some key) is not detected; such values must be reassigned in order to take effect.
+
+    def __setitem__(self, key, value) -> None:
+        self._reset_cached_id()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key) -> None:
+        self._reset_cached_id()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._reset_cached_id()
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self._reset_cached_id()
+        super().clear()
+
+    def pop(self, *args):
+        self._reset_cached_id()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._reset_cached_id()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._reset_cached_id()
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:
+        self._reset_cached_id()
+        super().update(*args, **kwargs)
+
 
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict]
@@ -0,0 +1,135 @@
+"""
+Process-wide registry of SQLAlchemy Engine objects, so that all SqlAlchemyExecutionEngine, DatabaseStoreBackend, and
+SqlAlchemyQueryStore objects, which connect to same database (with same credentials and engine options), share one
+Engine (and its pool of connections), rather than each creating its own.
+
+Pool of shared Engine is configured by usual "create_engine()" keyword arguments (e.g., "pool_size", "pool_pre_ping",
+"pool_recycle"), which are part of registry key (i.e., objects, configured with different pool options, do not share
+Engine).
+
+Connections, pooled by parent process, are never used by forked child processes (e.g., worker processes of
+ProcessPoolExecutor): pools of all shared Engines are replaced in child process right after fork (without closing
+connections of parent process).
+
+WARNING: This module is experimental.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+
+from packaging import version
+
+from great_expectations.util import import_make_url
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.engine.url import URL
+    from sqlalchemy.pool import Pool
+
+logger = logging.getLogger(__name__)
+
+_engines: Dict[Tuple[str, str], Engine] = {}
+
+_engines_lock = threading.Lock()
+
+# Pools, inherited from parent process, are kept referenced by forked child process, so that connections of parent process
+# are never closed (e.g., by garbage collection of their DBAPI connection objects) in child process.
+_inherited_pools: List[Pool] = []
+
+
+def get_shared_sqlalchemy_engine(url: Union[str, URL], **kwargs) -> Engine:
+    """Returns Engine for given URL and "create_engine()" keyword arguments, shared by all callers in this process (it is
+    created on first request).
+
+    Engines of in-memory SQLite databases are never shared (every such Engine connects to its own database).
+
+    Args:
+        url: Database URL (as string or SQLAlchemy URL object, including credentials).
+        kwargs: Keyword arguments of "sqlalchemy.create_engine()" (e.g., pool options).
+
+    Returns:
+        SQLAlchemy Engine.
+    """
+    parsed_url: URL = import_make_url()(url)
+    if parsed_url.get_backend_name() == "sqlite" and parsed_url.database in (
+        None,
+        "",
+        ":memory:",
+    ):
+        return sa.create_engine(url, **kwargs)
+
+    key: Tuple[str, str] = _get_engine_key(url=parsed_url, kwargs=kwargs)
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = sa.create_engine(url, **kwargs)
+            logger.debug(
+                f"Created shared SQLAlchemy engine for {repr(_engines[key].url)}."
+            )
+
+        return _engines[key]
+
+
+def is_shared_sqlalchemy_engine(engine: Any) -> bool:
+    """Returns whether given Engine is shared by means of this registry (and, hence, must not be disposed by its users)."""
+    with _engines_lock:
+        return any(shared_engine is engine for shared_engine in _engines.values())
+
+
+def dispose_shared_sqlalchemy_engines() -> None:
+    """Disposes all shared Engines (closing their pooled connections) and empties registry."""
+    with _engines_lock:
+        engine: Engine
+        for engine in _engines.values():
+            engine.dispose()
+
+        _engines.clear()
+
+
+def _reset_shared_sqlalchemy_engines_after_fork() -> None:
+    """Replaces pools of all shared Engines (inherited from parent process) by empty pools in forked child process."""
+    global _engines_lock
+    # Lock may have been held by another thread of parent process at time of fork.
+    _engines_lock = threading.Lock()
+
+    engine: Engine
+    for engine in _engines.values():
+        _inherited_pools.append(engine.pool)
+        if version.parse(sa.__version__) < version.parse("1.4.33"):
+            engine.pool = engine.pool.recreate()
+        else:
+            # Connections of parent process are dereferenced, but not closed (they are still used by parent process).
+            engine.dispose(close=False)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_sqlalchemy_engines_after_fork)
+
+
+def _get_engine_key(url: URL, kwargs: dict) -> Tuple[str, str]:
+    # URLs are normalized by rendering (which sorts query parameters); both parts of key are hashed, so that credentials
+    # are not held in plain text by registry.
+    rendered_url: str
+    if version.parse(sa.__version__) < version.parse("1.4"):
+        rendered_url = url.__to_string__(hide_password=False)
+    else:
+        rendered_url = url.set(
+            drivername=url.drivername.lower(),
+            host=url.host.lower() if url.host else url.host,
+        ).render_as_string(hide_password=False)
+
+    rendered_kwargs: str = json.dumps(kwargs, sort_keys=True, default=repr)
+    return (
+        hashlib.sha256(rendered_url.encode("utf-8")).hexdigest(),
+        hashlib.sha256(rendered_kwargs.encode("utf-8")).hexdigest(),
+    )
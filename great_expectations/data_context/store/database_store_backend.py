@@ -4,6 +4,9 @@ from pathlib import Path
 from typing import Dict, Tuple
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.sqlalchemy_engine_registry import (
+    get_shared_sqlalchemy_engine,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.util import (
     filter_properties_dict,
@@ -39,6 +42,7 @@ class DatabaseStoreBackend(StoreBackend):
         store_name=None,
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
+        share_engine: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -61,6 +65,7 @@ class DatabaseStoreBackend(StoreBackend):
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
+        self._share_engine = share_engine
 
         if engine is not None:
             if credentials is not None:
@@ -72,11 +77,11 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = self._create_engine(connection_string, **kwargs)
         elif url is not None:
             parsed_url = make_url(url)
             self.drivername = parsed_url.drivername
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = self._create_engine(url, **kwargs)
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
@@ -132,6 +137,7 @@ class DatabaseStoreBackend(StoreBackend):
             "store_name": store_name,
             "suppress_store_backend_id": suppress_store_backend_id,
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
+            "share_engine": share_engine,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -178,9 +184,17 @@ class DatabaseStoreBackend(StoreBackend):
 
         self.drivername = drivername
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = self._create_engine(options, **create_engine_kwargs)
         return engine
 
+    def _create_engine(self, url, **kwargs) -> "sa.engine.Engine":
+        """Creates SQLAlchemy Engine for given URL (or returns Engine, shared with other stores and execution engines of
+        this process, which connect to same database, if engines are shared)."""
+        if self._share_engine:
+            return get_shared_sqlalchemy_engine(url, **kwargs)
+
+        return sa.create_engine(url, **kwargs)
+
     @staticmethod
     def _get_sqlalchemy_key_pair_auth_url(
         drivername: str, credentials: dict
@@ -3,16 +3,17 @@ from string import Template
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.data_context_key import StringKey
+from great_expectations.core.sqlalchemy_engine_registry import (
+    get_shared_sqlalchemy_engine,
+)
 from great_expectations.data_context.store.store import Store
 from great_expectations.util import filter_properties_dict
 
 try:
     import sqlalchemy
-    from sqlalchemy import create_engine
     from sqlalchemy.engine.url import URL
 except ImportError:
     sqlalchemy = None
-    create_engine = None
     URL = None
 
 
@@ -65,13 +66,13 @@ class SqlAlchemyQueryStore(Store):
         if "engine" in credentials:
             self.engine = credentials["engine"]
         elif "url" in credentials:
-            self.engine = create_engine(credentials["url"])
+            self.engine = get_shared_sqlalchemy_engine(credentials["url"])
         elif "connection_string" in credentials:
-            self.engine = create_engine(credentials["connection_string"])
+            self.engine = get_shared_sqlalchemy_engine(credentials["connection_string"])
         else:
             drivername = credentials.pop("drivername")
             options = URL(drivername, **credentials)
-            self.engine = create_engine(options)
+            self.engine = get_shared_sqlalchemy_engine(options)
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
         # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
@@ -991,13 +991,27 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache = fields.Dict(required=False, allow_none=True)
+    domain_records_cache = fields.Dict(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
     force_reuse_spark_context = fields.Boolean(required=False, allow_none=True)
+    persist_domain_records = fields.Boolean(required=False, allow_none=True)
+    chunk_size = fields.Integer(required=False, allow_none=True)
+    project_columns = fields.Boolean(required=False, allow_none=True)
+    dtype_backend = fields.String(required=False, allow_none=True)
+    memory_map = fields.Boolean(required=False, allow_none=True)
+    download_part_size = fields.Integer(required=False, allow_none=True)
+    max_download_workers = fields.Integer(required=False, allow_none=True)
+    fingerprint_method = fields.String(required=False, allow_none=True)
     # BigQuery Service Account Credentials
     # https://googleapis.dev/python/sqlalchemy-bigquery/latest/README.html#connection-string-parameters
     credentials_info = fields.Dict(required=False, allow_none=True)
 
     create_temp_table = fields.Boolean(required=False, allow_none=True)
+    fuse_batch_metric_bundles = fields.Boolean(required=False, allow_none=True)
+    schema_cache_ttl = fields.Float(required=False, allow_none=True)
+    query_cost_guard = fields.Dict(required=False, allow_none=True)
+    share_engine = fields.Boolean(required=False, allow_none=True)
 
     # noinspection PyUnusedLocal
     @validates_schema
@@ -1492,19 +1506,50 @@ class IncludeRenderedContentConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False) -> None:
+    def __init__(
+        self,
+        enabled: bool = False,
+        mode: str = "thread",
+        max_processes: Optional[int] = None,
+    ) -> None:
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            mode: Either "thread" or "process"; in "process" mode, Checkpoint validations (of Batch requests, which hold
+                no in-memory data) are loaded, validated, and acted upon in pool of worker processes (each with its own
+                DataContext, loaded from context root directory), rather than in threads.
+            max_processes: Maximum number of worker processes in "process" mode (default is number of CPUs).
         """
+        if mode not in ["thread", "process"]:
+            raise ValueError(
+                f'Concurrency mode must be either "thread" or "process", not "{mode}".'
+            )
+
+        if max_processes is not None and max_processes < 1:
+            raise ValueError(
+                f"Maximum number of processes must be positive integer, not {max_processes}."
+            )
+
         self._enabled = enabled
+        self._mode = mode
+        self._max_processes = max_processes
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def mode(self) -> str:
+        """Whether validations are run in threads ("thread") or in worker processes ("process")."""
+        return self._mode
+
+    @property
+    def max_processes(self) -> Optional[int]:
+        """Maximum number of worker processes in "process" mode (None, if number of CPUs)."""
+        return self._max_processes
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
@@ -1538,6 +1583,10 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    mode = fields.String(
+        required=False, validate=OneOf(["thread", "process"]), default="thread"
+    )
+    max_processes = fields.Integer(required=False, allow_none=True)
 
 
 class GXCloudConfig(DictDot):
@@ -388,6 +388,10 @@ class ExecutionEngineError(DataContextError):
         super().__init__(self.message)
 
 
+class QueryCostBudgetExceededError(ExecutionEngineError):
+    pass
+
+
 class BatchFilterError(DataContextError):
     def __init__(self, message) -> None:
         self.message = message
@@ -25,3 +25,15 @@ class BundledMetricConfiguration(DictDot):
     def to_json_dict(self) -> dict:
         """Returns: this BundledMetricConfiguration as a JSON dictionary"""
         return convert_to_json_serializable(data=self.to_dict())
+
+
+@dataclass(frozen=True)
+class BundledWindowConditionCount:
+    """
+    BundledWindowConditionCount is the bundled metric function of unexpected count of window condition (e.g., condition
+    with window function or subquery), which, unlike aggregate function, cannot be nested in aggregate function; instead,
+    all such conditions over same domain records are evaluated for every row in one subquery, and summed over it.
+    """
+
+    condition: Any
+    domain_kwargs: dict
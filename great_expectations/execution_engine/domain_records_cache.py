@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine.metric_cache import _estimate_size_in_bytes
+
+logger = logging.getLogger(__name__)
+
+# Domain kwargs, which direct "get_domain_records()" to filter rows of Batch (other domain kwargs only select columns).
+ROW_FILTERING_DOMAIN_KEYS: Tuple[str, ...] = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+)
+COLUMN_PAIR_ROW_FILTERING_DOMAIN_KEYS: Tuple[str, ...] = (
+    "column_A",
+    "column_B",
+    "ignore_row_if",
+)
+MULTICOLUMN_ROW_FILTERING_DOMAIN_KEYS: Tuple[str, ...] = (
+    "column_list",
+    "ignore_row_if",
+)
+
+# Default limits of "DomainRecordsCache" (each filtered copy of Batch data held in memory can be as large as Batch).
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES: int = 16
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES: int = 256 * 2**20
+
+
+def get_domain_records_id(domain_kwargs: dict) -> Optional[str]:
+    """Returns normalized identifier of rows, which "get_domain_records()" obtains from Batch for given domain_kwargs.
+
+    Only directives, which filter rows ("row_condition", "filter_conditions", and "ignore_row_if"), are taken into
+    account, following precedence of "get_domain_records()" implementations (e.g., "ignore_row_if" is disregarded for
+    single-column domains).  If no rows are filtered out, None is returned (Batch data itself is domain records).
+    """
+    records_domain_kwargs: Dict[str, Any] = {
+        key: domain_kwargs[key]
+        for key in ROW_FILTERING_DOMAIN_KEYS
+        if domain_kwargs.get(key)
+    }
+    if "condition_parser" in records_domain_kwargs and not domain_kwargs.get(
+        "row_condition"
+    ):
+        del records_domain_kwargs["condition_parser"]
+
+    if "column" not in domain_kwargs:
+        key: str
+        if all(key in domain_kwargs for key in COLUMN_PAIR_ROW_FILTERING_DOMAIN_KEYS):
+            records_domain_kwargs.update(
+                {
+                    key: domain_kwargs[key]
+                    for key in COLUMN_PAIR_ROW_FILTERING_DOMAIN_KEYS
+                }
+            )
+        elif all(key in domain_kwargs for key in MULTICOLUMN_ROW_FILTERING_DOMAIN_KEYS):
+            records_domain_kwargs.update(
+                {
+                    key: domain_kwargs[key]
+                    for key in MULTICOLUMN_ROW_FILTERING_DOMAIN_KEYS
+                }
+            )
+
+    if not records_domain_kwargs:
+        return None
+
+    return IDDict(records_domain_kwargs).to_id(
+        id_keys=records_domain_kwargs.keys(), id_ignore_keys=set()
+    )
+
+
+class DomainRecordsCache:
+    """Least-recently-used cache of domain records (e.g., Batch rows, satisfying "row_condition"), used by execution
+    engines, so that rows are filtered only once for all metrics sharing same filtering directives.
+
+    Entries are keyed by ID of Batch and normalized filtering directives (see "get_domain_records_id()"); all records of
+    Batch are invalidated at once, whenever BatchManager drops or replaces data for that Batch.  Records may be given
+    "release" callable (e.g., "DataFrame.unpersist"), which is called once they are evicted or invalidated.
+
+    Cache is bounded by default (16 entries and 256 MiB); limits, explicitly set to None, are lifted.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached domain records (least recently used records are evicted first).
+            max_bytes: Maximum estimated total size of cached domain records (in bytes); records, whose size cannot be
+                estimated locally (e.g., Spark DataFrames), are only accounted for by "max_entries".
+        """
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(
+                f"""Value of "max_entries" for {self.__class__.__name__} must be positive integer (or None)."""
+            )
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(
+                f"""Value of "max_bytes" for {self.__class__.__name__} must be positive integer (or None)."""
+            )
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        # Entries are kept in recency order (least recently used first): key -> (records, size, release).
+        self._entries: OrderedDict[
+            Tuple[Optional[str], str], Tuple[Any, int, Optional[Callable[[], Any]]]
+        ] = OrderedDict()
+        self._keys_by_batch_id: Dict[Optional[str], Set[Tuple[Optional[str], str]]] = {}
+        self._total_bytes: int = 0
+
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated total size of cached domain records (in bytes)."""
+        return self._total_bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of domain records evicted in order to satisfy "max_entries" and/or "max_bytes" limits."""
+        return self._evictions
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, batch_id: Optional[str], domain_records_id: str) -> Optional[Any]:
+        """Returns cached domain records (or None, if records for given Batch and filtering directives are not cached)."""
+        key: Tuple[Optional[str], str] = (batch_id, domain_records_id)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return self._entries[key][0]
+
+        self._misses += 1
+        return None
+
+    def put(
+        self,
+        batch_id: Optional[str],
+        domain_records_id: str,
+        records: Any,
+        release: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        key: Tuple[Optional[str], str] = (batch_id, domain_records_id)
+        self._remove(key=key)
+
+        size: int = (
+            _estimate_size_in_bytes(value=records) if self._max_bytes is not None else 0
+        )
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug(
+                f"Domain records {key} (estimated size {size} bytes) exceed max_bytes={self._max_bytes}; not cached."
+            )
+            if release is not None:
+                release()
+
+            return
+
+        self._entries[key] = (records, size, release)
+        self._keys_by_batch_id.setdefault(batch_id, set()).add(key)
+        self._total_bytes += size
+
+        self._evict()
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        key: Tuple[Optional[str], str]
+        for key in list(self._keys_by_batch_id.get(batch_id, set())):
+            self._remove(key=key)
+
+    def clear(self) -> None:
+        key: Tuple[Optional[str], str]
+        for key in list(self._entries.keys()):
+            self._remove(key=key)
+
+    def _remove(self, key: Tuple[Optional[str], str]) -> None:
+        if key not in self._entries:
+            return
+
+        size: int
+        release: Optional[Callable[[], Any]]
+        _, size, release = self._entries.pop(key)
+        self._total_bytes -= size
+
+        keys: Set[Tuple[Optional[str], str]] = self._keys_by_batch_id[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_batch_id[key[0]]
+
+        if release is not None:
+            release()
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+        ):
+            self._remove(key=next(iter(self._entries)))
+            self._evictions += 1
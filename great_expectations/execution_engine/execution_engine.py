@@ -22,9 +22,15 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch_manager import BatchManager
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import AzureUrl, DBFSPath, GCSUrl, S3Url
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.execution_engine.bundled_metric_configuration import (
     BundledMetricConfiguration,
 )
+from great_expectations.execution_engine.domain_records_cache import DomainRecordsCache
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    NoOpMetricCache,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -56,18 +62,6 @@ except ImportError:
     )
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    # noinspection PyMethodMayBeStatic,PyUnusedLocal
-    def update(self, value):
-        return None
-
-
 class MetricFunctionTypes(Enum):
     VALUE = "value"
     MAP_VALUES = "value"  # "map_values"
@@ -204,6 +198,8 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache=None,
+        domain_records_cache=None,
     ) -> None:
         self.name = name
         self._validator = validator
@@ -211,11 +207,33 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
+        # "metric_cache" is class config of "MetricCache" implementation (default is unbounded "InMemoryMetricCache");
+        # e.g., {"class_name": "InMemoryMetricCache", "max_entries": 10000} bounds cache with LRU eviction.
+        self._metric_cache: MetricCache
         if self._caching:
-            self._metric_cache: Union[Dict, NoOpDict] = {}
+            self._metric_cache = instantiate_class_from_config(
+                config=metric_cache or {"class_name": "InMemoryMetricCache"},
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.execution_engine.metric_cache"
+                },
+            )
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = NoOpMetricCache()
+
+        # "domain_records_cache" is class config of "DomainRecordsCache" (records, filtered by row_condition and similar
+        # directives, are reused by all metrics sharing them); it is bounded by default, and e.g., {"max_bytes": 2 ** 30}
+        # changes memory it may hold.
+        self._domain_records_cache: Optional[DomainRecordsCache] = None
+        if self._caching:
+            self._domain_records_cache = instantiate_class_from_config(
+                config=domain_records_cache or {"class_name": "DomainRecordsCache"},
+                runtime_environment={},
+                config_defaults={
+                    "module_name": "great_expectations.execution_engine.domain_records_cache",
+                    "class_name": "DomainRecordsCache",
+                },
+            )
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -234,6 +252,10 @@ class ExecutionEngine(ABC):
             if key in self.recognized_batch_spec_defaults
         }
 
+        # IDs of metrics, whose values were computed over sample of domain records only (e.g., by query cost guard of
+        # SqlAlchemyExecutionEngine), or from such metrics; these are neither cached, nor reported as exact values.
+        self._sampled_metric_ids: Set[Tuple[str, str, str]] = set()
+
         self._batch_manager = BatchManager(execution_engine=self)
 
         if batch_data_dict is None:
@@ -246,6 +268,8 @@ class ExecutionEngine(ABC):
         self._config = {
             "name": name,
             "caching": caching,
+            "metric_cache": metric_cache,
+            "domain_records_cache": domain_records_cache,
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
@@ -266,6 +290,35 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def metric_cache(self) -> MetricCache:
+        """Cache of resolved metric values (exposes hit/miss counters and per-Batch invalidation)."""
+        return self._metric_cache
+
+    @property
+    def domain_records_cache(self) -> Optional[DomainRecordsCache]:
+        """Cache of filtered domain records (None, if caching is disabled)."""
+        return self._domain_records_cache
+
+    @property
+    def sampled_metric_ids(self) -> Set[Tuple[str, str, str]]:
+        """IDs of resolved metrics, whose values were computed over sample of domain records (not over all of them)."""
+        return self._sampled_metric_ids
+
+    def release_domain_records(self) -> None:
+        """Releases domain records, held for duration of validation run in scarce resources (e.g., persisted Spark
+        DataFrames).  Records held in process memory are retained (bounded by "DomainRecordsCache" limits)."""
+        pass
+
+    def project_batch_columns(
+        self, batch_id: str, column_names: Optional[Set[str]]
+    ) -> None:
+        """Hints that only given columns of batch data (all columns, if None) are accessed until projection is changed.
+
+        Execution engines, reading batch data lazily, may use this hint to avoid reading columns that are not accessed.
+        """
+        pass
+
     @property
     def batch_manager(self) -> BatchManager:
         """Getter for batch_manager"""
@@ -329,6 +382,11 @@ class ExecutionEngine(ABC):
 
         metric_fn_bundle: List[BundledMetricConfiguration] = []
 
+        # Resolved metrics are cached together with ID of Batch, on which they were computed (metrics, persisted for that
+        # Batch data in earlier run, are not computed again; values, cached in current session, are not reused for metrics
+        # explicitly requested, because metric ID does not capture configuration of metric dependencies).
+        batch_ids_by_metric_id: Dict[Tuple[str, str, str], Optional[str]] = {}
+
         metric_fn_type: MetricFunctionTypes
         metric_class: MetricProvider
         metric_fn: Any
@@ -339,12 +397,26 @@ class ExecutionEngine(ABC):
         resolved_metrics_by_metric_name: Dict[str, Any]
         k: str
         v: MetricConfiguration
+        batch_id: Optional[str]
         for metric_to_resolve in metrics_to_resolve:
+            batch_id = metric_to_resolve.metric_domain_kwargs.get(
+                "batch_id", self._batch_manager.active_batch_data_id
+            )
+            if self._caching and self._metric_cache.contains_persisted(
+                metric_id=metric_to_resolve.id, batch_id=batch_id
+            ):
+                resolved_metrics[metric_to_resolve.id] = self._metric_cache[
+                    metric_to_resolve.id
+                ]
+                continue
+
+            batch_ids_by_metric_id[metric_to_resolve.id] = batch_id
+
             resolved_metrics_by_metric_name = {}
             for k, v in metric_to_resolve.metric_dependencies.items():
                 if v.id in metrics:
                     resolved_metrics_by_metric_name[k] = metrics[v.id]
-                elif self._caching and v.id in self._metric_cache:  # type: ignore[operator] # TODO: update NoOpDict
+                elif self._caching and v.id in self._metric_cache:
                     resolved_metrics_by_metric_name[k] = self._metric_cache[v.id]
                 else:
                     raise ge_exceptions.MetricError(
@@ -412,6 +484,16 @@ class ExecutionEngine(ABC):
                     failed_metrics=(metric_to_resolve,),
                 ) from e
 
+            # Values, computed from sampled metric values, are sampled too (bundled metrics are marked by
+            # "resolve_metric_bundle()").
+            if metric_fn_type == MetricFunctionTypes.VALUE and any(
+                v.id in self._sampled_metric_ids
+                for v in metric_to_resolve.metric_dependencies.values()
+            ):
+                self._sampled_metric_ids.add(metric_to_resolve.id)
+            else:
+                self._sampled_metric_ids.discard(metric_to_resolve.id)
+
         if len(metric_fn_bundle) > 0:
             try:
                 # an engine-specific way of computing metrics together
@@ -419,6 +501,9 @@ class ExecutionEngine(ABC):
                     Tuple[str, str, str], MetricValue
                 ] = self.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
                 resolved_metrics.update(new_resolved)
+            except ge_exceptions.MetricResolutionError:
+                # Engine already identified which bundled metrics failed (the rest of bundle is not implicated).
+                raise
             except Exception as e:
                 raise ge_exceptions.MetricResolutionError(
                     message=str(e),
@@ -426,7 +511,17 @@ class ExecutionEngine(ABC):
                 ) from e
 
         if self._caching:
-            self._metric_cache.update(resolved_metrics)
+            metric_id: Tuple[str, str, str]
+            for metric_id, batch_id in batch_ids_by_metric_id.items():
+                if (
+                    metric_id in resolved_metrics
+                    and metric_id not in self._sampled_metric_ids
+                ):
+                    self._metric_cache.put(
+                        metric_id=metric_id,
+                        value=resolved_metrics[metric_id],
+                        batch_id=batch_id,
+                    )
 
         return resolved_metrics
 
@@ -0,0 +1,520 @@
+from __future__ import annotations
+
+import base64
+import datetime
+import decimal
+import hashlib
+import logging
+import pickle
+import sys
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.validator.computed_metric import MetricValue
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Batch markers, in which execution engines record fingerprint of Batch data (in order of preference).
+BATCH_DATA_FINGERPRINT_MARKER_KEYS: Tuple[str, ...] = (
+    "pandas_data_fingerprint",
+    "sqlalchemy_data_fingerprint",
+)
+
+# Suffixes of names of map metrics, whose values are aligned with rows of Batch (e.g., full-length pandas Series of
+# condition); such values are as large as Batch data itself, and are only cached in memory.
+_ROW_ALIGNED_METRIC_NAME_SUFFIXES: Tuple[str, ...] = (
+    ".condition",
+    ".map",
+)
+
+_PERSISTABLE_SCALAR_TYPES: Tuple[type, ...] = (
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+)
+
+
+class MetricCache(ABC):
+    """Cache of resolved metric values, used by "ExecutionEngine" across calls to "resolve_metrics()".
+
+    Entries are keyed by "MetricConfiguration.id" and tagged with ID of Batch, on which metric was computed, so that all
+    metrics of Batch can be invalidated at once (e.g., when BatchManager drops or replaces data for that Batch).
+    Membership test ("metric_id in cache" or "contains()") is how "ExecutionEngine" consults cache; hence, it updates
+    hit/miss counters.
+    """
+
+    def __init__(self) -> None:
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Number of membership tests that found requested metric in cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of membership tests that did not find requested metric in cache."""
+        return self._misses
+
+    @property
+    def persistent(self) -> bool:
+        """Whether or not cache is backed by persistent storage (i.e., "contains_persisted()" can ever succeed)."""
+        return False
+
+    def __contains__(self, metric_id: Tuple[str, str, str]) -> bool:
+        return self.contains(metric_id=metric_id)
+
+    def contains(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        """Checks whether or not metric, computed on Batch with given batch_id, is available from cache.
+
+        Knowing batch_id allows implementations to look beyond values, stored in memory (e.g., in persistent storage).
+        """
+        if self._contains(metric_id=metric_id, batch_id=batch_id):
+            self._hits += 1
+            return True
+
+        self._misses += 1
+        return False
+
+    def contains_persisted(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        """Checks whether or not metric, computed on Batch with given batch_id, is available from persistent storage.
+
+        Unlike values, cached in memory during current session, persisted values were computed on same Batch data in
+        earlier run; hence, "ExecutionEngine" skips computing them altogether.  Available value is loaded into cache.
+        Caches without persistent storage do not count this check as miss (it is not a lookup of value to be reused).
+        """
+        if not self.persistent:
+            return False
+
+        if self._contains_persisted(metric_id=metric_id, batch_id=batch_id):
+            self._hits += 1
+            return True
+
+        self._misses += 1
+        return False
+
+    def set_batch_fingerprint(self, batch_id: str, fingerprint: Optional[str]) -> None:
+        """Records fingerprint of data of Batch with given batch_id (no-op, unless implementation makes use of it)."""
+        pass
+
+    @abstractmethod
+    def __getitem__(self, metric_id: Tuple[str, str, str]) -> MetricValue:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def _contains(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        pass
+
+    def _contains_persisted(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        return False
+
+    @abstractmethod
+    def put(
+        self,
+        metric_id: Tuple[str, str, str],
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+    ) -> None:
+        """Stores resolved metric value, computed on Batch with given batch_id."""
+        pass
+
+    @abstractmethod
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        """Removes all cached metrics, computed on Batch with given batch_id."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all cached metrics (hit/miss counters are preserved)."""
+        pass
+
+
+class NoOpMetricCache(MetricCache):
+    """Cache that never stores anything; used when "caching" is disabled for "ExecutionEngine"."""
+
+    def __getitem__(self, metric_id: Tuple[str, str, str]) -> MetricValue:
+        raise KeyError(metric_id)
+
+    def __len__(self) -> int:
+        return 0
+
+    def _contains(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        return False
+
+    def put(
+        self,
+        metric_id: Tuple[str, str, str],
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+    ) -> None:
+        pass
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class InMemoryMetricCache(MetricCache):
+    """Least-recently-used in-memory metric cache, optionally bounded by number of entries and/or by estimated size.
+
+    With neither "max_entries" nor "max_bytes" specified, cache is unbounded (except for per-Batch invalidation).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached metric values (least recently used values are evicted first).
+            max_bytes: Maximum estimated total size of cached metric values (in bytes); single value, larger than this
+                limit, is not cached at all.
+        """
+        super().__init__()
+
+        if max_entries is not None and max_entries < 1:
+            raise ValueError(
+                f"""Value of "max_entries" for {self.__class__.__name__} must be positive integer (or None)."""
+            )
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(
+                f"""Value of "max_bytes" for {self.__class__.__name__} must be positive integer (or None)."""
+            )
+
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        # Entries are kept in recency order (least recently used first): metric_id -> (value, batch_id, size).
+        self._entries: OrderedDict[
+            Tuple[str, str, str], Tuple[MetricValue, Optional[str], int]
+        ] = OrderedDict()
+        self._metric_ids_by_batch_id: Dict[
+            Optional[str], Set[Tuple[str, str, str]]
+        ] = {}
+        self._total_bytes: int = 0
+
+        self._evictions: int = 0
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated total size of cached metric values (in bytes)."""
+        return self._total_bytes
+
+    @property
+    def evictions(self) -> int:
+        """Number of metric values evicted in order to satisfy "max_entries" and/or "max_bytes" limits."""
+        return self._evictions
+
+    def __getitem__(self, metric_id: Tuple[str, str, str]) -> MetricValue:
+        return self._entries[metric_id][0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _contains(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        if metric_id in self._entries:
+            self._entries.move_to_end(metric_id)
+            return True
+
+        return False
+
+    def put(
+        self,
+        metric_id: Tuple[str, str, str],
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+    ) -> None:
+        self._remove(metric_id=metric_id)
+
+        size: int = (
+            _estimate_size_in_bytes(value=value) if self._max_bytes is not None else 0
+        )
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug(
+                f"Metric {metric_id} (estimated size {size} bytes) exceeds max_bytes={self._max_bytes}; not cached."
+            )
+            return
+
+        self._entries[metric_id] = (value, batch_id, size)
+        self._metric_ids_by_batch_id.setdefault(batch_id, set()).add(metric_id)
+        self._total_bytes += size
+
+        self._evict()
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        metric_id: Tuple[str, str, str]
+        for metric_id in self._metric_ids_by_batch_id.pop(batch_id, set()):
+            self._total_bytes -= self._entries.pop(metric_id)[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._metric_ids_by_batch_id.clear()
+        self._total_bytes = 0
+
+    def _remove(self, metric_id: Tuple[str, str, str]) -> None:
+        if metric_id not in self._entries:
+            return
+
+        batch_id: Optional[str]
+        size: int
+        _, batch_id, size = self._entries.pop(metric_id)
+        self._total_bytes -= size
+
+        metric_ids: Set[Tuple[str, str, str]] = self._metric_ids_by_batch_id[batch_id]
+        metric_ids.discard(metric_id)
+        if not metric_ids:
+            del self._metric_ids_by_batch_id[batch_id]
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self._max_entries is not None and len(self._entries) > self._max_entries)
+            or (self._max_bytes is not None and self._total_bytes > self._max_bytes)
+        ):
+            self._remove(metric_id=next(iter(self._entries)))
+            self._evictions += 1
+
+
+class PersistentMetricCache(InMemoryMetricCache):
+    """In-memory metric cache, backed by persistent store, so that metrics can be reused across runs (processes).
+
+    Persisted entries are keyed by (fingerprint of Batch data, metric ID); hence, only metrics of Batches, whose data
+    fingerprint is known (e.g., "pandas_data_fingerprint" or "sqlalchemy_data_fingerprint" batch markers), are persisted,
+    and rerunning validation against unchanged data finds them in store.  Only plain metric values (numbers, strings,
+    dates, numpy/pandas objects, and containers thereof) are persisted -- partial functions, engine-specific objects
+    (e.g., SQLAlchemy expressions), and row-aligned values of map metrics (e.g., pandas condition Series) are only cached
+    in memory.
+
+    Values are pickled; hence, store must only be shared by trusted parties.  Note that "sqlalchemy_data_fingerprint"
+    identifies selected rows (table, splitter, and sampler), not their contents; persisting metrics of SQL Batches is
+    only appropriate for partitions that do not change once written (e.g., past days of date-partitioned table).
+    """
+
+    def __init__(
+        self,
+        store_backend: dict,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            store_backend: Class config of "StoreBackend" to persist metrics in (defaults to "TupleFilesystemStoreBackend";
+                e.g., {"base_directory": "/var/cache/ge_metrics"}).
+            max_entries: Maximum number of metric values, cached in memory (persistent store is not bounded).
+            max_bytes: Maximum estimated total size of metric values, cached in memory (in bytes).
+        """
+        super().__init__(max_entries=max_entries, max_bytes=max_bytes)
+
+        self._store_backend: StoreBackend = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment={},
+            config_defaults={
+                "module_name": "great_expectations.data_context.store",
+                "class_name": "TupleFilesystemStoreBackend",
+                "suppress_store_backend_id": True,
+            },
+        )
+        self._fingerprints_by_batch_id: Dict[str, str] = {}
+
+    @property
+    def store_backend(self) -> StoreBackend:
+        return self._store_backend
+
+    @property
+    def persistent(self) -> bool:
+        return True
+
+    def set_batch_fingerprint(self, batch_id: str, fingerprint: Optional[str]) -> None:
+        if fingerprint is None:
+            self._fingerprints_by_batch_id.pop(batch_id, None)
+        else:
+            self._fingerprints_by_batch_id[batch_id] = fingerprint
+
+    def _contains(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        if super()._contains(metric_id=metric_id, batch_id=batch_id):
+            return True
+
+        return self._contains_persisted(metric_id=metric_id, batch_id=batch_id)
+
+    def _contains_persisted(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str] = None
+    ) -> bool:
+        key: Optional[Tuple[str, str]] = self._build_store_key(
+            metric_id=metric_id, batch_id=batch_id
+        )
+        if key is None:
+            return False
+
+        try:
+            if not self._store_backend.has_key(key):
+                return False
+
+            if super()._contains(metric_id=metric_id, batch_id=batch_id):
+                return True
+
+            value: MetricValue = pickle.loads(
+                base64.b64decode(self._store_backend.get(key))
+            )
+        except Exception as e:
+            logger.warning(
+                f"Unable to load metric {metric_id} from {self._store_backend.__class__.__name__}: {e}"
+            )
+            return False
+
+        super().put(metric_id=metric_id, value=value, batch_id=batch_id)
+        return True
+
+    def put(
+        self,
+        metric_id: Tuple[str, str, str],
+        value: MetricValue,
+        batch_id: Optional[str] = None,
+    ) -> None:
+        super().put(metric_id=metric_id, value=value, batch_id=batch_id)
+
+        key: Optional[Tuple[str, str]] = self._build_store_key(
+            metric_id=metric_id, batch_id=batch_id
+        )
+        if (
+            key is None
+            or metric_id[0].endswith(_ROW_ALIGNED_METRIC_NAME_SUFFIXES)
+            or not _is_persistable(value=value)
+        ):
+            return
+
+        try:
+            self._store_backend.set(
+                key, base64.b64encode(pickle.dumps(value)).decode("ascii")
+            )
+        except Exception as e:
+            logger.warning(
+                f"Unable to persist metric {metric_id} to {self._store_backend.__class__.__name__}: {e}"
+            )
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> None:
+        # Persisted metrics remain valid for data, which they were computed on; only association with batch is dropped.
+        super().invalidate_batch(batch_id=batch_id)
+        self._fingerprints_by_batch_id.pop(batch_id, None)
+
+    def _build_store_key(
+        self, metric_id: Tuple[str, str, str], batch_id: Optional[str]
+    ) -> Optional[Tuple[str, str]]:
+        fingerprint: Optional[str] = self._fingerprints_by_batch_id.get(batch_id)
+        if fingerprint is None:
+            return None
+
+        return (
+            fingerprint,
+            hashlib.md5(str(metric_id).encode("utf-8")).hexdigest(),
+        )
+
+
+def get_batch_data_fingerprint(batch_markers: Optional[dict]) -> Optional[str]:
+    """Returns fingerprint of Batch data, recorded by "ExecutionEngine" among batch markers (or None, if there is none)."""
+    if not batch_markers:
+        return None
+
+    key: str
+    for key in BATCH_DATA_FINGERPRINT_MARKER_KEYS:
+        if batch_markers.get(key) is not None:
+            return str(batch_markers[key])
+
+    return None
+
+
+def _is_persistable(value: Any) -> bool:
+    """Plain data values can be persisted; functions and engine-specific objects (e.g., SQLAlchemy clauses) cannot."""
+    if value is None or isinstance(value, _PERSISTABLE_SCALAR_TYPES):
+        return True
+
+    if np is not None and isinstance(value, np.generic):
+        return True
+
+    if np is not None and isinstance(value, np.ndarray):
+        return value.dtype != object
+
+    if pd is not None and isinstance(value, (pd.Series, pd.DataFrame, pd.Index)):
+        return True
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_persistable(value=element) for element in value)
+
+    if isinstance(value, dict):
+        return all(
+            _is_persistable(value=key) and _is_persistable(value=element)
+            for key, element in value.items()
+        )
+
+    return False
+
+
+def _estimate_size_in_bytes(value: Any) -> int:
+    """Inexpensive estimate of memory held by metric value (pandas/numpy buffers are accounted for, shallowly)."""
+    if pd is not None and isinstance(value, (pd.Series, pd.DataFrame, pd.Index)):
+        memory_usage = value.memory_usage(index=True, deep=False)
+        return int(memory_usage.sum() if hasattr(memory_usage, "sum") else memory_usage)
+
+    if np is not None and isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_in_bytes(value=element) for element in value
+        )
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _estimate_size_in_bytes(value=element) for element in value.values()
+        )
+
+    return sys.getsizeof(value)
@@ -0,0 +1,117 @@
+import io
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DOWNLOAD_PART_SIZE: int = 8 * 1024 * 1024
+
+DEFAULT_MAX_DOWNLOAD_WORKERS: int = 8
+
+
+class ObjectRangeReader:
+    """Reads object of known size from object store (S3, Azure Blob Storage, GCS) by byte ranges: either entire object,
+    as parts, downloaded by bounded pool of threads, or on demand, through seekable file object (so that, e.g., Parquet
+    reader fetches footer first, and then only column chunks it needs).
+    """
+
+    def __init__(
+        self,
+        read_range: Callable[[int, int], bytes],
+        size: int,
+        part_size: int = DEFAULT_DOWNLOAD_PART_SIZE,
+        max_workers: int = DEFAULT_MAX_DOWNLOAD_WORKERS,
+    ) -> None:
+        """
+        Args:
+            read_range: Function of start (inclusive) and end (exclusive) offsets, returning bytes of object in between;
+                it is called concurrently (client of object store must be thread-safe).
+            size: Size of object in bytes.
+            part_size: Size of parts, in which object is downloaded, in bytes.
+            max_workers: Maximum number of parts, downloaded concurrently.
+        """
+        self._read_range = read_range
+        self._size = size
+        self._part_size = part_size
+        self._max_workers = max_workers
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get_part_ranges(self) -> List[Tuple[int, int]]:
+        return [
+            (start, min(start + self._part_size, self._size))
+            for start in range(0, self._size, self._part_size)
+        ]
+
+    def read(self) -> bytes:
+        """Downloads entire object, as parts of "part_size" bytes, using up to "max_workers" threads."""
+        part_ranges: List[Tuple[int, int]] = self.get_part_ranges()
+        if len(part_ranges) <= 1:
+            return self._read_range(0, self._size) if self._size > 0 else b""
+
+        logger.debug(
+            f"Downloading object of {self._size} bytes as {len(part_ranges)} parts."
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(part_ranges))
+        ) as executor:
+            parts: List[bytes] = list(
+                executor.map(
+                    lambda part_range: self._read_range(*part_range), part_ranges
+                )
+            )
+
+        return b"".join(parts)
+
+    def open(self) -> io.BufferedReader:
+        """Returns seekable binary file object, which downloads byte ranges of object as they are read."""
+        return io.BufferedReader(
+            _RangeRawIO(read_range=self._read_range, size=self._size),
+            buffer_size=min(self._part_size, io.DEFAULT_BUFFER_SIZE * 8),
+        )
+
+
+class _RangeRawIO(io.RawIOBase):
+    def __init__(self, read_range: Callable[[int, int], bytes], size: int) -> None:
+        super().__init__()
+        self._read_range = read_range
+        self._size = size
+        self._position: int = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position ({position}).")
+
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer) -> int:
+        end: int = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+
+        data: bytes = self._read_range(self._position, end)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
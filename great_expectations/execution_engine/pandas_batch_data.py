@@ -1,13 +1,261 @@
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Set
+
 import pandas as pd
 
 from great_expectations.core.batch import BatchData
+from great_expectations.execution_engine.pandas_data_fingerprint import (
+    PandasDataFingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+    logger.debug(
+        "Unable to load pyarrow; install optional pyarrow dependency for support of Arrow-backed batch data"
+    )
 
 
 class PandasBatchData(BatchData):
     def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        # NumPy-backed copy of DataFrame (see "numpy_backed_dataframe"), and DataFrame it was converted from.
+        self._numpy_backed_dataframe: Optional[pd.DataFrame] = None
+        self._numpy_backed_source: Optional[pd.DataFrame] = None
 
     @property
     def dataframe(self):
         return self._dataframe
+
+    @property
+    def numpy_backed_dataframe(self) -> pd.DataFrame:
+        """DataFrame of batch data, whose Arrow-backed columns are converted to NumPy-backed ones (see
+        "to_numpy_backed_dataframe()"); every DataFrame (e.g., every chunk of chunked batch data) is converted once."""
+        dataframe: pd.DataFrame = self.dataframe
+        if self._numpy_backed_source is not dataframe:
+            self._numpy_backed_dataframe = to_numpy_backed_dataframe(df=dataframe)
+            self._numpy_backed_source = dataframe
+
+        return self._numpy_backed_dataframe
+
+
+class PandasLazyBatchData(PandasBatchData):
+    """Batch data, which is read from its source on first access, so that only columns, projected onto by then, are read.
+
+    Projection may be widened later; data, already read under narrower projection, is then discarded and read again.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        reader: Callable[[Optional[Set[str]]], pd.DataFrame],
+    ) -> None:
+        """
+        Args:
+            execution_engine: "PandasExecutionEngine", to which batch data belongs.
+            reader: Function of names of columns to read (None, if all columns are to be read), returning batch data.
+        """
+        super().__init__(execution_engine=execution_engine, dataframe=None)
+        self._reader = reader
+        self._column_projection: Optional[Set[str]] = None
+        self._is_read: bool = False
+
+    @property
+    def column_projection(self) -> Optional[Set[str]]:
+        """Names of columns, which are read from source (None, if all columns are read)."""
+        return self._column_projection
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._dataframe is not None
+
+    def project_columns(self, column_names: Optional[Iterable[str]]) -> bool:
+        """Restricts columns, read from source, to given columns (None lifts projection).
+
+        Returns:
+            True, if data, already read under projection, which does not cover given columns, was discarded (values,
+            computed on that data, may no longer be valid); False otherwise.
+        """
+        projection: Optional[Set[str]] = (
+            None if column_names is None else set(column_names)
+        )
+        if not self._is_read:
+            self._column_projection = projection
+            return False
+
+        if self._column_projection is None or (
+            projection is not None and projection <= self._column_projection
+        ):
+            return False
+
+        self._dataframe = None
+        self._is_read = False
+        self._column_projection = projection
+        return True
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._dataframe is None:
+            self._is_read = True
+            self._dataframe = self._reader(self._column_projection)
+
+        return self._dataframe
+
+
+class PandasChunkedBatchData(PandasLazyBatchData):
+    """Batch data, which is read from its source in chunks (DataFrames of bounded number of rows) on every pass over it,
+    rather than held in memory.
+
+    "PandasExecutionEngine" computes metrics, which can be merged across chunks, one chunk at a time (while chunk is
+    bound, "dataframe" property returns that chunk).  Otherwise, "dataframe" property concatenates all chunks (once).
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader: Callable[[Optional[Set[str]]], Iterator[pd.DataFrame]],
+    ) -> None:
+        """
+        Args:
+            execution_engine: "PandasExecutionEngine", to which batch data belongs.
+            chunk_reader: Function of names of columns to read (None, if all columns are to be read), returning new
+                iterator over chunks of batch data on every call; index of each chunk continues index of previous chunk
+                (as if entire data were read at once).
+        """
+        super().__init__(
+            execution_engine=execution_engine, reader=self._read_all_chunks
+        )
+        self._chunk_reader = chunk_reader
+        self._bound_chunk: Optional[pd.DataFrame] = None
+        self._fingerprint_method: Optional[str] = None
+        self._on_fingerprint: Optional[Callable[[str], None]] = None
+
+    def fingerprint_chunks(
+        self, method: str, on_fingerprint: Callable[[str], None]
+    ) -> None:
+        """Fingerprints batch data incrementally, one chunk at a time, during first complete pass over all its columns
+        (so that batch data is not read just to be fingerprinted).
+
+        Args:
+            method: Fingerprint method (one of "FINGERPRINT_METHODS").
+            on_fingerprint: Function, which is called with fingerprint, once it is computed.
+        """
+        self._fingerprint_method = method
+        self._on_fingerprint = on_fingerprint
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Reads batch data from its source one chunk at a time (data, already materialized, is used as single chunk).
+
+        At least one chunk is always produced (empty DataFrame, if source has no rows), so that every metric has value.
+        """
+        if self._dataframe is not None:
+            yield self._dataframe
+            return
+
+        self._is_read = True
+
+        is_empty: bool = True
+        chunk: pd.DataFrame
+        for chunk in self._read_chunks(self._column_projection):
+            is_empty = False
+            yield chunk
+
+        if is_empty:
+            yield pd.DataFrame()
+
+    @contextmanager
+    def bind_chunk(self, chunk: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """While context is active, batch data consists of given chunk only."""
+        self._bound_chunk = chunk
+        try:
+            yield chunk
+        finally:
+            self._bound_chunk = None
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._bound_chunk is not None:
+            return self._bound_chunk
+
+        return super().dataframe
+
+    def _read_all_chunks(self, column_names: Optional[Set[str]]) -> pd.DataFrame:
+        logger.warning(
+            "Materializing chunked batch data in memory, because some metrics cannot be computed one chunk at a time."
+        )
+        chunks = list(self._read_chunks(column_names))
+        return pd.concat(chunks) if chunks else pd.DataFrame()
+
+    def _read_chunks(self, column_names: Optional[Set[str]]) -> Iterator[pd.DataFrame]:
+        if self._fingerprint_method is None or column_names is not None:
+            yield from self._chunk_reader(column_names)
+            return
+
+        fingerprint = PandasDataFingerprint(method=self._fingerprint_method)
+        chunk: pd.DataFrame
+        for chunk in self._chunk_reader(column_names):
+            fingerprint.update(chunk)
+            yield chunk
+
+        self._fingerprint_method = None
+        self._on_fingerprint(fingerprint.hexdigest())
+
+
+def is_arrow_backed_dtype(dtype: Any) -> bool:
+    ArrowDtype = getattr(pd, "ArrowDtype", None)
+    return ArrowDtype is not None and isinstance(dtype, ArrowDtype)
+
+
+def to_numpy_backed_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts Arrow-backed ("pd.ArrowDtype") columns of DataFrame to NumPy-backed columns, as pyarrow converts Arrow
+    tables to pandas (e.g., integer columns with nulls become "float64" columns), so that values of metrics equal those
+    of NumPy-backed batch data.  DataFrame without Arrow-backed columns is returned as is.
+    """
+    if not any(is_arrow_backed_dtype(dtype=dtype) for dtype in df.dtypes):
+        return df
+
+    columns: List[pd.Series] = []
+
+    idx: int
+    column: pd.Series
+    for idx in range(df.shape[1]):
+        column = df.iloc[:, idx]
+        if is_arrow_backed_dtype(dtype=column.dtype):
+            converted_column: pd.Series = pa.array(column.array).to_pandas()
+            converted_column.index = column.index
+            converted_column.name = column.name
+            column = converted_column
+
+        columns.append(column)
+
+    return pd.concat(columns, axis=1)
+
+
+def get_numpy_backed_dtypes(df: pd.DataFrame) -> List[Any]:
+    """Returns dtypes of columns of DataFrame, as converted by "to_numpy_backed_dataframe()" (without converting them)."""
+    dtypes: List[Any] = []
+
+    idx: int
+    dtype: Any
+    for idx, dtype in enumerate(df.dtypes):
+        if is_arrow_backed_dtype(dtype=dtype):
+            # Conversion of Arrow type to pandas depends on type and presence of nulls only.
+            arrow_type: pa.DataType = dtype.pyarrow_dtype
+            dtype = (
+                (
+                    pa.nulls(1, type=arrow_type)
+                    if df.iloc[:, idx].hasnans
+                    else pa.array([], type=arrow_type)
+                )
+                .to_pandas()
+                .dtype
+            )
+
+        dtypes.append(dtype)
+
+    return dtypes
@@ -0,0 +1,492 @@
+"""Merging of metric values, computed by "PandasExecutionEngine" on chunks of "PandasChunkedBatchData" one at a time.
+
+Every metric, which can be computed chunk by chunk, has "ChunkedMetricMerge", which combines values (or partial states)
+of metric on consecutive chunks into single accumulated value, from which value of metric on entire batch is obtained.
+"""
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        PandasExecutionEngine,
+    )
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+class ChunkLocalMetricValue:
+    """Placeholder value of metric, which is only meaningful for single chunk (e.g., boolean Series of map condition).
+
+    Such metrics are computed again for every chunk, whenever metrics depending on them are resolved chunk by chunk.
+    """
+
+    def __init__(self, metric_id: Tuple[str, str, str]) -> None:
+        self._metric_id = metric_id
+
+    @property
+    def metric_id(self) -> Tuple[str, str, str]:
+        return self._metric_id
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(metric_id={self._metric_id})"
+
+
+class ChunkedMetricMerge:
+    """Combines values of metric on chunks of batch data into value of that metric on entire batch data."""
+
+    def __init__(
+        self,
+        merge_fn: Callable[[Any, Any, dict], Any],
+        chunk_state_fn: Optional[
+            Callable[[PandasExecutionEngine, MetricConfiguration], Any]
+        ] = None,
+        finalize_fn: Optional[Callable[[Any, dict], Any]] = None,
+    ) -> None:
+        """
+        Args:
+            merge_fn: Function of accumulated state, state of next chunk, and metric value kwargs, returning new
+                accumulated state.
+            chunk_state_fn: Function, computing state of chunk, which is bound to batch data (if None, value of metric
+                itself, resolved on that chunk, is state of chunk).
+            finalize_fn: Function of accumulated state and metric value kwargs, returning value of metric (if None,
+                accumulated state is value of metric).
+        """
+        self._merge_fn = merge_fn
+        self._chunk_state_fn = chunk_state_fn
+        self._finalize_fn = finalize_fn
+
+    @property
+    def computes_chunk_state(self) -> bool:
+        """Whether or not state of chunk is computed directly (instead of resolving metric on that chunk)."""
+        return self._chunk_state_fn is not None
+
+    def get_chunk_state(
+        self,
+        execution_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+    ) -> Any:
+        return self._chunk_state_fn(execution_engine, metric_configuration)
+
+    def merge(self, accumulated: Any, state: Any, metric_value_kwargs: dict) -> Any:
+        return self._merge_fn(accumulated, state, metric_value_kwargs)
+
+    def finalize(self, accumulated: Any, metric_value_kwargs: dict) -> Any:
+        if self._finalize_fn is None:
+            return accumulated
+
+        return self._finalize_fn(accumulated, metric_value_kwargs)
+
+
+def _get_domain_column(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+) -> pd.Series:
+    """Non-null values of column domain of metric in chunk, which is bound to batch data."""
+    df: pd.DataFrame
+    accessor_domain_kwargs: dict
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        domain_kwargs=metric_configuration.metric_domain_kwargs,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
+    column: pd.Series = df[accessor_domain_kwargs["column"]]
+    return column[column.notnull()]
+
+
+def _truncate_unexpected(values: Any, metric_value_kwargs: dict) -> Any:
+    result_format: dict = metric_value_kwargs["result_format"]
+    if result_format["result_format"] == "COMPLETE":
+        return values
+
+    if isinstance(values, pd.DataFrame):
+        return values.iloc[: result_format["partial_unexpected_count"]]
+
+    return values[: result_format["partial_unexpected_count"]]
+
+
+def _sum(accumulated: Any, state: Any, metric_value_kwargs: dict) -> Any:
+    return accumulated + state
+
+
+def _extreme(reduce_fn: Callable[[Any, Any], Any]) -> Callable[[Any, Any, dict], Any]:
+    """Merges minimum (or maximum) of chunks; chunks without values (None or NaN result) are disregarded."""
+
+    def merge_fn(accumulated: Any, state: Any, metric_value_kwargs: dict) -> Any:
+        if state is None or (isinstance(state, float) and math.isnan(state)):
+            return accumulated
+
+        if accumulated is None or (
+            isinstance(accumulated, float) and math.isnan(accumulated)
+        ):
+            return state
+
+        return reduce_fn(accumulated, state)
+
+    return merge_fn
+
+
+def _concat_unexpected(accumulated: Any, state: Any, metric_value_kwargs: dict) -> Any:
+    if isinstance(accumulated, pd.DataFrame):
+        merged = pd.concat([accumulated, state])
+    else:
+        merged = list(accumulated) + list(state)
+
+    return _truncate_unexpected(values=merged, metric_value_kwargs=metric_value_kwargs)
+
+
+def _column_types_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+) -> pd.DataFrame:
+    df: pd.DataFrame
+    df, _, _ = execution_engine.get_compute_domain(
+        domain_kwargs=metric_configuration.metric_domain_kwargs,
+        domain_type=MetricDomainTypes.TABLE,
+    )
+    # Empty frames are concatenated into common column types of chunks (as if chunks themselves were concatenated).
+    return df.iloc[:0]
+
+
+def _merge_column_types(
+    accumulated: pd.DataFrame, state: pd.DataFrame, metric_value_kwargs: dict
+) -> pd.DataFrame:
+    return pd.concat([accumulated, state])
+
+
+def _finalize_column_types(
+    accumulated: pd.DataFrame, metric_value_kwargs: dict
+) -> List[dict]:
+    return [
+        {"name": name, "type": dtype}
+        for (name, dtype) in zip(accumulated.columns, accumulated.dtypes)
+    ]
+
+
+def _mean_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+) -> Tuple[Any, int]:
+    column: pd.Series = _get_domain_column(
+        execution_engine=execution_engine, metric_configuration=metric_configuration
+    )
+    return column.sum(), len(column)
+
+
+def _finalize_mean(accumulated: Tuple[Any, int], metric_value_kwargs: dict) -> Any:
+    total: Any
+    count: int
+    total, count = accumulated
+    return total / count if count > 0 else np.nan
+
+
+def _standard_deviation_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+) -> Tuple[int, float, float]:
+    column: pd.Series = _get_domain_column(
+        execution_engine=execution_engine, metric_configuration=metric_configuration
+    )
+    if len(column) == 0:
+        return 0, 0.0, 0.0
+
+    mean: float = column.mean()
+    return len(column), mean, float(((column - mean) ** 2).sum())
+
+
+def _merge_standard_deviation(
+    accumulated: Tuple[int, float, float],
+    state: Tuple[int, float, float],
+    metric_value_kwargs: dict,
+) -> Tuple[int, float, float]:
+    """Combines (count, mean, sum of squared deviations from mean) of two chunks (parallel algorithm of Chan et al.)."""
+    count: int
+    mean: float
+    m2: float
+    count, mean, m2 = accumulated
+    other_count: int
+    other_mean: float
+    other_m2: float
+    other_count, other_mean, other_m2 = state
+    if other_count == 0:
+        return accumulated
+
+    if count == 0:
+        return state
+
+    total_count: int = count + other_count
+    delta: float = other_mean - mean
+    return (
+        total_count,
+        mean + delta * other_count / total_count,
+        m2 + other_m2 + delta**2 * count * other_count / total_count,
+    )
+
+
+def _finalize_standard_deviation(
+    accumulated: Tuple[int, float, float], metric_value_kwargs: dict
+) -> float:
+    count: int
+    m2: float
+    count, _, m2 = accumulated
+    # Sample standard deviation (same "ddof" as "pandas.Series.std()").
+    return math.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+
+
+def _merge_value_counts(
+    accumulated: pd.Series, state: pd.Series, metric_value_kwargs: dict
+) -> pd.Series:
+    counts: pd.Series = pd.concat([accumulated, state]).groupby(level=0).sum()
+    if metric_value_kwargs.get("sort", "value") == "value":
+        try:
+            counts.sort_index(inplace=True)
+        except TypeError:
+            counts.index = counts.index.astype(str)
+            counts.sort_index(inplace=True)
+    else:
+        counts.sort_values(ascending=False, kind="stable", inplace=True)
+
+    counts.name = "count"
+    counts.index.name = "value"
+    return counts
+
+
+def _distinct_values_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+) -> Set[Any]:
+    column: pd.Series = _get_domain_column(
+        execution_engine=execution_engine, metric_configuration=metric_configuration
+    )
+    return set(column.unique())
+
+
+def _union(
+    accumulated: Set[Any], state: Set[Any], metric_value_kwargs: dict
+) -> Set[Any]:
+    return accumulated | state
+
+
+def _approx_quantile_values_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+):
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_approx_quantile_values import (
+        ColumnApproxQuantileValues,
+        get_rank_error,
+    )
+    from great_expectations.expectations.metrics.sketches import KllQuantileSketch
+
+    sketch = KllQuantileSketch(
+        k=KllQuantileSketch.k_for_rank_error(
+            rank_error=get_rank_error(
+                allow_relative_error=metric_configuration.metric_value_kwargs.get(
+                    "allow_relative_error"
+                ),
+                default_rank_error=ColumnApproxQuantileValues.default_kwarg_values[
+                    "allow_relative_error"
+                ],
+            )
+        )
+    )
+    sketch.update(
+        values=_get_domain_column(
+            execution_engine=execution_engine,
+            metric_configuration=metric_configuration,
+        )
+    )
+    return sketch
+
+
+def _approx_distinct_values_count_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+):
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_approx_distinct_values_count import (
+        ColumnApproxDistinctValuesCount,
+    )
+    from great_expectations.expectations.metrics.sketches import HyperLogLogSketch
+
+    relative_standard_error: float = metric_configuration.metric_value_kwargs.get(
+        "relative_standard_error"
+    ) or (
+        ColumnApproxDistinctValuesCount.default_kwarg_values["relative_standard_error"]
+    )
+    sketch = HyperLogLogSketch(
+        precision=HyperLogLogSketch.precision_for_relative_error(
+            relative_standard_error=relative_standard_error
+        )
+    )
+    sketch.update(
+        values=_get_domain_column(
+            execution_engine=execution_engine,
+            metric_configuration=metric_configuration,
+        )
+    )
+    return sketch
+
+
+def _get_heavy_hitters_kwargs(metric_value_kwargs: dict) -> Tuple[float, float]:
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_approx_heavy_hitters import (
+        ColumnApproxHeavyHitters,
+    )
+
+    min_frequency: Optional[float] = metric_value_kwargs.get("min_frequency")
+    if min_frequency is None:
+        min_frequency = ColumnApproxHeavyHitters.default_kwarg_values["min_frequency"]
+
+    relative_error: Optional[float] = metric_value_kwargs.get("relative_error")
+    if relative_error is None:
+        relative_error = ColumnApproxHeavyHitters.default_kwarg_values["relative_error"]
+
+    return min_frequency, relative_error
+
+
+def _approx_heavy_hitters_state(
+    execution_engine: PandasExecutionEngine, metric_configuration: MetricConfiguration
+):
+    from great_expectations.expectations.metrics.sketches import CountMinSketch
+
+    min_frequency: float
+    relative_error: float
+    min_frequency, relative_error = _get_heavy_hitters_kwargs(
+        metric_value_kwargs=metric_configuration.metric_value_kwargs
+    )
+    sketch = CountMinSketch(
+        relative_error=relative_error,
+        max_candidates=max(int(2.0 / min_frequency), 1),
+    )
+    sketch.update(
+        values=_get_domain_column(
+            execution_engine=execution_engine,
+            metric_configuration=metric_configuration,
+        )
+    )
+    return sketch
+
+
+def _merge_sketches(accumulated: Any, state: Any, metric_value_kwargs: dict) -> Any:
+    accumulated.merge(other=state)
+    return accumulated
+
+
+def _finalize_approx_quantile_values(
+    accumulated: Any, metric_value_kwargs: dict
+) -> Dict[str, Any]:
+    return {
+        "values": accumulated.quantiles(quantiles=metric_value_kwargs["quantiles"]),
+        "rank_error": accumulated.rank_error,
+    }
+
+
+def _finalize_approx_distinct_values_count(
+    accumulated: Any, metric_value_kwargs: dict
+) -> Dict[str, Any]:
+    return {
+        "value": accumulated.count(),
+        "relative_standard_error": accumulated.relative_standard_error,
+    }
+
+
+def _finalize_approx_heavy_hitters(
+    accumulated: Any, metric_value_kwargs: dict
+) -> Dict[str, Any]:
+    min_frequency: float
+    min_frequency, _ = _get_heavy_hitters_kwargs(
+        metric_value_kwargs=metric_value_kwargs
+    )
+    return {
+        "values": accumulated.heavy_hitters(min_frequency=min_frequency),
+        "count_error": accumulated.count_error,
+        "confidence": accumulated.confidence,
+    }
+
+
+CHUNKED_METRIC_MERGES: Dict[str, ChunkedMetricMerge] = {
+    "table.row_count": ChunkedMetricMerge(merge_fn=_sum),
+    "table.column_types": ChunkedMetricMerge(
+        merge_fn=_merge_column_types,
+        chunk_state_fn=_column_types_state,
+        finalize_fn=_finalize_column_types,
+    ),
+    "column.min": ChunkedMetricMerge(merge_fn=_extreme(reduce_fn=min)),
+    "column.max": ChunkedMetricMerge(merge_fn=_extreme(reduce_fn=max)),
+    "column.sum": ChunkedMetricMerge(merge_fn=_sum),
+    "column.mean": ChunkedMetricMerge(
+        merge_fn=lambda accumulated, state, metric_value_kwargs: (
+            accumulated[0] + state[0],
+            accumulated[1] + state[1],
+        ),
+        chunk_state_fn=_mean_state,
+        finalize_fn=_finalize_mean,
+    ),
+    "column.standard_deviation": ChunkedMetricMerge(
+        merge_fn=_merge_standard_deviation,
+        chunk_state_fn=_standard_deviation_state,
+        finalize_fn=_finalize_standard_deviation,
+    ),
+    "column.value_counts": ChunkedMetricMerge(merge_fn=_merge_value_counts),
+    "column.distinct_values": ChunkedMetricMerge(merge_fn=_union),
+    "column.distinct_values.count": ChunkedMetricMerge(
+        merge_fn=_union,
+        chunk_state_fn=_distinct_values_state,
+        finalize_fn=lambda accumulated, metric_value_kwargs: len(accumulated),
+    ),
+    "column.distinct_values.count.under_threshold": ChunkedMetricMerge(
+        merge_fn=_union,
+        chunk_state_fn=_distinct_values_state,
+        finalize_fn=lambda accumulated, metric_value_kwargs: (
+            len(accumulated) < metric_value_kwargs["threshold"]
+        ),
+    ),
+    "column.approx_quantile_values": ChunkedMetricMerge(
+        merge_fn=_merge_sketches,
+        chunk_state_fn=_approx_quantile_values_state,
+        finalize_fn=_finalize_approx_quantile_values,
+    ),
+    "column.distinct_values.approx_count": ChunkedMetricMerge(
+        merge_fn=_merge_sketches,
+        chunk_state_fn=_approx_distinct_values_count_state,
+        finalize_fn=_finalize_approx_distinct_values_count,
+    ),
+    "column.approx_heavy_hitters": ChunkedMetricMerge(
+        merge_fn=_merge_sketches,
+        chunk_state_fn=_approx_heavy_hitters_state,
+        finalize_fn=_finalize_approx_heavy_hitters,
+    ),
+}
+
+# Merges of metrics, derived from map metrics (by suffix of metric name).
+CHUNKED_MAP_METRIC_MERGES: Dict[str, ChunkedMetricMerge] = {
+    "unexpected_count": ChunkedMetricMerge(merge_fn=_sum),
+    "filtered_row_count": ChunkedMetricMerge(merge_fn=_sum),
+    "unexpected_values": ChunkedMetricMerge(merge_fn=_concat_unexpected),
+    "unexpected_index_list": ChunkedMetricMerge(merge_fn=_concat_unexpected),
+    "unexpected_rows": ChunkedMetricMerge(merge_fn=_concat_unexpected),
+}
+
+# Metrics, which are computed from values of their dependencies only (without accessing batch data).
+DEPENDENCY_ONLY_METRIC_NAMES: Set[str] = {
+    "table.columns",
+    "column.unique_proportion",
+}
+
+# Map metrics, whose value for any row depends on other rows (e.g., uniqueness or monotonicity of column values), which
+# hence cannot be evaluated on one chunk at a time.
+CROSS_ROW_MAP_METRIC_NAMES: Set[str] = {
+    "column_values.unique",
+    "column_values.increasing",
+    "column_values.decreasing",
+    "compound_columns.count",
+    "compound_columns.unique",
+}
+
+
+def is_cross_row_map_metric(metric_name: str) -> bool:
+    """Returns whether map series (or map condition series) metric with given name compares rows with each other."""
+    return metric_name.rsplit(".", 1)[0] in CROSS_ROW_MAP_METRIC_NAMES
+
+
+def get_chunked_metric_merge(metric_name: str) -> Optional[ChunkedMetricMerge]:
+    """Returns "ChunkedMetricMerge" of metric (None, if metric cannot be computed chunk by chunk)."""
+    if metric_name in CHUNKED_METRIC_MERGES:
+        return CHUNKED_METRIC_MERGES[metric_name]
+
+    return CHUNKED_MAP_METRIC_MERGES.get(metric_name.rsplit(".", 1)[-1])
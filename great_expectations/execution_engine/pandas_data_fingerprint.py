@@ -0,0 +1,137 @@
+import hashlib
+import json
+import logging
+import pickle
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Methods of fingerprinting pandas batch data:
+#   "full"    -- every cell (with index) is hashed;
+#   "sampled" -- schema, row count, and every cell of one block of "SAMPLED_BLOCK_SIZE" rows in every "SAMPLED_BLOCK_STRIDE"
+#                blocks are hashed;
+#   "schema"  -- schema, row count, and checksum of values of every column (and of index), each paired with its row
+#                position, are hashed.
+FINGERPRINT_METHODS: Tuple[str, ...] = ("full", "sampled", "schema")
+
+SAMPLED_BLOCK_SIZE: int = 1024
+
+SAMPLED_BLOCK_STRIDE: int = 64
+
+
+class PandasDataFingerprint:
+    """Fingerprint of pandas batch data, which is updated one chunk (DataFrame of consecutive rows) at a time.
+
+    Fingerprint does not depend on how batch data is divided into chunks (except for "full" method, if batch data holds
+    unhashable values, such as dicts; these are pickled instead), and "full" fingerprint of single chunk is equal to
+    "hash_pandas_dataframe()" of that chunk.
+    """
+
+    def __init__(self, method: str = "full") -> None:
+        if method not in FINGERPRINT_METHODS:
+            raise ValueError(
+                f'Fingerprint method must be one of {", ".join(FINGERPRINT_METHODS)}, not "{method}".'
+            )
+
+        self._method = method
+        self._md5 = hashlib.md5()
+        self._row_count: int = 0
+        self._columns: Optional[List[str]] = None
+        self._dtypes: Optional[List[str]] = None
+        # Checksums of index, followed by checksums of columns (in order of columns).
+        self._checksums: List[int] = []
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def row_count(self) -> int:
+        return self._row_count
+
+    def update(self, df: pd.DataFrame) -> None:
+        """Adds rows of given chunk, following all rows added so far, to fingerprint."""
+        if self._columns is None:
+            self._columns = [str(column) for column in df.columns]
+            self._dtypes = [str(dtype) for dtype in df.dtypes]
+
+        if self._method == "full":
+            self._md5.update(_hash_rows(df=df, unhashable="pickle"))
+        elif self._method == "sampled":
+            self._update_sampled(df=df)
+        else:
+            self._update_checksums(df=df)
+
+        self._row_count += df.shape[0]
+
+    def hexdigest(self) -> str:
+        if self._method == "full":
+            return self._md5.hexdigest()
+
+        md5 = self._md5.copy()
+        summary: dict = {
+            "method": self._method,
+            "columns": self._columns,
+            "dtypes": self._dtypes,
+            "row_count": self._row_count,
+        }
+        if self._method == "schema":
+            summary["checksums"] = self._checksums
+
+        md5.update(json.dumps(summary, sort_keys=True).encode("utf-8"))
+        return md5.hexdigest()
+
+    def _update_sampled(self, df: pd.DataFrame) -> None:
+        # Sampled blocks are positioned relative to first row of batch data (not of chunk).
+        stride: int = SAMPLED_BLOCK_SIZE * SAMPLED_BLOCK_STRIDE
+        offset: int = self._row_count
+        end: int = offset + df.shape[0]
+
+        block_start: int
+        for block_start in range((offset // stride) * stride, end, stride):
+            start: int = max(block_start, offset)
+            stop: int = min(block_start + SAMPLED_BLOCK_SIZE, end)
+            if start < stop:
+                self._md5.update(
+                    _hash_rows(
+                        df=df.iloc[start - offset : stop - offset],
+                        unhashable="str",
+                    )
+                )
+
+    def _update_checksums(self, df: pd.DataFrame) -> None:
+        # Values are hashed together with their row positions in batch data (not in chunk), so that checksums reflect
+        # order of rows (and pairing of values across columns), yet do not depend on how batch data is divided into chunks.
+        positions = pd.RangeIndex(
+            start=self._row_count, stop=self._row_count + df.shape[0]
+        )
+        columns: List[pd.Series] = [df.index.to_series(index=positions)] + [
+            df.iloc[:, idx].set_axis(positions) for idx in range(df.shape[1])
+        ]
+        if not self._checksums:
+            self._checksums = [0] * len(columns)
+
+        idx: int
+        column: pd.Series
+        for idx, column in enumerate(columns):
+            # Sum of 64-bit hashes wraps around, and is therefore merged across chunks modulo 2**64.
+            checksum: int = int(
+                _hash_rows(df=column, unhashable="str").sum(dtype=np.uint64)
+            )
+            self._checksums[idx] = (self._checksums[idx] + checksum) % 2**64
+
+
+def _hash_rows(df, unhashable: str, index: bool = True):
+    """Returns 64-bit hashes of rows of DataFrame (or Series); unhashable values are either converted to strings, or
+    entire data is pickled instead (as bytes)."""
+    try:
+        return pd.util.hash_pandas_object(df, index=index).values
+    except TypeError:
+        if unhashable == "pickle":
+            # In case of facing unhashable objects (like dict), use pickle
+            return pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+
+        return pd.util.hash_pandas_object(df.astype(str), index=index).values
@@ -1,16 +1,30 @@
 import datetime
 import hashlib
+import json
 import logging
-import pickle
+import os
 import warnings
+from contextvars import ContextVar
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch import BatchData, BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
     BatchSpec,
@@ -19,17 +33,50 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import SplitDomainKwargs
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.bundled_metric_configuration import (
+    BundledMetricConfiguration,
+)
+from great_expectations.execution_engine.domain_records_cache import (
+    get_domain_records_id,
+)
+from great_expectations.execution_engine.execution_engine import (
+    MetricPartialFunctionTypes,
+    SplitDomainKwargs,
+)
+from great_expectations.execution_engine.object_store_reader import (
+    DEFAULT_DOWNLOAD_PART_SIZE,
+    DEFAULT_MAX_DOWNLOAD_WORKERS,
+    ObjectRangeReader,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,
+    PandasChunkedBatchData,
+    PandasLazyBatchData,
+)
+from great_expectations.execution_engine.pandas_chunked_metrics import (
+    DEPENDENCY_ONLY_METRIC_NAMES,
+    ChunkedMetricMerge,
+    ChunkLocalMetricValue,
+    get_chunked_metric_merge,
+    is_cross_row_map_metric,
+)
+from great_expectations.execution_engine.pandas_data_fingerprint import (
+    FINGERPRINT_METHODS,
+    PandasDataFingerprint,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
 from great_expectations.execution_engine.split_and_sample.pandas_data_splitter import (
     PandasDataSplitter,
 )
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +91,18 @@ except ImportError:
         "Unable to load AWS connection object; install optional boto3 dependency for support"
     )
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    feather = None
+    pq = None
+    logger.debug(
+        "Unable to load pyarrow; install optional pyarrow dependency for support of reading Parquet files in chunks and of Arrow-backed batch data"
+    )
+
 try:
     from azure.storage.blob import BlobServiceClient
 except ImportError:
@@ -69,6 +128,21 @@ except ImportError:
 
 HASH_THRESHOLD = 1e9
 
+# Whether metrics, currently being resolved, are computed on Arrow-backed domain records (see "resolve_metrics()").
+_arrow_backed_domain_records: ContextVar[bool] = ContextVar(
+    "arrow_backed_domain_records", default=False
+)
+
+# Reader option, restricting columns read, per pandas reader method, which supports it.
+PROJECTING_READER_OPTIONS: Dict[str, str] = {
+    "read_csv": "usecols",
+    "read_table": "usecols",
+    "read_excel": "usecols",
+    "read_parquet": "columns",
+    "read_feather": "columns",
+    "read_orc": "columns",
+}
+
 
 class PandasExecutionEngine(ExecutionEngine):
     """
@@ -116,6 +190,73 @@ Notes:
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        # If "chunk_size" is set, CSV and Parquet files are read (on every pass over batch data) in chunks of that many
+        # rows, and metrics, which can be merged across chunks, are computed without holding entire batch in memory.
+        chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        if chunk_size is not None and chunk_size < 1:
+            raise ge_exceptions.ExecutionEngineError(
+                f'Value of "chunk_size" for PandasExecutionEngine must be positive integer (or None), not {chunk_size}.'
+            )
+
+        self._chunk_size = chunk_size
+        # If "project_columns" is set, file batches are read on first access, restricted to columns, which Validator
+        # projects them onto (see "project_batch_columns()"); such batches are not fingerprinted.
+        self._project_columns: bool = kwargs.pop("project_columns", False)
+        # If "dtype_backend" is "pyarrow", file batches are held as DataFrames of "pd.ArrowDtype" columns (Parquet and
+        # Feather files are converted from Arrow tables without materializing Python objects for strings); metrics, which
+        # do not support such columns, are computed on NumPy-backed copies of them (see "resolve_metrics()").
+        dtype_backend: Optional[str] = kwargs.pop("dtype_backend", None)
+        if dtype_backend not in [None, "numpy", "pyarrow"]:
+            raise ge_exceptions.ExecutionEngineError(
+                f'Value of "dtype_backend" for PandasExecutionEngine must be "numpy" or "pyarrow" (or None), not "{dtype_backend}".'
+            )
+
+        if dtype_backend == "pyarrow" and (
+            pa is None or getattr(pd, "ArrowDtype", None) is None
+        ):
+            raise ge_exceptions.ExecutionEngineError(
+                'PandasExecutionEngine with dtype_backend="pyarrow" requires pyarrow and pandas>=1.5 to be installed.'
+            )
+
+        self._dtype_backend = dtype_backend
+        # If "memory_map" is set, local Parquet and Feather (Arrow IPC) files are memory-mapped, rather than read into
+        # process memory; columns of uncompressed Arrow IPC files are then backed by pages of mapped file (shared
+        # between processes reading same file), which are only loaded, when column is accessed.
+        self._memory_map: bool = kwargs.pop("memory_map", False)
+        if self._memory_map and pa is None:
+            raise ge_exceptions.ExecutionEngineError(
+                'PandasExecutionEngine with "memory_map" requires pyarrow to be installed.'
+            )
+
+        # Objects of object stores (S3, Azure Blob Storage, GCS), larger than "download_part_size" bytes, are downloaded
+        # as parts of that size by up to "max_download_workers" threads (None downloads every object at once).
+        self._download_part_size: Optional[int] = kwargs.pop(
+            "download_part_size", DEFAULT_DOWNLOAD_PART_SIZE
+        )
+        self._max_download_workers: int = kwargs.pop(
+            "max_download_workers", DEFAULT_MAX_DOWNLOAD_WORKERS
+        )
+        if (
+            self._download_part_size is not None and self._download_part_size < 1
+        ) or self._max_download_workers < 1:
+            raise ge_exceptions.ExecutionEngineError(
+                'Values of "download_part_size" and "max_download_workers" for PandasExecutionEngine must be positive integers.'
+            )
+
+        # Batch data is fingerprinted ("pandas_data_fingerprint" batch marker) by "fingerprint_method" (one of
+        # "FINGERPRINT_METHODS"; None disables fingerprinting).  With "full" method, batch data, which takes more than
+        # "HASH_THRESHOLD" bytes of memory, is not fingerprinted (weaker "sampled" fingerprint, which would identify
+        # persisted metrics of such data, must be chosen explicitly).
+        self._fingerprint_method: Optional[str] = kwargs.pop(
+            "fingerprint_method", "full"
+        )
+        if (
+            self._fingerprint_method is not None
+            and self._fingerprint_method not in FINGERPRINT_METHODS
+        ):
+            raise ge_exceptions.ExecutionEngineError(
+                f'Value of "fingerprint_method" for PandasExecutionEngine must be one of {", ".join(FINGERPRINT_METHODS)} (or None), not "{self._fingerprint_method}".'
+            )
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -133,6 +274,26 @@ Notes:
                 "gcs_options": gcs_options,
             }
         )
+        if self._chunk_size is not None:
+            self._config["chunk_size"] = self._chunk_size
+
+        if self._project_columns:
+            self._config["project_columns"] = self._project_columns
+
+        if self._dtype_backend is not None:
+            self._config["dtype_backend"] = self._dtype_backend
+
+        if self._memory_map:
+            self._config["memory_map"] = self._memory_map
+
+        if self._download_part_size != DEFAULT_DOWNLOAD_PART_SIZE:
+            self._config["download_part_size"] = self._download_part_size
+
+        if self._max_download_workers != DEFAULT_MAX_DOWNLOAD_WORKERS:
+            self._config["max_download_workers"] = self._max_download_workers
+
+        if self._fingerprint_method != "full":
+            self._config["fingerprint_method"] = self._fingerprint_method
 
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
@@ -211,6 +372,8 @@ Notes:
         )
 
         batch_data: Any
+        deferred_batch_data: Optional[PandasLazyBatchData] = None
+        memory_mapped_path: Optional[str] = None
         if isinstance(batch_spec, RuntimeDataBatchSpec):
             # batch_data != None is already checked when RuntimeDataBatchSpec is instantiated
             batch_data = batch_spec.batch_data
@@ -259,9 +422,33 @@ Notes:
                 f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}"
             )
             reader_fn: Callable = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            deferred_batch_data = self._get_deferred_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                reader_options=reader_options,
+                source=lambda: s3_engine.get_object(
+                    Bucket=s3_url.bucket, Key=s3_url.key
+                )["Body"],
+            )
+            if deferred_batch_data is None:
+                source = self._open_object(
+                    reader_fn=reader_fn,
+                    reader_options=reader_options,
+                    size=s3_object.get("ContentLength"),
+                    read_range=lambda start, end: s3_engine.get_object(
+                        Bucket=s3_url.bucket,
+                        Key=s3_url.key,
+                        Range=f"bytes={start}-{end - 1}",
+                    )["Body"].read(),
+                    read_object=s3_object["Body"].read,
+                )
+                s3_object["Body"].close()
+                df = self._read_dataframe(
+                    reader_fn=reader_fn, source=source, reader_options=reader_options
+                )
+            else:
+                # Object is fetched again (and streamed) whenever deferred batch data is read.
+                s3_object["Body"].close()
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -280,14 +467,37 @@ Notes:
             blob_client = azure_engine.get_blob_client(
                 container=azure_url.container, blob=azure_url.blob
             )
-            azure_object = blob_client.download_blob()
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
-            buf = BytesIO(azure_object.readall())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            deferred_batch_data = self._get_deferred_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                reader_options=reader_options,
+                source=lambda: BytesIO(blob_client.download_blob().readall()),
+            )
+            if deferred_batch_data is None:
+                # Azure SDK downloads large blobs in parallel by itself; blob size is only needed to read Parquet files
+                # on demand.
+                source = self._open_object(
+                    reader_fn=reader_fn,
+                    reader_options=reader_options,
+                    size=blob_client.get_blob_properties().size
+                    if self._reads_parquet_on_demand(
+                        reader_fn=reader_fn, reader_options=reader_options
+                    )
+                    else None,
+                    read_range=lambda start, end: blob_client.download_blob(
+                        offset=start, length=end - start
+                    ).readall(),
+                    read_object=lambda: blob_client.download_blob(
+                        max_concurrency=self._max_download_workers
+                    ).readall(),
+                )
+                df = self._read_dataframe(
+                    reader_fn=reader_fn, source=source, reader_options=reader_options
+                )
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -305,6 +515,8 @@ Notes:
             try:
                 gcs_bucket = gcs_engine.get_bucket(gcs_url.bucket)
                 gcs_blob = gcs_bucket.blob(gcs_url.blob)
+                # Fetches metadata (including size) of blob.
+                gcs_blob.reload()
                 logger.debug(
                     f"Fetching GCS blob. Bucket: {gcs_url.bucket} Blob: {gcs_url.blob}"
                 )
@@ -314,16 +526,46 @@ Notes:
 Bucket: {error}"""
                 )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
-            buf = BytesIO(gcs_blob.download_as_bytes())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            deferred_batch_data = self._get_deferred_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                reader_options=reader_options,
+                source=lambda: gcs_blob.open("rb"),
+            )
+            if deferred_batch_data is None:
+                source = self._open_object(
+                    reader_fn=reader_fn,
+                    reader_options=reader_options,
+                    size=gcs_blob.size,
+                    # End offset of GCS range is inclusive.
+                    read_range=lambda start, end: gcs_blob.download_as_bytes(
+                        start=start, end=end - 1
+                    ),
+                    read_object=gcs_blob.download_as_bytes,
+                )
+                df = self._read_dataframe(
+                    reader_fn=reader_fn, source=source, reader_options=reader_options
+                )
 
         elif isinstance(batch_spec, PathBatchSpec):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
             reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            deferred_batch_data = self._get_deferred_batch_data(
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                reader_options=reader_options,
+                source=path,
+            )
+            if deferred_batch_data is None:
+                df = self._read_dataframe(
+                    reader_fn=reader_fn, source=path, reader_options=reader_options
+                )
+                if self._is_memory_mapped(
+                    reader_fn=reader_fn, source=path, reader_options=reader_options
+                ):
+                    memory_mapped_path = path
 
         else:
             raise ge_exceptions.BatchSpecError(
@@ -331,14 +573,411 @@ Bucket: {error}"""
 not {batch_spec.__class__.__name__}"""
             )
 
+        if deferred_batch_data is not None:
+            # Deferred batch data is not fingerprinted upfront (doing so would require reading entire data); chunked batch
+            # data (unless sampled) is fingerprinted during first complete pass over it.
+            if (
+                isinstance(deferred_batch_data, PandasChunkedBatchData)
+                and self._fingerprint_method is not None
+                and not batch_spec.get("sampling_method")
+            ):
+                deferred_batch_data.fingerprint_chunks(
+                    method=self._fingerprint_method,
+                    on_fingerprint=partial(
+                        batch_markers.__setitem__, "pandas_data_fingerprint"
+                    ),
+                )
+
+            return deferred_batch_data, batch_markers
+
         df = self._apply_splitting_and_sampling_methods(batch_spec, df)
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        if memory_mapped_path is not None:
+            # Hashing contents would load every page of memory-mapped file; identity of file is fingerprinted instead.
+            fingerprint: Optional[str] = hash_file_identity(
+                path=memory_mapped_path,
+                batch_spec=batch_spec,
+                dtype_backend=self._dtype_backend,
+            )
+            if fingerprint is not None:
+                batch_markers["pandas_data_fingerprint"] = fingerprint
+        elif self._fingerprint_method is not None:
+            fingerprint = self._fingerprint_dataframe(df=df)
+            if fingerprint is not None:
+                batch_markers["pandas_data_fingerprint"] = fingerprint
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
         return typed_batch_data, batch_markers
 
+    def _fingerprint_dataframe(self, df: pd.DataFrame) -> Optional[str]:
+        if (
+            self._fingerprint_method == "full"
+            and df.memory_usage().sum() >= HASH_THRESHOLD
+        ):
+            return None
+
+        fingerprint = PandasDataFingerprint(method=self._fingerprint_method)
+        fingerprint.update(df)
+        return fingerprint.hexdigest()
+
+    def _open_object(
+        self,
+        reader_fn: Callable,
+        reader_options: dict,
+        size: Optional[int],
+        read_range: Callable[[int, int], bytes],
+        read_object: Callable[[], bytes],
+    ) -> Any:
+        """Returns readable source of object of object store, which is "size" bytes long (None, if unknown).
+
+        Parquet files (read by pyarrow) are read on demand: footer first, and then only column chunks needed.  Other
+        objects, larger than "download_part_size", are downloaded as parts in parallel; smaller ones by "read_object()".
+
+        Args:
+            reader_fn: pandas reader function (possibly, with reader options, guessed from path, bound to it).
+            reader_options: Options of reader function.
+            size: Size of object in bytes (None, if unknown).
+            read_range: Function of start (inclusive) and end (exclusive) offsets, returning bytes of object in between.
+            read_object: Function, returning entire object.
+        """
+        if not isinstance(size, int) or self._download_part_size is None:
+            return BytesIO(read_object())
+
+        object_reader = ObjectRangeReader(
+            read_range=read_range,
+            size=size,
+            part_size=self._download_part_size,
+            max_workers=self._max_download_workers,
+        )
+        if self._reads_parquet_on_demand(
+            reader_fn=reader_fn, reader_options=reader_options
+        ):
+            return object_reader.open()
+
+        if size <= self._download_part_size:
+            return BytesIO(read_object())
+
+        return BytesIO(object_reader.read())
+
+    @staticmethod
+    def _reads_parquet_on_demand(reader_fn: Callable, reader_options: dict) -> bool:
+        return (
+            pq is not None
+            and not isinstance(reader_fn, partial)
+            and reader_fn.__name__ == "read_parquet"
+            and set(reader_options.keys()) <= {"columns"}
+        )
+
+    def _get_deferred_batch_data(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: Callable,
+        reader_options: dict,
+        source: Union[str, Callable[[], Any]],
+    ) -> Optional[PandasLazyBatchData]:
+        """Returns batch data, which is read from its source only when accessed: in chunks, if "chunk_size" is configured
+        (and reader supports it), or at once, restricted to projected columns, if "project_columns" is configured.
+
+        None is returned, if batch data is to be read right away.
+
+        Args:
+            batch_spec: BatchSpec, specifying splitting and sampling of batch data.
+            reader_fn: pandas reader function (possibly, with reader options, guessed from path, bound to it).
+            reader_options: Options of reader function.
+            source: Local path, or function, opening new readable stream of remote object.
+        """
+        chunk_reader: Optional[
+            Callable[[Optional[Set[str]]], Iterator[pd.DataFrame]]
+        ] = self._get_chunk_reader(
+            batch_spec=batch_spec,
+            reader_fn=reader_fn,
+            reader_options=reader_options,
+            source=source,
+        )
+        if chunk_reader is not None:
+            return PandasChunkedBatchData(
+                execution_engine=self, chunk_reader=chunk_reader
+            )
+
+        if not self._project_columns:
+            return None
+
+        reader_method: str = getattr(reader_fn, "func", reader_fn).__name__
+
+        def read_batch(column_names: Optional[Set[str]]) -> pd.DataFrame:
+            projected_reader_options: dict = self._get_projected_reader_options(
+                batch_spec=batch_spec,
+                reader_method=reader_method,
+                reader_options=reader_options,
+                column_names=column_names,
+            )
+            df: pd.DataFrame
+            try:
+                df = self._read_dataframe(
+                    reader_fn=reader_fn,
+                    source=source
+                    if isinstance(source, str)
+                    else BytesIO(source().read()),
+                    reader_options=projected_reader_options,
+                )
+            except (KeyError, ValueError) as e:
+                if projected_reader_options is reader_options:
+                    raise
+
+                # E.g., some of projected columns do not exist in Parquet file (they are reported as missing later).
+                logger.debug(
+                    f"Unable to read projected columns {sorted(column_names)} ({e}); reading all columns instead."
+                )
+                df = self._read_dataframe(
+                    reader_fn=reader_fn,
+                    source=source
+                    if isinstance(source, str)
+                    else BytesIO(source().read()),
+                    reader_options=reader_options,
+                )
+
+            return self._apply_splitting_and_sampling_methods(batch_spec, df)
+
+        return PandasLazyBatchData(execution_engine=self, reader=read_batch)
+
+    def _get_projected_reader_options(
+        self,
+        batch_spec: BatchSpec,
+        reader_method: str,
+        reader_options: dict,
+        column_names: Optional[Set[str]],
+    ) -> dict:
+        """Adds columns, projected onto (together with columns, used for splitting and sampling), to reader options.
+
+        Reader options are returned unchanged, if there is no projection, reader cannot select columns, or columns to
+        read are already specified by reader options.
+        """
+        reader_option: Optional[str] = PROJECTING_READER_OPTIONS.get(reader_method)
+        if column_names is None or reader_option is None:
+            return reader_options
+
+        if reader_options.get(reader_option) is not None:
+            return reader_options
+
+        column_names = column_names | self._get_splitting_and_sampling_column_names(
+            batch_spec=batch_spec
+        )
+        if reader_option == "usecols":
+            # Callable "usecols" ignores projected columns, which do not exist in file.
+            return {
+                **reader_options,
+                "usecols": lambda column_name: column_name in column_names,
+            }
+
+        return {**reader_options, reader_option: sorted(column_names)}
+
+    @staticmethod
+    def _get_splitting_and_sampling_column_names(batch_spec: BatchSpec) -> Set[str]:
+        column_names: Set[str] = set()
+
+        kwargs_key: str
+        for kwargs_key in ("splitter_kwargs", "sampling_kwargs"):
+            kwargs: dict = batch_spec.get(kwargs_key) or {}
+            if kwargs.get("column_name") is not None:
+                column_names.add(kwargs["column_name"])
+
+            column_names.update(kwargs.get("column_names") or [])
+
+        return column_names
+
+    def project_batch_columns(
+        self, batch_id: str, column_names: Optional[Set[str]]
+    ) -> None:
+        """Restricts columns, read for deferred batch data, to given columns, if "project_columns" is configured.
+
+        If data, already read under narrower projection, is discarded, metrics and domain records of batch are
+        invalidated as well.
+        """
+        if not self._project_columns:
+            return
+
+        batch_data: Optional[BatchData] = self.batch_manager.batch_data_cache.get(
+            batch_id
+        )
+        if not isinstance(batch_data, PandasLazyBatchData):
+            return
+
+        if batch_data.project_columns(column_names=column_names):
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+            if self.domain_records_cache is not None:
+                self.domain_records_cache.invalidate_batch(batch_id=batch_id)
+
+    def _get_chunk_reader(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: Callable,
+        reader_options: dict,
+        source: Union[str, Callable[[], Any]],
+    ) -> Optional[Callable[[Optional[Set[str]]], Iterator[pd.DataFrame]]]:
+        """Returns function of names of columns to read (None, if all columns are to be read), reading (splitting and
+        sampling) batch data in chunks of "chunk_size" rows on every call.
+
+        None is returned, if batch data must be read at once: "chunk_size" is not configured, reader is neither
+        "read_csv" nor "read_parquet" (Parquet is only read in chunks from local files, using pyarrow), or batch data is
+        sampled by limit (which applies to batch data as whole).
+
+        Args:
+            batch_spec: BatchSpec, specifying splitting and sampling of batch data.
+            reader_fn: pandas reader function (possibly, with reader options, guessed from path, bound to it).
+            reader_options: Options of reader function.
+            source: Local path, or function, opening new readable stream of remote object.
+        """
+        if (
+            self._chunk_size is None
+            or (batch_spec.get("sampling_method") or "").lstrip("_")
+            == "sample_using_limit"
+        ):
+            return None
+
+        reader_method: str = getattr(reader_fn, "func", reader_fn).__name__
+
+        read_chunks: Callable[[Optional[Set[str]]], Iterator[pd.DataFrame]]
+        if reader_method == "read_csv":
+
+            def read_chunks(column_names: Optional[Set[str]]) -> Iterator[pd.DataFrame]:
+                with reader_fn(
+                    source if isinstance(source, str) else source(),
+                    chunksize=self._chunk_size,
+                    **self._get_projected_reader_options(
+                        batch_spec=batch_spec,
+                        reader_method=reader_method,
+                        reader_options=reader_options,
+                        column_names=column_names,
+                    ),
+                ) as reader:
+                    yield from reader
+
+        elif (
+            reader_method == "read_parquet"
+            and isinstance(source, str)
+            and pq is not None
+            and set(reader_options.keys()) <= {"columns"}
+        ):
+
+            def read_chunks(column_names: Optional[Set[str]]) -> Iterator[pd.DataFrame]:
+                parquet_file = pq.ParquetFile(source, memory_map=self._memory_map)
+                columns: Optional[List[str]] = reader_options.get("columns")
+                if columns is None and column_names is not None:
+                    # Projected columns, which do not exist in file, are ignored (and reported as missing later).
+                    column_names = (
+                        column_names
+                        | self._get_splitting_and_sampling_column_names(
+                            batch_spec=batch_spec
+                        )
+                    )
+                    columns = [
+                        name
+                        for name in parquet_file.schema_arrow.names
+                        if name in column_names
+                    ]
+
+                start: int = 0
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=self._chunk_size, columns=columns
+                ):
+                    chunk: pd.DataFrame = record_batch.to_pandas(
+                        types_mapper=self._get_arrow_types_mapper()
+                    )
+                    # Index of chunk continues index of previous chunk (as if entire file were read at once).
+                    chunk.index = pd.RangeIndex(start=start, stop=start + len(chunk))
+                    start += len(chunk)
+                    yield chunk
+
+        else:
+            return None
+
+        def read_batch_chunks(
+            column_names: Optional[Set[str]],
+        ) -> Iterator[pd.DataFrame]:
+            chunk: pd.DataFrame
+            for chunk in read_chunks(column_names):
+                if reader_method == "read_csv":
+                    chunk = self._convert_to_dtype_backend(df=chunk)
+
+                yield self._apply_splitting_and_sampling_methods(batch_spec, chunk)
+
+        return read_batch_chunks
+
+    def _read_dataframe(
+        self,
+        reader_fn: Callable,
+        source: Any,
+        reader_options: dict,
+    ) -> pd.DataFrame:
+        """Reads DataFrame using pandas reader function, with columns of configured "dtype_backend"."""
+        memory_mapped: bool = self._is_memory_mapped(
+            reader_fn=reader_fn, source=source, reader_options=reader_options
+        )
+        reader_method: str = getattr(reader_fn, "func", reader_fn).__name__
+        if (
+            pa is not None
+            and reader_method in ["read_parquet", "read_feather"]
+            and set(reader_options.keys()) <= {"columns"}
+            and not isinstance(reader_fn, partial)
+        ):
+            # Arrow table is read by pyarrow directly (pandas would read file objects, e.g., of objects in object stores,
+            # read on demand, in their entirety) and converted to DataFrame (with "dtype_backend" of "pyarrow", string
+            # columns are never materialized as Python objects).
+            read_table: Callable = (
+                pq.read_table if reader_method == "read_parquet" else feather.read_table
+            )
+            table: pa.Table = read_table(
+                source, columns=reader_options.get("columns"), memory_map=memory_mapped
+            )
+            # Separate block per column lets columns, which need no conversion, reference buffers of Arrow table.
+            return table.to_pandas(
+                types_mapper=self._get_arrow_types_mapper(), split_blocks=memory_mapped
+            )
+
+        return self._convert_to_dtype_backend(df=reader_fn(source, **reader_options))
+
+    def _is_memory_mapped(
+        self, reader_fn: Callable, source: Any, reader_options: dict
+    ) -> bool:
+        return (
+            self._memory_map
+            and isinstance(source, str)
+            and not isinstance(reader_fn, partial)
+            and reader_fn.__name__ in ["read_parquet", "read_feather"]
+            and set(reader_options.keys()) <= {"columns"}
+        )
+
+    def _get_arrow_types_mapper(self) -> Optional[Callable]:
+        if self._dtype_backend != "pyarrow":
+            return None
+
+        return pd.ArrowDtype
+
+    def _convert_to_dtype_backend(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Converts columns of DataFrame to "pd.ArrowDtype", if "dtype_backend" is "pyarrow" (columns, which Arrow cannot
+        represent, e.g., of mixed Python objects, are left unchanged)."""
+        if self._dtype_backend != "pyarrow" or df.shape[1] == 0:
+            return df
+
+        columns: List[pd.Series] = []
+
+        column: pd.Series
+        for _, column in df.items():
+            try:
+                columns.append(
+                    pd.Series(
+                        pd.arrays.ArrowExtensionArray(
+                            pa.chunked_array([pa.array(column, from_pandas=True)])
+                        ),
+                        index=df.index,
+                        name=column.name,
+                    )
+                )
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                columns.append(column)
+
+        return pd.concat(columns, axis=1)
+
     def _apply_splitting_and_sampling_methods(self, batch_spec, batch_data):
         splitter_method_name: Optional[str] = batch_spec.get("splitter_method")
         if splitter_method_name:
@@ -394,7 +1033,12 @@ not {batch_spec.__class__.__name__}"""
             return {"reader_method": "read_json"}
         elif path.endswith(".pkl"):
             return {"reader_method": "read_pickle"}
-        elif path.endswith(".feather"):
+        elif (
+            path.endswith(".feather")
+            or path.endswith(".arrow")
+            or path.endswith(".ipc")
+        ):
+            # Feather (version 2) files are Arrow IPC files.
             return {"reader_method": "read_feather"}
         elif path.endswith(".csv.gz") or path.endswith(".tsv.gz"):
             return {
@@ -444,13 +1088,476 @@ not {batch_spec.__class__.__name__}"""
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
-    def resolve_metric_bundle(  # type: ignore[empty-body]
-        self, metric_fn_bundle
-    ) -> Dict[Tuple[str, str, str], Any]:
-        """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
-        pass  # This method is NO-OP for PandasExecutionEngine (no bundling for direct execution computational backend).
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Metrics of "PandasChunkedBatchData" are resolved chunk by chunk (see "_resolve_chunked_metrics()"); other
+        metrics are resolved as usual.
+
+        If "dtype_backend" is "pyarrow", only metrics, whose providers support Arrow-backed columns (see
+        "MetricProvider.supports_arrow_backed_columns"), are computed on Arrow-backed domain records; other metrics are
+        computed on NumPy-backed copies of them (see "get_domain_records()"), so that their values equal values of same
+        metrics of NumPy-backed batch data.
+        """
+        if self._dtype_backend != "pyarrow":
+            return self._resolve_metrics(
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        arrow_backed_metrics: List[MetricConfiguration] = []
+        numpy_backed_metrics: List[MetricConfiguration] = []
 
-    def get_domain_records(  # noqa: C901 - 17
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            metric_class, _ = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            if getattr(metric_class, "supports_arrow_backed_columns", False):
+                arrow_backed_metrics.append(metric_to_resolve)
+            else:
+                numpy_backed_metrics.append(metric_to_resolve)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if numpy_backed_metrics or not arrow_backed_metrics:
+            resolved_metrics.update(
+                self._resolve_metrics(
+                    metrics_to_resolve=numpy_backed_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if arrow_backed_metrics:
+            token = _arrow_backed_domain_records.set(True)
+            try:
+                resolved_metrics.update(
+                    self._resolve_metrics(
+                        metrics_to_resolve=arrow_backed_metrics,
+                        metrics=metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+            finally:
+                _arrow_backed_domain_records.reset(token)
+
+        return resolved_metrics
+
+    def _resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        if metrics is None:
+            metrics = {}
+
+        metrics_by_chunked_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        other_metrics: List[MetricConfiguration] = []
+
+        metric_to_resolve: MetricConfiguration
+        batch_id: Optional[str]
+        for metric_to_resolve in metrics_to_resolve:
+            batch_id = metric_to_resolve.metric_domain_kwargs.get("batch_id")
+            if batch_id is None:
+                batch_id = self.batch_manager.active_batch_data_id
+
+            if isinstance(
+                self.batch_manager.batch_data_cache.get(batch_id),
+                PandasChunkedBatchData,
+            ):
+                metrics_by_chunked_batch_id.setdefault(batch_id, []).append(
+                    metric_to_resolve
+                )
+            else:
+                other_metrics.append(metric_to_resolve)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if other_metrics or not metrics_by_chunked_batch_id:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=other_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        batch_metrics: List[MetricConfiguration]
+        for batch_id, batch_metrics in metrics_by_chunked_batch_id.items():
+            resolved_metrics.update(
+                self._resolve_chunked_metrics(
+                    batch_id=batch_id,
+                    metrics_to_resolve=batch_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _resolve_chunked_metrics(  # noqa: C901 - 16
+        self,
+        batch_id: str,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics of "PandasChunkedBatchData" in single pass over its chunks.
+
+        Map series and map condition series (e.g., boolean Series of unexpected values) only exist for one chunk at a
+        time; their value is "ChunkLocalMetricValue" placeholder, and they are computed again for every chunk, whenever
+        metrics depending on them are resolved (map metrics, comparing rows with each other, such as uniqueness of
+        column values, materialize batch data, so that their single chunk is entire batch).  Metrics, computed from their dependencies only, are resolved as usual.
+        Other metrics are resolved on every chunk and merged (see "ChunkedMetricMerge"); if any metric cannot be merged,
+        batch data is materialized (all further passes consist of that single chunk).
+        """
+        batch_data: PandasChunkedBatchData = cast(
+            PandasChunkedBatchData, self.batch_manager.batch_data_cache[batch_id]
+        )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        # Values of dependencies (including those only present in metric cache), available on every chunk.
+        dependency_values: Dict[Tuple[str, str, str], MetricValue] = dict(metrics)
+
+        dependency_only_metrics: List[MetricConfiguration] = []
+        chunked_metrics: List[MetricConfiguration] = []
+        merges: Dict[Tuple[str, str, str], Optional[ChunkedMetricMerge]] = {}
+
+        metric_to_resolve: MetricConfiguration
+        metric_fn: Any
+        metric_fn_type: Any
+        for metric_to_resolve in metrics_to_resolve:
+            if self._caching and self._metric_cache.contains_persisted(
+                metric_id=metric_to_resolve.id, batch_id=batch_id
+            ):
+                resolved_metrics[metric_to_resolve.id] = self._metric_cache[
+                    metric_to_resolve.id
+                ]
+                continue
+
+            _, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            metric_fn_type = getattr(metric_fn, "metric_fn_type", None)
+            if metric_fn_type in [
+                MetricPartialFunctionTypes.MAP_SERIES,
+                MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+            ]:
+                # Rows of different chunks cannot be compared with each other; hence, batch data is materialized.
+                if not batch_data.is_materialized and is_cross_row_map_metric(
+                    metric_name=metric_to_resolve.metric_name
+                ):
+                    _ = batch_data.dataframe
+
+                resolved_metrics[metric_to_resolve.id] = ChunkLocalMetricValue(
+                    metric_id=metric_to_resolve.id
+                )
+            elif (
+                metric_fn_type == MetricPartialFunctionTypes.AGGREGATE_FN
+                or metric_to_resolve.metric_name in DEPENDENCY_ONLY_METRIC_NAMES
+            ) and not self._get_chunk_local_dependencies(
+                metrics_to_resolve=[metric_to_resolve],
+                dependency_values=dependency_values,
+            ):
+                dependency_only_metrics.append(metric_to_resolve)
+            else:
+                chunked_metrics.append(metric_to_resolve)
+                merges[metric_to_resolve.id] = get_chunked_metric_merge(
+                    metric_name=metric_to_resolve.metric_name
+                )
+
+        if dependency_only_metrics:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=dependency_only_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if not chunked_metrics:
+            return resolved_metrics
+
+        if not batch_data.is_materialized and any(
+            merge is None for merge in merges.values()
+        ):
+            _ = batch_data.dataframe
+
+        metrics_resolved_on_chunks: List[MetricConfiguration] = [
+            metric_to_resolve
+            for metric_to_resolve in chunked_metrics
+            if merges[metric_to_resolve.id] is None
+            or not merges[metric_to_resolve.id].computes_chunk_state
+        ]
+        chunk_local_dependencies: List[
+            MetricConfiguration
+        ] = self._get_chunk_local_dependencies(
+            metrics_to_resolve=metrics_resolved_on_chunks,
+            dependency_values=dependency_values,
+        )
+
+        accumulated_values: Dict[Tuple[str, str, str], Any] = {}
+
+        merge: Optional[ChunkedMetricMerge]
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue]
+        state: Any
+        number_of_chunks: int = 0
+        chunk: pd.DataFrame
+        for chunk in batch_data.iter_chunks():
+            number_of_chunks += 1
+            with batch_data.bind_chunk(chunk):
+                self._invalidate_chunk_domain_records(
+                    batch_data=batch_data, batch_id=batch_id
+                )
+                chunk_metrics = self._resolve_metrics_on_chunk(
+                    metrics_to_resolve=chunk_local_dependencies
+                    + metrics_resolved_on_chunks,
+                    metrics=dependency_values,
+                    runtime_configuration=runtime_configuration,
+                )
+                for metric_to_resolve in chunked_metrics:
+                    merge = merges[metric_to_resolve.id]
+                    try:
+                        if merge is not None and merge.computes_chunk_state:
+                            state = merge.get_chunk_state(
+                                execution_engine=self,
+                                metric_configuration=metric_to_resolve,
+                            )
+                        else:
+                            state = chunk_metrics[metric_to_resolve.id]
+
+                        if merge is not None and (
+                            metric_to_resolve.id in accumulated_values
+                        ):
+                            state = merge.merge(
+                                accumulated=accumulated_values[metric_to_resolve.id],
+                                state=state,
+                                metric_value_kwargs=metric_to_resolve.metric_value_kwargs,
+                            )
+                    except Exception as e:
+                        raise ge_exceptions.MetricResolutionError(
+                            message=str(e),
+                            failed_metrics=(metric_to_resolve,),
+                        ) from e
+
+                    accumulated_values[metric_to_resolve.id] = state
+
+        self._invalidate_chunk_domain_records(batch_data=batch_data, batch_id=batch_id)
+
+        logger.debug(
+            f"PandasExecutionEngine resolved {len(chunked_metrics)} metrics in {number_of_chunks} chunks of batch_id {batch_id}"
+        )
+
+        for metric_to_resolve in chunked_metrics:
+            merge = merges[metric_to_resolve.id]
+            try:
+                resolved_metrics[metric_to_resolve.id] = (
+                    accumulated_values[metric_to_resolve.id]
+                    if merge is None
+                    else merge.finalize(
+                        accumulated=accumulated_values[metric_to_resolve.id],
+                        metric_value_kwargs=metric_to_resolve.metric_value_kwargs,
+                    )
+                )
+            except Exception as e:
+                raise ge_exceptions.MetricResolutionError(
+                    message=str(e),
+                    failed_metrics=(metric_to_resolve,),
+                ) from e
+
+            if self._caching:
+                self._metric_cache.put(
+                    metric_id=metric_to_resolve.id,
+                    value=resolved_metrics[metric_to_resolve.id],
+                    batch_id=batch_id,
+                )
+
+        return resolved_metrics
+
+    def _get_chunk_local_dependencies(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        dependency_values: Dict[Tuple[str, str, str], MetricValue],
+    ) -> List[MetricConfiguration]:
+        """Returns (transitive) dependencies of metrics, whose values are "ChunkLocalMetricValue" placeholders, ordered
+        so that every dependency precedes metrics depending on it.  Values of other dependencies, which are only found in
+        metric cache, are added to "dependency_values".
+        """
+        chunk_local_dependencies: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        visited: Set[Tuple[str, str, str]] = set()
+
+        def _collect(metric_configuration: MetricConfiguration) -> None:
+            dependency: MetricConfiguration
+            for dependency in metric_configuration.metric_dependencies.values():
+                if dependency.id in visited:
+                    continue
+
+                visited.add(dependency.id)
+                if (
+                    dependency.id not in dependency_values
+                    and self._caching
+                    and dependency.id in self._metric_cache
+                ):
+                    dependency_values[dependency.id] = self._metric_cache[dependency.id]
+
+                if isinstance(
+                    dependency_values.get(dependency.id), ChunkLocalMetricValue
+                ):
+                    _collect(metric_configuration=dependency)
+                    chunk_local_dependencies[dependency.id] = dependency
+
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve:
+            _collect(metric_configuration=metric_to_resolve)
+
+        return list(chunk_local_dependencies.values())
+
+    def _resolve_metrics_on_chunk(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics (in order of their dependencies) on chunk, which is bound to batch data; values, computed on
+        single chunk, are neither taken from, nor stored in metric cache."""
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue] = dict(metrics)
+
+        pending_metrics: Dict[Tuple[str, str, str], MetricConfiguration] = {
+            metric_to_resolve.id: metric_to_resolve
+            for metric_to_resolve in metrics_to_resolve
+        }
+        ready_metrics: List[MetricConfiguration]
+        caching: bool = self._caching
+        self._caching = False
+        try:
+            while pending_metrics:
+                ready_metrics = [
+                    metric_to_resolve
+                    for metric_to_resolve in pending_metrics.values()
+                    if not any(
+                        dependency.id in pending_metrics
+                        for dependency in metric_to_resolve.metric_dependencies.values()
+                    )
+                ]
+                chunk_metrics.update(
+                    super().resolve_metrics(
+                        metrics_to_resolve=ready_metrics,
+                        metrics=chunk_metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+                for metric_to_resolve in ready_metrics:
+                    del pending_metrics[metric_to_resolve.id]
+        finally:
+            self._caching = caching
+
+        return chunk_metrics
+
+    def _invalidate_chunk_domain_records(
+        self, batch_data: PandasChunkedBatchData, batch_id: str
+    ) -> None:
+        """Domain records, filtered from chunk, are not valid for any other chunk."""
+        if not batch_data.is_materialized and self.domain_records_cache is not None:
+            self.domain_records_cache.invalidate_batch(batch_id=batch_id)
+
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[BundledMetricConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """For every metric in a set of Metrics to resolve, groups column aggregates by their compute domain, so that
+        records of each domain are obtained (e.g., filtered by "row_condition") only once and every column is accessed
+        only once for all aggregates computed on it.
+
+            Args:
+                metric_fn_bundle (Iterable[BundledMetricConfiguration]): \
+                    "BundledMetricConfiguration" contains MetricProvider's MetricConfiguration (its unique identifier),
+                    its metric provider function (the function that actually executes the metric), and arguments to pass
+                    to metric provider function (dictionary of metrics defined in registry and corresponding arguments).
+
+            Returns:
+                A dictionary of "MetricConfiguration" IDs and their corresponding fully resolved values for domains.
+
+            Raises:
+                MetricResolutionError: Listing only those bundled metrics, whose aggregate functions failed.
+        """
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        aggregates: Dict[Tuple[str, str, str], dict] = {}
+
+        aggregate: dict
+
+        domain_id: Tuple[str, str, str]
+
+        bundled_metric_configuration: BundledMetricConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            compute_domain_kwargs: dict = (
+                bundled_metric_configuration.compute_domain_kwargs
+            )
+            if not isinstance(compute_domain_kwargs, IDDict):
+                compute_domain_kwargs = IDDict(compute_domain_kwargs)
+
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in aggregates:
+                aggregates[domain_id] = {
+                    "column_aggregates": [],
+                    "domain_kwargs": compute_domain_kwargs,
+                }
+
+            aggregates[domain_id]["column_aggregates"].append(
+                bundled_metric_configuration
+            )
+
+        failed_metrics: List[MetricConfiguration] = []
+        failure_messages: List[str] = []
+        first_exception: Optional[Exception] = None
+
+        for domain_id, aggregate in aggregates.items():
+            df: pd.DataFrame = self.get_domain_records(
+                domain_kwargs=aggregate["domain_kwargs"]
+            )
+
+            columns: Dict[str, pd.Series] = {}
+
+            column_name: str
+            for bundled_metric_configuration in aggregate["column_aggregates"]:
+                metric_to_resolve: MetricConfiguration = (
+                    bundled_metric_configuration.metric_configuration
+                )
+                column_name = bundled_metric_configuration.accessor_domain_kwargs[
+                    "column"
+                ]
+                try:
+                    if column_name not in columns:
+                        columns[column_name] = df[column_name]
+
+                    resolved_metrics[
+                        metric_to_resolve.id
+                    ] = bundled_metric_configuration.metric_fn(columns[column_name])
+                except Exception as e:
+                    # Failure of one aggregate must not fail other metrics of bundle (they are computed independently).
+                    failed_metrics.append(metric_to_resolve)
+                    failure_messages.append(str(e))
+                    if first_exception is None:
+                        first_exception = e
+
+            logger.debug(
+                f"PandasExecutionEngine computed {len(aggregate['column_aggregates'])} metrics on domain_id {domain_id}"
+            )
+
+        if failed_metrics:
+            raise ge_exceptions.MetricResolutionError(
+                message="\n".join(failure_messages),
+                failed_metrics=failed_metrics,
+            ) from first_exception
+
+        return resolved_metrics
+
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
@@ -458,6 +1565,9 @@ not {batch_spec.__class__.__name__}"""
         Uses the given domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to
         obtain and/or query a batch. Returns in the format of a Pandas DataFrame.
 
+        Filtered records are cached per batch (see "DomainRecordsCache"), so that metrics sharing the same filtering
+        directives do not filter the batch again.
+
         Args:
             domain_kwargs (dict) - A dictionary consisting of the domain kwargs specifying which data to obtain
 
@@ -471,26 +1581,60 @@ not {batch_spec.__class__.__name__}"""
             )
 
         batch_id = domain_kwargs.get("batch_id")
+        batch_data: PandasBatchData
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
-                data = cast(
-                    PandasBatchData, self.batch_manager.active_batch_data
-                ).dataframe
+                batch_data = cast(PandasBatchData, self.batch_manager.active_batch_data)
             else:
                 raise ge_exceptions.ValidationError(
                     "No batch is specified, but could not identify a loaded batch."
                 )
         else:
             if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
+                batch_data = cast(
                     PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
+                )
             else:
                 raise ge_exceptions.ValidationError(
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        domain_records_id: Optional[str] = get_domain_records_id(
+            domain_kwargs=domain_kwargs
+        )
+        if self._dtype_backend == "pyarrow" and not (
+            domain_records_id is None and _arrow_backed_domain_records.get()
+        ):
+            # Arrow-backed columns are only passed (unfiltered) to metrics, which support them; filtered (and cached)
+            # domain records are always NumPy-backed.
+            data = batch_data.numpy_backed_dataframe
+        else:
+            data = batch_data.dataframe
+        if domain_records_id is None or self.domain_records_cache is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        if batch_id is None:
+            batch_id = self.batch_manager.active_batch_data_id
+
+        records: Optional[pd.DataFrame] = self.domain_records_cache.get(
+            batch_id=batch_id, domain_records_id=domain_records_id
+        )
+        if records is None:
+            records = self._filter_domain_records(
+                data=data, domain_kwargs=domain_kwargs
+            )
+            self.domain_records_cache.put(
+                batch_id=batch_id, domain_records_id=domain_records_id, records=records
+            )
+
+        return records
+
+    @staticmethod
+    def _filter_domain_records(  # noqa: C901 - 14
+        data: pd.DataFrame, domain_kwargs: dict
+    ) -> pd.DataFrame:
+        """Applies row_condition and ignore_row_if directives of domain kwargs to batch data."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -618,11 +1762,33 @@ Please use "neither" instead.
         return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
 
 
-def hash_pandas_dataframe(df):
-    try:
-        obj = pd.util.hash_pandas_object(df, index=True).values
-    except TypeError:
-        # In case of facing unhashable objects (like dict), use pickle
-        obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+def hash_file_identity(
+    path: str, batch_spec: BatchSpec, dtype_backend: Optional[str] = None
+) -> Optional[str]:
+    """Fingerprints local file by its path, size, and modification time (together with reader method and options, column
+    "dtype_backend", and splitting of batch data), without reading its contents.  None is returned for sampled batch data
+    (samples may differ between reads of same file).
+    """
+    if batch_spec.get("sampling_method"):
+        return None
+
+    stat: os.stat_result = os.stat(path)
+    file_identity: dict = {
+        "path": os.path.realpath(path),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "reader_method": batch_spec.get("reader_method"),
+        "reader_options": batch_spec.get("reader_options"),
+        "dtype_backend": dtype_backend,
+        "splitter_method": batch_spec.get("splitter_method"),
+        "splitter_kwargs": batch_spec.get("splitter_kwargs"),
+    }
+    return hashlib.md5(
+        json.dumps(file_identity, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
 
-    return hashlib.md5(obj).hexdigest()
+
+def hash_pandas_dataframe(df):
+    fingerprint = PandasDataFingerprint(method="full")
+    fingerprint.update(df)
+    return fingerprint.hexdigest()
@@ -9,6 +9,7 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union,
 
 from dateutil.parser import parse
 
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
@@ -24,6 +25,7 @@ from great_expectations.core.util import (
     convert_to_json_serializable,
     get_or_create_spark_application,
 )
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import (
     BatchSpecError,
     ExecutionEngineError,
@@ -35,6 +37,9 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.bundled_metric_configuration import (
     BundledMetricConfiguration,
 )
+from great_expectations.execution_engine.domain_records_cache import (
+    get_domain_records_id,
+)
 from great_expectations.execution_engine.execution_engine import SplitDomainKwargs
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
 from great_expectations.execution_engine.split_and_sample.sparkdf_data_sampler import (
@@ -172,11 +177,23 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=False,
+        concurrency: Optional[ConcurrencyConfig] = None,
+        persist_domain_records: bool = False,
         **kwargs,
     ) -> None:
         # Creation of the Spark DataFrame is done outside this class
         self._persist = persist
 
+        # If enabled, domain records (e.g., rows satisfying "row_condition") are persisted once filtered, and unpersisted
+        # when validation run finishes (or when they are evicted from "DomainRecordsCache").
+        self._persist_domain_records = persist_domain_records
+
+        # If concurrency is enabled, aggregations of different compute domains are submitted as concurrent Spark jobs.
+        if concurrency is None:
+            concurrency = ConcurrencyConfig()
+
+        self._concurrency = concurrency
+
         if spark_config is None:
             spark_config = {}
 
@@ -199,6 +216,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._config.update(
             {
                 "persist": self._persist,
+                "persist_domain_records": self._persist_domain_records,
                 "spark_config": spark_config,
                 "azure_options": azure_options,
             }
@@ -435,7 +453,7 @@ illegal.  Please check your config."""
                 f"Unable to find reader_method {reader_method} in spark.",
             )
 
-    def get_domain_records(  # noqa: C901 - 18
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> DataFrame:
@@ -443,6 +461,9 @@ illegal.  Please check your config."""
         Uses the given domain kwargs (which include row_condition, condition_parser, and ignore_row_if directives) to
         obtain and/or query a batch. Returns in the format of a Spark DataFrame.
 
+        Filtered records are cached per batch (see "DomainRecordsCache"); if "persist_domain_records" is enabled, they are
+        also persisted, so that metrics sharing the same filtering directives do not filter the batch again.
+
         Args:
             domain_kwargs (dict) - A dictionary consisting of the domain kwargs specifying which data to obtain
 
@@ -474,6 +495,45 @@ illegal.  Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
+        domain_records_id: Optional[str] = get_domain_records_id(
+            domain_kwargs=domain_kwargs
+        )
+        if domain_records_id is None or self.domain_records_cache is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        if batch_id is None:
+            batch_id = self.batch_manager.active_batch_data_id
+
+        records: Optional[DataFrame] = self.domain_records_cache.get(
+            batch_id=batch_id, domain_records_id=domain_records_id
+        )
+        if records is None:
+            records = self._filter_domain_records(
+                data=data, domain_kwargs=domain_kwargs
+            )
+            release: Optional[Callable[[], Any]] = None
+            if self._persist_domain_records:
+                records.persist()
+                release = records.unpersist
+
+            self.domain_records_cache.put(
+                batch_id=batch_id,
+                domain_records_id=domain_records_id,
+                records=records,
+                release=release,
+            )
+
+        return records
+
+    def release_domain_records(self) -> None:
+        """Unpersists domain records, persisted during validation run (if "persist_domain_records" is enabled)."""
+        if self._persist_domain_records and self.domain_records_cache is not None:
+            self.domain_records_cache.clear()
+
+    def _filter_domain_records(  # noqa: C901 - 15
+        self, data: DataFrame, domain_kwargs: dict
+    ) -> DataFrame:
+        """Applies row_condition, filter_conditions, and ignore_row_if directives of domain kwargs to batch data."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -716,13 +776,28 @@ illegal.  Please check your config."""
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
-        for aggregate in aggregates.values():
-            domain_kwargs: dict = aggregate["domain_kwargs"]
-            df: DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+        # Aggregations of different compute domains are independent; if concurrency is enabled, they are submitted to
+        # Spark scheduler as concurrent jobs.  Results are always collected in the order, in which domains were encountered.
+        with AsyncExecutor(
+            concurrency_config=self._concurrency, max_workers=len(aggregates)
+        ) as async_executor:
+            async_results: Dict[Tuple[str, str, str], AsyncResult] = {}
+            for domain_id, aggregate in aggregates.items():
+                df: DataFrame = self.get_domain_records(
+                    domain_kwargs=aggregate["domain_kwargs"]
+                )
 
-            assert len(aggregate["column_aggregates"]) == len(aggregate["metric_ids"])
+                assert len(aggregate["column_aggregates"]) == len(
+                    aggregate["metric_ids"]
+                )
 
-            res = df.agg(*aggregate["column_aggregates"]).collect()
+                async_results[domain_id] = async_executor.submit(
+                    df.agg(*aggregate["column_aggregates"]).collect
+                )
+
+        for domain_id, aggregate in aggregates.items():
+            domain_kwargs: dict = aggregate["domain_kwargs"]
+            res = async_results[domain_id].result()
 
             logger.debug(
                 f"SparkDFExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
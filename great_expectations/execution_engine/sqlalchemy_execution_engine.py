@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 import datetime
 import hashlib
+import json
 import logging
 import math
 import os
@@ -11,6 +12,7 @@ import re
 import string
 import traceback
 import warnings
+from functools import partial
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -30,10 +32,18 @@ from great_expectations._version import get_versions  # isort:skip
 
 __version__ = get_versions()["version"]  # isort:skip
 
+from great_expectations.core.sqlalchemy_engine_registry import (
+    get_shared_sqlalchemy_engine,
+    is_shared_sqlalchemy_engine,
+)
 from great_expectations.core.usage_statistics.events import UsageStatsEvents
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine.bundled_metric_configuration import (
     BundledMetricConfiguration,
+    BundledWindowConditionCount,
+)
+from great_expectations.execution_engine.domain_records_cache import (
+    get_domain_records_id,
 )
 from great_expectations.execution_engine.split_and_sample.sqlalchemy_data_sampler import (
     SqlAlchemyDataSampler,
@@ -41,12 +51,22 @@ from great_expectations.execution_engine.split_and_sample.sqlalchemy_data_sample
 from great_expectations.execution_engine.split_and_sample.sqlalchemy_data_splitter import (
     SqlAlchemyDataSplitter,
 )
+from great_expectations.execution_engine.sqlalchemy_query_plan import (
+    QueryCostGuard,
+    QueryPlanEstimate,
+    explain_query,
+)
+from great_expectations.execution_engine.sqlalchemy_schema_cache import (
+    DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+    SchemaCache,
+)
 from great_expectations.validator.computed_metric import MetricValue
 
 del get_versions  # isort:skip
 
 
 from great_expectations.core import IDDict
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
@@ -59,6 +79,7 @@ from great_expectations.exceptions import (
     GreatExpectationsError,
     InvalidBatchSpecError,
     InvalidConfigError,
+    QueryCostBudgetExceededError,
 )
 from great_expectations.exceptions import exceptions as ge_exceptions
 from great_expectations.execution_engine import ExecutionEngine
@@ -264,6 +285,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        metric_cache: Optional[dict] = None,
+        fuse_batch_metric_bundles: bool = False,
+        schema_cache_ttl: Optional[float] = DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+        query_cost_guard: Optional[dict] = None,
+        share_engine: bool = True,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -290,17 +316,54 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
-                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.  When \
+                    enabled, bundled metric queries of different compute domains are executed concurrently, each on
+                    its own pooled connection (the data context concurrency config is used if none is provided).
+                metric_cache (dict): \
+                    Class config of "MetricCache" used to cache resolved metrics (e.g., to bound its size).
+                fuse_batch_metric_bundles (bool): \
+                    If True, bundled metrics of several Batch objects, split from same table by same splitter, are
+                    computed in single "GROUP BY" query (one table scan), instead of one query per Batch (only Batch
+                    objects, whose compiled metric expressions are identical, are fused; disabled by default).
+                schema_cache_ttl (float): \
+                    Time (in seconds), for which column metadata of tables (reflected from database catalog) are reused
+                    by all Batch objects (and Validator objects) of this execution engine; if None (or 0), catalog is
+                    queried for every Batch.
+                query_cost_guard (dict): \
+                    Keyword arguments of "QueryCostGuard" (budgets for estimated rows, estimated cost, and full table
+                    scans of queries, and action taken when budget is exceeded); if given, bundled metric queries and
+                    queries of unexpected values are checked using "EXPLAIN", before they are issued.
+                share_engine (bool): \
+                    If True, SQLAlchemy Engine (and its pool of connections), built from credentials, connection string,
+                    or url, is shared by all execution engines, Datasources, and stores of this process, which connect
+                    to same database with same engine options (e.g., "pool_size", "pool_pre_ping", "pool_recycle").
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name, batch_data_dict=batch_data_dict, metric_cache=metric_cache
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._fuse_batch_metric_bundles = fuse_batch_metric_bundles
+        self._schema_cache = SchemaCache(ttl_seconds=schema_cache_ttl)
+        self._query_cost_guard: Optional[QueryCostGuard] = (
+            QueryCostGuard(**query_cost_guard) if query_cost_guard else None
+        )
+        self._query_plan_estimates: List[QueryPlanEstimate] = []
+        self._share_engine = share_engine
         os.environ["SF_PARTNER"] = "great_expectations_oss"
 
+        if concurrency is None:
+            if data_context is None or data_context.concurrency is None:
+                concurrency = ConcurrencyConfig()
+            else:
+                concurrency = data_context.concurrency
+
+        self._concurrency = concurrency
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -309,21 +372,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
-            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)  # type: ignore[union-attr]
+            concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             if credentials is not None:
                 self.engine = self._build_engine(credentials=credentials, **kwargs)
             elif connection_string is not None:
-                self.engine = sa.create_engine(connection_string, **kwargs)
+                self.engine = self._create_engine(connection_string, **kwargs)
             elif url is not None:
                 parsed_url = make_url(url)
                 self.drivername = parsed_url.drivername
-                self.engine = sa.create_engine(url, **kwargs)
+                self.engine = self._create_engine(url, **kwargs)
             else:
                 raise InvalidConfigError(
                     "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -426,12 +484,24 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache": metric_cache,
+            "query_cost_guard": query_cost_guard,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
+        if fuse_batch_metric_bundles:
+            self._config["fuse_batch_metric_bundles"] = fuse_batch_metric_bundles
+
+        if not share_engine:
+            self._config["share_engine"] = share_engine
+
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+        # Set after filtering, since None (i.e., disabled schema cache) differs from default and must be retained.
+        if schema_cache_ttl != DEFAULT_SCHEMA_CACHE_TTL_SECONDS:
+            self._config["schema_cache_ttl"] = schema_cache_ttl
+
         self._data_splitter = SqlAlchemyDataSplitter(dialect=self.dialect_name)
         self._data_sampler = SqlAlchemyDataSampler()
 
@@ -439,6 +509,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def credentials(self) -> Optional[dict]:
         return self._credentials
 
+    @property
+    def schema_cache(self) -> SchemaCache:
+        """Cache of column metadata of tables, shared by all Batch objects of this execution engine (use its
+        "invalidate()" method, after schema of table is changed)."""
+        return self._schema_cache
+
+    @property
+    def query_plan_estimates(self) -> List[QueryPlanEstimate]:
+        """Estimates of all queries, checked by query cost guard of this execution engine (in order of checking)."""
+        return self._query_plan_estimates
+
     @property
     def connection_string(self) -> Optional[str]:
         return self._connection_string
@@ -487,9 +568,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             options = get_sqlalchemy_url(drivername, **credentials)
 
         self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = self._create_engine(options, **create_engine_kwargs)
         return engine
 
+    def _create_engine(self, url: Any, **kwargs) -> "sa.engine.Engine":
+        """Creates SQLAlchemy Engine for given URL (or returns shared Engine, if engines are shared)."""
+        if self._share_engine:
+            return get_shared_sqlalchemy_engine(url, **kwargs)
+
+        return sa.create_engine(url, **kwargs)
+
     @staticmethod
     def _get_sqlalchemy_key_pair_auth_url(
         drivername: str,
@@ -950,6 +1038,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # We need a different query for each domain (where clause).
         queries: Dict[Tuple[str, str, str], dict] = {}
 
+        # Unexpected counts of window conditions are computed by separate query for each domain (of their records).
+        window_condition_queries: Dict[Tuple[str, str, str], dict] = {}
+
         query: dict
 
         domain_id: Tuple[str, str, str]
@@ -960,6 +1051,24 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 bundled_metric_configuration.metric_configuration
             )
             metric_fn: Any = bundled_metric_configuration.metric_fn
+            if isinstance(metric_fn, BundledWindowConditionCount):
+                window_condition_domain_kwargs = IDDict(metric_fn.domain_kwargs)
+                domain_id = window_condition_domain_kwargs.to_id()
+                if domain_id not in window_condition_queries:
+                    window_condition_queries[domain_id] = {
+                        "select": [],
+                        "metric_ids": [],
+                        "domain_kwargs": window_condition_domain_kwargs,
+                    }
+
+                window_condition_queries[domain_id]["select"].append(
+                    metric_fn.condition
+                )
+                window_condition_queries[domain_id]["metric_ids"].append(
+                    metric_to_resolve.id
+                )
+                continue
+
             compute_domain_kwargs: dict = (
                 bundled_metric_configuration.compute_domain_kwargs
             )
@@ -989,46 +1098,70 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
             queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
-        for query in queries.values():
-            domain_kwargs: dict = query["domain_kwargs"]
-            selectable: Selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs
+        # Same metrics of Batch objects, split from same table by same splitter, are computed in single "GROUP BY" query.
+        # Fused queries cannot be sampled; if query cost guard samples queries, which exceed budget, metrics of every
+        # Batch are computed by its own query instead.
+        res_by_domain_id: Dict[Tuple[str, str, str], List[Row]] = {}
+        if self._fuse_batch_metric_bundles and not (
+            self._query_cost_guard is not None
+            and self._query_cost_guard.on_exceed == "sample"
+        ):
+            res_by_domain_id = self._resolve_splitter_batch_metric_bundles(
+                queries=queries
             )
 
-            assert len(query["select"]) == len(query["metric_ids"])
-
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
-                if TextClause and isinstance(selectable, TextClause):
-                    sa_query_object = sa.select(query["select"]).select_from(
-                        selectable.columns().subquery()
-                    )
-                elif (Select and isinstance(selectable, Select)) or (
-                    TextualSelect and isinstance(selectable, TextualSelect)
-                ):
-                    sa_query_object = sa.select(query["select"]).select_from(
-                        selectable.subquery()
-                    )
-                else:
-                    sa_query_object = sa.select(query["select"]).select_from(selectable)
+        # All queries are checked by query cost guard (if any), before any of them is issued.
+        sa_query_objects: Dict[
+            Tuple[str, str, str], Select
+        ] = self._guard_metric_bundle_query_costs(
+            queries={
+                domain_id: query
+                for domain_id, query in queries.items()
+                if domain_id not in res_by_domain_id
+            },
+            build_query=self._build_metric_bundle_query,
+        )
 
-                logger.debug(f"Attempting query {str(sa_query_object)}")
-                res = self.engine.execute(sa_query_object).fetchall()
+        window_condition_sa_query_objects: Dict[
+            Tuple[str, str, str], Select
+        ] = self._guard_metric_bundle_query_costs(
+            queries=window_condition_queries,
+            build_query=self._build_window_condition_count_query,
+        )
 
-                logger.debug(
-                    f"""SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id \
-{IDDict(domain_kwargs).to_id()}"""
+        # Queries of different compute domains are independent; if concurrency is enabled (and "self.engine" is a pool
+        # of connections, rather than single "Connection" object, to which temporary tables are bound), they are issued
+        # concurrently.  Results are always collected in the order, in which compute domains were encountered.
+        max_workers: int = (
+            len(sa_query_objects) + len(window_condition_sa_query_objects)
+            if isinstance(self.engine, sa.engine.Engine)
+            else 1
+        )
+        with AsyncExecutor(
+            concurrency_config=self._concurrency, max_workers=max_workers
+        ) as async_executor:
+            async_results: Dict[Tuple[str, str, str], AsyncResult] = {
+                domain_id: async_executor.submit(
+                    self._execute_metric_bundle_query,
+                    sa_query_object=sa_query_object,
+                    domain_id=domain_id,
+                )
+                for domain_id, sa_query_object in sa_query_objects.items()
+            }
+            window_condition_async_results: Dict[Tuple[str, str, str], AsyncResult] = {
+                domain_id: async_executor.submit(
+                    self._execute_metric_bundle_query,
+                    sa_query_object=sa_query_object,
+                    domain_id=domain_id,
                 )
-            except OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
+                for domain_id, sa_query_object in window_condition_sa_query_objects.items()
+            }
+
+        for domain_id, query in queries.items():
+            if domain_id in res_by_domain_id:
+                res = res_by_domain_id[domain_id]
+            else:
+                res = async_results[domain_id].result()
 
             assert (
                 len(res) == 1
@@ -1046,8 +1179,362 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     data=res[0][idx]
                 )
 
+        for domain_id, query in window_condition_queries.items():
+            res = window_condition_async_results[domain_id].result()
+            for idx, metric_id in enumerate(query["metric_ids"]):
+                # Sums are NULL, if domain has no records, in which case unexpected counts are zero.
+                resolved_metrics[metric_id] = (
+                    int(res[0][idx]) if res[0][idx] is not None else 0
+                )
+
         return resolved_metrics
 
+    def _guard_metric_bundle_query_costs(
+        self,
+        queries: Dict[Tuple[str, str, str], dict],
+        build_query: Callable[..., Select],
+    ) -> Dict[Tuple[str, str, str], Select]:
+        """Builds bundled metric query of every compute domain, checked by query cost guard; metrics of sampled queries
+        are marked as sampled (so that they are neither cached, nor reported as exact values)."""
+        sa_query_objects: Dict[Tuple[str, str, str], Select] = {}
+        domain_id: Tuple[str, str, str]
+        query: dict
+        for domain_id, query in queries.items():
+            full_sa_query_object: Select = build_query(query=query)
+            sa_query_objects[domain_id] = self.guard_query_cost(
+                query=full_sa_query_object,
+                build_sampled_query=partial(build_query, query=query),
+            )
+            if sa_query_objects[domain_id] is full_sa_query_object:
+                self._sampled_metric_ids.difference_update(query["metric_ids"])
+            else:
+                self._sampled_metric_ids.update(query["metric_ids"])
+
+        return sa_query_objects
+
+    def _build_metric_bundle_query(
+        self, query: dict, sample_size: Optional[int] = None
+    ) -> Select:
+        """Builds query, selecting all bundled metrics of one compute domain from its domain records (or from at most
+        "sample_size" of them, if given)."""
+        domain_kwargs: dict = query["domain_kwargs"]
+        selectable: Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
+
+        assert len(query["select"]) == len(query["metric_ids"])
+
+        """
+        If a custom query is passed, selectable will be TextClause and not formatted
+        as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+        to TextualSelect using sa.columns() before it can be converted to type Subquery
+        """
+        if TextClause and isinstance(selectable, TextClause):
+            selectable = selectable.columns().subquery()
+        elif (Select and isinstance(selectable, Select)) or (
+            TextualSelect and isinstance(selectable, TextualSelect)
+        ):
+            selectable = selectable.subquery()
+
+        if sample_size is not None:
+            selectable = self._get_sampled_domain_records(
+                selectable=selectable, sample_size=sample_size
+            )
+
+        return sa.select(query["select"]).select_from(selectable)
+
+    @staticmethod
+    def _get_sampled_domain_records(
+        selectable: Selectable, sample_size: int
+    ) -> Selectable:
+        """Returns (at most) "sample_size" of given domain records, selected by plain "LIMIT" (no ordering, which would
+        require reading and sorting all domain records).  Which records are selected is up to database; most databases
+        select same records of unchanged table for same query, but this is best effort, not guarantee.
+        """
+        return sa.select("*").select_from(selectable).limit(sample_size).subquery()
+
+    def _build_window_condition_count_query(
+        self, query: dict, sample_size: Optional[int] = None
+    ) -> Select:
+        """Builds query, counting rows of domain records, which satisfy each of bundled window conditions, in one pass.
+
+        Window conditions cannot be nested in aggregate functions; hence, every condition is evaluated (once per row) in
+        subquery over domain records, and aggregate query sums all evaluated conditions over that subquery.
+        """
+        # The integral values are cast to SQL Numeric in order to avoid a bug in AWS Redshift (converted to integer later).
+        conditions: Selectable = self._build_metric_bundle_query(
+            query={
+                "select": [
+                    sa.case(
+                        [(condition, sa.sql.expression.cast(1, sa.Numeric))],
+                        else_=sa.sql.expression.cast(0, sa.Numeric),
+                    ).label(f"condition_{idx}")
+                    for idx, condition in enumerate(query["select"])
+                ],
+                "metric_ids": query["metric_ids"],
+                "domain_kwargs": query["domain_kwargs"],
+            },
+            sample_size=sample_size,
+        ).subquery("conditions")
+
+        return sa.select(
+            [
+                sa.func.sum(conditions.c[f"condition_{idx}"]).label(
+                    f"unexpected_count_{idx}"
+                )
+                for idx in range(len(query["select"]))
+            ]
+        ).select_from(conditions)
+
+    def _resolve_splitter_batch_metric_bundles(
+        self, queries: Dict[Tuple[str, str, str], dict]
+    ) -> Dict[Tuple[str, str, str], List[Row]]:
+        """Computes bundled metrics of Batch objects, split from same table by same splitter, in one "GROUP BY" query.
+
+        Compute domains, which differ only in "batch_id" and bundle same metrics, whose compiled expressions (including
+        bound values of their dependencies, such as mean in expression of standard deviation) are identical, are fused
+        into single query over source table, whose rows are labeled by Batch they belong to (using split clause of every Batch), and grouped by
+        that label; each resulting row is then fanned out to compute domain of corresponding Batch.  Compute domains of
+        Batch objects, which cannot be fused (or have no rows), are omitted from returned dictionary.
+
+        Args:
+            queries: Bundled metric queries ("select" clauses, "metric_ids", and "domain_kwargs") by compute domain.
+
+        Returns:
+            Dictionary of (single-row) query results by compute domain.
+        """
+        res_by_domain_id: Dict[Tuple[str, str, str], List[Row]] = {}
+
+        domain_ids_by_fusion_key: Dict[str, List[Tuple[str, str, str]]] = {}
+        batch_specs: Dict[Tuple[str, str, str], SqlAlchemyDatasourceBatchSpec] = {}
+
+        domain_id: Tuple[str, str, str]
+        query: dict
+        for domain_id, query in queries.items():
+            batch_spec: Optional[
+                SqlAlchemyDatasourceBatchSpec
+            ] = self._get_splitter_batch_spec(domain_kwargs=query["domain_kwargs"])
+            if batch_spec is None:
+                continue
+
+            batch_specs[domain_id] = batch_spec
+            fusion_key: str = IDDict(
+                {
+                    "domain_kwargs": {
+                        key: value
+                        for key, value in query["domain_kwargs"].items()
+                        if key != "batch_id"
+                    },
+                    "schema_name": batch_spec.get("schema_name"),
+                    "table_name": batch_spec["table_name"],
+                    "splitter_method": batch_spec["splitter_method"],
+                    "splitter_kwargs": batch_spec.get("splitter_kwargs", {}),
+                    "metrics": [metric_id[0::2] for metric_id in query["metric_ids"]],
+                    "select": self._get_compiled_select_list_id(
+                        select_list=query["select"]
+                    ),
+                }
+            ).to_id()
+            domain_ids_by_fusion_key.setdefault(fusion_key, []).append(domain_id)
+
+        domain_ids: List[Tuple[str, str, str]]
+        for domain_ids in domain_ids_by_fusion_key.values():
+            # Batch objects with identical split clauses (i.e., same rows) cannot be distinguished in one query.
+            if len(domain_ids) < 2 or len(
+                {
+                    IDDict(batch_specs[domain_id]["batch_identifiers"]).to_id()
+                    for domain_id in domain_ids
+                }
+            ) < len(domain_ids):
+                continue
+
+            split_clauses: list = []
+            for domain_id in domain_ids:
+                batch_spec = batch_specs[domain_id]
+                splitter_fn: Callable = self._get_splitter_method(
+                    splitter_method_name=batch_spec["splitter_method"]
+                )
+                split_clauses.append(
+                    splitter_fn(
+                        batch_identifiers=batch_spec["batch_identifiers"],
+                        **batch_spec.get("splitter_kwargs", {}),
+                    )
+                )
+
+            # Rows of every Batch are labeled by position of its compute domain in group (in subquery, so that splitter
+            # expressions, carrying bound parameters, are not repeated in "GROUP BY" clause).
+            batch_index = sa.case(
+                [
+                    (split_clause, sa.literal_column(str(idx)))
+                    for idx, split_clause in enumerate(split_clauses)
+                ]
+            )
+            batch_spec = batch_specs[domain_ids[0]]
+            labeled_records: Select = (
+                sa.select("*")
+                .select_from(
+                    sa.table(
+                        batch_spec["table_name"],
+                        schema=batch_spec.get("schema_name", None),
+                    )
+                )
+                .where(sa.or_(*split_clauses))
+                .add_columns(batch_index.label("__batch_index"))
+            )
+            sa_query_object: Select = (
+                sa.select(
+                    queries[domain_ids[0]]["select"] + [sa.column("__batch_index")]
+                )
+                .select_from(labeled_records.subquery())
+                .group_by(sa.column("__batch_index"))
+            )
+
+            res: List[Row] = self._execute_metric_bundle_query(
+                sa_query_object=self.guard_query_cost(query=sa_query_object),
+                domain_id=domain_ids[0],
+            )
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed metrics of {len(res)} Batch objects in single query."""
+            )
+
+            row: Row
+            res_by_batch_index: Dict[int, Row] = {int(row[-1]): row for row in res}
+            idx: int
+            for idx, domain_id in enumerate(domain_ids):
+                if idx in res_by_batch_index:
+                    res_by_domain_id[domain_id] = [res_by_batch_index[idx][:-1]]
+
+        return res_by_domain_id
+
+    def _get_compiled_select_list_id(self, select_list: list) -> str:
+        """Returns identifier of select list, compiled for dialect of this engine (with values of bound parameters)."""
+        compiled = sa.select(select_list).compile(dialect=self.engine.dialect)
+        return hashlib.md5(
+            json.dumps(
+                [str(compiled), compiled.params], sort_keys=True, default=repr
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def _get_splitter_batch_spec(
+        self, domain_kwargs: dict
+    ) -> Optional[SqlAlchemyDatasourceBatchSpec]:
+        """Returns BatchSpec of Batch, whose domain records are rows of table, selected by splitter (without sampling
+        and further row filtering), or None, if metrics of this compute domain cannot be computed on source table."""
+        if domain_kwargs.get("table") is not None:
+            return None
+
+        if get_domain_records_id(domain_kwargs=domain_kwargs) is not None:
+            return None
+
+        batch = self.batch_manager.batch_cache.get(domain_kwargs.get("batch_id"))
+        batch_spec: Optional[BatchSpec] = getattr(batch, "batch_spec", None)
+        if not (
+            isinstance(batch_spec, SqlAlchemyDatasourceBatchSpec)
+            and batch_spec.get("splitter_method")
+            and batch_spec.get("table_name")
+            and batch_spec.get("sampling_method") is None
+        ):
+            return None
+
+        if batch_spec["splitter_method"] in (
+            "split_on_whole_table",
+            "_split_on_whole_table",
+        ):
+            return None
+
+        return batch_spec
+
+    def _execute_metric_bundle_query(
+        self, sa_query_object: Select, domain_id: Tuple[str, str, str]
+    ) -> List[Row]:
+        """Executes single bundled metric query (all metrics of one compute domain) and returns resulting rows."""
+        res: List[Row]
+        try:
+            logger.debug(f"Attempting query {str(sa_query_object)}")
+            res = self.engine.execute(sa_query_object).fetchall()
+
+            logger.debug(
+                f"""SqlAlchemyExecutionEngine computed {len(res[0]) if res else 0} metrics on domain_id {domain_id}"""
+            )
+        except OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+
+        return res
+
+    def explain_query(self, query: Select) -> QueryPlanEstimate:
+        """Returns estimates of given query, obtained by "EXPLAIN" (without issuing query itself)."""
+        return explain_query(
+            connectable=self.engine, query=query, dialect_name=self.dialect_name
+        )
+
+    def guard_query_cost(
+        self,
+        query: Select,
+        build_sampled_query: Optional[Callable[..., Select]] = None,
+    ) -> Select:
+        """Checks estimates of given query against budget of query cost guard (if configured), before query is issued.
+
+        Args:
+            query: Query to be issued.
+            build_sampled_query: Function, which builds same query over (at most) "sample_size" domain records (if query
+                cannot be sampled, it is issued in full, when budget is exceeded and query cost guard samples queries).
+
+        Returns:
+            Query to issue instead (i.e., given query, or its sampled version).
+
+        Raises:
+            QueryCostBudgetExceededError: If estimates exceed budget and query cost guard raises errors (or samples
+                queries, but estimates of sampled query exceed budget as well).
+        """
+        if self._query_cost_guard is None:
+            return query
+
+        estimate: QueryPlanEstimate = self.explain_query(query=query)
+        self._query_plan_estimates.append(estimate)
+        logger.info(
+            f"Query plan estimate: rows={estimate.estimated_rows}, cost={estimate.estimated_cost}, "
+            f"full_table_scan={estimate.full_table_scan}; query: {estimate.query}"
+        )
+
+        violations: List[str] = self._query_cost_guard.get_violations(estimate=estimate)
+        if not violations:
+            return query
+
+        exception_message: str = f"""Estimate of query exceeds budget of query cost guard ({", ".join(violations)}): \
+{estimate.query}"""
+        if self._query_cost_guard.on_exceed == "raise":
+            raise QueryCostBudgetExceededError(message=exception_message)
+
+        if (
+            self._query_cost_guard.on_exceed == "sample"
+            and build_sampled_query is not None
+        ):
+            sample_size: int = self._query_cost_guard.sample_size
+            sampled_query: Select = build_sampled_query(sample_size=sample_size)
+            sampled_estimate: QueryPlanEstimate = self.explain_query(
+                query=sampled_query
+            )
+            self._query_plan_estimates.append(sampled_estimate)
+            sampled_violations: List[str] = self._query_cost_guard.get_violations(
+                estimate=sampled_estimate
+            )
+            if sampled_violations:
+                raise QueryCostBudgetExceededError(
+                    message=f"""{exception_message}
+Estimate of query over {sample_size} sampled domain records exceeds budget of query cost guard as well \
+({", ".join(sampled_violations)}): {sampled_estimate.query}"""
+                )
+
+            logger.warning(
+                f"{exception_message}\nQuery is issued over (at most) {sample_size} domain records only; resulting metrics are marked as sampled."
+            )
+            return sampled_query
+
+        logger.warning(exception_message)
+        return query
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1066,10 +1553,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
+        # Shared engines (and their pools of connections) are kept for other users (and disposed at interpreter exit).
         if self._engine_backup:
             self.engine.close()
-            self._engine_backup.dispose()
-        else:
+            if not is_shared_sqlalchemy_engine(engine=self._engine_backup):
+                self._engine_backup.dispose()
+        elif not is_shared_sqlalchemy_engine(engine=self.engine):
             self.engine.dispose()
 
     def _get_splitter_method(self, splitter_method_name: str) -> Callable:
@@ -1183,6 +1672,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             .where(split_clause)
         )
 
+    def _get_batch_data_fingerprint(self, batch_spec: BatchSpec) -> Optional[str]:
+        """Fingerprint of rows, selected by batch_spec (database, table or query, splitter, and sampler).
+
+        Unlike "pandas_data_fingerprint", it does not reflect contents of selected rows, which are not read here.
+        """
+        url = self.engine.engine.url
+        try:
+            fingerprint_source: dict = convert_to_json_serializable(
+                data={
+                    "database": [url.drivername, url.host, url.port, url.database],
+                    "batch_spec": dict(batch_spec),
+                }
+            )
+        except TypeError as e:
+            logger.debug(f"Unable to compute fingerprint of batch data: {e}")
+            return None
+
+        return hashlib.md5(
+            json.dumps(fingerprint_source, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:
@@ -1204,6 +1714,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             }
         )
 
+        data_fingerprint: Optional[str] = self._get_batch_data_fingerprint(
+            batch_spec=batch_spec
+        )
+        if data_fingerprint is not None:
+            batch_markers["sqlalchemy_data_fingerprint"] = data_fingerprint
+
         source_schema_name: str = batch_spec.get("schema_name", None)
         source_table_name: str = batch_spec.get("table_name", None)
 
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+
+logger = logging.getLogger(__name__)
+
+QUERY_COST_GUARD_ACTIONS = ("raise", "warn", "sample")
+
+DEFAULT_QUERY_COST_GUARD_SAMPLE_SIZE: int = 10000
+
+# Nodes of PostgreSQL query plans, which consume their input in full before emitting first row.
+POSTGRESQL_BLOCKING_NODE_TYPES = (
+    "Aggregate",
+    "Hash",
+    "Materialize",
+    "SetOp",
+    "Sort",
+    "WindowAgg",
+)
+
+
+@dataclass(frozen=True)
+class QueryPlanEstimate:
+    """Estimates, obtained by "EXPLAIN" of query (any of which is None, if dialect does not report it)."""
+
+    query: str
+    estimated_rows: Optional[float] = None
+    estimated_cost: Optional[float] = None
+    full_table_scan: bool = False
+
+
+class QueryCostGuard:
+    """Budget for estimated cost of queries, which SqlAlchemyExecutionEngine checks (using "EXPLAIN") before it issues
+    bundled metric queries and queries of unexpected values.
+
+    When estimate of query exceeds budget, "on_exceed" action is taken:
+        "raise": query is not issued (QueryCostBudgetExceededError is raised);
+        "warn": query is issued (warning is logged);
+        "sample": query is issued over (at most) "sample_size" domain records only (warning is logged), provided that
+            estimate of sampled query is within budget (otherwise, QueryCostBudgetExceededError is raised).
+
+    Budgets are ignored for estimates, which dialect does not report (e.g., SQLite reports no row or cost estimates).
+    """
+
+    def __init__(
+        self,
+        max_estimated_rows: Optional[float] = None,
+        max_estimated_cost: Optional[float] = None,
+        allow_full_table_scans: bool = True,
+        on_exceed: str = "raise",
+        sample_size: int = DEFAULT_QUERY_COST_GUARD_SAMPLE_SIZE,
+    ) -> None:
+        """
+        Args:
+            max_estimated_rows: Maximum estimated number of rows, which query may scan (or return).
+            max_estimated_cost: Maximum estimated cost of query (in units of query planner of dialect).
+            allow_full_table_scans: Whether queries, whose plan scans entire table, are within budget.
+            on_exceed: Action taken, when estimate exceeds budget (one of "raise", "warn", "sample").
+            sample_size: Maximum number of domain records, over which query is issued, if "on_exceed" is "sample".
+        """
+        if on_exceed not in QUERY_COST_GUARD_ACTIONS:
+            raise ValueError(
+                f'Value of "on_exceed" for query cost guard must be one of {QUERY_COST_GUARD_ACTIONS}, not "{on_exceed}".'
+            )
+
+        if sample_size < 1:
+            raise ValueError(
+                f'Value of "sample_size" for query cost guard must be a positive integer, not {sample_size}.'
+            )
+
+        self._max_estimated_rows = max_estimated_rows
+        self._max_estimated_cost = max_estimated_cost
+        self._allow_full_table_scans = allow_full_table_scans
+        self._on_exceed = on_exceed
+        self._sample_size = sample_size
+
+    @property
+    def on_exceed(self) -> str:
+        return self._on_exceed
+
+    @property
+    def sample_size(self) -> int:
+        return self._sample_size
+
+    def get_violations(self, estimate: QueryPlanEstimate) -> List[str]:
+        """Returns descriptions of budgets, which given estimate exceeds (empty, if estimate is within budget)."""
+        violations: List[str] = []
+        if (
+            self._max_estimated_rows is not None
+            and estimate.estimated_rows is not None
+            and estimate.estimated_rows > self._max_estimated_rows
+        ):
+            violations.append(
+                f"estimated rows {estimate.estimated_rows} > {self._max_estimated_rows}"
+            )
+
+        if (
+            self._max_estimated_cost is not None
+            and estimate.estimated_cost is not None
+            and estimate.estimated_cost > self._max_estimated_cost
+        ):
+            violations.append(
+                f"estimated cost {estimate.estimated_cost} > {self._max_estimated_cost}"
+            )
+
+        if not self._allow_full_table_scans and estimate.full_table_scan:
+            violations.append("full table scan")
+
+        return violations
+
+
+def explain_query(
+    connectable: Any, query: Any, dialect_name: Union[str, GXSqlDialect]
+) -> QueryPlanEstimate:
+    """Runs "EXPLAIN" of given query, and extracts estimated rows, estimated cost, and whether any table is scanned in
+    full, from query plan (as reported by PostgreSQL, MySQL, and SQLite; other dialects yield no estimates).
+
+    Args:
+        connectable: SQLAlchemy Engine (or Connection), on which query would be issued.
+        query: SQLAlchemy Select statement.
+        dialect_name: Name of dialect of "connectable".
+
+    Returns:
+        QueryPlanEstimate of query.
+    """
+    compiled = query.compile(
+        dialect=connectable.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    query_string: str = str(compiled)
+    parameters: Union[tuple, dict]
+    if compiled.positional:
+        parameters = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        parameters = compiled.params
+
+    if dialect_name == GXSqlDialect.POSTGRESQL:
+        return _explain_postgresql(
+            connectable=connectable, query_string=query_string, parameters=parameters
+        )
+
+    if dialect_name == GXSqlDialect.MYSQL:
+        return _explain_mysql(
+            connectable=connectable, query_string=query_string, parameters=parameters
+        )
+
+    if dialect_name == GXSqlDialect.SQLITE:
+        plan_details: List[str] = [
+            row[-1]
+            for row in connectable.execute(
+                f"EXPLAIN QUERY PLAN {query_string}", parameters
+            ).fetchall()
+        ]
+        return QueryPlanEstimate(
+            query=query_string,
+            full_table_scan=any(
+                detail.startswith("SCAN") and " USING " not in detail
+                for detail in plan_details
+            ),
+        )
+
+    logger.debug(
+        f'Query plan estimates are not supported for dialect "{dialect_name}".'
+    )
+    return QueryPlanEstimate(query=query_string)
+
+
+def _explain_postgresql(
+    connectable: Any, query_string: str, parameters: Union[tuple, dict]
+) -> QueryPlanEstimate:
+    plan: Any = connectable.execute(
+        f"EXPLAIN (FORMAT JSON) {query_string}", parameters
+    ).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    root: dict = plan[0]["Plan"]
+    # Scans, whose output is capped by "LIMIT" (with no blocking node in between), stop early; hence, their rows are
+    # capped as well, and they are not full table scans.
+    nodes: List[Tuple[dict, Optional[float]]] = list(
+        _iterate_postgresql_plan_nodes(node=root)
+    )
+    rows: List[float] = [
+        min(float(node["Plan Rows"]), row_limit)
+        if row_limit is not None
+        else float(node["Plan Rows"])
+        for node, row_limit in nodes
+        if node.get("Plan Rows") is not None
+    ]
+    return QueryPlanEstimate(
+        query=query_string,
+        estimated_rows=max(rows) if rows else None,
+        estimated_cost=root.get("Total Cost"),
+        full_table_scan=any(
+            node.get("Node Type") == "Seq Scan" and row_limit is None
+            for node, row_limit in nodes
+        ),
+    )
+
+
+def _iterate_postgresql_plan_nodes(
+    node: dict, row_limit: Optional[float] = None
+) -> Iterator[Tuple[dict, Optional[float]]]:
+    """Yields every node of PostgreSQL query plan, together with number of rows, to which "LIMIT" of its ancestor caps
+    its output (None, if output of node is consumed in full)."""
+    node_type: Optional[str] = node.get("Node Type")
+    if node_type == "Limit" and node.get("Plan Rows") is not None:
+        plan_rows: float = float(node["Plan Rows"])
+        row_limit = plan_rows if row_limit is None else min(row_limit, plan_rows)
+    elif node_type in POSTGRESQL_BLOCKING_NODE_TYPES:
+        row_limit = None
+
+    yield node, row_limit
+    child: dict
+    for child in node.get("Plans", []):
+        yield from _iterate_postgresql_plan_nodes(node=child, row_limit=row_limit)
+
+
+def _explain_mysql(
+    connectable: Any, query_string: str, parameters: Union[tuple, dict]
+) -> QueryPlanEstimate:
+    plan: dict = json.loads(
+        connectable.execute(f"EXPLAIN FORMAT=JSON {query_string}", parameters).scalar()
+    )
+    query_block: dict = plan.get("query_block", {})
+    query_cost: Optional[str] = query_block.get("cost_info", {}).get("query_cost")
+    return QueryPlanEstimate(
+        query=query_string,
+        estimated_rows=_get_max_value(node=query_block, key="rows_examined_per_scan"),
+        estimated_cost=float(query_cost) if query_cost is not None else None,
+        full_table_scan=any(
+            node.get("access_type") == "ALL"
+            for node in _iterate_nodes(node=query_block)
+        ),
+    )
+
+
+def _iterate_nodes(node: Any) -> Iterator[dict]:
+    """Yields every dictionary (i.e., node) nested in JSON query plan."""
+    if isinstance(node, dict):
+        yield node
+        value: Any
+        for value in node.values():
+            yield from _iterate_nodes(node=value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iterate_nodes(node=value)
+
+
+def _get_max_value(node: Any, key: str) -> Optional[float]:
+    # Row estimate of query is that of its largest scan (or intermediate result).
+    values: List[float] = [
+        float(nested_node[key])
+        for nested_node in _iterate_nodes(node=node)
+        if nested_node.get(key) is not None
+    ]
+    return max(values) if values else None
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCHEMA_CACHE_TTL_SECONDS: float = 300.0
+
+# Entries are keyed by schema name (None, if default schema or custom query) and table name (or hash of custom query).
+SchemaCacheKey = Tuple[Optional[str], str]
+
+
+class SchemaCache:
+    """Cache of column metadata (reflected from database catalog, or obtained by fallback queries), used by
+    SqlAlchemyExecutionEngine, so that catalog of every table is queried only once for all Batch objects of that table.
+
+    Entries expire "ttl_seconds" after they were stored (so that changes of table schema are eventually picked up), and
+    may be invalidated explicitly (e.g., after table is altered).  Cache is shared by all Validator objects, which use
+    same SqlAlchemyExecutionEngine (i.e., by all Validator objects of same Datasource).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = DEFAULT_SCHEMA_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ttl_seconds: Time (in seconds), for which column metadata are reused; if None (or 0), nothing is cached.
+            clock: Source of (monotonic) time, in seconds.
+        """
+        if ttl_seconds is not None and ttl_seconds < 0:
+            raise ValueError(
+                f"Time-to-live of schema cache must be non-negative number of seconds, not {ttl_seconds}."
+            )
+
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: Dict[SchemaCacheKey, Tuple[float, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._ttl_seconds)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: SchemaCacheKey) -> Optional[List[Any]]:
+        """Returns column metadata stored for given key, unless missing or expired (None is returned then)."""
+        with self._lock:
+            entry: Optional[Tuple[float, List[Any]]] = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, columns = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+        return _copy_columns(columns=columns)
+
+    def put(self, key: SchemaCacheKey, columns: List[Any]) -> None:
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (
+                self._clock() + self._ttl_seconds,  # type: ignore[operator]
+                _copy_columns(columns=columns),
+            )
+
+    def get_or_reflect(
+        self, key: SchemaCacheKey, reflect: Callable[[], Optional[List[Any]]]
+    ) -> Optional[List[Any]]:
+        """Returns column metadata stored for given key; if missing or expired, these are obtained by "reflect" callable
+        (and stored, unless None)."""
+        columns: Optional[List[Any]] = self.get(key=key)
+        if columns is not None:
+            return columns
+
+        columns = reflect()
+        if columns is not None:
+            self.put(key=key, columns=columns)
+
+        return columns
+
+    def invalidate(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> None:
+        """Removes column metadata of given table (in any schema, unless "schema_name" is given), or of all tables in
+        given schema (if only "schema_name" is given); all entries are removed, if neither is given."""
+        with self._lock:
+            if table_name is None and schema_name is None:
+                self._entries.clear()
+                return
+
+            key: SchemaCacheKey
+            for key in list(self._entries.keys()):
+                if (table_name is None or key[1] == table_name) and (
+                    schema_name is None or key[0] == schema_name
+                ):
+                    del self._entries[key]
+
+
+def _copy_columns(columns: List[Any]) -> List[Any]:
+    # Column metadata dictionaries are copied, so that callers cannot modify cached entries.
+    return [dict(column) if isinstance(column, dict) else column for column in columns]
@@ -3148,6 +3148,14 @@ def _format_map_output(
                 "unexpected_rows": unexpected_rows,
             }
         )
+        # Unexpected rows, spilled to file (per "unexpected_spill_directory" of result_format), are only partially kept.
+        unexpected_rows_spill_path: Optional[str] = getattr(
+            unexpected_rows, "spill_path", None
+        )
+        if unexpected_rows_spill_path is not None:
+            return_obj["result"].update(
+                {"unexpected_rows_spill_path": unexpected_rows_spill_path}
+            )
 
     if result_format["result_format"] == "BASIC":
         return return_obj
@@ -3201,8 +3209,22 @@ def _format_map_output(
 
     if unexpected_list is not None:
         return_obj["result"].update({"unexpected_list": unexpected_list})
+        unexpected_list_spill_path: Optional[str] = getattr(
+            unexpected_list, "spill_path", None
+        )
+        if unexpected_list_spill_path is not None:
+            return_obj["result"].update(
+                {"unexpected_list_spill_path": unexpected_list_spill_path}
+            )
     if unexpected_index_list is not None:
         return_obj["result"].update({"unexpected_index_list": unexpected_index_list})
+        unexpected_index_list_spill_path: Optional[str] = getattr(
+            unexpected_index_list, "spill_path", None
+        )
+        if unexpected_index_list_spill_path is not None:
+            return_obj["result"].update(
+                {"unexpected_index_list_spill_path": unexpected_index_list_spill_path}
+            )
     if unexpected_index_query is not None:
         return_obj["result"].update({"unexpected_index_query": unexpected_index_query})
     if result_format["result_format"] == "COMPLETE":
@@ -0,0 +1,73 @@
+"""
+String functions of pandas columns, which are evaluated by "pyarrow.compute" kernels for Arrow-backed string columns
+(columns of "pd.ArrowDtype", e.g., read by "PandasExecutionEngine" configured with dtype_backend="pyarrow"), rather than
+on Python string objects.  Other columns (and regular expressions, which Arrow cannot compile) are handled by pandas.
+
+Metric providers, using these functions, set "supports_arrow_backed_columns"; all other metrics are computed on
+NumPy-backed copies of Arrow-backed columns (see "PandasExecutionEngine.resolve_metrics()").
+"""
+
+import logging
+from typing import Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+    pc = None
+    logger.debug(
+        "Unable to load pyarrow; install optional pyarrow dependency for support of Arrow-backed pandas columns"
+    )
+
+
+def is_arrow_string_column(column: pd.Series) -> bool:
+    ArrowDtype = getattr(pd, "ArrowDtype", None)
+    if pa is None or ArrowDtype is None or not isinstance(column.dtype, ArrowDtype):
+        return False
+
+    return pa.types.is_string(column.dtype.pyarrow_dtype) or pa.types.is_large_string(
+        column.dtype.pyarrow_dtype
+    )
+
+
+def _get_arrow_array(column: pd.Series) -> "pa.ChunkedArray":
+    return pa.chunked_array(pa.array(column.array))
+
+
+def _match_regex_arrow(column: pd.Series, regex: str) -> Optional[pd.Series]:
+    try:
+        matches: pa.ChunkedArray = pc.match_substring_regex(
+            _get_arrow_array(column=column), pattern=regex
+        )
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        # Arrow uses RE2 syntax, which lacks some constructs of Python regular expressions (e.g., backreferences).
+        logger.debug(f'Unable to match regex "{regex}" using pyarrow ({e}).')
+        return None
+
+    return pd.Series(
+        pc.fill_null(matches, False).to_numpy(), index=column.index, dtype=bool
+    )
+
+
+def column_values_match_regex(column: pd.Series, regex: str) -> pd.Series:
+    """Equivalent of "column.astype(str).str.contains(regex)"."""
+    if is_arrow_string_column(column=column):
+        matches: Optional[pd.Series] = _match_regex_arrow(column=column, regex=regex)
+        if matches is not None:
+            return matches
+
+    return column.astype(str).str.contains(regex)
+
+
+def column_value_lengths(column: pd.Series) -> pd.Series:
+    """Equivalent of "column.astype(str).str.len()"."""
+    if is_arrow_string_column(column=column):
+        lengths: pa.ChunkedArray = pc.utf8_length(_get_arrow_array(column=column))
+        return pd.Series(lengths.to_pandas().to_numpy(), index=column.index)
+
+    return column.astype(str).str.len()
@@ -2,11 +2,14 @@ import logging
 from functools import wraps
 from typing import Any, Callable, Dict, Optional, Type, Union
 
+import pandas as pd
+
 from great_expectations.core import ExpectationConfiguration
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
     MetricDomainTypes,
     MetricPartialFunctionTypes,
+    SplitDomainKwargs,
 )
 from great_expectations.execution_engine.sparkdf_execution_engine import (
     SparkDFExecutionEngine,
@@ -81,12 +84,14 @@ def column_aggregate_value(
                     execution_engine=execution_engine,
                 )
 
+                column = df[column_name]
                 if filter_column_isnull:
-                    df = df[df[column_name].notnull()]
+                    # Filtering column (rather than entire DataFrame) avoids copying all other columns of domain.
+                    column = column[column.notnull()]
 
                 return metric_fn(
                     cls,
-                    column=df[column_name],
+                    column=column,
                     **metric_value_kwargs,
                     _metrics=metrics,
                 )
@@ -112,7 +117,63 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
     """
     partial_fn_type = MetricPartialFunctionTypes.AGGREGATE_FN
     domain_type = MetricDomainTypes.COLUMN
-    if issubclass(engine, SqlAlchemyExecutionEngine):
+    if issubclass(engine, PandasExecutionEngine):
+
+        def wrapper(metric_fn: Callable):
+            @metric_partial(
+                engine=PandasExecutionEngine,
+                partial_fn_type=partial_fn_type,
+                domain_type=domain_type,
+            )
+            @wraps(metric_fn)
+            def inner_func(
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: dict,
+                metric_value_kwargs: dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: dict,
+            ):
+                filter_column_isnull = kwargs.get(
+                    "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+                )
+
+                # Data is not accessed here; records of compute domain are obtained by "resolve_metric_bundle()" once for
+                # all column aggregates, bundled on that domain.
+                split_domain_kwargs: SplitDomainKwargs = (
+                    execution_engine._split_domain_kwargs(
+                        domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                    )
+                )
+                compute_domain_kwargs: dict = split_domain_kwargs.compute
+                accessor_domain_kwargs: dict = split_domain_kwargs.accessor
+
+                column_name: Union[str, quoted_name] = accessor_domain_kwargs["column"]
+
+                accessor_domain_kwargs["column"] = get_dbms_compatible_column_names(
+                    column_names=column_name,
+                    batch_columns_list=metrics["table.columns"],
+                    execution_engine=execution_engine,
+                )
+
+                def metric_aggregate(column: pd.Series) -> Any:
+                    if filter_column_isnull:
+                        column = column[column.notnull()]
+
+                    return metric_fn(
+                        cls,
+                        column=column,
+                        **metric_value_kwargs,
+                        _metrics=metrics,
+                    )
+
+                return metric_aggregate, compute_domain_kwargs, accessor_domain_kwargs
+
+            return inner_func
+
+        return wrapper
+
+    elif issubclass(engine, SqlAlchemyExecutionEngine):
 
         def wrapper(metric_fn: Callable):
             @metric_partial(
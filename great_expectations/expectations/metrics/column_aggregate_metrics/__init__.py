@@ -1,3 +1,6 @@
+from .column_approx_distinct_values_count import ColumnApproxDistinctValuesCount
+from .column_approx_heavy_hitters import ColumnApproxHeavyHitters
+from .column_approx_quantile_values import ColumnApproxQuantileValues
 from .column_distinct_values import (
     ColumnDistinctValues,
     ColumnDistinctValuesCount,
@@ -0,0 +1,132 @@
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import HyperLogLogSketch
+
+# Native approximate distinct count functions of SQL dialects and their documented relative standard errors.
+SQL_APPROX_DISTINCT_COUNT_FUNCTIONS: Dict[GXSqlDialect, tuple] = {
+    GXSqlDialect.TRINO: ("approx_distinct", 0.023),
+    GXSqlDialect.AWSATHENA: ("approx_distinct", 0.023),
+    GXSqlDialect.SNOWFLAKE: ("approx_count_distinct", 0.0162338),
+}
+
+
+class ColumnApproxDistinctValuesCount(ColumnAggregateMetricProvider):
+    """Approximate number of distinct values of column, computed with HyperLogLog sketch (or its native equivalent).
+
+    Resulting value is dictionary with estimated "value" and its "relative_standard_error" (0.0 for SQL dialects,
+    lacking approximate distinct count, where exact count is computed by database instead).
+    """
+
+    metric_name = "column.distinct_values.approx_count"
+    value_keys = ("relative_standard_error",)
+    default_kwarg_values = {
+        "relative_standard_error": 0.01,
+    }
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        column: pd.Series,
+        relative_standard_error: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if relative_standard_error is None:
+            relative_standard_error = cls.default_kwarg_values[
+                "relative_standard_error"
+            ]
+
+        sketch = HyperLogLogSketch(
+            precision=HyperLogLogSketch.precision_for_relative_error(
+                relative_standard_error=relative_standard_error
+            )
+        )
+        sketch.update(values=column)
+        return {
+            "value": sketch.count(),
+            "relative_standard_error": sketch.relative_standard_error,
+        }
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> Dict[str, Any]:
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+
+        count_fn: Any
+        relative_standard_error: float
+        dialect_name: str = execution_engine.engine.dialect.name.lower()
+        if dialect_name in SQL_APPROX_DISTINCT_COUNT_FUNCTIONS:
+            function_name: str
+            (
+                function_name,
+                relative_standard_error,
+            ) = SQL_APPROX_DISTINCT_COUNT_FUNCTIONS[dialect_name]
+            count_fn = getattr(sa.func, function_name)(column)
+        else:
+            count_fn = sa.func.count(sa.distinct(column))
+            relative_standard_error = 0.0
+
+        value: int = execution_engine.engine.execute(
+            sa.select([count_fn]).select_from(selectable)
+        ).scalar()
+        return {
+            "value": int(value),
+            "relative_standard_error": relative_standard_error,
+        }
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> Dict[str, Any]:
+        """Spark computes approximate distinct count natively (HyperLogLog++ sketch), with given relative error."""
+        (
+            df,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        relative_standard_error: float = metric_value_kwargs.get(
+            "relative_standard_error"
+        ) or (cls.default_kwarg_values["relative_standard_error"])
+        value: int = df.select(
+            F.approx_count_distinct(
+                F.col(accessor_domain_kwargs["column"]), rsd=relative_standard_error
+            )
+        ).collect()[0][0]
+        return {
+            "value": int(value),
+            "relative_standard_error": relative_standard_error,
+        }
@@ -0,0 +1,58 @@
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.sketches import CountMinSketch
+
+# Column values are consumed by sketch in chunks of this many rows, so that memory is bounded by chunk size.
+PANDAS_SKETCH_CHUNK_SIZE: int = 100000
+
+
+class ColumnApproxHeavyHitters(ColumnAggregateMetricProvider):
+    """Approximate most frequent values of column, tracked with Count-Min sketch.
+
+    Resulting value is dictionary with "values" (list of {"value", "count"} items, whose estimated share of non-null
+    values is at least "min_frequency", by descending count), "count_error" (bound on overestimate of every count), and
+    "confidence" (probability, with which "count_error" bound holds).
+    """
+
+    metric_name = "column.approx_heavy_hitters"
+    value_keys = ("min_frequency", "relative_error")
+    default_kwarg_values = {
+        "min_frequency": 0.01,
+        "relative_error": 1.0e-3,
+    }
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        column: pd.Series,
+        min_frequency: Optional[float] = None,
+        relative_error: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if min_frequency is None:
+            min_frequency = cls.default_kwarg_values["min_frequency"]
+
+        if relative_error is None:
+            relative_error = cls.default_kwarg_values["relative_error"]
+
+        sketch = CountMinSketch(
+            relative_error=relative_error,
+            # Every value with share of at least "min_frequency" fits among candidates (with room to spare).
+            max_candidates=max(int(2.0 / min_frequency), 1),
+        )
+        start: int
+        for start in range(0, len(column), PANDAS_SKETCH_CHUNK_SIZE):
+            sketch.update(values=column.iloc[start : start + PANDAS_SKETCH_CHUNK_SIZE])
+
+        return {
+            "values": sketch.heavy_hitters(min_frequency=min_frequency),
+            "count_error": sketch.count_error,
+            "confidence": sketch.confidence,
+        }
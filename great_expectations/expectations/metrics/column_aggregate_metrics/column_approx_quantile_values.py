@@ -0,0 +1,241 @@
+import math
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (
+    _get_column_quantiles_athena,
+    _get_column_quantiles_trino,
+    get_column_quantiles_sqlalchemy,
+)
+from great_expectations.expectations.metrics.import_manager import sa
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import KllQuantileSketch
+
+# Typical rank errors of native approximate percentile functions of SQL dialects (BigQuery "APPROX_QUANTILES" is given
+# number of quantile boundaries, derived from requested rank error, instead).
+SQL_APPROX_QUANTILE_RANK_ERRORS: Dict[GXSqlDialect, float] = {
+    GXSqlDialect.TRINO: 0.01,
+    GXSqlDialect.AWSATHENA: 0.01,
+    GXSqlDialect.SNOWFLAKE: 0.01,
+    GXSqlDialect.REDSHIFT: 0.005,
+}
+
+
+def get_rank_error(allow_relative_error: Any, default_rank_error: float) -> float:
+    """Interprets "allow_relative_error" value kwarg of approximate quantile metrics as normalized rank error."""
+    if allow_relative_error is None or isinstance(allow_relative_error, bool):
+        return default_rank_error
+
+    if (
+        not isinstance(allow_relative_error, (int, float))
+        or allow_relative_error <= 0.0
+        or allow_relative_error >= 1.0
+    ):
+        raise ValueError(
+            'Value of "allow_relative_error" for approximate quantiles must be a float between 0 and 1 (exclusive).'
+        )
+
+    return float(allow_relative_error)
+
+
+class ColumnApproxQuantileValues(ColumnAggregateMetricProvider):
+    """Approximate quantiles of column, computed in single pass without sorting column values (by KLL sketch in pandas,
+    and by native approximate percentile functions in Spark and SQL dialects, which have them).
+
+    Resulting value is dictionary with estimated "values" (one for each of "quantiles") and "rank_error" -- the bound
+    (as fraction of number of values) on difference between requested quantile and true rank of estimated value (typical
+    error for SQL dialects, and 0.0 for SQL dialects, lacking approximation, where exact quantiles are computed).
+    Median is approximated by "quantiles" of "[0.5]".
+    """
+
+    metric_name = "column.approx_quantile_values"
+    value_keys = ("quantiles", "allow_relative_error")
+    default_kwarg_values = {
+        "allow_relative_error": 0.01,
+    }
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        column: pd.Series,
+        quantiles: List[float],
+        allow_relative_error: Optional[float] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        sketch = KllQuantileSketch(
+            k=KllQuantileSketch.k_for_rank_error(
+                rank_error=get_rank_error(
+                    allow_relative_error=allow_relative_error,
+                    default_rank_error=cls.default_kwarg_values["allow_relative_error"],
+                )
+            )
+        )
+        sketch.update(values=column)
+        return {
+            "values": sketch.quantiles(quantiles=quantiles),
+            "rank_error": sketch.rank_error,
+        }
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> Dict[str, Any]:
+        """Computes quantiles in database by native approximate percentile function of SQL dialect (Snowflake, Trino,
+        Athena, BigQuery, and Redshift); other dialects compute exact quantiles (with rank error of 0.0) instead."""
+        (
+            selectable,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+        quantiles: List[float] = list(metric_value_kwargs["quantiles"])
+        rank_error: float = get_rank_error(
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error"),
+            default_rank_error=cls.default_kwarg_values["allow_relative_error"],
+        )
+
+        sqlalchemy_engine = execution_engine.engine
+        dialect_name: str = sqlalchemy_engine.dialect.name.lower()
+        values: list
+        if dialect_name == GXSqlDialect.SNOWFLAKE:
+            values = list(
+                sqlalchemy_engine.execute(
+                    sa.select(
+                        [
+                            sa.func.approx_percentile(column, quantile)
+                            for quantile in quantiles
+                        ]
+                    ).select_from(selectable)
+                ).fetchone()
+            )
+        elif dialect_name == GXSqlDialect.TRINO:
+            values = _get_column_quantiles_trino(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+            )
+        elif dialect_name == GXSqlDialect.AWSATHENA:
+            values = _get_column_quantiles_athena(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+            )
+        elif dialect_name == GXSqlDialect.BIGQUERY:
+            # "APPROX_QUANTILES(column, n)" returns n + 1 boundaries (minimum, n - 1 quantiles, and maximum).
+            number_of_quantiles: int = math.ceil(1.0 / rank_error)
+            boundaries: list = sqlalchemy_engine.execute(
+                sa.select(
+                    [sa.func.approx_quantiles(column, number_of_quantiles)]
+                ).select_from(selectable)
+            ).scalar()
+            values = [
+                boundaries[round(quantile * number_of_quantiles)]
+                for quantile in quantiles
+            ]
+            return {
+                "values": values,
+                "rank_error": 1.0 / number_of_quantiles,
+            }
+        elif dialect_name == GXSqlDialect.REDSHIFT:
+            values = list(
+                sqlalchemy_engine.execute(
+                    sa.select(
+                        [
+                            sa.text(
+                                get_approximate_percentile_disc_sql(
+                                    selects=[
+                                        sa.func.percentile_disc(quantile).within_group(
+                                            column.asc()
+                                        )
+                                        for quantile in quantiles
+                                    ],
+                                    sql_engine_dialect=sqlalchemy_engine.dialect,
+                                )
+                            )
+                        ]
+                    ).select_from(selectable)
+                ).fetchone()
+            )
+        else:
+            # Lacking native approximation, exact quantiles of non-null values are computed by database (column values
+            # are never transferred to client).
+            nonnull_selectable = (
+                sa.select([column])
+                .select_from(selectable)
+                .where(column.isnot(None))
+                .subquery()
+            )
+            nonnull_count: Optional[int] = None
+            if dialect_name == GXSqlDialect.SQLITE:
+                nonnull_count = sqlalchemy_engine.execute(
+                    sa.select([sa.func.count()]).select_from(nonnull_selectable)
+                ).scalar()
+
+            return {
+                "values": get_column_quantiles_sqlalchemy(
+                    column=column,
+                    quantiles=quantiles,
+                    allow_relative_error=False,
+                    selectable=nonnull_selectable,
+                    sqlalchemy_engine=sqlalchemy_engine,
+                    table_row_count=nonnull_count,
+                ),
+                "rank_error": 0.0,
+            }
+
+        return {
+            "values": values,
+            "rank_error": SQL_APPROX_QUANTILE_RANK_ERRORS[dialect_name],
+        }
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: dict,
+    ) -> Dict[str, Any]:
+        """Spark computes approximate quantiles natively (Greenwald-Khanna sketch), with given relative error."""
+        (
+            df,
+            compute_domain_kwargs,
+            accessor_domain_kwargs,
+        ) = execution_engine.get_compute_domain(
+            metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        rank_error: float = get_rank_error(
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error"),
+            default_rank_error=cls.default_kwarg_values["allow_relative_error"],
+        )
+        return {
+            "values": df.approxQuantile(
+                accessor_domain_kwargs["column"],
+                list(metric_value_kwargs["quantiles"]),
+                rank_error,
+            ),
+            "rank_error": rank_error,
+        }
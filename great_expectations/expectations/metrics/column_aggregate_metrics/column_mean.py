@@ -6,7 +6,6 @@ from great_expectations.execution_engine import (
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
 
@@ -16,7 +15,7 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         return column.mean()
@@ -13,7 +13,6 @@ from great_expectations.execution_engine.sparkdf_execution_engine import (
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
 
@@ -22,7 +21,7 @@ class ColumnMin(ColumnAggregateMetricProvider):
     metric_name = "column.min"
     value_keys = ("parse_strings_as_datetimes",)
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         parse_strings_as_datetimes: bool = (
             kwargs.get("parse_strings_as_datetimes") or False
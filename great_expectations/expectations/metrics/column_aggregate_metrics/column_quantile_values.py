@@ -21,6 +21,7 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches import KllQuantileSketch
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,14 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         """Quantile Function"""
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
 
+        # Numeric relative error selects single-pass sketch (as is the case for Spark), instead of exact quantiles.
+        if isinstance(allow_relative_error, float) and 0.0 < allow_relative_error < 1.0:
+            sketch = KllQuantileSketch(
+                k=KllQuantileSketch.k_for_rank_error(rank_error=allow_relative_error)
+            )
+            sketch.update(values=column)
+            return sketch.quantiles(quantiles=quantiles)
+
         if not allow_relative_error:
             allow_relative_error = "nearest"
 
@@ -97,82 +106,14 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         ) = execution_engine.get_compute_domain(
             metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
         )
-        column_name = accessor_domain_kwargs["column"]
-        column = sa.column(column_name)
-        sqlalchemy_engine = execution_engine.engine
-        dialect = sqlalchemy_engine.dialect
-        quantiles = metric_value_kwargs["quantiles"]
-        allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
-        table_row_count = metrics.get("table.row_count")
-        if dialect.name.lower() == GXSqlDialect.MSSQL:
-            return _get_column_quantiles_mssql(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == GXSqlDialect.BIGQUERY:
-            return _get_column_quantiles_bigquery(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == GXSqlDialect.MYSQL:
-            return _get_column_quantiles_mysql(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == GXSqlDialect.TRINO:
-            return _get_column_quantiles_trino(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == GXSqlDialect.SNOWFLAKE:
-            # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
-            # in its percentile_disc implementation that causes an error when we do
-            # not round. It is unclear to me *how* the call to round affects the behavior --
-            # the binary representation should be identical before and after, and I do
-            # not observe a type difference. However, the issue is replicable in the
-            # snowflake console and directly observable in side-by-side comparisons with
-            # and without the call to round()
-            quantiles = [round(x, 10) for x in quantiles]
-            return _get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
-                allow_relative_error=allow_relative_error,
-                dialect=dialect,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        elif dialect.name.lower() == GXSqlDialect.SQLITE:
-            return _get_column_quantiles_sqlite(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-                table_row_count=table_row_count,
-            )
-        elif dialect.name.lower() == GXSqlDialect.AWSATHENA:
-            return _get_column_quantiles_athena(
-                column=column,
-                quantiles=quantiles,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
-        else:
-            return _get_column_quantiles_generic_sqlalchemy(
-                column=column,
-                quantiles=quantiles,
-                allow_relative_error=allow_relative_error,
-                dialect=dialect,
-                selectable=selectable,
-                sqlalchemy_engine=sqlalchemy_engine,
-            )
+        return get_column_quantiles_sqlalchemy(
+            column=sa.column(accessor_domain_kwargs["column"]),
+            quantiles=metric_value_kwargs["quantiles"],
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error", False),
+            selectable=selectable,
+            sqlalchemy_engine=execution_engine.engine,
+            table_row_count=metrics.get("table.row_count"),
+        )
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -209,6 +150,87 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         return df.approxQuantile(column, list(quantiles), allow_relative_error)
 
 
+def get_column_quantiles_sqlalchemy(
+    column,
+    quantiles: Iterable,
+    allow_relative_error: Any,
+    selectable,
+    sqlalchemy_engine,
+    table_row_count: Any,
+) -> list:
+    """Computes quantiles of column by means of (exact, where available) percentile function of SQL dialect."""
+    dialect = sqlalchemy_engine.dialect
+    if dialect.name.lower() == GXSqlDialect.MSSQL:
+        return _get_column_quantiles_mssql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == GXSqlDialect.BIGQUERY:
+        return _get_column_quantiles_bigquery(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == GXSqlDialect.MYSQL:
+        return _get_column_quantiles_mysql(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == GXSqlDialect.TRINO:
+        return _get_column_quantiles_trino(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == GXSqlDialect.SNOWFLAKE:
+        # NOTE: 20201216 - JPC - snowflake has a representation/precision limitation
+        # in its percentile_disc implementation that causes an error when we do
+        # not round. It is unclear to me *how* the call to round affects the behavior --
+        # the binary representation should be identical before and after, and I do
+        # not observe a type difference. However, the issue is replicable in the
+        # snowflake console and directly observable in side-by-side comparisons with
+        # and without the call to round()
+        quantiles = [round(x, 10) for x in quantiles]
+        return _get_column_quantiles_generic_sqlalchemy(
+            column=column,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            dialect=dialect,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    elif dialect.name.lower() == GXSqlDialect.SQLITE:
+        return _get_column_quantiles_sqlite(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+            table_row_count=table_row_count,
+        )
+    elif dialect.name.lower() == GXSqlDialect.AWSATHENA:
+        return _get_column_quantiles_athena(
+            column=column,
+            quantiles=quantiles,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+    else:
+        return _get_column_quantiles_generic_sqlalchemy(
+            column=column,
+            quantiles=quantiles,
+            allow_relative_error=allow_relative_error,
+            dialect=dialect,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+        )
+
+
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, sqlalchemy_engine
 ) -> list:
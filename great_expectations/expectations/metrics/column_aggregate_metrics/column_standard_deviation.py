@@ -12,7 +12,6 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_partial,
-    column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -33,7 +32,7 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
         """Pandas Standard Deviation implementation"""
         return column.std()
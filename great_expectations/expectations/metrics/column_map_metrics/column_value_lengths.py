@@ -7,6 +7,7 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.arrow_compute import column_value_lengths
 from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -19,6 +20,7 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 
 class ColumnValuesValueLengthEquals(ColumnMapMetricProvider):
     condition_metric_name = "column_values.value_length.equals"
+    supports_arrow_backed_columns = True
     condition_value_keys = ("value",)
 
     @column_condition_partial(engine=PandasExecutionEngine)
@@ -63,6 +65,7 @@ class ColumnValuesValueLengthEquals(ColumnMapMetricProvider):
 class ColumnValuesValueLength(ColumnMapMetricProvider):
     condition_metric_name = "column_values.value_length.between"
     function_metric_name = "column_values.value_length"
+    supports_arrow_backed_columns = True
 
     condition_value_keys = (
         "min_value",
@@ -73,7 +76,7 @@ class ColumnValuesValueLength(ColumnMapMetricProvider):
 
     @column_function_partial(engine=PandasExecutionEngine)
     def _pandas_function(cls, column, **kwargs):
-        return column.astype(str).str.len()
+        return column_value_lengths(column=column)
 
     @column_function_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy_function(cls, column, **kwargs):
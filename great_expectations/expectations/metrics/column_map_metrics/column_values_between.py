@@ -1,6 +1,6 @@
 import datetime
 import warnings
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 import pandas as pd
 from dateutil.parser import parse
@@ -15,6 +15,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    pandas_column_values_are_instances_of,
+)
 
 
 class ColumnValuesBetween(ColumnMapMetricProvider):
@@ -72,7 +75,10 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
                     pass
 
             try:
-                temp_column = column.map(parse)
+                # Each distinct value is parsed only once.
+                temp_column = column.map(
+                    {value: parse(value) for value in pd.unique(column)}
+                )
             except TypeError:
                 temp_column = column
 
@@ -83,13 +89,17 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
             raise ValueError("min_value cannot be greater than max_value")
 
         # Use a vectorized approach for native numpy dtypes
-        if column.dtype in [int, float] and not allow_cross_type_comparisons:
+        if (
+            pd.api.types.is_numeric_dtype(temp_column.dtype)
+            and not pd.api.types.is_bool_dtype(temp_column.dtype)
+            and not allow_cross_type_comparisons
+        ):
             return cls._pandas_vectorized(
                 temp_column, min_value, max_value, strict_min, strict_max
             )
         elif (
-            isinstance(column.dtype, pd.DatetimeTZDtype)
-            or pd.api.types.is_datetime64_ns_dtype(column.dtype)
+            isinstance(temp_column.dtype, pd.DatetimeTZDtype)
+            or pd.api.types.is_datetime64_ns_dtype(temp_column.dtype)
         ) and (not allow_cross_type_comparisons):
             # NOTE: 20220818 - JPC
             # we parse the *parameters* that we will be comparing here because it is possible
@@ -108,6 +118,23 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
                 temp_column, min_value, max_value, strict_min, strict_max
             )
 
+        # Object columns, holding only strings (or only numbers) compared to strings (or to numbers), are compared in
+        # vectorized manner too; only columns of mixed (or other) types are checked value by value.
+        if not allow_cross_type_comparisons:
+            bound_types: Tuple[type, ...]
+            for bound_types in ((str,), (int, float)):
+                if all(
+                    bound is None or isinstance(bound, bound_types)
+                    for bound in (min_value, max_value)
+                ) and (
+                    pandas_column_values_are_instances_of(
+                        column=temp_column, types=bound_types
+                    ).all()
+                ):
+                    return cls._pandas_vectorized(
+                        temp_column, min_value, max_value, strict_min, strict_max
+                    )
+
         def is_between(val):
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).
             # Ensure types can be compared since some types in Python 3 cannot be logically compared.
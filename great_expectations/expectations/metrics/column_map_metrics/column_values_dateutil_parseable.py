@@ -1,10 +1,19 @@
+import pandas as pd
 from dateutil.parser import parse
 
-from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    get_pandas_column_value_types,
+    get_spark_column_condition_from_pandas,
+    map_pandas_column_distinct_strings,
+)
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -12,17 +21,29 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        def is_parseable(val):
-            try:
-                if type(val) != str:
-                    raise TypeError(
-                        "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                    )
+        return _is_dateutil_parseable(column=column)
+
+    @column_condition_partial(engine=SparkDFExecutionEngine)
+    def _spark(cls, column, **kwargs):
+        # Spark has no equivalent of "dateutil" parser; hence, values are checked by vectorized pandas implementation.
+        return get_spark_column_condition_from_pandas(
+            column=column, condition_fn=_is_dateutil_parseable
+        )
+
+
+def _is_dateutil_parseable(column: pd.Series) -> pd.Series:
+    if not (get_pandas_column_value_types(column=column) == str).all():
+        raise TypeError(
+            "Values passed to expect_column_values_to_be_dateutil_parseable must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
+        )
 
-                parse(val)
-                return True
+    def is_parseable(val):
+        try:
+            parse(val)
+            return True
 
-            except (ValueError, OverflowError):
-                return False
+        except (ValueError, OverflowError):
+            return False
 
-        return column.map(is_parseable)
+    # Each distinct value is parsed only once.
+    return map_pandas_column_distinct_strings(column=column, fn=is_parseable)
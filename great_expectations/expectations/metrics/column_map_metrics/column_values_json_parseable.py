@@ -1,14 +1,19 @@
 import json
 
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
-from great_expectations.expectations.metrics.import_manager import F, sparktypes
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    get_spark_column_condition_from_pandas,
+    map_pandas_column_distinct_strings,
+)
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -16,24 +21,24 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        return column.map(is_json)
+        return _is_json_parseable(column=column)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
-        def is_json(val):
-            try:
-                json.loads(val)
-                return True
-            except:
-                return False
-
-        is_json_udf = F.udf(is_json, sparktypes.BooleanType())
-
-        return is_json_udf(column)
+        # Spark JSON functions ("get_json_object()", "from_json()") ignore trailing content and require schema,
+        # respectively; hence, values are checked by vectorized pandas implementation.
+        return get_spark_column_condition_from_pandas(
+            column=column, condition_fn=_is_json_parseable
+        )
+
+
+def _is_json_parseable(column: pd.Series) -> pd.Series:
+    def is_json(val):
+        try:
+            json.loads(val)
+            return True
+        except:
+            return False
+
+    # Each distinct string is decoded only once (other values, e.g., bytes, are decoded one by one).
+    return map_pandas_column_distinct_strings(column=column, fn=is_json)
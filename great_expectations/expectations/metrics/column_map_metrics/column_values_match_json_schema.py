@@ -1,17 +1,23 @@
+import functools
 import json
 
 import jsonschema
+import pandas as pd
 
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
-from great_expectations.expectations.metrics.import_manager import F, sparktypes
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    get_spark_column_condition_from_pandas,
+    map_pandas_column_distinct_strings,
+    pandas_column_values_are_instances_of,
+)
 
 
 class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
@@ -20,45 +26,37 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
-        def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        return column.map(matches_json_schema)
+        return _match_json_schema(column=column, json_schema=json_schema)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
         # This step insures that Spark UDF defined can be pickled; otherwise, pickle serialization exceptions may occur.
         json_schema = convert_to_json_serializable(data=json_schema)
 
-        def matches_json_schema(val):
-            if val is None:
-                return False
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(instance=val_json, schema=json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
-
-        matches_json_schema_udf = F.udf(
-            lambda val: matches_json_schema(val=val), sparktypes.BooleanType()
+        # Spark has no JSON Schema validation; hence, values are checked by vectorized pandas implementation.
+        return get_spark_column_condition_from_pandas(
+            column=column,
+            condition_fn=functools.partial(_match_json_schema, json_schema=json_schema),
         )
 
-        return matches_json_schema_udf(column)
+
+def _match_json_schema(column: pd.Series, json_schema: dict) -> pd.Series:
+    def matches_json_schema(val):
+        try:
+            val_json = json.loads(val)
+            jsonschema.validate(instance=val_json, schema=json_schema)
+            # jsonschema.validate raises an error if validation fails.
+            # So if we make it this far, we know that the validation succeeded.
+            return True
+        except jsonschema.ValidationError:
+            return False
+        except jsonschema.SchemaError:
+            raise
+        except:
+            raise
+
+    if not pandas_column_values_are_instances_of(column=column, types=(str,)).all():
+        return column.map(matches_json_schema)
+
+    # Each distinct value is decoded and validated only once.
+    return map_pandas_column_distinct_strings(column=column, fn=matches_json_schema)
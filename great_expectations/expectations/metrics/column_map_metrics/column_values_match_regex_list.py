@@ -7,6 +7,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.arrow_compute import (
+    column_values_match_regex,
+)
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -19,6 +22,7 @@ logger = logging.getLogger(__name__)
 
 class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
     condition_metric_name = "column_values.match_regex_list"
+    supports_arrow_backed_columns = True
     condition_value_keys = (
         "regex_list",
         "match_on",
@@ -29,7 +33,7 @@ class ColumnValuesMatchRegexList(ColumnMapMetricProvider):
     def _pandas(cls, column, regex_list, match_on, **kwargs):
         regex_matches = []
         for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
+            regex_matches.append(column_values_match_regex(column=column, regex=regex))
         regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
 
         if match_on == "any":
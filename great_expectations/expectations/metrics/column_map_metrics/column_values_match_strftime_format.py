@@ -1,14 +1,20 @@
+import functools
 from datetime import datetime
 
+import pandas as pd
+
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
-from great_expectations.expectations.metrics.import_manager import F, sparktypes
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    get_spark_column_condition_from_pandas,
+    map_pandas_column_distinct_strings,
+)
 
 
 class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
@@ -17,18 +23,7 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, strftime_format, **kwargs):
-        def is_parseable_by_format(val):
-            try:
-                datetime.strptime(val, strftime_format)
-                return True
-            except TypeError:
-                raise TypeError(
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                )
-            except ValueError:
-                return False
-
-        return column.map(is_parseable_by_format)
+        return _match_strftime_format(column=column, strftime_format=strftime_format)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, strftime_format, **kwargs):
@@ -41,18 +36,29 @@ class ColumnValuesMatchStrftimeFormat(ColumnMapMetricProvider):
         except ValueError as e:
             raise ValueError(f"Unable to use provided strftime_format: {str(e)}")
 
-        def is_parseable_by_format(val):
-            if val is None:
-                return False
-            try:
-                datetime.strptime(val, strftime_format)
-                return True
-            except TypeError:
-                raise TypeError(
-                    "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
-                )
-            except ValueError:
-                return False
-
-        success_udf = F.udf(is_parseable_by_format, sparktypes.BooleanType())
-        return success_udf(column)
+        # Spark "to_timestamp()" (Java date-time patterns) is both more lenient and stricter than "strptime()" in ways
+        # that cannot be expressed by translated format; hence, values are checked by vectorized pandas implementation.
+        return get_spark_column_condition_from_pandas(
+            column=column,
+            condition_fn=functools.partial(
+                _match_strftime_format, strftime_format=strftime_format
+            ),
+        )
+
+
+def _match_strftime_format(column: pd.Series, strftime_format: str) -> pd.Series:
+    """Equivalent of checking every (non-null) value of column with "datetime.strptime()", which parses each distinct
+    string value only once."""
+
+    def is_parseable_by_format(val):
+        try:
+            datetime.strptime(val, strftime_format)
+            return True
+        except TypeError:
+            raise TypeError(
+                "Values passed to expect_column_values_to_match_strftime_format must be of type string.\nIf you want to validate a column of dates or timestamps, please call the expectation before converting from string format."
+            )
+        except ValueError:
+            return False
+
+    return map_pandas_column_distinct_strings(column=column, fn=is_parseable_by_format)
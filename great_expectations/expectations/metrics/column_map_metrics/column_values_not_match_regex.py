@@ -5,6 +5,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.arrow_compute import (
+    column_values_match_regex,
+)
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
@@ -16,11 +19,12 @@ logger = logging.getLogger(__name__)
 
 class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_match_regex"
+    supports_arrow_backed_columns = True
     condition_value_keys = ("regex",)
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex, **kwargs):
-        return ~column.astype(str).str.contains(regex)
+        return ~column_values_match_regex(column=column, regex=regex)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(cls, column, regex, _dialect, **kwargs):
@@ -7,6 +7,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.metrics.arrow_compute import (
+    column_values_match_regex,
+)
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
@@ -19,13 +22,14 @@ logger = logging.getLogger(__name__)
 
 class ColumnValuesNotMatchRegexList(ColumnMapMetricProvider):
     condition_metric_name = "column_values.not_match_regex_list"
+    supports_arrow_backed_columns = True
     condition_value_keys = ("regex_list",)
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex_list, **kwargs):
         regex_matches = []
         for regex in regex_list:
-            regex_matches.append(column.astype(str).str.contains(regex))
+            regex_matches.append(column_values_match_regex(column=column, regex=regex))
         regex_match_df = pd.concat(regex_matches, axis=1, ignore_index=True)
 
         return ~regex_match_df.any(axis="columns")
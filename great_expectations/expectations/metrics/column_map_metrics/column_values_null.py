@@ -20,6 +20,7 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 
 class ColumnValuesNull(ColumnMapMetricProvider):
     condition_metric_name = "column_values.null"
+    supports_arrow_backed_columns = True
     filter_column_isnull = False
 
     @column_condition_partial(engine=PandasExecutionEngine)
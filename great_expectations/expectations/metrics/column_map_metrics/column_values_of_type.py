@@ -9,6 +9,9 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    pandas_column_values_are_instances_of,
+)
 
 
 class ColumnValuesOfType(ColumnMapMetricProvider):
@@ -42,4 +45,6 @@ class ColumnValuesOfType(ColumnMapMetricProvider):
         if len(comp_types) < 1:
             raise ValueError(f"Unrecognized numpy/python type: {type_}")
 
-        return column.map(lambda x: isinstance(x, tuple(comp_types)))
+        return pandas_column_values_are_instances_of(
+            column=column, types=tuple(comp_types)
+        )
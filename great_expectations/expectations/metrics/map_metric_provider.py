@@ -14,6 +14,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.bundled_metric_configuration import (
+    BundledWindowConditionCount,
+)
 from great_expectations.execution_engine.execution_engine import (
     MetricDomainTypes,
     MetricFunctionTypes,
@@ -34,6 +37,7 @@ from great_expectations.expectations.metrics.util import (
     Insert,
     Label,
     Select,
+    fetch_unexpected_sqlalchemy_query_results,
     get_dbms_compatible_column_names,
     get_sqlalchemy_source_table_and_schema,
     sql_statement_with_post_compile_to_string,
@@ -1962,6 +1966,37 @@ def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
     )
 
 
+def _sqlalchemy_window_condition_unexpected_count_aggregate_fn(
+    cls,
+    execution_engine: SqlAlchemyExecutionEngine,
+    metric_domain_kwargs: dict,
+    metric_value_kwargs: dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns unexpected count for MapExpectations, whose unexpected_condition is a window function (to be computed
+    together with unexpected counts of all other window conditions over same domain records, in one query).
+    """
+    unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
+        "unexpected_condition"
+    )
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.  Domain records do not depend on "column", however; hence, window
+    conditions of all columns (over same compute domain) are counted together.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+    domain_kwargs.pop("column", None)
+
+    return (
+        BundledWindowConditionCount(
+            condition=unexpected_condition, domain_kwargs=domain_kwargs
+        ),
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    )
+
+
 def _sqlalchemy_map_condition_unexpected_count_value(
     cls,
     execution_engine: SqlAlchemyExecutionEngine,
@@ -2111,10 +2146,12 @@ def _sqlalchemy_column_map_condition_values(
         )
         query = query.limit(10000)  # BigQuery upper bound on query parameters
 
-    return [
-        val.unexpected_values
-        for val in execution_engine.engine.execute(query).fetchall()
-    ]
+    return fetch_unexpected_sqlalchemy_query_results(
+        execution_engine=execution_engine,
+        query=query,
+        result_format=result_format,
+        row_fn=lambda row: row.unexpected_values,
+    )
 
 
 def _sqlalchemy_column_pair_map_condition_values(
@@ -2168,11 +2205,12 @@ def _sqlalchemy_column_pair_map_condition_values(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
 
-    unexpected_list = [
-        (val.unexpected_values_A, val.unexpected_values_B)
-        for val in execution_engine.engine.execute(query).fetchall()
-    ]
-    return unexpected_list
+    return fetch_unexpected_sqlalchemy_query_results(
+        execution_engine=execution_engine,
+        query=query,
+        result_format=result_format,
+        row_fn=lambda row: (row.unexpected_values_A, row.unexpected_values_B),
+    )
 
 
 def _sqlalchemy_column_pair_map_condition_filtered_row_count(
@@ -2253,7 +2291,12 @@ def _sqlalchemy_multicolumn_map_condition_values(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
 
-    return [dict(val) for val in execution_engine.engine.execute(query).fetchall()]
+    return fetch_unexpected_sqlalchemy_query_results(
+        execution_engine=execution_engine,
+        query=query,
+        result_format=result_format,
+        row_fn=dict,
+    )
 
 
 def _sqlalchemy_multicolumn_map_condition_filtered_row_count(
@@ -2372,7 +2415,11 @@ def _sqlalchemy_map_condition_rows(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
     try:
-        return execution_engine.engine.execute(query).fetchall()
+        return fetch_unexpected_sqlalchemy_query_results(
+            execution_engine=execution_engine,
+            query=query,
+            result_format=result_format,
+        )
     except OperationalError as oe:
         exception_message: str = f"An SQL execution Exception occurred: {str(oe)}."
         raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
@@ -2494,18 +2541,14 @@ def _sqlalchemy_map_condition_index(
             domain_records_as_selectable
         ).limit(result_format["partial_unexpected_count"])
     )
-    query_result: List[tuple] = execution_engine.engine.execute(final_query).fetchall()
-
-    unexpected_index_list: Optional[List[Dict[str, Any]]] = []
-
-    for row in query_result:
-        primary_key_dict: Dict[str, Any] = {}
-        for index in range(len(unexpected_index_column_names)):
-            name: str = unexpected_index_column_names[index]
-            primary_key_dict[name] = row[index]
-        unexpected_index_list.append(primary_key_dict)
-
-    return unexpected_index_list
+    return fetch_unexpected_sqlalchemy_query_results(
+        execution_engine=execution_engine,
+        query=final_query,
+        result_format=result_format,
+        row_fn=lambda row: {
+            name: row[index] for index, name in enumerate(unexpected_index_column_names)
+        },
+    )
 
 
 def _spark_map_condition_unexpected_count_aggregate_fn(
@@ -3092,15 +3135,38 @@ class MapMetricProvider(MetricProvider):
                     elif (
                         metric_fn_type == MetricPartialFunctionTypes.WINDOW_CONDITION_FN
                     ):
-                        register_metric(
-                            metric_name=f"{metric_name}.unexpected_count",
-                            metric_domain_keys=metric_domain_keys,
-                            metric_value_keys=metric_value_keys,
-                            execution_engine=engine,
-                            metric_class=cls,
-                            metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
-                            metric_fn_type=MetricFunctionTypes.VALUE,
-                        )
+                        if MapMetricProvider.is_sqlalchemy_metric_selectable(
+                            map_metric_provider=cls
+                        ):
+                            register_metric(
+                                metric_name=f"{metric_name}.unexpected_count",
+                                metric_domain_keys=metric_domain_keys,
+                                metric_value_keys=metric_value_keys,
+                                execution_engine=engine,
+                                metric_class=cls,
+                                metric_provider=_sqlalchemy_map_condition_unexpected_count_value,
+                                metric_fn_type=MetricFunctionTypes.VALUE,
+                            )
+                        else:
+                            register_metric(
+                                metric_name=metric_name
+                                + ".unexpected_count.aggregate_fn",
+                                metric_domain_keys=metric_domain_keys,
+                                metric_value_keys=metric_value_keys,
+                                execution_engine=engine,
+                                metric_class=cls,
+                                metric_provider=_sqlalchemy_window_condition_unexpected_count_aggregate_fn,
+                                metric_fn_type=MetricPartialFunctionTypes.AGGREGATE_FN,
+                            )
+                            register_metric(
+                                metric_name=f"{metric_name}.unexpected_count",
+                                metric_domain_keys=metric_domain_keys,
+                                metric_value_keys=metric_value_keys,
+                                execution_engine=engine,
+                                metric_class=cls,
+                                metric_provider=None,
+                                metric_fn_type=MetricFunctionTypes.VALUE,
+                            )
                     if domain_type == MetricDomainTypes.COLUMN:
                         register_metric(
                             metric_name=f"{metric_name}.unexpected_values",
@@ -79,7 +79,9 @@ class MetricProvider(metaclass=MetaMetricProvider):
     In some cases, subclasses of Expectation, such as TableMetricProvider will already
     have correct values that may simply be inherited.
 
-    They *may* optionally override the `default_kwarg_values` attribute.
+    They *may* optionally override the `default_kwarg_values` attribute, and set the `supports_arrow_backed_columns`
+    attribute, if their pandas implementations compute correct values on Arrow-backed ("pd.ArrowDtype") columns (other
+    metrics are computed on NumPy-backed copies of such columns).
 
     MetricProvider classes *must* implement the following:
         1. `_get_evaluation_dependencies`. Note that often, _get_evaluation_dependencies should
@@ -97,6 +99,7 @@ class MetricProvider(metaclass=MetaMetricProvider):
     domain_keys: Tuple[str, ...] = tuple()
     value_keys: Tuple[str, ...] = tuple()
     default_kwarg_values = {}
+    supports_arrow_backed_columns: bool = False
 
     @classmethod
     def _register_metric_functions(cls) -> None:
@@ -0,0 +1,434 @@
+"""Streaming, mergeable sketches, used by approximate column aggregate metrics.
+
+Every sketch consumes column values in chunks (so that it can be updated batch by batch, or chunk by chunk, and merged
+with sketches of other Batch objects), uses memory bounded by its accuracy parameters (rather than by number of rows),
+and reports error bound of its estimates:
+
+    - "KllQuantileSketch" (quantiles): rank of every estimated quantile is within "rank_error" (fraction of all values)
+      of requested quantile (with probability of 99%).
+    - "HyperLogLogSketch" (number of distinct values): estimate has relative standard error "relative_standard_error".
+    - "CountMinSketch" (frequencies and heavy hitters): estimated frequency of value never underestimates its true
+      frequency, and overestimates it by at most "count_error" (with probability "confidence").
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# Normalized rank error of KLL sketch for given "k" is approximately "2.296 / k ** 0.9723" (99% confidence, single
+# quantile), as established empirically for KLL sketch implementation of Apache DataSketches library.
+KLL_RANK_ERROR_COEFFICIENT: float = 2.296
+KLL_RANK_ERROR_EXPONENT: float = 0.9723
+KLL_MIN_K: int = 8
+KLL_MAX_K: int = 65535
+KLL_DEFAULT_K: int = 200
+# Values are consumed in chunks of bounded size, so that compactions sort at most this many values at a time.
+KLL_UPDATE_CHUNK_SIZE: int = 2**16
+
+HLL_MIN_PRECISION: int = 4
+HLL_MAX_PRECISION: int = 18
+HLL_DEFAULT_PRECISION: int = 14
+
+
+def hash_values(values: Union[pd.Series, np.ndarray, Sequence]) -> np.ndarray:
+    """Returns 64-bit hashes of values (equal values of same type have equal hashes in every chunk and Batch)."""
+    if not isinstance(values, pd.Series):
+        values = pd.Series(list(values))
+
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+    """Vectorized number of leading zero bits of 64-bit unsigned integers."""
+    values = values.astype(np.uint64, copy=True)
+    leading_zeros: np.ndarray = np.zeros(values.shape, dtype=np.uint8)
+    shift: int
+    for shift in (32, 16, 8, 4, 2, 1):
+        is_short: np.ndarray = values < (np.uint64(1) << np.uint64(64 - shift))
+        leading_zeros[is_short] += shift
+        values[is_short] <<= np.uint64(shift)
+
+    leading_zeros[values == 0] = 64
+    return leading_zeros
+
+
+class KllQuantileSketch:
+    """KLL sketch (Karnin, Lang, and Liberty, 2016) of numeric values, estimating their quantiles.
+
+    Values are kept in hierarchy of "compactors"; every value at level "h" stands for "2 ** h" values of input.  Once
+    compactor exceeds its capacity, its values are sorted, and every other value (starting at random offset) is promoted
+    to next level, so that memory is "O(k)" regardless of number of values, and sketches can be merged level by level.
+    """
+
+    def __init__(self, k: int = KLL_DEFAULT_K, seed: Optional[int] = 0) -> None:
+        """
+        Args:
+            k: Accuracy parameter (capacity of top level compactor); see "KllQuantileSketch.k_for_rank_error()".
+            seed: Seed of random offsets, used when compacting (fixed by default, so that estimates are reproducible).
+        """
+        if k < KLL_MIN_K or k > KLL_MAX_K:
+            raise ValueError(
+                f"""Value of "k" for {self.__class__.__name__} must be between {KLL_MIN_K} and {KLL_MAX_K}."""
+            )
+
+        self._k = k
+        self._rng = np.random.default_rng(seed)
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._count: int = 0
+        # Extreme values are tracked exactly (compactions may discard them), so that quantiles 0 and 1 are exact.
+        self._min_value: float = math.inf
+        self._max_value: float = -math.inf
+
+    @staticmethod
+    def k_for_rank_error(rank_error: float) -> int:
+        """Returns smallest "k", for which normalized rank error of sketch does not exceed "rank_error"."""
+        if not 0.0 < rank_error < 1.0:
+            raise ValueError('"rank_error" must be between 0 and 1 (exclusive).')
+
+        k: int = math.ceil(
+            (KLL_RANK_ERROR_COEFFICIENT / rank_error) ** (1.0 / KLL_RANK_ERROR_EXPONENT)
+        )
+        return min(max(k, KLL_MIN_K), KLL_MAX_K)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """Number of values, consumed by sketch."""
+        return self._count
+
+    @property
+    def rank_error(self) -> float:
+        """Normalized rank error of estimated quantiles (99% confidence)."""
+        return KLL_RANK_ERROR_COEFFICIENT / self._k**KLL_RANK_ERROR_EXPONENT
+
+    @property
+    def num_retained(self) -> int:
+        """Number of values retained by sketch (its memory footprint)."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, values: Union[pd.Series, np.ndarray, Sequence]) -> None:
+        """Consumes chunk of numeric values (null values are ignored)."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self._count += len(values)
+        self._min_value = min(self._min_value, float(np.min(values)))
+        self._max_value = max(self._max_value, float(np.max(values)))
+        start: int
+        for start in range(0, len(values), KLL_UPDATE_CHUNK_SIZE):
+            self._levels[0] = np.concatenate(
+                [self._levels[0], values[start : start + KLL_UPDATE_CHUNK_SIZE]]
+            )
+            self._compress()
+
+    def merge(self, other: KllQuantileSketch) -> None:
+        """Merges other sketch into this one (result summarizes values of both sketches)."""
+        level: int
+        for level, values in enumerate(other._levels):
+            if level >= len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+
+            self._levels[level] = np.concatenate([self._levels[level], values])
+
+        self._count += other._count
+        self._min_value = min(self._min_value, other._min_value)
+        self._max_value = max(self._max_value, other._max_value)
+        self._compress()
+
+    def quantiles(self, quantiles: Sequence[float]) -> List[Optional[float]]:
+        """Returns estimated values at given quantiles (None, if sketch has not consumed any values)."""
+        if self._count == 0:
+            return [None for _ in quantiles]
+
+        values: np.ndarray = np.concatenate(self._levels)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(len(level_values), 2**level, dtype=np.int64)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order: np.ndarray = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+        total_weight: int = int(cumulative_weights[-1])
+
+        quantile: float
+        result: List[Optional[float]] = []
+        for quantile in quantiles:
+            if not 0.0 <= quantile <= 1.0:
+                raise ValueError("Quantiles must be between 0 and 1.")
+
+            if quantile == 0.0:
+                result.append(self._min_value)
+                continue
+
+            if quantile == 1.0:
+                result.append(self._max_value)
+                continue
+
+            index: int = int(
+                np.searchsorted(
+                    cumulative_weights, max(quantile * total_weight, 1), side="left"
+                )
+            )
+            result.append(float(values[min(index, len(values) - 1)]))
+
+        return result
+
+    def _capacity(self, level: int) -> int:
+        depth: int = len(self._levels) - level - 1
+        return max(int(math.ceil(self._k * (2.0 / 3.0) ** depth)), 2)
+
+    def _compress(self) -> None:
+        level: int = 0
+        while level < len(self._levels):
+            values: np.ndarray = self._levels[level]
+            if len(values) > self._capacity(level=level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+
+                values = np.sort(values, kind="stable")
+                # Odd value out stays at present level, so that total weight is preserved exactly.
+                remainder: np.ndarray = values[len(values) - len(values) % 2 :]
+                values = values[: len(values) - len(values) % 2]
+                offset: int = int(self._rng.integers(0, 2))
+                self._levels[level] = remainder
+                self._levels[level + 1] = np.concatenate(
+                    [self._levels[level + 1], values[offset::2]]
+                )
+
+            level += 1
+
+
+class HyperLogLogSketch:
+    """HyperLogLog sketch (Flajolet, Fusy, Gandouet, and Meunier, 2007), estimating number of distinct values.
+
+    Every value is hashed to 64 bits; first "precision" bits select one of "2 ** precision" registers, which retains
+    maximum position of leftmost 1-bit in remaining bits.  Sketches with same precision merge by taking register maxima.
+    """
+
+    def __init__(self, precision: int = HLL_DEFAULT_PRECISION) -> None:
+        """
+        Args:
+            precision: Number of hash bits selecting register; see "HyperLogLogSketch.precision_for_relative_error()".
+        """
+        if precision < HLL_MIN_PRECISION or precision > HLL_MAX_PRECISION:
+            raise ValueError(
+                f"""Value of "precision" for {self.__class__.__name__} must be between {HLL_MIN_PRECISION} and \
+{HLL_MAX_PRECISION}."""
+            )
+
+        self._precision = precision
+        self._registers: np.ndarray = np.zeros(2**precision, dtype=np.uint8)
+
+    @staticmethod
+    def precision_for_relative_error(relative_standard_error: float) -> int:
+        """Returns smallest precision, for which relative standard error does not exceed "relative_standard_error"."""
+        if not 0.0 < relative_standard_error < 1.0:
+            raise ValueError(
+                '"relative_standard_error" must be between 0 and 1 (exclusive).'
+            )
+
+        precision: int = math.ceil(2 * math.log2(1.04 / relative_standard_error))
+        return min(max(precision, HLL_MIN_PRECISION), HLL_MAX_PRECISION)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_standard_error(self) -> float:
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def update(self, values: Union[pd.Series, np.ndarray, Sequence]) -> None:
+        """Consumes chunk of values (null values are ignored)."""
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values)
+
+        values = values.dropna()
+        if len(values) == 0:
+            return
+
+        self.update_hashes(hashes=hash_values(values=values))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Consumes chunk of 64-bit hashes of values (as computed by "hash_values()")."""
+        precision: np.uint64 = np.uint64(self._precision)
+        registers: np.ndarray = (hashes >> (np.uint64(64) - precision)).astype(np.int64)
+        ranks: np.ndarray = np.minimum(
+            _count_leading_zeros(values=hashes << precision) + 1,
+            64 - self._precision + 1,
+        ).astype(np.uint8)
+        np.maximum.at(self._registers, registers, ranks)
+
+    def merge(self, other: HyperLogLogSketch) -> None:
+        if other._precision != self._precision:
+            raise ValueError(
+                f"Only {self.__class__.__name__} objects of same precision can be merged."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+
+    def count(self) -> int:
+        """Returns estimated number of distinct values."""
+        num_registers: int = len(self._registers)
+        alpha: float
+        if num_registers == 16:
+            alpha = 0.673
+        elif num_registers == 32:
+            alpha = 0.697
+        elif num_registers == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1.0 + 1.079 / num_registers)
+
+        estimate: float = (
+            alpha
+            * num_registers**2
+            / float(np.sum(np.power(2.0, -self._registers.astype(np.float64))))
+        )
+        num_zero_registers: int = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_zero_registers > 0:
+            # Small range correction ("linear counting").
+            estimate = num_registers * math.log(num_registers / num_zero_registers)
+
+        return int(round(estimate))
+
+
+class CountMinSketch:
+    """Count-Min sketch (Cormode and Muthukrishnan, 2005), estimating frequencies of values, and tracking heavy hitters.
+
+    Frequencies are counted in "depth" rows of "width" counters (each row uses its own hash of value); estimate is
+    minimum over rows.  In order to report heavy hitters (without retaining all distinct values), at most
+    "max_candidates" values with highest estimated frequencies are retained as candidates.
+    """
+
+    def __init__(
+        self,
+        relative_error: float = 1.0e-3,
+        confidence: float = 0.99,
+        max_candidates: int = 1000,
+    ) -> None:
+        """
+        Args:
+            relative_error: Estimated frequencies exceed true frequencies by at most "relative_error" times number of
+                consumed values (with probability "confidence").
+            confidence: Probability, with which "relative_error" bound holds.
+            max_candidates: Maximum number of heavy hitter candidates retained.
+        """
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError('"relative_error" must be between 0 and 1 (exclusive).')
+
+        if not 0.0 < confidence < 1.0:
+            raise ValueError('"confidence" must be between 0 and 1 (exclusive).')
+
+        self._relative_error = relative_error
+        self._confidence = confidence
+        self._width: int = int(math.ceil(math.e / relative_error))
+        self._depth: int = int(math.ceil(math.log(1.0 / (1.0 - confidence))))
+        self._counters: np.ndarray = np.zeros(
+            (self._depth, self._width), dtype=np.int64
+        )
+        self._max_candidates = max_candidates
+        self._candidates: Dict[Any, int] = {}
+        self._count: int = 0
+
+    @property
+    def count(self) -> int:
+        """Number of values, consumed by sketch."""
+        return self._count
+
+    @property
+    def confidence(self) -> float:
+        return self._confidence
+
+    @property
+    def count_error(self) -> float:
+        """Maximum overestimate of frequency of any value (holds with probability "confidence")."""
+        return self._relative_error * self._count
+
+    def update(self, values: Union[pd.Series, np.ndarray, Sequence]) -> None:
+        """Consumes chunk of values (null values are ignored)."""
+        if not isinstance(values, pd.Series):
+            values = pd.Series(values)
+
+        value_counts: pd.Series = values.value_counts(dropna=True)
+        if len(value_counts) == 0:
+            return
+
+        self._count += int(value_counts.sum())
+        hashes: np.ndarray = hash_values(values=value_counts.index)
+        counts: np.ndarray = value_counts.to_numpy(dtype=np.int64)
+        row: int
+        for row, columns in enumerate(self._columns(hashes=hashes)):
+            np.add.at(self._counters[row], columns, counts)
+
+        candidates: List[Any] = list(self._candidates.keys()) + [
+            value for value in value_counts.index if value not in self._candidates
+        ]
+        self._retain_candidates(candidates=candidates)
+
+    def merge(self, other: CountMinSketch) -> None:
+        if self._counters.shape != other._counters.shape:
+            raise ValueError(
+                f"Only {self.__class__.__name__} objects of same dimensions can be merged."
+            )
+
+        self._counters += other._counters
+        self._count += other._count
+        self._retain_candidates(
+            candidates=list(dict.fromkeys([*self._candidates, *other._candidates]))
+        )
+
+    def estimate(self, values: Sequence[Any]) -> List[int]:
+        """Returns estimated frequencies of given values."""
+        if len(values) == 0:
+            return []
+
+        hashes: np.ndarray = hash_values(values=values)
+        estimates: np.ndarray = np.min(
+            np.stack(
+                [
+                    self._counters[row][columns]
+                    for row, columns in enumerate(self._columns(hashes=hashes))
+                ]
+            ),
+            axis=0,
+        )
+        return [int(estimate) for estimate in estimates]
+
+    def heavy_hitters(self, min_frequency: float) -> List[Dict[str, Any]]:
+        """Returns candidate values, whose estimated frequency is at least "min_frequency" of consumed values (by
+        descending estimated count)."""
+        threshold: float = min_frequency * self._count
+        heavy_hitters: List[Dict[str, Any]] = [
+            {"value": value, "count": count}
+            for value, count in self._candidates.items()
+            if count >= threshold
+        ]
+        return sorted(heavy_hitters, key=lambda item: item["count"], reverse=True)
+
+    def _columns(self, hashes: np.ndarray) -> List[np.ndarray]:
+        # Rows use "double hashing" ("h1 + row * h2"), derived from halves of 64-bit hash of value.
+        low: np.ndarray = hashes & np.uint64(0xFFFFFFFF)
+        high: np.ndarray = hashes >> np.uint64(32)
+        width: np.uint64 = np.uint64(self._width)
+        return [
+            ((low + np.uint64(row) * high) % width).astype(np.int64)
+            for row in range(self._depth)
+        ]
+
+    def _retain_candidates(self, candidates: List[Any]) -> None:
+        estimates: List[int] = self.estimate(values=candidates)
+        ranked: List[tuple] = sorted(
+            zip(candidates, estimates), key=lambda item: item[1], reverse=True
+        )
+        self._candidates = dict(ranked[: self._max_candidates])
@@ -1,3 +1,5 @@
+import hashlib
+from functools import partial
 from typing import Any, Dict, Optional, cast
 
 from great_expectations.core.metric_domain_types import MetricDomainTypes
@@ -7,9 +9,13 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_batch_data import (
+    get_numpy_backed_dtypes,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_schema_cache import SchemaCacheKey
 from great_expectations.expectations.metrics.import_manager import sparktypes
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.expectations.metrics.table_metric_provider import (
@@ -27,6 +33,7 @@ class ColumnTypes(TableMetricProvider):
     metric_name = "table.column_types"
     value_keys = ("include_nested",)
     default_kwarg_values = {"include_nested": True}
+    supports_arrow_backed_columns = True
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(
@@ -40,9 +47,11 @@ class ColumnTypes(TableMetricProvider):
         df, _, _ = execution_engine.get_compute_domain(
             metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
         )
+        # Types of Arrow-backed columns are reported as types of their NumPy-backed copies, on which other metrics (e.g.,
+        # types of column values) are computed.
         return [
             {"name": name, "type": dtype}
-            for (name, dtype) in zip(df.columns, df.dtypes)
+            for (name, dtype) in zip(df.columns, get_numpy_backed_dtypes(df=df))
         ]
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -73,7 +82,7 @@ class ColumnTypes(TableMetricProvider):
                 "the requested batch is not available; please load the batch into the execution engine."
             )
 
-        return _get_sqlalchemy_column_metadata(execution_engine.engine, batch_data)
+        return _get_sqlalchemy_column_metadata(execution_engine, batch_data)
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
@@ -92,21 +101,33 @@ class ColumnTypes(TableMetricProvider):
         )
 
 
-def _get_sqlalchemy_column_metadata(engine, batch_data: SqlAlchemyBatchData):
+def _get_sqlalchemy_column_metadata(
+    execution_engine: SqlAlchemyExecutionEngine, batch_data: SqlAlchemyBatchData
+):
     # if a custom query was passed
     if isinstance(batch_data.selectable, TextClause):
         table_selectable: TextClause = batch_data.selectable
         schema_name = None
+        # Column metadata of custom query are cached by hash of its text.
+        schema_cache_key: SchemaCacheKey = (
+            None,
+            hashlib.md5(str(table_selectable).encode("utf-8")).hexdigest(),
+        )
     else:
         table_selectable: str = (  # type: ignore[no-redef]
             batch_data.source_table_name or batch_data.selectable.name
         )
         schema_name = batch_data.source_schema_name or batch_data.selectable.schema
-
-    return get_sqlalchemy_column_metadata(
-        engine=engine,
-        table_selectable=table_selectable,
-        schema_name=schema_name,
+        schema_cache_key = (schema_name, table_selectable)
+
+    return execution_engine.schema_cache.get_or_reflect(
+        key=schema_cache_key,
+        reflect=partial(
+            get_sqlalchemy_column_metadata,
+            engine=execution_engine.engine,
+            table_selectable=table_selectable,
+            schema_name=schema_name,
+        ),
     )
 
 
@@ -21,6 +21,7 @@ from great_expectations.expectations.metrics.table_metric_provider import (
 
 class TableRowCount(TableMetricProvider):
     metric_name = "table.row_count"
+    supports_arrow_backed_columns = True
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(
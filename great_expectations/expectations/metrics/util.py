@@ -1,19 +1,29 @@
+import json
 import logging
+import os
 import re
+import uuid
 import warnings
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.execution_engine import (
     ExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.util import check_sql_engine_dialect
+from great_expectations.expectations.metrics.import_manager import (
+    F,
+    pyspark_sql_Column,
+    sparktypes,
+)
 from great_expectations.util import get_sqlalchemy_inspector
 
 try:
@@ -120,6 +130,11 @@ except ImportError:
         pybigquery = None
         namedtuple = None
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 try:
     import teradatasqlalchemy.dialect
     import teradatasqlalchemy.types as teradatatypes
@@ -709,6 +724,93 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def get_pandas_column_value_types(column: pd.Series) -> pd.Series:
+    """Returns types of (Python) values of column, as seen by "column.map()".
+
+    Values of columns with numeric, boolean, or datetime numpy dtypes are all of same type; hence, only first value is
+    inspected.  Otherwise ("object" and extension dtypes), "type" builtin is applied to every value (no Python-level
+    function call per value).
+    """
+    if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufcmM":
+        if column.empty:
+            return pd.Series([], index=column.index, dtype=object)
+
+        return pd.Series(
+            type(column.iloc[:1].astype(object).iloc[0]),
+            index=column.index,
+            dtype=object,
+        )
+
+    return column.astype(object).map(type)
+
+
+def pandas_column_values_are_instances_of(
+    column: pd.Series, types: Tuple[type, ...]
+) -> pd.Series:
+    """Vectorized equivalent of "column.map(lambda x: isinstance(x, types))".
+
+    Type check is evaluated once per distinct type of column values, rather than once per value.
+    """
+    value_types: pd.Series = get_pandas_column_value_types(column=column)
+    matching_types: List[type] = [
+        value_type
+        for value_type in pd.unique(value_types)
+        if issubclass(value_type, types)
+    ]
+    return value_types.isin(matching_types)
+
+
+def map_pandas_column_distinct_strings(
+    column: pd.Series, fn: Callable[[Any], bool]
+) -> pd.Series:
+    """Equivalent of "column.map(fn)" for (pure) boolean function, which is evaluated once per distinct string value of
+    column (values, other than strings, are passed to "fn" one by one, as by "column.map(fn)").
+    """
+    is_string: pd.Series = pandas_column_values_are_instances_of(
+        column=column, types=(str,)
+    )
+    matching_values: List[str] = [
+        value for value in pd.unique(column[is_string]) if fn(value)
+    ]
+    is_string_values: np.ndarray = is_string.to_numpy(dtype=bool)
+    result: np.ndarray = np.zeros(len(column), dtype=bool)
+    result[is_string_values] = (
+        column[is_string].isin(matching_values).to_numpy(dtype=bool)
+    )
+    if not is_string_values.all():
+        result[~is_string_values] = column[~is_string].map(fn).to_numpy(dtype=bool)
+
+    return pd.Series(result, index=column.index)
+
+
+def get_spark_column_condition_from_pandas(
+    column: pyspark_sql_Column, condition_fn: Callable[[pd.Series], pd.Series]
+) -> pyspark_sql_Column:
+    """Evaluates vectorized pandas condition on Spark column in Arrow batches ("pandas_udf"), rather than row by row.
+
+    Null values evaluate to False (without being passed to "condition_fn").  If "pyarrow" is not installed, row-at-a-time
+    Python UDF is used instead.
+    """
+
+    def condition_of_non_null_values(values: pd.Series) -> pd.Series:
+        is_not_null: np.ndarray = values.notna().to_numpy(dtype=bool)
+        result: np.ndarray = np.zeros(len(values), dtype=bool)
+        if is_not_null.any():
+            result[is_not_null] = condition_fn(values[is_not_null]).to_numpy(dtype=bool)
+
+        return pd.Series(result, index=values.index)
+
+    if pyarrow is None:
+        return F.udf(
+            lambda value: bool(
+                condition_of_non_null_values(pd.Series([value], dtype=object)).iloc[0]
+            ),
+            sparktypes.BooleanType(),
+        )(column)
+
+    return F.pandas_udf(condition_of_non_null_values, sparktypes.BooleanType())(column)
+
+
 def get_dialect_like_pattern_expression(column, dialect, like_pattern, positive=True):
     dialect_supported: bool = False
 
@@ -1056,3 +1158,136 @@ def get_sqlalchemy_source_table_and_schema(
         schema=schema_name,
     )
     return selectable
+
+
+# Number of rows fetched from database at a time, when streaming unexpected values (or rows) of map metrics.
+SQL_UNEXPECTED_FETCH_SIZE: int = 1000
+
+
+class SpilledUnexpectedList(list):
+    """List of first unexpected values (or rows) of map metric, all of which were written to JSON Lines file at
+    "spill_path" (so that they are not embedded in validation result)."""
+
+    def __init__(self, iterable=(), spill_path: Optional[str] = None) -> None:
+        super().__init__(iterable)
+        self.spill_path = spill_path
+
+
+def fetch_unexpected_sqlalchemy_query_results(
+    execution_engine: SqlAlchemyExecutionEngine,
+    query: "sqlalchemy.sql.Select",
+    result_format: dict,
+    row_fn: Optional[Callable[[Any], Any]] = None,
+) -> List[Any]:
+    """
+    Streams results of query, which selects unexpected values (or rows) of map metric, using server-side cursor (where
+    supported by dialect), so that these are never all held in memory at once.
+
+    Retrieval stops (with warning) as soon as either budget, configured in "result_format", is exhausted:
+        "max_unexpected_rows": maximum number of rows retrieved;
+        "max_unexpected_bytes": maximum total size of retrieved rows (as JSON).
+
+    If "unexpected_spill_directory" is configured in "result_format", retrieved rows are written, as JSON Lines, to new
+    file in that directory, and only first "partial_unexpected_count" of them are returned (as SpilledUnexpectedList).
+
+    Args:
+        execution_engine: SqlAlchemyExecutionEngine, which executes query.
+        query: Select statement of unexpected values (or rows).
+        result_format: Result format (with optional budgets and spill directory, described above).
+        row_fn: Function, which converts each result row into returned value (rows are returned as is, if None).
+    Returns:
+        List of converted rows.
+    """
+    max_rows: Optional[int] = _get_unexpected_budget(
+        result_format=result_format, key="max_unexpected_rows"
+    )
+    max_bytes: Optional[int] = _get_unexpected_budget(
+        result_format=result_format, key="max_unexpected_bytes"
+    )
+    spill_directory: Optional[str] = result_format.get("unexpected_spill_directory")
+
+    if max_rows is not None:
+        # One extra row tells whether budget truncated results; "LIMIT" of query (e.g., "partial_unexpected_count"), if
+        # lower, is kept (results, truncated by it, are not truncated by budget).
+        existing_limit: Optional[int] = query._limit
+        if existing_limit is None or existing_limit > max_rows:
+            query = query.limit(max_rows + 1)
+
+    query = execution_engine.guard_query_cost(query=query)
+
+    values: List[Any] = []
+    spill_file = None
+    spill_path: Optional[str] = None
+    if spill_directory:
+        os.makedirs(spill_directory, exist_ok=True)
+        spill_path = os.path.join(
+            spill_directory, f"unexpected_{uuid.uuid4().hex}.jsonl"
+        )
+        spill_file = open(spill_path, "w")
+
+    row_count: int = 0
+    byte_count: int = 0
+    truncated: bool = False
+    result = execution_engine.engine.execute(
+        query.execution_options(stream_results=True)
+    )
+    try:
+        rows: list = result.fetchmany(SQL_UNEXPECTED_FETCH_SIZE)
+        while rows:
+            for row in rows:
+                if max_rows is not None and row_count >= max_rows:
+                    truncated = True
+                    break
+
+                value: Any = row if row_fn is None else row_fn(row)
+                if max_bytes is not None or spill_file is not None:
+                    serialized_value: str = json.dumps(
+                        convert_to_json_serializable(data=value)
+                    )
+                    byte_count += len(serialized_value.encode("utf-8"))
+                    if max_bytes is not None and byte_count > max_bytes:
+                        truncated = True
+                        break
+
+                    if spill_file is not None:
+                        spill_file.write(f"{serialized_value}\n")
+
+                row_count += 1
+                if (
+                    spill_file is None
+                    or len(values) < result_format["partial_unexpected_count"]
+                ):
+                    values.append(value)
+
+            if truncated:
+                break
+
+            rows = result.fetchmany(SQL_UNEXPECTED_FETCH_SIZE)
+    finally:
+        result.close()
+        if spill_file is not None:
+            spill_file.close()
+
+    if truncated:
+        logger.warning(
+            f"Retrieval of unexpected values was stopped after {row_count} rows, because budget "
+            f"(max_unexpected_rows={max_rows}, max_unexpected_bytes={max_bytes}) of result_format was exhausted."
+        )
+
+    if spill_path is not None:
+        return SpilledUnexpectedList(values, spill_path=spill_path)
+
+    return values
+
+
+def _get_unexpected_budget(result_format: dict, key: str) -> Optional[int]:
+    budget: Optional[int] = result_format.get(key)
+    if budget is None:
+        return None
+
+    if isinstance(budget, bool) or not isinstance(budget, int) or budget < 0:
+        raise ValueError(
+            f'Value of "{key}" in result_format must be a non-negative integer, not {budget}.'
+        )
+
+    return budget
@@ -1,5 +1,8 @@
+import ast
 import enum
+import re
 from dataclasses import dataclass
+from typing import Dict, Optional, Set
 
 from pyparsing import (
     CaselessLiteral,
@@ -178,3 +181,42 @@ def parse_condition_to_sqlalchemy(
         return sa.not_(sa.column(column).is_(None))
     else:
         raise ConditionParserError(f"unrecognized column condition: {row_condition}")
+
+
+def get_row_condition_column_names(
+    row_condition: str, condition_parser: Optional[str]
+) -> Optional[Set[str]]:
+    """Returns names of columns, referenced by row condition (None, if they cannot be determined).
+
+    Names, referenced by pandas (or python) conditions, may include names other than column names (e.g., "index").
+    """
+    if condition_parser == "great_expectations__experimental__":
+        try:
+            return {_parse_great_expectations_condition(row_condition)["column"]}
+        except ConditionParserError:
+            return None
+
+    if condition_parser not in ["python", "pandas"]:
+        return None
+
+    # Backtick-quoted column names (which may not be Python identifiers) are replaced by placeholder identifiers, and
+    # references to local variables ("@name") are dropped, so that condition can be parsed as Python expression.
+    quoted_column_names: Dict[str, str] = {}
+
+    def _replace_quoted_column_name(match: re.Match) -> str:
+        placeholder: str = f"__quoted_column_{len(quoted_column_names)}__"
+        quoted_column_names[placeholder] = match.group(1)
+        return placeholder
+
+    expression: str = re.sub(r"`([^`]*)`", _replace_quoted_column_name, row_condition)
+    expression = re.sub(r"@(?=[A-Za-z_])", "__local_variable__.", expression)
+    try:
+        tree: ast.AST = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError:
+        return None
+
+    return {
+        quoted_column_names.get(node.id, node.id)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and node.id != "__local_variable__"
+    }
@@ -1,7 +1,7 @@
 import logging
 import warnings
 from collections import OrderedDict
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from dateutil.parser import parse
 
@@ -9,6 +9,9 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations.checkpoint.util import send_slack_notification
 from great_expectations.core.async_executor import AsyncExecutor
 from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_validation_result import (
+    ExpectationSuiteValidationResult,
+)
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset import DataAsset
 from great_expectations.data_asset.util import parse_result_format
@@ -338,76 +341,34 @@ class ActionListValidationOperator(ValidationOperator):
             for item in assets_to_validate:
                 batch = self._build_batch_from_item(item)
 
-                if hasattr(batch, "active_batch_id"):
-                    batch_identifier = batch.active_batch_id
-                else:
-                    batch_identifier = batch.batch_id
-
                 if result_format is None:
                     result_format = self.result_format
 
-                batch_validate_arguments = {
-                    "run_id": run_id,
-                    "result_format": result_format,
-                    "evaluation_parameters": evaluation_parameters,
-                }
-
-                if catch_exceptions is not None:
-                    batch_validate_arguments["catch_exceptions"] = catch_exceptions
-
-                if checkpoint_name is not None:
-                    batch_validate_arguments["checkpoint_name"] = checkpoint_name
-
                 batch_and_async_result_tuples.append(
                     (
                         batch,
                         async_executor.submit(
                             batch.validate,
-                            **batch_validate_arguments,
+                            **self._get_batch_validate_arguments(
+                                run_id=run_id,
+                                result_format=result_format,
+                                evaluation_parameters=evaluation_parameters,
+                                catch_exceptions=catch_exceptions,
+                                checkpoint_name=checkpoint_name,
+                            ),
                         ),
                     )
                 )
 
             run_results = {}
             for batch, async_batch_validation_result in batch_and_async_result_tuples:
-                if self.data_context.cloud_mode:
-                    expectation_suite_identifier = GXCloudIdentifier(
-                        resource_type=GXCloudRESTResource.EXPECTATION_SUITE,
-                        cloud_id=batch._expectation_suite.ge_cloud_id,
-                    )
-                    validation_result_id = GXCloudIdentifier(
-                        resource_type=GXCloudRESTResource.VALIDATION_RESULT
-                    )
-                else:
-                    expectation_suite_identifier = ExpectationSuiteIdentifier(
-                        expectation_suite_name=batch._expectation_suite.expectation_suite_name
-                    )
-                    validation_result_id = ValidationResultIdentifier(
-                        batch_identifier=batch_identifier,
-                        expectation_suite_identifier=expectation_suite_identifier,
-                        run_id=run_id,
-                    )
-
-                validation_result = async_batch_validation_result.result()
-                validation_result.meta["validation_id"] = validation_id
-                validation_result.meta["checkpoint_id"] = (
-                    checkpoint_identifier.cloud_id if checkpoint_identifier else None
-                )
-
-                batch_actions_results = self._run_actions(
+                validation_result_id, run_result_obj = self._run_actions_on_result(
                     batch=batch,
-                    expectation_suite_identifier=expectation_suite_identifier,
-                    expectation_suite=batch._expectation_suite,
-                    batch_validation_result=validation_result,
+                    validation_result=async_batch_validation_result.result(),
                     run_id=run_id,
-                    validation_result_id=validation_result_id,
                     checkpoint_identifier=checkpoint_identifier,
+                    validation_id=validation_id,
                 )
-
-                run_result_obj = {
-                    "validation_result": validation_result,
-                    "actions_results": batch_actions_results,
-                }
                 run_results[validation_result_id] = run_result_obj
 
         return ValidationOperatorResult(
@@ -417,6 +378,90 @@ class ActionListValidationOperator(ValidationOperator):
             evaluation_parameters=evaluation_parameters,
         )
 
+    @staticmethod
+    def _get_batch_validate_arguments(
+        run_id: RunIdentifier,
+        result_format: Union[str, dict],
+        evaluation_parameters: Optional[dict],
+        catch_exceptions: Optional[bool] = None,
+        checkpoint_name: Optional[str] = None,
+    ) -> dict:
+        batch_validate_arguments = {
+            "run_id": run_id,
+            "result_format": result_format,
+            "evaluation_parameters": evaluation_parameters,
+        }
+
+        if catch_exceptions is not None:
+            batch_validate_arguments["catch_exceptions"] = catch_exceptions
+
+        if checkpoint_name is not None:
+            batch_validate_arguments["checkpoint_name"] = checkpoint_name
+
+        return batch_validate_arguments
+
+    def _run_actions_on_result(
+        self,
+        batch: Union[Batch, DataAsset],
+        validation_result: ExpectationSuiteValidationResult,
+        run_id: RunIdentifier,
+        checkpoint_identifier: Optional[GXCloudIdentifier] = None,
+        validation_id: Optional[str] = None,
+        action_names: Optional[List[str]] = None,
+        batch_actions_results: Optional[dict] = None,
+    ) -> Tuple[Union[ValidationResultIdentifier, GXCloudIdentifier], dict]:
+        """Runs all actions configured for this operator (or only those named in "action_names") on the result of
+        validating one batch; results of actions, which already ran, may be given as "batch_actions_results".
+
+        Returns:
+            Identifier of validation result and run result (validation result and results of actions).
+        """
+        if hasattr(batch, "active_batch_id"):
+            batch_identifier = batch.active_batch_id
+        else:
+            batch_identifier = batch.batch_id
+
+        if self.data_context.cloud_mode:
+            expectation_suite_identifier = GXCloudIdentifier(
+                resource_type=GXCloudRESTResource.EXPECTATION_SUITE,
+                cloud_id=batch._expectation_suite.ge_cloud_id,
+            )
+            validation_result_id = GXCloudIdentifier(
+                resource_type=GXCloudRESTResource.VALIDATION_RESULT
+            )
+        else:
+            expectation_suite_identifier = ExpectationSuiteIdentifier(
+                expectation_suite_name=batch._expectation_suite.expectation_suite_name
+            )
+            validation_result_id = ValidationResultIdentifier(
+                batch_identifier=batch_identifier,
+                expectation_suite_identifier=expectation_suite_identifier,
+                run_id=run_id,
+            )
+
+        validation_result.meta["validation_id"] = validation_id
+        validation_result.meta["checkpoint_id"] = (
+            checkpoint_identifier.cloud_id if checkpoint_identifier else None
+        )
+
+        batch_actions_results = self._run_actions(
+            batch=batch,
+            expectation_suite_identifier=expectation_suite_identifier,
+            expectation_suite=batch._expectation_suite,
+            batch_validation_result=validation_result,
+            run_id=run_id,
+            validation_result_id=validation_result_id,
+            checkpoint_identifier=checkpoint_identifier,
+            action_names=action_names,
+            batch_actions_results=batch_actions_results,
+        )
+
+        run_result_obj = {
+            "validation_result": validation_result,
+            "actions_results": batch_actions_results,
+        }
+        return validation_result_id, run_result_obj
+
     def _run_actions(
         self,
         batch: Union[Batch, DataAsset],
@@ -426,6 +471,8 @@ class ActionListValidationOperator(ValidationOperator):
         run_id,
         validation_result_id=None,
         checkpoint_identifier=None,
+        action_names=None,
+        batch_actions_results=None,
     ):
         """
         Runs all actions configured for this operator on the result of validating one
@@ -437,10 +484,17 @@ class ActionListValidationOperator(ValidationOperator):
         :param expectation_suite:
         :param batch_validation_result:
         :param run_id:
+        :param action_names: names of actions to run (all actions, if None)
+        :param batch_actions_results: results of actions, which already ran on this validation result
         :return: a dictionary: {action name -> result returned by the action}
         """
-        batch_actions_results = {}
+        if batch_actions_results is None:
+            batch_actions_results = {}
+
         for action in self.action_list:
+            if action_names is not None and action["name"] not in action_names:
+                continue
+
             # NOTE: Eugene: 2019-09-23: log the info about the batch and the expectation suite
             logger.debug(f"Processing validation action with name {action['name']}")
 
@@ -477,7 +531,12 @@ class ActionListValidationOperator(ValidationOperator):
                 logger.exception(f"Error running action with name {action['name']}")
                 raise e
 
-        return batch_actions_results
+        # Results are listed in order of configuration (even if some actions ran earlier).
+        return {
+            action["name"]: batch_actions_results[action["name"]]
+            for action in self.action_list
+            if action["name"] in batch_actions_results
+        }
 
 
 class WarningAndFailureExpectationSuitesValidationOperator(
@@ -6,6 +6,7 @@ from typing import (
     TYPE_CHECKING,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -60,6 +61,97 @@ class MetricEdge:
         return f"<{self._left.__repr__()}|{self._right.__repr__()}>"
 
 
+class MetricDependencyIndex:
+    """Incremental scheduler over "MetricEdge" objects of "ValidationGraph".
+
+    Dependency index (unmet dependency counts and reverse adjacency map, keyed by "MetricConfiguration.id") is built
+    in single pass over edges; thereafter, each resolved metric releases those dependent metrics, whose dependencies
+    are all met, into "ready" queue -- no rescanning of entire edge list is required between resolution rounds.
+    """
+
+    def __init__(
+        self,
+        edges: List[MetricEdge],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> None:
+        # Metrics, whose dependencies are all resolved (insertion-ordered, keyed by "MetricConfiguration.id").
+        self._ready: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        # Metrics, having at least one unresolved dependency, with their unresolved dependency counts ("indegree").
+        self._needed: Dict[Tuple[str, str, str], Tuple[MetricConfiguration, int]] = {}
+        # Reverse adjacency map: metric id -> ids of metrics that depend on it.
+        self._dependents: Dict[Tuple[str, str, str], Set[Tuple[str, str, str]]] = {}
+
+        metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        unmet_dependency_ids: Dict[Tuple[str, str, str], Set[Tuple[str, str, str]]] = {}
+
+        edge: MetricEdge
+        left_id: Tuple[str, str, str]
+        right_id: Tuple[str, str, str]
+        for edge in edges:
+            left_id = edge.left.id
+            if left_id in metrics:
+                continue
+
+            if left_id not in metric_configurations:
+                metric_configurations[left_id] = edge.left
+                unmet_dependency_ids[left_id] = set()
+
+            if edge.right is not None:
+                right_id = edge.right.id
+                if (
+                    right_id not in metrics
+                    and right_id not in unmet_dependency_ids[left_id]
+                ):
+                    unmet_dependency_ids[left_id].add(right_id)
+                    self._dependents.setdefault(right_id, set()).add(left_id)
+
+        metric_id: Tuple[str, str, str]
+        metric_configuration: MetricConfiguration
+        for metric_id, metric_configuration in metric_configurations.items():
+            if unmet_dependency_ids[metric_id]:
+                self._needed[metric_id] = (
+                    metric_configuration,
+                    len(unmet_dependency_ids[metric_id]),
+                )
+            else:
+                self._ready[metric_id] = metric_configuration
+
+    @property
+    def ready_metrics(self) -> List[MetricConfiguration]:
+        """Returns unresolved "MetricConfiguration" objects, whose dependencies have all been resolved."""
+        return list(self._ready.values())
+
+    @property
+    def num_needed_metrics(self) -> int:
+        """Returns number of unresolved "MetricConfiguration" objects, still waiting on at least one dependency."""
+        return len(self._needed)
+
+    def mark_resolved(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        """Records resolution of supplied metrics and releases dependent metrics, whose dependencies are now met."""
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        metric_configuration: MetricConfiguration
+        num_unmet_dependencies: int
+        for metric_id in metric_ids:
+            self._ready.pop(metric_id, None)
+            self._needed.pop(metric_id, None)
+            for dependent_id in self._dependents.pop(metric_id, set()):
+                if dependent_id not in self._needed:
+                    continue
+
+                metric_configuration, num_unmet_dependencies = self._needed[
+                    dependent_id
+                ]
+                if num_unmet_dependencies > 1:
+                    self._needed[dependent_id] = (
+                        metric_configuration,
+                        num_unmet_dependencies - 1,
+                    )
+                else:
+                    del self._needed[dependent_id]
+                    self._ready[dependent_id] = metric_configuration
+
+
 class ValidationGraph:
     def __init__(
         self,
@@ -232,16 +324,22 @@ class ValidationGraph:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ] = {}
 
-        ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        ready_metrics: List[MetricConfiguration]
+        num_needed_metrics: int
 
         exception_info: ExceptionInfo
 
         progress_bar: Optional[tqdm] = None
 
+        # Dependency index is built once; subsequently, metrics are released into "ready" queue as they become computable.
+        dependency_index: MetricDependencyIndex = self._build_dependency_index(
+            metrics=metrics
+        )
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics = dependency_index.ready_metrics
+            num_needed_metrics = dependency_index.num_needed_metrics
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -251,7 +349,7 @@ class ValidationGraph:
             if progress_bar is None:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=len(ready_metrics) + num_needed_metrics,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
@@ -268,13 +366,15 @@ class ValidationGraph:
 
             try:
                 # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,
-                        metrics=metrics,
-                        runtime_configuration=runtime_configuration,
-                    )
+                newly_resolved_metrics: Dict[
+                    Tuple[str, str, str], MetricValue
+                ] = self._execution_engine.resolve_metrics(
+                    metrics_to_resolve=computable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(newly_resolved_metrics)
+                dependency_index.mark_resolved(metric_ids=newly_resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except ge_exceptions.MetricResolutionError as err:
@@ -309,7 +409,7 @@ class ValidationGraph:
                 else:
                     raise e
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
+            if (len(ready_metrics) + num_needed_metrics == 0) or (
                 len(ready_metrics) == len(aborted_metrics_info)
             ):
                 done = True
@@ -318,29 +418,12 @@ class ValidationGraph:
 
         return aborted_metrics_info
 
-    def _parse(
+    def _build_dependency_index(
         self,
         metrics: Dict[Tuple[str, str, str], MetricValue],
-    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+    ) -> MetricDependencyIndex:
+        """Builds "MetricDependencyIndex" over edges of this "ValidationGraph", treating supplied metrics as resolved."""
+        return MetricDependencyIndex(edges=self.edges, metrics=metrics)
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
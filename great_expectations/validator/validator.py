@@ -60,6 +60,9 @@ from great_expectations.expectations.registry import (
     get_expectation_impl,
     list_registered_expectation_implementations,
 )
+from great_expectations.expectations.row_conditions import (
+    get_row_condition_column_names,
+)
 from great_expectations.experimental.datasources.interfaces import Batch as XBatch
 from great_expectations.rule_based_profiler import RuleBasedProfilerResult
 from great_expectations.rule_based_profiler.config import RuleBasedProfilerConfig
@@ -984,6 +987,66 @@ class Validator:
         Returns:
             A list of Validations, validating that all necessary metrics are available.
         """
+        return self._graph_validate(
+            configurations=configurations,
+            batch_ids=[self.active_batch_id],
+            runtime_configuration=runtime_configuration,
+        )
+
+    def graph_validate_batches(
+        self,
+        configurations: List[ExpectationConfiguration],
+        batch_ids: Optional[List[str]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[str, List[ExpectationValidationResult]]:
+        """Validates given Expectation Configurations against every one of given (loaded) Batch objects in one pass.
+
+        Metric dependencies of all (Expectation Configuration, Batch) pairs are combined into single suite-level
+        "ValidationGraph", so that execution engine resolves metrics of all Batch objects together (e.g., in same
+        metric bundles), instead of building and resolving separate graph for each Batch.
+
+        Args:
+            configurations(List[ExpectationConfiguration]): A list of needed Expectation Configurations that will be
+            used to supply domain and values for metrics.
+            batch_ids (List[str]): IDs of loaded Batch objects to validate (default is all loaded Batch objects).
+            runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics, such as the
+            result_format.
+
+        Returns:
+            Dictionary, mapping each Batch ID to list of Validations for that Batch.
+        """
+        if batch_ids is None:
+            batch_ids = self.loaded_batch_ids
+
+        unknown_batch_ids: List[str] = [
+            batch_id for batch_id in batch_ids if batch_id not in self.batch_cache
+        ]
+        if unknown_batch_ids:
+            raise ValueError(
+                f"Batch objects with IDs {unknown_batch_ids} have not been loaded into {self.__class__.__name__}."
+            )
+
+        evrs: List[ExpectationValidationResult] = self._graph_validate(
+            configurations=configurations,
+            batch_ids=batch_ids,
+            runtime_configuration=runtime_configuration,
+        )
+
+        evrs_by_batch_id: Dict[str, List[ExpectationValidationResult]] = {
+            batch_id: [] for batch_id in batch_ids
+        }
+        evr: ExpectationValidationResult
+        for evr in evrs:
+            evrs_by_batch_id[evr.expectation_config.kwargs["batch_id"]].append(evr)
+
+        return evrs_by_batch_id
+
+    def _graph_validate(
+        self,
+        configurations: List[ExpectationConfiguration],
+        batch_ids: List[Optional[str]],
+        runtime_configuration: Optional[dict] = None,
+    ) -> List[ExpectationValidationResult]:
         if runtime_configuration is None:
             runtime_configuration = {}
 
@@ -1004,6 +1067,7 @@ class Validator:
             processed_configurations,
         ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
             expectation_configurations=configurations,
+            batch_ids=batch_ids,
             processed_configurations=processed_configurations,
             catch_exceptions=catch_exceptions,
             runtime_configuration=runtime_configuration,
@@ -1044,6 +1108,9 @@ class Validator:
                 return evrs
             else:
                 raise err
+        finally:
+            # Domain records (e.g., persisted Spark DataFrames) are only needed while metrics are being resolved.
+            self._execution_engine.release_domain_records()
 
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
@@ -1054,6 +1121,11 @@ class Validator:
                     execution_engine=self._execution_engine,
                     runtime_configuration=runtime_configuration,
                 )
+                self._mark_sampled_metrics(
+                    result=result,
+                    configuration=configuration,
+                    expectation_validation_graphs=expectation_validation_graphs,
+                )
                 evrs.append(result)
             except Exception as err:
                 if catch_exceptions:
@@ -1069,12 +1141,47 @@ class Validator:
 
         return evrs
 
+    def _mark_sampled_metrics(
+        self,
+        result: ExpectationValidationResult,
+        configuration: ExpectationConfiguration,
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+    ) -> None:
+        """Lists names of metrics of expectation, computed over sample of domain records only (e.g., by query cost guard
+        of SqlAlchemyExecutionEngine), under "sampled_metrics" key of "meta" of its validation result."""
+        sampled_metric_ids: Set[
+            Tuple[str, str, str]
+        ] = self._execution_engine.sampled_metric_ids
+        if not sampled_metric_ids:
+            return
+
+        expectation_validation_graph: ExpectationValidationGraph
+        edge: MetricEdge
+        for expectation_validation_graph in expectation_validation_graphs:
+            if expectation_validation_graph.configuration is not configuration:
+                continue
+
+            sampled_metric_names: Set[str] = {
+                vertex.metric_name
+                for edge in expectation_validation_graph.graph.edges
+                for vertex in [edge.left, edge.right]
+                if vertex is not None and vertex.id in sampled_metric_ids
+            }
+            if sampled_metric_names:
+                if result.meta is None:
+                    result.meta = {}
+
+                result.meta["sampled_metrics"] = sorted(sampled_metric_names)
+
+            return
+
     def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
         self,
         expectation_configurations: List[ExpectationConfiguration],
         processed_configurations: List[ExpectationConfiguration],
         catch_exceptions: bool,
         runtime_configuration: Optional[dict] = None,
+        batch_ids: Optional[List[Optional[str]]] = None,
     ) -> Tuple[
         List[ExpectationValidationGraph],
         List[ExpectationValidationResult],
@@ -1082,13 +1189,20 @@ class Validator:
     ]:
         # While evaluating expectation configurations, create sub-graph for every metric dependency and incorporate
         # these sub-graphs under corresponding expectation-level sub-graph (state of ExpectationValidationGraph object).
+        # Every expectation configuration is evaluated against each Batch (by default, only against active Batch).
+        if batch_ids is None:
+            batch_ids = [self.active_batch_id]
+
         expectation_validation_graphs: List[ExpectationValidationGraph] = []
         evrs: List[ExpectationValidationResult] = []
         configuration: ExpectationConfiguration
+        batch_id: Optional[str]
         evaluated_config: ExpectationConfiguration
         metric_configuration: MetricConfiguration
         graph: ValidationGraph
-        for configuration in expectation_configurations:
+        for configuration, batch_id in itertools.product(
+            expectation_configurations, batch_ids
+        ):
             # Validating
             try:
                 assert (
@@ -1098,7 +1212,7 @@ class Validator:
                 raise InvalidExpectationConfigurationError(str(e))
 
             evaluated_config = copy.deepcopy(configuration)
-            evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            evaluated_config.kwargs.update({"batch_id": batch_id})
 
             expectation_impl = get_expectation_impl(evaluated_config.expectation_type)
             validation_dependencies: ValidationDependencies = (
@@ -1781,10 +1895,23 @@ class Validator:
                 catch_exceptions=catch_exceptions, result_format=result_format
             )
 
-            results = self.graph_validate(
-                configurations=expectations_to_evaluate,
-                runtime_configuration=runtime_configuration,
+            # Batch data, read lazily, need only contain columns, referenced by expectations being evaluated.
+            self._execution_engine.project_batch_columns(
+                batch_id=self.active_batch_id,
+                column_names=self._get_referenced_column_names(
+                    configurations=expectations_to_evaluate,
+                    runtime_configuration=runtime_configuration,
+                ),
             )
+            try:
+                results = self.graph_validate(
+                    configurations=expectations_to_evaluate,
+                    runtime_configuration=runtime_configuration,
+                )
+            finally:
+                self._execution_engine.project_batch_columns(
+                    batch_id=self.active_batch_id, column_names=None
+                )
 
             if self._include_rendered_content:
                 for validation_result in results:
@@ -2026,6 +2153,59 @@ class Validator:
             self._execution_engine
         ).__name__
 
+    @staticmethod
+    def _get_referenced_column_names(
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: dict,
+    ) -> Optional[Set[str]]:
+        """Returns names of columns, referenced by given expectations (None, if any expectation, e.g., table-level one,
+        may need all columns, or referenced columns cannot be determined)."""
+        column_names: Set[str] = set()
+
+        def _update_unexpected_index_column_names(
+            result_format: Union[dict, str, None]
+        ) -> None:
+            if isinstance(result_format, dict):
+                column_names.update(
+                    result_format.get("unexpected_index_column_names") or []
+                )
+
+        _update_unexpected_index_column_names(
+            result_format=runtime_configuration.get("result_format")
+        )
+
+        configuration: ExpectationConfiguration
+        for configuration in configurations:
+            kwargs: dict = configuration.kwargs
+            _update_unexpected_index_column_names(
+                result_format=kwargs.get("result_format")
+            )
+            expectation_column_names: List[str] = [
+                kwargs[key]
+                for key in ("column", "column_A", "column_B")
+                if kwargs.get(key) is not None
+            ] + list(kwargs.get("column_list") or [])
+            if not expectation_column_names or not all(
+                isinstance(column_name, str) for column_name in expectation_column_names
+            ):
+                return None
+
+            column_names.update(expectation_column_names)
+
+            if kwargs.get("row_condition"):
+                row_condition_column_names: Optional[
+                    Set[str]
+                ] = get_row_condition_column_names(
+                    row_condition=kwargs["row_condition"],
+                    condition_parser=kwargs.get("condition_parser"),
+                )
+                if row_condition_column_names is None:
+                    return None
+
+                column_names.update(row_condition_column_names)
+
+        return column_names
+
     def _get_runtime_configuration(
         self,
         catch_exceptions: Optional[bool] = None,
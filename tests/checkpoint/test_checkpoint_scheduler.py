@@ -0,0 +1,215 @@
+import threading
+from typing import List
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.checkpoint import Checkpoint, CheckpointScheduler
+from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.data_context.data_context.data_context import DataContext
+from great_expectations.validation_operators import ActionListValidationOperator
+
+
+@pytest.fixture
+def context_with_two_pandas_datasources(empty_data_context, tmp_path) -> DataContext:
+    context: DataContext = empty_data_context
+    datasource_name: str
+    for datasource_name in ["my_datasource", "my_other_datasource"]:
+        base_directory = tmp_path / datasource_name
+        base_directory.mkdir()
+        pd.DataFrame({"col1": [1, 2, 3]}).to_csv(
+            base_directory / "valid.csv", index=False
+        )
+        pd.DataFrame({"col1": [1, 2, 30]}).to_csv(
+            base_directory / "invalid.csv", index=False
+        )
+        context.add_datasource(
+            datasource_name,
+            class_name="Datasource",
+            execution_engine={"class_name": "PandasExecutionEngine"},
+            data_connectors={
+                "my_data_connector": {
+                    "class_name": "InferredAssetFilesystemDataConnector",
+                    "base_directory": str(base_directory),
+                    "default_regex": {
+                        "pattern": "(.*)\\.csv",
+                        "group_names": ["data_asset_name"],
+                    },
+                }
+            },
+        )
+
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "col1", "min_value": 0, "max_value": 10},
+        )
+    )
+    context.save_expectation_suite(suite)
+    return context
+
+
+def _get_validation(datasource_name: str, data_asset_name: str) -> dict:
+    return {
+        "batch_request": {
+            "datasource_name": datasource_name,
+            "data_connector_name": "my_data_connector",
+            "data_asset_name": data_asset_name,
+        }
+    }
+
+
+def _get_checkpoint(context: DataContext, name: str, validations: List[dict]):
+    return Checkpoint(
+        name=name,
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {"class_name": "StoreValidationResultAction"},
+            },
+        ],
+        validations=validations,
+    )
+
+
+@pytest.mark.integration
+def test_checkpoint_scheduler_runs_validations_of_multiple_checkpoints(
+    context_with_two_pandas_datasources, monkeypatch
+):
+    context: DataContext = context_with_two_pandas_datasources
+    checkpoints: List[Checkpoint] = [
+        _get_checkpoint(
+            context=context,
+            name="first_checkpoint",
+            validations=[
+                _get_validation("my_datasource", "valid"),
+                _get_validation("my_other_datasource", "valid"),
+            ],
+        ),
+        _get_checkpoint(
+            context=context,
+            name="second_checkpoint",
+            validations=[
+                _get_validation("my_datasource", "invalid"),
+            ],
+        ),
+    ]
+
+    action_thread_names: List[str] = []
+    run_actions_on_result = ActionListValidationOperator._run_actions_on_result
+
+    def _run_actions_on_result(self, **kwargs):
+        action_thread_names.append(threading.current_thread().name)
+        return run_actions_on_result(self, **kwargs)
+
+    monkeypatch.setattr(
+        ActionListValidationOperator, "_run_actions_on_result", _run_actions_on_result
+    )
+    results: List[CheckpointResult] = CheckpointScheduler(
+        data_context=context, max_workers=2
+    ).run(checkpoints=checkpoints)
+
+    assert len(action_thread_names) == 3
+    assert threading.current_thread().name not in action_thread_names
+    assert len(context.validations_store.list_keys()) == 3
+
+    assert [len(result.run_results) for result in results] == [2, 1]
+    assert results[0].success
+    assert not results[1].success
+    assert {
+        validation_result.meta["active_batch_definition"]["datasource_name"]
+        for validation_result in results[0].list_validation_results()
+    } == {"my_datasource", "my_other_datasource"}
+    assert (
+        results[1].list_validation_results()[0].meta["checkpoint_name"]
+        == "second_checkpoint"
+    )
+
+
+@pytest.mark.integration
+def test_checkpoint_scheduler_raises_validation_errors(
+    context_with_two_pandas_datasources,
+):
+    context: DataContext = context_with_two_pandas_datasources
+    checkpoint: Checkpoint = _get_checkpoint(
+        context=context,
+        name="my_checkpoint",
+        validations=[_get_validation("my_datasource", "valid")],
+    )
+    checkpoint.config.expectation_suite_name = "missing_suite"
+
+    with pytest.raises(ge_exceptions.DataContextError):
+        CheckpointScheduler(data_context=context).run(checkpoints=[checkpoint])
+
+    with pytest.raises(ValueError):
+        CheckpointScheduler(data_context=context, max_action_workers=0)
+
+
+@pytest.mark.integration
+def test_checkpoint_scheduler_orders_validations_by_evaluation_parameters(
+    context_with_two_pandas_datasources,
+):
+    context: DataContext = context_with_two_pandas_datasources
+    upstream_suite = context.create_expectation_suite("my_upstream_suite")
+    upstream_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 0, "max_value": 10},
+        )
+    )
+    context.save_expectation_suite(upstream_suite)
+    dependent_suite = context.create_expectation_suite("my_dependent_suite")
+    dependent_suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={
+                "value": {
+                    "$PARAMETER": "urn:great_expectations:validations:my_upstream_suite:"
+                    "expect_table_row_count_to_be_between.result.observed_value"
+                }
+            },
+        )
+    )
+    context.save_expectation_suite(dependent_suite)
+
+    checkpoint: Checkpoint = _get_checkpoint(
+        context=context,
+        name="my_checkpoint",
+        validations=[
+            {
+                **_get_validation("my_datasource", "valid"),
+                "expectation_suite_name": "my_dependent_suite",
+            },
+            {
+                **_get_validation("my_other_datasource", "valid"),
+                "expectation_suite_name": "my_upstream_suite",
+            },
+        ],
+    )
+    checkpoint.config.action_list.append(
+        {
+            "name": "store_evaluation_params",
+            "action": {"class_name": "StoreEvaluationParametersAction"},
+        }
+    )
+
+    result: CheckpointResult = CheckpointScheduler(
+        data_context=context, max_workers=2
+    ).run(checkpoints=[checkpoint])[0]
+
+    assert result.success
+    assert [
+        validation_result.meta["expectation_suite_name"]
+        for validation_result in result.list_validation_results()
+    ] == ["my_dependent_suite", "my_upstream_suite"]
+    assert [
+        list(run_result["actions_results"])
+        for run_result in result.run_results.values()
+    ] == [["store_validation_result", "store_evaluation_params"]] * 2
@@ -0,0 +1,178 @@
+from typing import Iterator
+
+import pandas as pd
+import pytest
+
+from great_expectations.checkpoint import Checkpoint
+from great_expectations.checkpoint.types.checkpoint_result import CheckpointResult
+from great_expectations.checkpoint.validation_process_pool import (
+    get_validation_process_pool,
+    shutdown_validation_process_pools,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.data_context.data_context.data_context import DataContext
+from great_expectations.data_context.types.base import ConcurrencyConfig
+
+
+@pytest.fixture
+def context_with_process_concurrency(
+    empty_data_context, tmp_path
+) -> Iterator[DataContext]:
+    context: DataContext = empty_data_context
+    context.variables.concurrency = ConcurrencyConfig(
+        enabled=True, mode="process", max_processes=2
+    )
+    context.variables.save_config()
+
+    base_directory = tmp_path / "data"
+    base_directory.mkdir()
+    pd.DataFrame({"col1": [1, 2, 3]}).to_csv(base_directory / "valid.csv", index=False)
+    pd.DataFrame({"col1": [1, 2, 30]}).to_csv(
+        base_directory / "invalid.csv", index=False
+    )
+    context.add_datasource(
+        "my_datasource",
+        class_name="Datasource",
+        execution_engine={"class_name": "PandasExecutionEngine"},
+        data_connectors={
+            "my_data_connector": {
+                "class_name": "InferredAssetFilesystemDataConnector",
+                "base_directory": str(base_directory),
+                "default_regex": {
+                    "pattern": "(.*)\\.csv",
+                    "group_names": ["data_asset_name"],
+                },
+            }
+        },
+    )
+
+    suite = context.create_expectation_suite("my_expectation_suite")
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={"column": "col1", "min_value": 0, "max_value": 10},
+        )
+    )
+    context.save_expectation_suite(suite)
+
+    yield context
+
+    shutdown_validation_process_pools()
+
+
+@pytest.mark.integration
+def test_validation_process_pool_is_reused(context_with_process_concurrency):
+    context: DataContext = context_with_process_concurrency
+    process_pool = get_validation_process_pool(data_context=context)
+    assert process_pool is not None
+    assert get_validation_process_pool(data_context=context) is process_pool
+
+    context.variables.concurrency = ConcurrencyConfig(enabled=True)
+    assert get_validation_process_pool(data_context=context) is None
+
+
+@pytest.mark.integration
+def test_validation_process_pool_is_replaced_on_config_change(
+    context_with_process_concurrency,
+):
+    context: DataContext = context_with_process_concurrency
+    process_pool = get_validation_process_pool(data_context=context)
+
+    context.save_config_variable("my_variable", "my_value")
+
+    assert get_validation_process_pool(data_context=context) is not process_pool
+    with pytest.raises(RuntimeError):
+        process_pool.submit(print)
+
+
+@pytest.mark.integration
+def test_checkpoint_run_validates_in_worker_processes(
+    context_with_process_concurrency,
+):
+    context: DataContext = context_with_process_concurrency
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_validation_result",
+                "action": {"class_name": "StoreValidationResultAction"},
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["valid", "invalid"]
+        ],
+    )
+
+    result: CheckpointResult = checkpoint.run()
+
+    assert not result.success
+    assert [
+        validation_result.success
+        for validation_result in result.list_validation_results()
+    ] == [True, False]
+    assert [
+        validation_result.meta["active_batch_definition"]["data_asset_name"]
+        for validation_result in result.list_validation_results()
+    ] == ["valid", "invalid"]
+    # Validation results are stored by worker processes (in filesystem store of DataContext).
+    assert len(context.validations_store.list_keys()) == 2
+    assert (
+        context.get_datasource(
+            "my_datasource"
+        ).execution_engine.batch_manager.loaded_batch_ids
+        == []
+    )
+
+
+@pytest.mark.integration
+def test_checkpoint_run_stores_in_memory_evaluation_parameters_in_calling_process(
+    context_with_process_concurrency,
+):
+    context: DataContext = context_with_process_concurrency
+    checkpoint = Checkpoint(
+        name="my_checkpoint",
+        data_context=context,
+        config_version=1,
+        run_name_template="%Y-%M-foo-bar-template",
+        expectation_suite_name="my_expectation_suite",
+        action_list=[
+            {
+                "name": "store_evaluation_params",
+                "action": {"class_name": "StoreEvaluationParametersAction"},
+            },
+        ],
+        validations=[
+            {
+                "batch_request": {
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "my_data_connector",
+                    "data_asset_name": data_asset_name,
+                }
+            }
+            for data_asset_name in ["valid", "invalid"]
+        ],
+    )
+
+    result: CheckpointResult = checkpoint.run()
+
+    assert [
+        validation_result.success
+        for validation_result in result.list_validation_results()
+    ] == [True, False]
+    assert (
+        context.get_datasource(
+            "my_datasource"
+        ).execution_engine.batch_manager.loaded_batch_ids
+        != []
+    )
@@ -0,0 +1,86 @@
+import copy
+import pickle
+
+import pytest
+
+from great_expectations.core.id_dict import BatchSpec, IDDict
+from great_expectations.types.attributes import Attributes
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_is_memoized():
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+
+    assert id_dict._cached_id is None
+    first_id = id_dict.to_id()
+    assert id_dict._cached_id == first_id
+    assert id_dict.to_id() is first_id
+    assert hash(id_dict) == hash(first_id)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        pytest.param(lambda d: d.__setitem__("row_condition", "b>0"), id="setitem"),
+        pytest.param(lambda d: d.__delitem__("column"), id="delitem"),
+        pytest.param(lambda d: d.update({"column": "b"}), id="update"),
+        pytest.param(
+            lambda d: d.setdefault("condition_parser", "pandas"), id="setdefault"
+        ),
+        pytest.param(lambda d: d.pop("column"), id="pop"),
+        pytest.param(lambda d: d.popitem(), id="popitem"),
+        pytest.param(lambda d: d.clear(), id="clear"),
+        pytest.param(lambda d: d.__ior__({"column": "b"}), id="ior"),
+    ],
+)
+def test_id_dict_mutation_invalidates_memoized_id(mutate):
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+    id_dict.to_id()
+
+    mutate(id_dict)
+
+    assert id_dict.to_id() == IDDict(dict(id_dict)).to_id()
+
+
+@pytest.mark.unit
+def test_id_dict_to_id_with_explicit_keys_is_not_memoized():
+    id_dict = IDDict({"column": "a", "batch_id": "1234"})
+    default_id = id_dict.to_id()
+
+    assert id_dict.to_id(id_keys=["column"]) == "column=a"
+    assert id_dict.to_id(id_ignore_keys=["batch_id"]) == "column=a"
+    assert id_dict.to_id() == default_id
+
+
+@pytest.mark.unit
+def test_id_dict_memoized_id_survives_copy_and_pickle():
+    id_dict = BatchSpec({"path": "/data/file.csv", "reader_method": "read_csv"})
+    expected_id = id_dict.to_id()
+
+    for restored in (
+        copy.copy(id_dict),
+        copy.deepcopy(id_dict),
+        pickle.loads(pickle.dumps(id_dict)),
+    ):
+        assert isinstance(restored, BatchSpec)
+        assert restored.to_id() == expected_id
+        restored["reader_method"] = "read_parquet"
+        assert restored.to_id() != expected_id
+
+    assert id_dict.to_id() == expected_id
+
+
+@pytest.mark.unit
+def test_attributes_memoized_id_is_not_stored_as_key():
+    attributes = Attributes({"x": 1})
+
+    assert attributes.to_id() == "x=1"
+    assert attributes.to_id() == "x=1"
+    assert dict(attributes) == {"x": 1}
+    assert attributes.to_json_dict() == {"x": 1}
+    assert hash(attributes) == hash("x=1")
+
+    attributes["y"] = 2
+    assert "_cached_id" not in attributes
+    assert attributes.to_id() == IDDict({"x": 1, "y": 2}).to_id()
@@ -0,0 +1,115 @@
+import json
+import os
+
+import pytest
+
+from great_expectations.core.sqlalchemy_engine_registry import (
+    dispose_shared_sqlalchemy_engines,
+    get_shared_sqlalchemy_engine,
+    is_shared_sqlalchemy_engine,
+)
+from great_expectations.data_context.store import DatabaseStoreBackend
+from great_expectations.data_context.store.query_store import SqlAlchemyQueryStore
+from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    yield f"sqlite:///{tmp_path / 'test.db'}"
+    dispose_shared_sqlalchemy_engines()
+
+
+@pytest.mark.unit
+def test_engines_are_shared_by_normalized_url_and_engine_options(sa, sqlite_url):
+    engine = get_shared_sqlalchemy_engine(sqlite_url)
+    assert is_shared_sqlalchemy_engine(engine=engine)
+    assert get_shared_sqlalchemy_engine(sa.engine.make_url(sqlite_url)) is engine
+    assert get_shared_sqlalchemy_engine(sqlite_url.replace("sqlite", "SQLite")) is (
+        engine
+    )
+    assert get_shared_sqlalchemy_engine(sqlite_url, pool_pre_ping=True) is not engine
+
+    dispose_shared_sqlalchemy_engines()
+    assert not is_shared_sqlalchemy_engine(engine=engine)
+    assert get_shared_sqlalchemy_engine(sqlite_url) is not engine
+
+
+@pytest.mark.unit
+def test_engines_of_in_memory_sqlite_databases_are_not_shared(sa):
+    engine = get_shared_sqlalchemy_engine("sqlite://")
+    assert not is_shared_sqlalchemy_engine(engine=engine)
+    assert get_shared_sqlalchemy_engine("sqlite://") is not engine
+
+
+@pytest.mark.integration
+def test_execution_engines_and_stores_share_engine(sa, sqlite_url):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string=sqlite_url)
+    other_execution_engine = SqlAlchemyExecutionEngine(url=sqlite_url)
+    store_backend = DatabaseStoreBackend(
+        table_name="test_store",
+        key_columns=["k1"],
+        url=sqlite_url,
+    )
+    query_store = SqlAlchemyQueryStore(
+        credentials={"url": sqlite_url}, queries={"q1": "SELECT 1"}
+    )
+
+    # SQLite execution engines use their own connection of (shared) engine.
+    engine = execution_engine._engine_backup
+    assert engine is other_execution_engine._engine_backup
+    assert engine is store_backend.engine
+    assert engine is query_store.engine
+
+    # Closing execution engine closes its connection, but does not dispose shared engine.
+    execution_engine.close()
+    assert is_shared_sqlalchemy_engine(engine=engine)
+
+    unshared_execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=sqlite_url, share_engine=False
+    )
+    assert unshared_execution_engine._engine_backup is not engine
+    assert unshared_execution_engine.config["share_engine"] is False
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not hasattr(os, "register_at_fork"), reason="requires fork support")
+def test_forked_processes_do_not_use_pooled_connections_of_parent(sa, sqlite_url):
+    engine = get_shared_sqlalchemy_engine(sqlite_url, poolclass=sa.pool.QueuePool)
+    assert engine.execute("SELECT 1").scalar() == 1
+    assert engine.pool.checkedin() == 1
+    parent_pool_id: int = id(engine.pool)
+
+    read_fd, write_fd = os.pipe()
+    pid: int = os.fork()
+    if pid == 0:
+        # Child process reports, whether it uses pool of parent process, and exits without running pytest teardown.
+        exit_code = 1
+        try:
+            os.close(read_fd)
+            child_engine = get_shared_sqlalchemy_engine(
+                sqlite_url, poolclass=sa.pool.QueuePool
+            )
+            report: str = json.dumps(
+                [
+                    child_engine is engine,
+                    id(child_engine.pool) == parent_pool_id,
+                    child_engine.pool.checkedin(),
+                    child_engine.execute("SELECT 1").scalar(),
+                ]
+            )
+            os.write(write_fd, report.encode("utf-8"))
+            exit_code = 0
+        finally:
+            os._exit(exit_code)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as read_file:
+        report = read_file.read()
+    _, status = os.waitpid(pid, 0)
+
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+    # Child process uses same (shared) engine, but with new, empty pool.
+    assert json.loads(report) == [True, False, 0, 1]
+    # Connections of parent process are not closed by child process.
+    assert engine.pool.checkedin() == 1
+    assert engine.execute("SELECT 1").scalar() == 1
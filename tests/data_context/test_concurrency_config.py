@@ -1,3 +1,5 @@
+import pytest
+
 from great_expectations.data_context import BaseDataContext
 from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
@@ -29,3 +31,26 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_concurrency_mode_defaults_to_thread():
+    concurrency_config = ConcurrencyConfig(enabled=True)
+    assert concurrency_config.mode == "thread"
+    assert concurrency_config.max_processes is None
+
+
+def test_concurrency_process_mode_with_dict():
+    data_context_config = DataContextConfig(
+        concurrency={"enabled": True, "mode": "process", "max_processes": 2}
+    )
+    assert data_context_config.concurrency.mode == "process"
+    assert data_context_config.concurrency.max_processes == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"mode": "fork"}, {"mode": "process", "max_processes": 0}],
+)
+def test_concurrency_config_raises_on_invalid_mode_or_max_processes(kwargs):
+    with pytest.raises(ValueError):
+        ConcurrencyConfig(enabled=True, **kwargs)
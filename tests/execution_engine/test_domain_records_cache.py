@@ -0,0 +1,152 @@
+from typing import List
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.domain_records_cache import (
+    DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES,
+    DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
+    DomainRecordsCache,
+    get_domain_records_id,
+)
+
+
+@pytest.mark.unit
+def test_get_domain_records_id_is_none_without_row_filtering_directives():
+    assert get_domain_records_id(domain_kwargs={"column": "a"}) is None
+    assert get_domain_records_id(domain_kwargs={"table": None}) is None
+    # Single-column domains disregard "ignore_row_if" directive.
+    assert (
+        get_domain_records_id(
+            domain_kwargs={
+                "column": "a",
+                "column_list": ["a", "b"],
+                "ignore_row_if": "any_value_is_missing",
+            }
+        )
+        is None
+    )
+
+
+@pytest.mark.unit
+def test_get_domain_records_id_ignores_column_selection():
+    row_condition_kwargs: dict = {
+        "row_condition": "b<5",
+        "condition_parser": "pandas",
+    }
+    assert get_domain_records_id(
+        domain_kwargs={"column": "a", **row_condition_kwargs}
+    ) == get_domain_records_id(domain_kwargs={"column": "c", **row_condition_kwargs})
+    assert get_domain_records_id(
+        domain_kwargs={"column": "a", **row_condition_kwargs}
+    ) != get_domain_records_id(
+        domain_kwargs={
+            "column": "a",
+            "row_condition": "b<4",
+            "condition_parser": "pandas",
+        }
+    )
+    assert get_domain_records_id(
+        domain_kwargs={
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "either_value_is_missing",
+        }
+    ) != get_domain_records_id(
+        domain_kwargs={
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "both_values_are_missing",
+        }
+    )
+
+
+@pytest.mark.unit
+def test_domain_records_cache_evicts_least_recently_used_records():
+    released: List[str] = []
+    cache = DomainRecordsCache(max_entries=2)
+
+    cache.put(
+        batch_id="batch_1",
+        domain_records_id="a",
+        records="records_a",
+        release=lambda: released.append("a"),
+    )
+    cache.put(batch_id="batch_1", domain_records_id="b", records="records_b")
+    assert cache.get(batch_id="batch_1", domain_records_id="a") == "records_a"
+
+    cache.put(batch_id="batch_1", domain_records_id="c", records="records_c")
+
+    assert cache.get(batch_id="batch_1", domain_records_id="b") is None
+    assert cache.get(batch_id="batch_1", domain_records_id="a") == "records_a"
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert released == []
+
+
+@pytest.mark.unit
+def test_domain_records_cache_accounts_for_memory():
+    df = pd.DataFrame({"a": range(1000)})
+    cache = DomainRecordsCache(max_bytes=int(df.memory_usage(deep=True).sum() * 1.5))
+
+    cache.put(batch_id="batch_1", domain_records_id="a", records=df)
+    assert cache.total_bytes > 0
+
+    cache.put(batch_id="batch_1", domain_records_id="b", records=df.copy())
+
+    assert len(cache) == 1
+    assert cache.get(batch_id="batch_1", domain_records_id="a") is None
+    assert cache.get(batch_id="batch_1", domain_records_id="b") is not None
+
+
+@pytest.mark.unit
+def test_domain_records_cache_releases_invalidated_records():
+    released: List[str] = []
+    cache = DomainRecordsCache()
+
+    cache.put(
+        batch_id="batch_1",
+        domain_records_id="a",
+        records="records_a",
+        release=lambda: released.append("batch_1"),
+    )
+    cache.put(
+        batch_id="batch_2",
+        domain_records_id="a",
+        records="records_a",
+        release=lambda: released.append("batch_2"),
+    )
+
+    cache.invalidate_batch(batch_id="batch_1")
+    assert released == ["batch_1"]
+    assert cache.get(batch_id="batch_1", domain_records_id="a") is None
+    assert cache.get(batch_id="batch_2", domain_records_id="a") == "records_a"
+
+    cache.clear()
+    assert released == ["batch_1", "batch_2"]
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+@pytest.mark.unit
+def test_domain_records_cache_is_bounded_by_default():
+    cache = DomainRecordsCache()
+    assert cache.max_entries == DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES
+    assert cache.max_bytes == DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+
+    domain_records_id: int
+    for domain_records_id in range(DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES + 1):
+        cache.put(
+            batch_id="batch_1",
+            domain_records_id=str(domain_records_id),
+            records=pd.DataFrame({"a": [domain_records_id]}),
+        )
+
+    assert len(cache) == DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES
+    assert cache.get(batch_id="batch_1", domain_records_id="0") is None
+
+    unbounded_cache = DomainRecordsCache(max_entries=None, max_bytes=None)
+    assert unbounded_cache.max_entries is None
+    assert unbounded_cache.max_bytes is None
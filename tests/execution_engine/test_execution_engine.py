@@ -1,11 +1,19 @@
 from typing import Dict, Tuple
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch import BatchData, BatchMarkers
+from great_expectations.core.batch import Batch, BatchData, BatchMarkers
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.core.id_dict import IDDict
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    NoOpMetricCache,
+)
+from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -184,12 +192,38 @@ def test_resolve_metrics_with_aggregates_and_column_map():
 
     metrics.update(results)
 
+    column_mean_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.mean.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_mean_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_standard_deviation_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.standard_deviation.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_standard_deviation_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_mean_aggregate_fn_metric,
+            column_standard_deviation_aggregate_fn_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": column_mean_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     stdev = MetricConfiguration(
@@ -198,6 +232,7 @@ def test_resolve_metrics_with_aggregates_and_column_map():
         metric_value_kwargs=None,
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": column_standard_deviation_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
@@ -268,12 +303,38 @@ def test_resolve_metrics_with_extraneous_value_key():
 
     metrics.update(results)
 
+    column_mean_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.mean.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_mean_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_standard_deviation_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.standard_deviation.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2, 3, 4, 5]},
+    )
+    column_standard_deviation_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_mean_aggregate_fn_metric,
+            column_standard_deviation_aggregate_fn_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": column_mean_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     # Ensuring that an unused value key will not mess up computation
@@ -283,6 +344,7 @@ def test_resolve_metrics_with_extraneous_value_key():
         metric_value_kwargs={"value_set": [1, 2, 3, 4, 5]},
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": column_standard_deviation_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
 
@@ -327,3 +389,117 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(ge_exceptions.GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_metric_cache_config():
+    engine = PandasExecutionEngine()
+    assert isinstance(engine.metric_cache, InMemoryMetricCache)
+    assert engine.metric_cache.max_entries is None
+
+    engine = PandasExecutionEngine(
+        metric_cache={"class_name": "InMemoryMetricCache", "max_entries": 10}
+    )
+    assert isinstance(engine.metric_cache, InMemoryMetricCache)
+    assert engine.metric_cache.max_entries == 10
+    assert engine.config["metric_cache"] == {
+        "class_name": "InMemoryMetricCache",
+        "max_entries": 10,
+    }
+
+    engine = PandasExecutionEngine(caching=False)
+    assert isinstance(engine.metric_cache, NoOpMetricCache)
+
+
+def test_metric_cache_is_invalidated_for_dropped_and_replaced_batches():
+    engine = PandasExecutionEngine()
+    engine.load_batch_data(batch_id="batch_1", batch_data=pd.DataFrame({"a": [1, 2]}))
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a", "batch_id": "batch_1"},
+        metric_value_kwargs=None,
+    )
+    metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results.update(
+        engine.resolve_metrics(metrics_to_resolve=(metric,), metrics=results)
+    )
+    assert results[metric.id] == 1.5
+    assert metric.id in engine.metric_cache
+    assert engine.metric_cache[metric.id] == 1.5
+
+    # Replacing data of loaded Batch invalidates metrics, previously computed on it.
+    engine.load_batch_data(batch_id="batch_1", batch_data=pd.DataFrame({"a": [3, 4]}))
+    assert metric.id not in engine.metric_cache
+
+    del results[metric.id]
+    results.update(
+        engine.resolve_metrics(metrics_to_resolve=(metric,), metrics=results)
+    )
+    assert results[metric.id] == 3.5
+    assert metric.id in engine.metric_cache
+
+    engine.batch_manager.drop_batch(batch_id="batch_1")
+    assert metric.id not in engine.metric_cache
+    assert "batch_1" not in engine.batch_manager.batch_data_cache
+
+
+def test_persistent_metric_cache_skips_metrics_computed_on_same_data(tmp_path):
+    metric_cache_config: dict = {
+        "class_name": "PersistentMetricCache",
+        "store_backend": {"base_directory": str(tmp_path / "metrics")},
+    }
+    df = pd.DataFrame({"a": [1, 2, 3]})
+
+    def _resolve_column_median(
+        engine: PandasExecutionEngine, batch_id: str
+    ) -> MetricValue:
+        batch_data, batch_markers = engine.get_batch_data_and_markers(
+            batch_spec=RuntimeDataBatchSpec(batch_data=df)
+        )
+        assert "pandas_data_fingerprint" in batch_markers
+        engine.batch_manager.load_batch_list(
+            batch_list=[
+                Batch(
+                    data=batch_data,
+                    batch_definition=IDDict({"batch_id": batch_id}),
+                    batch_markers=batch_markers,
+                )
+            ]
+        )
+
+        table_columns_metric: MetricConfiguration
+        results: Dict[Tuple[str, str, str], MetricValue]
+        table_columns_metric, results = get_table_columns_metric(engine=engine)
+        metric = MetricConfiguration(
+            metric_name="column.median",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=None,
+        )
+        metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        return engine.resolve_metrics(metrics_to_resolve=(metric,), metrics=results)[
+            metric.id
+        ]
+
+    engine = PandasExecutionEngine(metric_cache=metric_cache_config)
+    assert _resolve_column_median(engine=engine, batch_id="batch_1") == 2
+
+    # Rerun (with different batch_id for same data) finds metrics in persistent store instead of computing them.
+    engine = PandasExecutionEngine(metric_cache=metric_cache_config)
+    with mock.patch(
+        "great_expectations.execution_engine.execution_engine.get_metric_provider",
+        side_effect=get_metric_provider,
+    ) as mock_get_metric_provider:
+        assert _resolve_column_median(engine=engine, batch_id="batch_2") == 2
+
+    # Column types (dtype objects) are not plain data; hence, they are not persisted.
+    assert [
+        call.kwargs["metric_name"] for call in mock_get_metric_provider.call_args_list
+    ] == ["table.column_types"]
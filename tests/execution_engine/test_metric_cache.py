@@ -0,0 +1,213 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.execution_engine.metric_cache import (
+    InMemoryMetricCache,
+    NoOpMetricCache,
+    PersistentMetricCache,
+    get_batch_data_fingerprint,
+)
+
+METRIC_ID_1 = ("column.max", "column=a", "()")
+METRIC_ID_2 = ("column.min", "column=a", "()")
+METRIC_ID_3 = ("column.mean", "column=a", "()")
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_counts_hits_and_misses():
+    cache = InMemoryMetricCache()
+
+    assert METRIC_ID_1 not in cache
+    cache.put(metric_id=METRIC_ID_1, value=3, batch_id="batch_1")
+    assert METRIC_ID_1 in cache
+    assert cache[METRIC_ID_1] == 3
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_evicts_least_recently_used_entries():
+    cache = InMemoryMetricCache(max_entries=2)
+
+    cache.put(metric_id=METRIC_ID_1, value=1, batch_id="batch_1")
+    cache.put(metric_id=METRIC_ID_2, value=2, batch_id="batch_1")
+    # Using first metric makes second metric the least recently used one.
+    assert METRIC_ID_1 in cache
+    cache.put(metric_id=METRIC_ID_3, value=3, batch_id="batch_1")
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert METRIC_ID_1 in cache
+    assert METRIC_ID_2 not in cache
+    assert METRIC_ID_3 in cache
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_evicts_by_estimated_size():
+    large_value = pd.Series(range(1000), dtype="int64")
+    cache = InMemoryMetricCache(max_bytes=12000)
+
+    cache.put(metric_id=METRIC_ID_1, value=large_value, batch_id="batch_1")
+    assert cache.total_bytes >= large_value.nbytes
+    cache.put(metric_id=METRIC_ID_2, value=large_value.copy(), batch_id="batch_1")
+
+    assert METRIC_ID_1 not in cache
+    assert METRIC_ID_2 in cache
+    assert cache.total_bytes <= cache.max_bytes
+
+    # Values larger than entire budget are not cached at all.
+    cache.put(
+        metric_id=METRIC_ID_3,
+        value=pd.Series(range(10000), dtype="int64"),
+        batch_id="batch_1",
+    )
+    assert METRIC_ID_3 not in cache
+    assert METRIC_ID_2 in cache
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_invalidates_batch():
+    cache = InMemoryMetricCache()
+
+    cache.put(metric_id=METRIC_ID_1, value=1, batch_id="batch_1")
+    cache.put(metric_id=METRIC_ID_2, value=2, batch_id="batch_2")
+    cache.put(metric_id=METRIC_ID_3, value=3, batch_id="batch_1")
+
+    cache.invalidate_batch(batch_id="batch_1")
+
+    assert len(cache) == 1
+    assert METRIC_ID_2 in cache
+
+    # Overwriting entry moves it to its new batch.
+    cache.put(metric_id=METRIC_ID_2, value=4, batch_id="batch_3")
+    cache.invalidate_batch(batch_id="batch_2")
+    assert cache[METRIC_ID_2] == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({"max_entries": 0}, id="max_entries"),
+        pytest.param({"max_bytes": -1}, id="max_bytes"),
+    ],
+)
+def test_in_memory_metric_cache_rejects_non_positive_limits(kwargs: dict):
+    with pytest.raises(ValueError):
+        InMemoryMetricCache(**kwargs)
+
+
+@pytest.mark.unit
+def test_no_op_metric_cache_never_stores_values():
+    cache = NoOpMetricCache()
+
+    cache.put(metric_id=METRIC_ID_1, value=1, batch_id="batch_1")
+
+    assert METRIC_ID_1 not in cache
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+@pytest.mark.unit
+def test_in_memory_metric_cache_does_not_count_persisted_lookups():
+    cache = InMemoryMetricCache()
+
+    assert not cache.persistent
+    assert not cache.contains_persisted(metric_id=METRIC_ID_1, batch_id="batch_1")
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+@pytest.fixture
+def persistent_metric_cache_config(tmp_path) -> dict:
+    return {
+        "class_name": "PersistentMetricCache",
+        "store_backend": {"base_directory": str(tmp_path / "metrics")},
+    }
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_reuses_metrics_across_instances(
+    persistent_metric_cache_config: dict,
+):
+    cache = instantiate_class_from_config(
+        config=persistent_metric_cache_config,
+        runtime_environment={},
+        config_defaults={
+            "module_name": "great_expectations.execution_engine.metric_cache"
+        },
+    )
+    assert isinstance(cache, PersistentMetricCache)
+
+    cache.set_batch_fingerprint(batch_id="batch_1", fingerprint="fingerprint_1")
+    cache.put(metric_id=METRIC_ID_1, value=np.float64(3.5), batch_id="batch_1")
+    cache.put(
+        metric_id=METRIC_ID_2,
+        value={"values": [1, 2], "frequencies": (3, 4)},
+        batch_id="batch_1",
+    )
+    # Metrics of Batches without fingerprint, and metric values, which are not plain data, are not persisted.
+    cache.put(metric_id=METRIC_ID_3, value=3, batch_id="batch_2")
+    cache.put(metric_id=METRIC_ID_3, value=(len, {}, {}), batch_id="batch_1")
+    # Row-aligned values of map metrics are not persisted either.
+    cache.put(
+        metric_id=("column_values.nonnull.condition", "column=a", "()"),
+        value=(pd.Series([True, False, True]), {}, {}),
+        batch_id="batch_1",
+    )
+    assert len(cache.store_backend.list_keys()) == 2
+
+    other_cache = PersistentMetricCache(
+        **{
+            key: value
+            for key, value in persistent_metric_cache_config.items()
+            if key != "class_name"
+        }
+    )
+    assert METRIC_ID_1 not in other_cache
+    assert not other_cache.contains(metric_id=METRIC_ID_1, batch_id="batch_1")
+
+    # Same data may be loaded under different batch_id.
+    other_cache.set_batch_fingerprint(batch_id="batch_3", fingerprint="fingerprint_1")
+    assert other_cache.contains(metric_id=METRIC_ID_1, batch_id="batch_3")
+    assert other_cache[METRIC_ID_1] == 3.5
+    assert other_cache.contains(metric_id=METRIC_ID_2, batch_id="batch_3")
+    assert other_cache[METRIC_ID_2] == {"values": [1, 2], "frequencies": (3, 4)}
+    assert not other_cache.contains(metric_id=METRIC_ID_3, batch_id="batch_3")
+
+    # Changed data of Batch means changed fingerprint (and new persistent entries).
+    other_cache.invalidate_batch(batch_id="batch_3")
+    other_cache.set_batch_fingerprint(batch_id="batch_3", fingerprint="fingerprint_2")
+    assert not other_cache.contains(metric_id=METRIC_ID_1, batch_id="batch_3")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "batch_markers,expected_fingerprint",
+    [
+        pytest.param(None, None, id="no_markers"),
+        pytest.param({"ge_load_time": "20221017T000000.000000Z"}, None, id="none"),
+        pytest.param(
+            {"pandas_data_fingerprint": "abc", "ge_load_time": "20221017"},
+            "abc",
+            id="pandas",
+        ),
+        pytest.param({"sqlalchemy_data_fingerprint": "def"}, "def", id="sqlalchemy"),
+    ],
+)
+def test_get_batch_data_fingerprint(
+    batch_markers: Optional[dict], expected_fingerprint: Optional[str]
+):
+    assert (
+        get_batch_data_fingerprint(batch_markers=batch_markers) == expected_fingerprint
+    )
@@ -0,0 +1,117 @@
+import hashlib
+from typing import List
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.pandas_data_fingerprint import (
+    FINGERPRINT_METHODS,
+    SAMPLED_BLOCK_SIZE,
+    SAMPLED_BLOCK_STRIDE,
+    PandasDataFingerprint,
+)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    number_of_rows: int = SAMPLED_BLOCK_SIZE * SAMPLED_BLOCK_STRIDE * 2 + 10
+    return pd.DataFrame(
+        {
+            "a": range(number_of_rows),
+            "b": [f"value_{idx % 7}" for idx in range(number_of_rows)],
+        }
+    )
+
+
+def _get_fingerprint(method: str, chunks: List[pd.DataFrame]) -> str:
+    fingerprint = PandasDataFingerprint(method=method)
+    chunk: pd.DataFrame
+    for chunk in chunks:
+        fingerprint.update(chunk)
+
+    return fingerprint.hexdigest()
+
+
+def _split(df: pd.DataFrame, chunk_size: int) -> List[pd.DataFrame]:
+    return [df.iloc[idx : idx + chunk_size] for idx in range(0, len(df), chunk_size)]
+
+
+def test_full_fingerprint_of_single_chunk_hashes_every_cell(df):
+    assert (
+        _get_fingerprint(method="full", chunks=[df])
+        == hashlib.md5(pd.util.hash_pandas_object(df, index=True).values).hexdigest()
+    )
+
+
+@pytest.mark.parametrize("method", FINGERPRINT_METHODS)
+def test_fingerprint_does_not_depend_on_chunks(df, method):
+    fingerprint: str = _get_fingerprint(method=method, chunks=[df])
+    assert _get_fingerprint(method=method, chunks=_split(df, 1000)) == fingerprint
+    assert _get_fingerprint(method=method, chunks=_split(df, 4097)) == fingerprint
+
+
+def test_sampled_fingerprint_reflects_only_sampled_blocks_and_row_count(df):
+    fingerprint: str = _get_fingerprint(method="sampled", chunks=[df])
+
+    df_changed_outside_samples = df.copy()
+    df_changed_outside_samples.loc[SAMPLED_BLOCK_SIZE, "a"] = -1
+    assert (
+        _get_fingerprint(method="sampled", chunks=[df_changed_outside_samples])
+        == fingerprint
+    )
+
+    df_changed_in_sample = df.copy()
+    df_changed_in_sample.loc[SAMPLED_BLOCK_SIZE * SAMPLED_BLOCK_STRIDE, "a"] = -1
+    assert (
+        _get_fingerprint(method="sampled", chunks=[df_changed_in_sample]) != fingerprint
+    )
+
+    assert _get_fingerprint(method="sampled", chunks=[df.iloc[:-1]]) != fingerprint
+
+
+def test_schema_fingerprint_reflects_every_value_and_dtype(df):
+    fingerprint: str = _get_fingerprint(method="schema", chunks=[df])
+
+    df_changed = df.copy()
+    df_changed.loc[SAMPLED_BLOCK_SIZE, "b"] = "other"
+    assert _get_fingerprint(method="schema", chunks=[df_changed]) != fingerprint
+
+    assert (
+        _get_fingerprint(method="schema", chunks=[df.astype({"a": "float64"})])
+        != fingerprint
+    )
+
+
+def test_schema_fingerprint_reflects_order_and_pairing_of_values():
+    df = pd.DataFrame({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+    fingerprint: str = _get_fingerprint(method="schema", chunks=[df])
+
+    # Values of one column reordered (rows are paired differently).
+    assert (
+        _get_fingerprint(
+            method="schema",
+            chunks=[pd.DataFrame({"x": [3, 2, 1], "y": ["a", "b", "c"]})],
+        )
+        != fingerprint
+    )
+    # Entire rows reordered (with or without their index).
+    assert (
+        _get_fingerprint(method="schema", chunks=[df.iloc[::-1].reset_index(drop=True)])
+        != fingerprint
+    )
+    assert _get_fingerprint(method="schema", chunks=[df.iloc[::-1]]) != fingerprint
+
+
+def test_fingerprint_of_unhashable_values():
+    df = pd.DataFrame({"a": [{"x": 1}, {"y": 2}]})
+
+    method: str
+    for method in FINGERPRINT_METHODS:
+        assert _get_fingerprint(method=method, chunks=[df]) == _get_fingerprint(
+            method=method, chunks=[df.copy()]
+        )
+
+
+def test_unknown_fingerprint_method():
+    with pytest.raises(ValueError):
+        PandasDataFingerprint(method="unknown")
@@ -1,5 +1,7 @@
+import hashlib
 import os
-from typing import Dict, Tuple
+from io import BytesIO
+from typing import Dict, List, Tuple
 from unittest import mock
 
 import pandas as pd
@@ -16,14 +18,28 @@ except:
 
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_suite import ExpectationSuite
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasChunkedBatchData,
+    PandasLazyBatchData,
+    to_numpy_backed_dataframe,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    hash_file_identity,
     storage,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -84,6 +100,45 @@ def test_get_domain_records_with_column_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+def test_get_domain_records_filters_rows_once_per_batch():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]}
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    row_condition_kwargs: dict = {
+        "row_condition": "b<5",
+        "condition_parser": "pandas",
+    }
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "_filter_domain_records",
+        wraps=PandasExecutionEngine._filter_domain_records,
+    ) as mock_filter_domain_records:
+        data_a = engine.get_domain_records(
+            domain_kwargs={"column": "a", **row_condition_kwargs}
+        )
+        data_c = engine.get_domain_records(
+            domain_kwargs={"column": "c", **row_condition_kwargs}
+        )
+        assert mock_filter_domain_records.call_count == 1
+        assert data_a is data_c
+        assert data_a.equals(df.iloc[:3])
+
+        # Replacing data of Batch invalidates its domain records.
+        new_df = df.iloc[1:]
+        engine.load_batch_data(batch_data=new_df, batch_id="1234")
+        data_a = engine.get_domain_records(
+            domain_kwargs={"column": "a", **row_condition_kwargs}
+        )
+        assert mock_filter_domain_records.call_count == 2
+        assert data_a.equals(new_df.iloc[:2])
+
+    assert engine.domain_records_cache.hits == 1
+    assert len(engine.domain_records_cache) == 1
+
+
 def test_get_domain_records_with_column_pair_domain():
     engine = PandasExecutionEngine()
     df = pd.DataFrame(
@@ -379,12 +434,38 @@ def test_resolve_metric_bundle():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    column_mean_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.mean.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_mean_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_standard_deviation_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.standard_deviation.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_standard_deviation_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_mean_aggregate_fn_metric,
+            column_standard_deviation_aggregate_fn_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": column_mean_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     stdev = MetricConfiguration(
@@ -393,6 +474,7 @@ def test_resolve_metric_bundle():
         metric_value_kwargs=None,
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": column_standard_deviation_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
@@ -410,6 +492,115 @@ def test_resolve_metric_bundle():
     )
 
 
+def _build_column_aggregate_metrics(
+    engine: PandasExecutionEngine,
+    metric_names: Tuple[str, ...],
+    metric_domain_kwargs_list: Tuple[dict, ...],
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Tuple[MetricConfiguration, ...]:
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    partial_metrics: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+    desired_metrics = []
+    for metric_domain_kwargs in metric_domain_kwargs_list:
+        for metric_name in metric_names:
+            partial_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.aggregate_fn",
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            partial_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            partial_metrics[partial_metric.id] = partial_metric
+
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": partial_metric,
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(desired_metric)
+
+    metrics.update(
+        engine.resolve_metrics(
+            metrics_to_resolve=partial_metrics.values(), metrics=metrics
+        )
+    )
+    return tuple(desired_metrics)
+
+
+def test_resolve_metric_bundle_obtains_domain_records_once_per_compute_domain():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4.0, 5.0, 6.0, 7.0]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    row_condition_kwargs = {"row_condition": "b>4", "condition_parser": "pandas"}
+    desired_metrics = _build_column_aggregate_metrics(
+        engine=engine,
+        metric_names=("column.min", "column.max", "column.mean", "column.sum"),
+        metric_domain_kwargs_list=(
+            {"column": "a"},
+            {"column": "b"},
+            {"column": "a", **row_condition_kwargs},
+            {"column": "b", **row_condition_kwargs},
+        ),
+        metrics=metrics,
+    )
+
+    with mock.patch.object(
+        engine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+
+    # Sixteen aggregates are computed on two compute domains (entire table and rows, satisfying "row_condition").
+    assert mock_get_domain_records.call_count == 2
+    assert [results[metric.id] for metric in desired_metrics] == [
+        1.0,
+        3.0,
+        2.0,
+        6.0,
+        4.0,
+        7.0,
+        5.5,
+        22.0,
+        2.0,
+        3.0,
+        2.5,
+        5.0,
+        5.0,
+        7.0,
+        6.0,
+        18.0,
+    ]
+
+
+def test_resolve_metric_bundle_reports_only_failed_metrics():
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", "z", None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    desired_metrics = _build_column_aggregate_metrics(
+        engine=engine,
+        metric_names=("column.mean",),
+        metric_domain_kwargs_list=({"column": "a"}, {"column": "b"}),
+        metrics=metrics,
+    )
+
+    with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+
+    assert [metric.id for metric in e.value.failed_metrics] == [desired_metrics[1].id]
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -520,6 +711,257 @@ def test_get_batch_with_split_on_divided_integer_and_sample_on_list(test_df):
     assert split_df.dataframe.id.max() == 59
 
 
+@pytest.fixture
+def chunked_csv_path(tmp_path) -> str:
+    path = str(tmp_path / "chunked.csv")
+    pd.DataFrame(
+        {
+            "a": [1, 2, None, 4, 5, 6, 7, 8, 9, 10, 11],
+            "b": ["x", "y", "z", "x", "y", "z", "x", "y", "z", "x", "w"],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+def _get_validator(path: str, chunk_size=None, project_columns=False) -> Validator:
+    execution_engine = PandasExecutionEngine(
+        chunk_size=chunk_size, project_columns=project_columns
+    )
+    batch_data = execution_engine.get_batch_data(
+        PathBatchSpec(path=path, reader_method="read_csv")
+    )
+    return Validator(
+        execution_engine=execution_engine, batches=[Batch(data=batch_data)]
+    )
+
+
+def test_chunked_batch_metrics_equal_metrics_of_entire_batch(chunked_csv_path):
+    chunked_validator: Validator = _get_validator(path=chunked_csv_path, chunk_size=3)
+    validator: Validator = _get_validator(path=chunked_csv_path)
+
+    batch_data = chunked_validator.execution_engine.batch_manager.active_batch_data
+    assert isinstance(batch_data, PandasChunkedBatchData)
+
+    result_format: dict = {"result_format": "COMPLETE"}
+    metrics: Dict[str, MetricConfiguration] = {
+        "table.row_count": MetricConfiguration("table.row_count", {}),
+        "column.min": MetricConfiguration("column.min", {"column": "a"}),
+        "column.max": MetricConfiguration("column.max", {"column": "a"}),
+        "column.sum": MetricConfiguration("column.sum", {"column": "a"}),
+        "column.mean": MetricConfiguration("column.mean", {"column": "a"}),
+        "column.standard_deviation": MetricConfiguration(
+            "column.standard_deviation", {"column": "a"}
+        ),
+        "column.value_counts": MetricConfiguration(
+            "column.value_counts", {"column": "b"}, {"sort": "value", "collate": None}
+        ),
+        "column.distinct_values.count": MetricConfiguration(
+            "column.distinct_values.count", {"column": "b"}
+        ),
+        "column_values.nonnull.unexpected_count": MetricConfiguration(
+            "column_values.nonnull.unexpected_count", {"column": "a"}
+        ),
+        "column_values.between.unexpected_count": MetricConfiguration(
+            "column_values.between.unexpected_count",
+            {"column": "a"},
+            {"min_value": 2, "max_value": 8, "strict_min": False, "strict_max": False},
+        ),
+        "column_values.between.unexpected_index_list": MetricConfiguration(
+            "column_values.between.unexpected_index_list",
+            {"column": "a"},
+            {
+                "min_value": 2,
+                "max_value": 8,
+                "strict_min": False,
+                "strict_max": False,
+                "result_format": result_format,
+            },
+        ),
+        "column_values.in_set.unexpected_values": MetricConfiguration(
+            "column_values.in_set.unexpected_values",
+            {"column": "b"},
+            {
+                "value_set": ["x", "y"],
+                "parse_strings_as_datetimes": False,
+                "result_format": {
+                    "result_format": "SUMMARY",
+                    "partial_unexpected_count": 3,
+                },
+            },
+        ),
+    }
+
+    chunked_values: Dict[str, MetricValue] = chunked_validator.get_metrics(
+        metrics=metrics
+    )
+    values: Dict[str, MetricValue] = validator.get_metrics(metrics=metrics)
+
+    assert not batch_data.is_materialized
+
+    assert chunked_values["column.standard_deviation"] == pytest.approx(
+        values.pop("column.standard_deviation")
+    )
+    assert chunked_values["column.value_counts"].equals(
+        values.pop("column.value_counts")
+    )
+    assert {
+        name: value
+        for name, value in chunked_values.items()
+        if name not in ["column.standard_deviation", "column.value_counts"]
+    } == values
+    assert chunked_values["column_values.between.unexpected_index_list"] == [
+        0,
+        8,
+        9,
+        10,
+    ]
+    assert chunked_values["column_values.in_set.unexpected_values"] == [
+        "z",
+        "z",
+        "z",
+    ]
+
+
+def test_chunked_batch_is_materialized_for_metrics_not_computable_in_chunks(
+    chunked_csv_path,
+):
+    chunked_validator: Validator = _get_validator(path=chunked_csv_path, chunk_size=3)
+    batch_data = chunked_validator.execution_engine.batch_manager.active_batch_data
+
+    assert (
+        chunked_validator.get_metric(
+            MetricConfiguration("column.median", {"column": "a"})
+        )
+        == 6.5
+    )
+    assert batch_data.is_materialized
+    assert batch_data.dataframe.shape == (11, 2)
+
+    # Metrics, depending on chunk-local map conditions, are still resolved on materialized batch data.
+    assert (
+        chunked_validator.get_metric(
+            MetricConfiguration(
+                "column_values.nonnull.unexpected_count", {"column": "a"}
+            )
+        )
+        == 1
+    )
+
+
+@pytest.mark.parametrize(
+    "values,expectation_type,kwargs,expected_unexpected_count",
+    [
+        pytest.param(
+            [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0],
+            "expect_column_values_to_be_unique",
+            {"column": "a"},
+            2,
+            id="unique",
+        ),
+        pytest.param(
+            [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 0],
+            "expect_compound_columns_to_be_unique",
+            {"column_list": ["a", "b"]},
+            2,
+            id="compound_unique",
+        ),
+        pytest.param(
+            [1, 2, 3, 4, 5, 0, 1, 2, 3, 4, 5],
+            "expect_column_values_to_be_increasing",
+            {"column": "a"},
+            1,
+            id="increasing",
+        ),
+        pytest.param(
+            [5, 4, 3, 2, 1, 9, 8, 7, 6, 5, 4],
+            "expect_column_values_to_be_decreasing",
+            {"column": "a"},
+            1,
+            id="decreasing",
+        ),
+    ],
+)
+def test_chunked_batch_cross_row_conditions_span_chunks(
+    tmp_path, values, expectation_type, kwargs, expected_unexpected_count
+):
+    # Duplicates and order breaks cross boundary of chunks (of 5 rows each).
+    path = str(tmp_path / "cross_row.csv")
+    pd.DataFrame({"a": values, "b": ["x"] * len(values)}).to_csv(path, index=False)
+
+    chunked_validator: Validator = _get_validator(path=path, chunk_size=5)
+    validator: Validator = _get_validator(path=path)
+
+    chunked_result = getattr(chunked_validator, expectation_type)(**kwargs)
+    result = getattr(validator, expectation_type)(**kwargs)
+
+    assert not chunked_result.success
+    assert chunked_result.result["unexpected_count"] == expected_unexpected_count
+    assert chunked_result.result == result.result
+    assert (
+        chunked_validator.execution_engine.batch_manager.active_batch_data.is_materialized
+    )
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(chunk_size=0)
+
+    assert PandasExecutionEngine(chunk_size=1000).config["chunk_size"] == 1000
+    assert "chunk_size" not in PandasExecutionEngine().config
+
+
+@pytest.mark.parametrize("fingerprint_method", ["full", "sampled", "schema"])
+def test_chunked_batch_is_fingerprinted_during_first_pass(
+    chunked_csv_path, fingerprint_method
+):
+    batch_spec = PathBatchSpec(path=chunked_csv_path, reader_method="read_csv")
+    batch_data, batch_markers = PandasExecutionEngine(
+        chunk_size=3, fingerprint_method=fingerprint_method
+    ).get_batch_data_and_markers(batch_spec)
+    assert isinstance(batch_data, PandasChunkedBatchData)
+    assert "pandas_data_fingerprint" not in batch_markers
+
+    list(batch_data.iter_chunks())
+
+    assert batch_markers["pandas_data_fingerprint"] == PandasExecutionEngine(
+        fingerprint_method=fingerprint_method
+    ).get_batch_data_and_markers(batch_spec)[1].get("pandas_data_fingerprint")
+
+
+def test_large_batch_is_only_fingerprinted_by_explicit_sampling(chunked_csv_path):
+    batch_spec = PathBatchSpec(path=chunked_csv_path, reader_method="read_csv")
+    with mock.patch(
+        "great_expectations.execution_engine.pandas_execution_engine.HASH_THRESHOLD",
+        0,
+    ):
+        # Sampled fingerprint does not reflect every cell; hence, it is not substituted for full fingerprint.
+        assert (
+            "pandas_data_fingerprint"
+            not in PandasExecutionEngine().get_batch_data_and_markers(batch_spec)[1]
+        )
+        fingerprint: str = (
+            PandasExecutionEngine(fingerprint_method="sampled")
+            .get_batch_data_and_markers(batch_spec)[1]
+            .get("pandas_data_fingerprint")
+        )
+
+    assert fingerprint is not None
+    assert fingerprint == PandasExecutionEngine(
+        fingerprint_method="sampled"
+    ).get_batch_data_and_markers(batch_spec)[1].get("pandas_data_fingerprint")
+    assert (
+        "pandas_data_fingerprint"
+        not in PandasExecutionEngine(
+            fingerprint_method=None
+        ).get_batch_data_and_markers(batch_spec)[1]
+    )
+
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(fingerprint_method="unknown")
+
+    assert "fingerprint_method" not in PandasExecutionEngine().config
+
+
 # noinspection PyUnusedLocal
 @mock.patch(
     "great_expectations.execution_engine.pandas_execution_engine.BlobServiceClient",
@@ -643,3 +1085,611 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+def test_projected_batch_reads_only_projected_columns(chunked_csv_path):
+    validator: Validator = _get_validator(path=chunked_csv_path, project_columns=True)
+    execution_engine: PandasExecutionEngine = validator.execution_engine
+    batch_data = execution_engine.batch_manager.active_batch_data
+    assert isinstance(batch_data, PandasLazyBatchData)
+    assert not batch_data.is_materialized
+    assert "pandas_data_fingerprint" not in validator.active_batch_markers
+
+    execution_engine.project_batch_columns(
+        batch_id=validator.active_batch_id, column_names={"a", "missing"}
+    )
+    assert (
+        validator.get_metric(MetricConfiguration("column.max", {"column": "a"})) == 11
+    )
+    assert list(batch_data.dataframe.columns) == ["a"]
+
+    # Narrowing projection keeps data (and metrics) already read.
+    execution_engine.project_batch_columns(
+        batch_id=validator.active_batch_id, column_names=set()
+    )
+    assert list(batch_data.dataframe.columns) == ["a"]
+
+    # Widening projection discards data, read under narrower projection, and metrics, computed on it.
+    execution_engine.project_batch_columns(
+        batch_id=validator.active_batch_id, column_names=None
+    )
+    assert not batch_data.is_materialized
+    assert validator.get_metric(MetricConfiguration("table.columns", {})) == ["a", "b"]
+
+
+def test_validation_of_projected_batch_reads_only_referenced_columns(
+    chunked_csv_path,
+):
+    validator: Validator = _get_validator(path=chunked_csv_path, project_columns=True)
+    batch_data = validator.execution_engine.batch_manager.active_batch_data
+
+    read_column_projections = []
+    reader = batch_data._reader
+
+    def _spy_reader(column_names):
+        read_column_projections.append(column_names)
+        return reader(column_names)
+
+    batch_data._reader = _spy_reader
+
+    suite = ExpectationSuite(
+        expectation_suite_name="projected",
+        expectations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={
+                    "column": "a",
+                    "row_condition": 'b == "x"',
+                    "condition_parser": "pandas",
+                },
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 10, "max_value": 11},
+            ),
+        ],
+    )
+    assert validator.validate(expectation_suite=suite).success
+    assert read_column_projections == [{"a", "b"}]
+
+    # Table-level expectations need all columns.
+    suite.add_expectation(
+        ExpectationConfiguration(
+            expectation_type="expect_table_column_count_to_equal",
+            kwargs={"value": 2},
+        )
+    )
+    assert validator.validate(expectation_suite=suite).success
+    assert read_column_projections == [{"a", "b"}, None]
+
+
+def test_dtype_backend_must_be_supported():
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(dtype_backend="cudf")
+
+    assert "dtype_backend" not in PandasExecutionEngine().config
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_arrow_backed_batch_metrics_equal_metrics_of_numpy_backed_batch(tmp_path):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, None, 4, 5],
+            "b": ["abc", "de", None, "fghij", "abd"],
+        }
+    )
+    csv_path = str(tmp_path / "arrow.csv")
+    df.to_csv(csv_path, index=False)
+    parquet_path = str(tmp_path / "arrow.parquet")
+    df.to_parquet(parquet_path)
+
+    metrics: Dict[str, MetricConfiguration] = {
+        "column.max": MetricConfiguration("column.max", {"column": "a"}),
+        "column.value_counts": MetricConfiguration(
+            "column.value_counts", {"column": "b"}, {"sort": "value", "collate": None}
+        ),
+        "column_values.nonnull.unexpected_count": MetricConfiguration(
+            "column_values.nonnull.unexpected_count", {"column": "b"}
+        ),
+        "column_values.match_regex.unexpected_count": MetricConfiguration(
+            "column_values.match_regex.unexpected_count",
+            {"column": "b"},
+            {"regex": "^ab"},
+        ),
+        "column_values.value_length.equals.unexpected_count": MetricConfiguration(
+            "column_values.value_length.equals.unexpected_count",
+            {"column": "b"},
+            {"value": 3},
+        ),
+    }
+    expected_values: Dict[str, MetricValue] = {
+        "column.max": 5,
+        "column.value_counts": [1, 1, 1, 1],
+        "column_values.nonnull.unexpected_count": 1,
+        "column_values.match_regex.unexpected_count": 2,
+        "column_values.value_length.equals.unexpected_count": 2,
+    }
+
+    path: str
+    reader_method: str
+    for path, reader_method in [(csv_path, "read_csv"), (parquet_path, "read_parquet")]:
+        execution_engine = PandasExecutionEngine(dtype_backend="pyarrow")
+        batch_data = execution_engine.get_batch_data(
+            PathBatchSpec(path=path, reader_method=reader_method)
+        )
+        assert all(
+            isinstance(dtype, pd.ArrowDtype) for dtype in batch_data.dataframe.dtypes
+        )
+
+        validator = Validator(
+            execution_engine=execution_engine, batches=[Batch(data=batch_data)]
+        )
+        results: Dict[str, MetricValue] = {
+            name: validator.get_metric(metric) for name, metric in metrics.items()
+        }
+        results["column.value_counts"] = results["column.value_counts"].tolist()
+        assert results == expected_values
+
+
+@pytest.fixture
+def arrow_backend_equivalence_expectation_configurations() -> List[
+    ExpectationConfiguration
+]:
+    partition_object: dict = {"bins": [0, 3, 6], "weights": [0.5, 0.5]}
+    return [
+        ExpectationConfiguration(expectation_type=expectation_type, kwargs=kwargs)
+        for expectation_type, kwargs in [
+            ("expect_table_row_count_to_equal", {"value": 6}),
+            (
+                "expect_table_columns_to_match_set",
+                {"column_set": ["i", "n", "f", "s", "d", "j", "b"]},
+            ),
+            ("expect_column_values_to_be_of_type", {"column": "i", "type_": "int64"}),
+            ("expect_column_values_to_be_of_type", {"column": "n", "type_": "float64"}),
+            ("expect_column_values_to_be_of_type", {"column": "s", "type_": "str"}),
+            (
+                "expect_column_values_to_be_in_type_list",
+                {"column": "f", "type_list": ["float64"]},
+            ),
+            (
+                "expect_column_values_to_be_in_type_list",
+                {"column": "s", "type_list": ["str"]},
+            ),
+            ("expect_column_values_to_not_be_null", {"column": "s"}),
+            ("expect_column_values_to_be_null", {"column": "f"}),
+            ("expect_column_values_to_be_unique", {"column": "s"}),
+            (
+                "expect_column_values_to_be_in_set",
+                {"column": "s", "value_set": ["abc", "de"]},
+            ),
+            (
+                "expect_column_values_to_not_be_in_set",
+                {"column": "i", "value_set": [1, 2]},
+            ),
+            ("expect_column_values_to_be_in_set", {"column": "b", "value_set": [True]}),
+            (
+                "expect_column_values_to_be_between",
+                {"column": "n", "min_value": 1, "max_value": 5},
+            ),
+            (
+                "expect_column_values_to_be_between",
+                {"column": "d", "min_value": "2020-01-01", "max_value": "2020-12-31"},
+            ),
+            ("expect_column_values_to_be_increasing", {"column": "i"}),
+            ("expect_column_values_to_be_decreasing", {"column": "f"}),
+            ("expect_column_values_to_match_regex", {"column": "s", "regex": "^a"}),
+            ("expect_column_values_to_not_match_regex", {"column": "s", "regex": "^a"}),
+            (
+                "expect_column_values_to_match_regex_list",
+                {"column": "s", "regex_list": ["^a", "e$"]},
+            ),
+            (
+                "expect_column_value_lengths_to_be_between",
+                {"column": "s", "min_value": 2, "max_value": 3},
+            ),
+            ("expect_column_value_lengths_to_equal", {"column": "s", "value": 3}),
+            (
+                "expect_column_values_to_match_strftime_format",
+                {"column": "d", "strftime_format": "%Y-%m-%d"},
+            ),
+            ("expect_column_values_to_be_dateutil_parseable", {"column": "d"}),
+            ("expect_column_values_to_be_json_parseable", {"column": "j"}),
+            (
+                "expect_column_value_z_scores_to_be_less_than",
+                {"column": "f", "threshold": 1.5, "double_sided": True},
+            ),
+            (
+                "expect_column_min_to_be_between",
+                {"column": "n", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_max_to_be_between",
+                {"column": "f", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_mean_to_be_between",
+                {"column": "n", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_median_to_be_between",
+                {"column": "f", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_stdev_to_be_between",
+                {"column": "f", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_sum_to_be_between",
+                {"column": "n", "min_value": 0, "max_value": 100},
+            ),
+            (
+                "expect_column_quantile_values_to_be_between",
+                {
+                    "column": "f",
+                    "quantile_ranges": {
+                        "quantiles": [0.25, 0.5],
+                        "value_ranges": [[0, 10], [0, 10]],
+                    },
+                },
+            ),
+            (
+                "expect_column_unique_value_count_to_be_between",
+                {"column": "s", "min_value": 0, "max_value": 10},
+            ),
+            (
+                "expect_column_proportion_of_unique_values_to_be_between",
+                {"column": "s", "min_value": 0, "max_value": 1},
+            ),
+            (
+                "expect_column_most_common_value_to_be_in_set",
+                {"column": "s", "value_set": ["de"]},
+            ),
+            (
+                "expect_column_distinct_values_to_equal_set",
+                {"column": "i", "value_set": [1, 2, 3, 4, 5, 6]},
+            ),
+            (
+                "expect_column_kl_divergence_to_be_less_than",
+                {"column": "f", "partition_object": partition_object, "threshold": 0.5},
+            ),
+            (
+                "expect_column_pair_values_a_to_be_greater_than_b",
+                {"column_A": "i", "column_B": "n", "or_equal": True},
+            ),
+            (
+                "expect_column_pair_values_to_be_equal",
+                {"column_A": "i", "column_B": "n"},
+            ),
+            (
+                "expect_multicolumn_sum_to_equal",
+                {"column_list": ["i", "n"], "sum_total": 6},
+            ),
+            (
+                "expect_select_column_values_to_be_unique_within_record",
+                {"column_list": ["i", "n"]},
+            ),
+            ("expect_compound_columns_to_be_unique", {"column_list": ["i", "n"]}),
+        ]
+    ]
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+@pytest.mark.parametrize("reader_method", ["read_csv", "read_parquet"])
+def test_arrow_backed_batch_validation_results_equal_results_of_numpy_backed_batch(
+    tmp_path, reader_method, arrow_backend_equivalence_expectation_configurations
+):
+    df = pd.DataFrame(
+        {
+            "i": [1, 2, 3, 4, 5, 6],
+            "n": [1, 7, None, 4, 5, 3],
+            "f": [0.5, 1.5, 2.5, None, 4.5, 5.5],
+            "s": ["abc", "de", None, "fghij", "abd", "de"],
+            "d": [
+                "2020-01-01",
+                "2020-01-02",
+                "2020-13-01",
+                None,
+                "2021-05-05",
+                "2020-01-01",
+            ],
+            "j": ['{"a": 1}', "[1]", "x", None, "1", '"s"'],
+            "b": [True, False, True, True, None, False],
+        }
+    )
+    path: str
+    if reader_method == "read_csv":
+        path = str(tmp_path / "data.csv")
+        df.to_csv(path, index=False)
+    else:
+        path = str(tmp_path / "data.parquet")
+        df.to_parquet(path)
+
+    def _validate(dtype_backend: str) -> List[dict]:
+        execution_engine = PandasExecutionEngine(dtype_backend=dtype_backend)
+        batch_data = execution_engine.get_batch_data(
+            PathBatchSpec(path=path, reader_method=reader_method)
+        )
+        validator = Validator(
+            execution_engine=execution_engine, batches=[Batch(data=batch_data)]
+        )
+        results: List[dict] = []
+        configuration: ExpectationConfiguration
+        for configuration in arrow_backend_equivalence_expectation_configurations:
+            result: dict = validator.graph_validate(
+                configurations=[
+                    ExpectationConfiguration(
+                        expectation_type=configuration.expectation_type,
+                        kwargs={**configuration.kwargs, "result_format": "COMPLETE"},
+                    )
+                ]
+            )[0].to_json_dict()
+            assert not result["exception_info"]["raised_exception"], result
+            results.append({key: result[key] for key in ["success", "result"]})
+
+        return results
+
+    arrow_backed_results: List[dict] = _validate(dtype_backend="pyarrow")
+    numpy_backed_results: List[dict] = _validate(dtype_backend="numpy")
+
+    configuration: ExpectationConfiguration
+    arrow_backed_result: dict
+    numpy_backed_result: dict
+    for configuration, arrow_backed_result, numpy_backed_result in zip(
+        arrow_backend_equivalence_expectation_configurations,
+        arrow_backed_results,
+        numpy_backed_results,
+    ):
+        assert arrow_backed_result == numpy_backed_result, configuration
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_arrow_backed_batch_is_converted_only_for_metrics_not_supporting_it(tmp_path):
+    path = str(tmp_path / "data.parquet")
+    pd.DataFrame({"s": ["abc", "de", None, "abd"], "i": [1, 2, 3, 4]}).to_parquet(path)
+
+    execution_engine = PandasExecutionEngine(dtype_backend="pyarrow")
+    batch_data = execution_engine.get_batch_data(
+        PathBatchSpec(path=path, reader_method="read_parquet")
+    )
+    validator = Validator(
+        execution_engine=execution_engine, batches=[Batch(data=batch_data)]
+    )
+
+    with mock.patch(
+        "great_expectations.execution_engine.pandas_batch_data.to_numpy_backed_dataframe",
+        wraps=to_numpy_backed_dataframe,
+    ) as mock_to_numpy_backed_dataframe:
+        results = validator.graph_validate(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_match_regex",
+                    kwargs={"column": "s", "regex": "^a"},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_value_lengths_to_be_between",
+                    kwargs={"column": "s", "min_value": 2, "max_value": 3},
+                ),
+            ]
+        )
+        assert [result.success for result in results] == [False, True]
+        assert not mock_to_numpy_backed_dataframe.called
+
+        # Metrics, which do not support Arrow-backed columns, convert batch data (once).
+        results = validator.graph_validate(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_max_to_be_between",
+                    kwargs={"column": "i", "min_value": 4, "max_value": 4},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_unique_value_count_to_be_between",
+                    kwargs={"column": "s", "min_value": 3, "max_value": 3},
+                ),
+            ]
+        )
+        assert [result.success for result in results] == [True, True]
+        assert mock_to_numpy_backed_dataframe.call_count == 1
+
+    assert all(
+        isinstance(dtype, pd.ArrowDtype) for dtype in batch_data.dataframe.dtypes
+    )
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_memory_mapped_arrow_ipc_batch_references_mapped_file(tmp_path):
+    import pyarrow as pa
+
+    path = str(tmp_path / "mapped.arrow")
+    df = pd.DataFrame({"a": range(100000), "b": ["x", "y"] * 50000})
+    df.to_feather(path, compression="uncompressed")
+
+    allocated_bytes: int = pa.total_allocated_bytes()
+    execution_engine = PandasExecutionEngine(memory_map=True, dtype_backend="pyarrow")
+    batch_data = execution_engine.get_batch_data(PathBatchSpec(path=path))
+
+    # Columns are backed by memory-mapped file, rather than by memory allocated by Arrow.
+    assert pa.total_allocated_bytes() - allocated_bytes < 1024
+    assert batch_data.dataframe["a"].max() == 99999
+    assert batch_data.dataframe["b"].tolist()[:3] == ["x", "y", "x"]
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_memory_mapped_batch_is_fingerprinted_by_file_identity(tmp_path):
+    path = str(tmp_path / "mapped.parquet")
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_parquet(path)
+
+    def _get_fingerprint(dtype_backend=None, **batch_spec_kwargs) -> str:
+        execution_engine = PandasExecutionEngine(
+            memory_map=True, dtype_backend=dtype_backend
+        )
+        with mock.patch(
+            "great_expectations.execution_engine.pandas_execution_engine.PandasDataFingerprint"
+        ) as mock_pandas_data_fingerprint:
+            batch_markers = execution_engine.get_batch_data_and_markers(
+                PathBatchSpec(path=path, **batch_spec_kwargs)
+            )[1]
+
+        assert not mock_pandas_data_fingerprint.called
+        return batch_markers.get("pandas_data_fingerprint")
+
+    fingerprint: str = _get_fingerprint()
+    assert fingerprint is not None
+    assert _get_fingerprint() == fingerprint
+
+    # Sampled batch data is not fingerprinted.
+    assert (
+        _get_fingerprint(
+            sampling_method="_sample_using_random", sampling_kwargs={"p": 0.5}
+        )
+        is None
+    )
+
+    # Reads of same file with different reader options (or column types) yield different batch data.
+    assert (
+        _get_fingerprint(reader_options={"columns": ["a"]})
+        != _get_fingerprint(reader_options={"columns": ["b"]})
+        != fingerprint
+    )
+    assert _get_fingerprint(reader_method="read_parquet") != fingerprint
+    assert _get_fingerprint(dtype_backend="pyarrow") != fingerprint
+
+    os.utime(path, ns=(0, 0))
+    assert _get_fingerprint() != fingerprint
+
+
+def test_file_identity_fingerprint_depends_on_reader_method_and_options(tmp_path):
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_csv(path, index=False)
+
+    fingerprint: str = hash_file_identity(
+        path=path, batch_spec=PathBatchSpec(path=path)
+    )
+    assert fingerprint == hash_file_identity(
+        path=path, batch_spec=PathBatchSpec(path=path)
+    )
+
+    fingerprints = {
+        hash_file_identity(
+            path=path,
+            batch_spec=PathBatchSpec(path=path, reader_options={"usecols": ["a"]}),
+        ),
+        hash_file_identity(
+            path=path,
+            batch_spec=PathBatchSpec(path=path, reader_options={"usecols": ["b"]}),
+        ),
+        hash_file_identity(
+            path=path,
+            batch_spec=PathBatchSpec(path=path, reader_method="read_table"),
+        ),
+        hash_file_identity(
+            path=path, batch_spec=PathBatchSpec(path=path), dtype_backend="pyarrow"
+        ),
+        fingerprint,
+    }
+    assert len(fingerprints) == 5
+
+
+def test_guess_reader_method_from_path_of_arrow_ipc_file():
+    assert PandasExecutionEngine.guess_reader_method_from_path("data.arrow") == {
+        "reader_method": "read_feather"
+    }
+
+
+def _spy_on_s3_ranges(execution_engine: PandasExecutionEngine) -> list:
+    """Records byte ranges of objects, fetched by S3 client of execution engine."""
+    execution_engine._instantiate_s3_client()
+    s3_client = execution_engine._s3
+    get_object = s3_client.get_object
+    ranges: list = []
+
+    def _get_object(**kwargs):
+        ranges.append(kwargs.get("Range"))
+        return get_object(**kwargs)
+
+    s3_client.get_object = _get_object
+    return ranges
+
+
+def test_get_batch_s3_object_is_downloaded_as_parallel_parts(s3, s3_bucket):
+    df = pd.DataFrame({"a": range(1000), "b": ["x"] * 1000})
+    body: bytes = df.to_csv(index=False).encode()
+    s3.put_object(Bucket=s3_bucket, Key="path/large.csv", Body=body)
+
+    execution_engine = PandasExecutionEngine(
+        download_part_size=1000, max_download_workers=4
+    )
+    ranges: list = _spy_on_s3_ranges(execution_engine=execution_engine)
+    batch_data = execution_engine.get_batch_data(
+        S3BatchSpec(path=f"s3a://{s3_bucket}/path/large.csv", reader_method="read_csv")
+    )
+
+    pd.testing.assert_frame_equal(batch_data.dataframe, df)
+    assert ranges[0] is None
+    assert ranges[1:] == [
+        f"bytes={start}-{min(start + 1000, len(body)) - 1}"
+        for start in range(0, len(body), 1000)
+    ]
+
+
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_get_batch_s3_parquet_reads_only_footer_and_needed_columns(s3, s3_bucket):
+    # Object is kept smaller than 1 MiB (moto serves ranges beyond that incorrectly); column "b" makes most of it.
+    df = pd.DataFrame(
+        {
+            "a": range(20000),
+            "b": [hashlib.md5(str(idx).encode()).hexdigest() for idx in range(20000)],
+        }
+    )
+    buf = BytesIO()
+    df.to_parquet(buf)
+    size: int = len(buf.getvalue())
+    s3.put_object(Bucket=s3_bucket, Key="path/large.parquet", Body=buf.getvalue())
+
+    execution_engine = PandasExecutionEngine()
+    ranges: list = _spy_on_s3_ranges(execution_engine=execution_engine)
+    batch_data = execution_engine.get_batch_data(
+        S3BatchSpec(
+            path=f"s3a://{s3_bucket}/path/large.parquet",
+            reader_method="read_parquet",
+            reader_options={"columns": ["a"]},
+        )
+    )
+
+    pd.testing.assert_series_equal(batch_data.dataframe["a"], df["a"])
+    assert list(batch_data.dataframe.columns) == ["a"]
+
+    fetched_bytes: int = 0
+    for byte_range in ranges[1:]:
+        start, end = byte_range[len("bytes=") :].split("-")
+        fetched_bytes += int(end) - int(start) + 1
+
+    assert fetched_bytes < size / 2
+
+
+def test_download_options_must_be_positive():
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(max_download_workers=0)
+
+    assert (
+        PandasExecutionEngine(download_part_size=None).config["download_part_size"]
+        is None
+    )
+    assert "max_download_workers" not in PandasExecutionEngine().config
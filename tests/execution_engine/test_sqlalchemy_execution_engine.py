@@ -1,16 +1,20 @@
 import logging
 import os
-from typing import Dict, Tuple, cast
+from typing import Dict, List, Tuple, cast
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core import IDDict
+from great_expectations.core.batch import Batch, BatchDefinition
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
@@ -279,6 +283,317 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+def test_sa_batch_aggregate_metrics_on_different_compute_domains_with_concurrency(
+    sa, tmp_path
+):
+    db_file_path: str = str(tmp_path / "concurrency.db")
+    sqlalchemy_engine = sa.create_engine(f"sqlite:///{db_file_path}")
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 5, 5]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(enabled=True),
+    )
+    # SQLite execution engine is pinned to single "Connection" by default; restore connection pool to exercise threads.
+    engine.engine = sqlalchemy_engine
+    engine.load_batch_data(
+        batch_id="1234",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    row_conditions: List[str] = [
+        'col("b")==4',
+        'col("b")==5',
+    ]
+    aggregate_fn_metrics: List[MetricConfiguration] = []
+    desired_metrics: List[MetricConfiguration] = []
+    row_condition: str
+    for row_condition in row_conditions:
+        metric_domain_kwargs: dict = {
+            "column": "a",
+            "row_condition": row_condition,
+            "condition_parser": "great_expectations__experimental__",
+        }
+        aggregate_fn_metric = MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        aggregate_fn_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        aggregate_fn_metrics.append(aggregate_fn_metric)
+
+        desired_metric = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=None,
+        )
+        desired_metric.metric_dependencies = {
+            "metric_partial_fn": aggregate_fn_metric,
+            "table.columns": table_columns_metric,
+        }
+        desired_metrics.append(desired_metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics,
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics,
+        metrics=metrics,
+    )
+    assert list(results.keys()) == [
+        desired_metric.id for desired_metric in desired_metrics
+    ]
+    assert results[desired_metrics[0].id] == 2
+    assert results[desired_metrics[1].id] == 3
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("fuse_batch_metric_bundles", [True, False])
+def test_sa_batch_aggregate_metrics_of_splitter_batches_in_single_query(
+    sa, fuse_batch_metric_bundles
+):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, 7], "b": [4, 4, 4, 5, 5, 5, 6]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        fuse_batch_metric_bundles=fuse_batch_metric_bundles,
+    )
+
+    batches: List[Batch] = []
+    splitter_value: int
+    for splitter_value in (4, 5, 6):
+        batch_spec = SqlAlchemyDatasourceBatchSpec(
+            table_name="test",
+            splitter_method="split_on_column_value",
+            splitter_kwargs={"column_name": "b"},
+            batch_identifiers={"b": splitter_value},
+            create_temp_table=False,
+        )
+        batch_data, batch_markers = engine.get_batch_data_and_markers(
+            batch_spec=batch_spec
+        )
+        batches.append(
+            Batch(
+                data=batch_data,
+                batch_definition=BatchDefinition(
+                    datasource_name="my_datasource",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="test",
+                    batch_identifiers=IDDict({"b": splitter_value}),
+                ),
+                batch_spec=batch_spec,
+                batch_markers=batch_markers,
+            )
+        )
+
+    engine.batch_manager.load_batch_list(batch_list=batches)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    # All Batch objects share columns of "test" table.
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    aggregate_fn_metrics: List[MetricConfiguration] = []
+    desired_metrics: List[MetricConfiguration] = []
+    batch: Batch
+    for batch in batches:
+        metric_name: str
+        for metric_name in ("column.max", "column.min"):
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.aggregate_fn",
+                metric_domain_kwargs={"column": "a", "batch_id": batch.id},
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics.append(aggregate_fn_metric)
+
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": "a", "batch_id": batch.id},
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": aggregate_fn_metric,
+                "table.columns": table_columns_metric,
+            }
+            desired_metrics.append(desired_metric)
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics,
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "_execute_metric_bundle_query",
+        autospec=True,
+        side_effect=SqlAlchemyExecutionEngine._execute_metric_bundle_query,
+    ) as mock_execute_metric_bundle_query:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics,
+            metrics=metrics,
+        )
+
+    # All three Batch objects are covered by one scan when fusion is enabled.
+    expected_query_count: int = 1 if fuse_batch_metric_bundles else 3
+    assert mock_execute_metric_bundle_query.call_count == expected_query_count
+    assert [results[desired_metric.id] for desired_metric in desired_metrics] == [
+        2,
+        1,
+        3,
+        2,
+        7,
+        7,
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("fuse_batch_metric_bundles", [True, False])
+def test_sa_batch_dependent_metrics_of_splitter_batches_are_not_fused(
+    sa, fuse_batch_metric_bundles
+):
+    # Expression of standard deviation (in SQLite) embeds mean of Batch, which differs between Batch objects.
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 100, 200, 300], "b": [4, 4, 4, 5, 5, 5]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        fuse_batch_metric_bundles=fuse_batch_metric_bundles,
+    )
+
+    batches: List[Batch] = []
+    splitter_value: int
+    for splitter_value in (4, 5):
+        batch_spec = SqlAlchemyDatasourceBatchSpec(
+            table_name="test",
+            splitter_method="split_on_column_value",
+            splitter_kwargs={"column_name": "b"},
+            batch_identifiers={"b": splitter_value},
+            create_temp_table=False,
+        )
+        batch_data, batch_markers = engine.get_batch_data_and_markers(
+            batch_spec=batch_spec
+        )
+        batches.append(
+            Batch(
+                data=batch_data,
+                batch_definition=BatchDefinition(
+                    datasource_name="my_datasource",
+                    data_connector_name="my_data_connector",
+                    data_asset_name="test",
+                    batch_identifiers=IDDict({"b": splitter_value}),
+                ),
+                batch_spec=batch_spec,
+                batch_markers=batch_markers,
+            )
+        )
+
+    validator = Validator(execution_engine=engine, batches=batches)
+
+    metric_configurations: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="column.standard_deviation",
+            metric_domain_kwargs={"column": "a", "batch_id": batch.id},
+            metric_value_kwargs=None,
+        )
+        for batch in batches
+    ]
+    results: Dict[Tuple[str, str, str], MetricValue] = validator.compute_metrics(
+        metric_configurations=metric_configurations,
+        runtime_configuration=None,
+    )
+
+    assert [
+        results[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ] == pytest.approx([1.0, 100.0])
+
+
+@pytest.mark.integration
+def test_sa_batch_window_condition_unexpected_counts_in_single_query(sa):
+    engine: SqlAlchemyExecutionEngine = build_sa_engine(
+        pd.DataFrame(
+            {
+                "a": [1, 2, 3, 4, 5, 6],
+                "b": [1, 1, 2, 2, 3, None],
+                "c": [1, 1, 1, 2, 3, 4],
+            }
+        ),
+        sa,
+    )
+    validator = Validator(execution_engine=engine)
+
+    metric_configurations: List[MetricConfiguration] = [
+        MetricConfiguration(
+            metric_name="column_values.unique.unexpected_count",
+            metric_domain_kwargs={"column": column},
+            metric_value_kwargs=None,
+        )
+        for column in ("a", "b", "c")
+    ] + [
+        MetricConfiguration(
+            metric_name="column_values.unique.unexpected_count",
+            metric_domain_kwargs={
+                "column": "c",
+                "row_condition": 'col("a")>3',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            metric_value_kwargs=None,
+        )
+    ]
+
+    with mock.patch.object(
+        SqlAlchemyExecutionEngine,
+        "_execute_metric_bundle_query",
+        autospec=True,
+        side_effect=SqlAlchemyExecutionEngine._execute_metric_bundle_query,
+    ) as mock_execute_metric_bundle_query:
+        results: Dict[Tuple[str, str, str], MetricValue] = validator.compute_metrics(
+            metric_configurations=metric_configurations
+        )
+
+    # Unexpected counts of all columns over same domain records are computed in one query (another for row condition).
+    assert (
+        len(
+            [
+                call
+                for call in mock_execute_metric_bundle_query.call_args_list
+                if "conditions" in str(call.kwargs["sa_query_object"])
+            ]
+        )
+        == 2
+    )
+    assert [
+        results[metric_configuration.id]
+        for metric_configuration in metric_configurations
+    ] == [0, 4, 3, 0]
+
+
 def test_get_domain_records_with_column_domain(sa):
     df = pd.DataFrame(
         {"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]}
@@ -955,13 +1270,28 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
 
     validate_tmp_tables()
 
+    aggregate_partial = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    aggregate_partial.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(aggregate_partial,), metrics=metrics
+    )
+    metrics.update(results)
+
+    validate_tmp_tables()
+
     desired_metric = MetricConfiguration(
         metric_name="column_values.unique.unexpected_count",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_partial,
     }
     # noinspection PyUnusedLocal
     results = engine.resolve_metrics(
@@ -0,0 +1,314 @@
+from typing import List
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.expectation_validation_result import (
+    ExpectationValidationResult,
+)
+from great_expectations.exceptions import QueryCostBudgetExceededError
+from great_expectations.execution_engine.bundled_metric_configuration import (
+    BundledMetricConfiguration,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_query_plan import (
+    QueryCostGuard,
+    QueryPlanEstimate,
+    explain_query,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+def _get_validator(sa, query_cost_guard: dict) -> Validator:
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": range(100)}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    sqlalchemy_engine.execute("CREATE INDEX test_a ON test (a)")
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, query_cost_guard=query_cost_guard
+    )
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(
+            table_name="test", create_temp_table=False
+        )
+    )
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    return Validator(execution_engine=engine)
+
+
+def _estimate_rows_of_test_queries(query) -> QueryPlanEstimate:
+    # SQLite reports no row estimates; queries over sampled domain records (having "LIMIT") are estimated to read 10
+    # rows, and all other queries to read all 100 rows of test table.
+    query_string: str = str(query)
+    return QueryPlanEstimate(
+        query=query_string, estimated_rows=10 if "LIMIT" in query_string else 100
+    )
+
+
+def _get_row_count(validator: Validator) -> int:
+    return validator.get_metric(
+        MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": "my_id"},
+            metric_value_kwargs=None,
+        )
+    )
+
+
+def test_query_cost_guard_violations():
+    query_cost_guard = QueryCostGuard(
+        max_estimated_rows=1000, max_estimated_cost=50.0, allow_full_table_scans=False
+    )
+    assert (
+        query_cost_guard.get_violations(
+            estimate=QueryPlanEstimate(
+                query="SELECT 1", estimated_rows=1000, estimated_cost=50.0
+            )
+        )
+        == []
+    )
+    assert (
+        len(
+            query_cost_guard.get_violations(
+                estimate=QueryPlanEstimate(
+                    query="SELECT 1",
+                    estimated_rows=1001,
+                    estimated_cost=50.1,
+                    full_table_scan=True,
+                )
+            )
+        )
+        == 3
+    )
+    # Estimates, which dialect does not report, are within budget.
+    assert (
+        query_cost_guard.get_violations(estimate=QueryPlanEstimate(query="SELECT 1"))
+        == []
+    )
+
+    with pytest.raises(ValueError):
+        QueryCostGuard(on_exceed="ignore")
+
+
+@pytest.mark.integration
+def test_explain_query_detects_full_table_scans_in_sqlite(sa):
+    validator: Validator = _get_validator(sa=sa, query_cost_guard={})
+    engine: SqlAlchemyExecutionEngine = validator.execution_engine
+    assert engine.explain_query(
+        query=sa.select([sa.func.count()]).select_from(sa.table("test"))
+    ).full_table_scan
+    assert not engine.explain_query(
+        query=sa.select([sa.column("a")])
+        .select_from(sa.table("test"))
+        .where(sa.column("a") == 5)
+    ).full_table_scan
+
+
+@pytest.mark.integration
+def test_query_cost_guard_raises_before_query_is_issued(sa):
+    validator: Validator = _get_validator(
+        sa=sa, query_cost_guard={"allow_full_table_scans": False}
+    )
+    engine: SqlAlchemyExecutionEngine = validator.execution_engine
+    with pytest.raises(QueryCostBudgetExceededError, match="full table scan"):
+        engine.resolve_metric_bundle(
+            metric_fn_bundle=[
+                BundledMetricConfiguration(
+                    metric_configuration=MetricConfiguration(
+                        metric_name="table.row_count",
+                        metric_domain_kwargs={"batch_id": "my_id"},
+                        metric_value_kwargs=None,
+                    ),
+                    metric_fn=sa.func.count(),
+                    compute_domain_kwargs={"batch_id": "my_id"},
+                    accessor_domain_kwargs={},
+                    metric_provider_kwargs={},
+                )
+            ]
+        )
+
+    assert len(engine.query_plan_estimates) == 1
+    assert engine.query_plan_estimates[0].full_table_scan
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "on_exceed,expected_row_count", [("warn", 100), ("sample", 10)]
+)
+def test_query_cost_guard_warns_or_samples(
+    sa, caplog, monkeypatch, on_exceed, expected_row_count
+):
+    validator: Validator = _get_validator(
+        sa=sa,
+        query_cost_guard={
+            "max_estimated_rows": 50,
+            "on_exceed": on_exceed,
+            "sample_size": 10,
+        },
+    )
+    monkeypatch.setattr(
+        validator.execution_engine, "explain_query", _estimate_rows_of_test_queries
+    )
+    assert _get_row_count(validator=validator) == expected_row_count
+    assert "exceeds budget of query cost guard" in caplog.text
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("on_exceed", ["warn", "sample"])
+def test_query_cost_guard_marks_sampled_metrics(sa, monkeypatch, on_exceed):
+    validator: Validator = _get_validator(
+        sa=sa,
+        query_cost_guard={
+            "max_estimated_rows": 50,
+            "on_exceed": on_exceed,
+            "sample_size": 10,
+        },
+    )
+    engine: SqlAlchemyExecutionEngine = validator.execution_engine
+    monkeypatch.setattr(engine, "explain_query", _estimate_rows_of_test_queries)
+
+    results: List[ExpectationValidationResult] = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_be_between",
+                kwargs={"min_value": 0, "max_value": 200},
+            )
+        ]
+    )
+
+    if on_exceed == "sample":
+        assert results[0].result["observed_value"] == 10
+        assert results[0].meta["sampled_metrics"] == ["table.row_count"]
+        # Sampled values are not cached (they are computed again by next validation).
+        assert engine.sampled_metric_ids
+        assert not any(
+            metric_id in engine.metric_cache for metric_id in engine.sampled_metric_ids
+        )
+    else:
+        assert results[0].result["observed_value"] == 100
+        assert "sampled_metrics" not in results[0].meta
+        assert not engine.sampled_metric_ids
+
+
+@pytest.mark.integration
+def test_query_cost_guard_samples_domain_records_by_limit(sa):
+    validator: Validator = _get_validator(
+        sa=sa, query_cost_guard={"on_exceed": "sample", "sample_size": 10}
+    )
+    engine: SqlAlchemyExecutionEngine = validator.execution_engine
+
+    sampled_query = engine._build_metric_bundle_query(
+        query={
+            "select": [sa.func.count()],
+            "metric_ids": [("table.row_count", "", "")],
+            "domain_kwargs": {"batch_id": "my_id"},
+        },
+        sample_size=10,
+    )
+
+    # Domain records are sampled by plain "LIMIT" (ordering them would require reading and sorting all of them).
+    sampled_query_string: str = str(sampled_query)
+    assert "LIMIT" in sampled_query_string
+    assert "ORDER BY" not in sampled_query_string
+    assert engine.engine.execute(sampled_query).scalar() == 10
+
+
+@pytest.mark.integration
+def test_query_cost_guard_raises_if_sampled_query_exceeds_budget(sa):
+    # Sampled query still scans test table (SQLite does not report that scan stops at "LIMIT").
+    validator: Validator = _get_validator(
+        sa=sa,
+        query_cost_guard={
+            "allow_full_table_scans": False,
+            "on_exceed": "sample",
+            "sample_size": 10,
+        },
+    )
+    engine: SqlAlchemyExecutionEngine = validator.execution_engine
+    with pytest.raises(
+        QueryCostBudgetExceededError, match="sampled domain records exceeds budget"
+    ):
+        engine.resolve_metric_bundle(
+            metric_fn_bundle=[
+                BundledMetricConfiguration(
+                    metric_configuration=MetricConfiguration(
+                        metric_name="table.row_count",
+                        metric_domain_kwargs={"batch_id": "my_id"},
+                        metric_value_kwargs=None,
+                    ),
+                    metric_fn=sa.func.count(),
+                    compute_domain_kwargs={"batch_id": "my_id"},
+                    accessor_domain_kwargs={},
+                    metric_provider_kwargs={},
+                )
+            ]
+        )
+
+    assert len(engine.query_plan_estimates) == 2
+    assert all(estimate.full_table_scan for estimate in engine.query_plan_estimates)
+
+
+def test_explain_query_caps_postgresql_scans_by_limit(sa):
+    class PostgreSQLConnectableStub:
+        dialect = sa.dialects.postgresql.dialect()
+
+        def __init__(self, plan: dict) -> None:
+            self._plan = plan
+
+        def execute(self, *args, **kwargs):
+            return mock.Mock(scalar=mock.Mock(return_value=[{"Plan": self._plan}]))
+
+    seq_scan: dict = {"Node Type": "Seq Scan", "Plan Rows": 1000000}
+    query = sa.select([sa.func.count()]).select_from(sa.table("test"))
+
+    def _explain(plan: dict) -> QueryPlanEstimate:
+        return explain_query(
+            connectable=PostgreSQLConnectableStub(plan=plan),
+            query=query,
+            dialect_name=GXSqlDialect.POSTGRESQL,
+        )
+
+    estimate: QueryPlanEstimate = _explain(
+        plan={
+            "Node Type": "Aggregate",
+            "Plan Rows": 1,
+            "Total Cost": 20000.0,
+            "Plans": [seq_scan],
+        }
+    )
+    assert estimate.estimated_rows == 1000000
+    assert estimate.estimated_cost == 20000.0
+    assert estimate.full_table_scan
+
+    # Scan under "LIMIT" stops early.
+    estimate = _explain(
+        plan={
+            "Node Type": "Aggregate",
+            "Plan Rows": 1,
+            "Total Cost": 0.2,
+            "Plans": [{"Node Type": "Limit", "Plan Rows": 10, "Plans": [seq_scan]}],
+        }
+    )
+    assert estimate.estimated_rows == 10
+    assert estimate.estimated_cost == 0.2
+    assert not estimate.full_table_scan
+
+    # Scan under blocking node (e.g., "Sort") is read in full, even if output of blocking node is limited.
+    estimate = _explain(
+        plan={
+            "Node Type": "Limit",
+            "Plan Rows": 10,
+            "Total Cost": 30000.0,
+            "Plans": [{"Node Type": "Sort", "Plan Rows": 1000000, "Plans": [seq_scan]}],
+        }
+    )
+    assert estimate.estimated_rows == 1000000
+    assert estimate.full_table_scan
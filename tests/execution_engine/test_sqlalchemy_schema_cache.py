@@ -0,0 +1,124 @@
+from typing import List
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import SqlAlchemyDatasourceBatchSpec
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_schema_cache import SchemaCache
+from great_expectations.expectations.metrics.table_metrics import table_column_types
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_schema_cache_entries_expire_after_ttl():
+    clock = _Clock()
+    schema_cache = SchemaCache(ttl_seconds=10, clock=clock)
+    reflect = mock.Mock(return_value=[{"name": "a"}])
+
+    assert schema_cache.get_or_reflect(key=(None, "t"), reflect=reflect) == [
+        {"name": "a"}
+    ]
+    clock.now = 9.0
+    assert schema_cache.get_or_reflect(key=(None, "t"), reflect=reflect) == [
+        {"name": "a"}
+    ]
+    assert reflect.call_count == 1
+
+    clock.now = 10.0
+    schema_cache.get_or_reflect(key=(None, "t"), reflect=reflect)
+    assert reflect.call_count == 2
+
+
+def test_schema_cache_returns_copies_of_column_metadata():
+    schema_cache = SchemaCache()
+    schema_cache.put(key=(None, "t"), columns=[{"name": "a"}])
+
+    columns: List[dict] = schema_cache.get(key=(None, "t"))
+    columns[0]["name"] = "b"
+    assert schema_cache.get(key=(None, "t")) == [{"name": "a"}]
+
+
+def test_schema_cache_invalidation():
+    schema_cache = SchemaCache()
+    for key in [("main", "t"), ("other", "t"), ("main", "u")]:
+        schema_cache.put(key=key, columns=[{"name": "a"}])
+
+    schema_cache.invalidate(table_name="t", schema_name="other")
+    assert schema_cache.get(key=("other", "t")) is None
+    assert len(schema_cache) == 2
+
+    schema_cache.invalidate(schema_name="main")
+    assert len(schema_cache) == 0
+
+    schema_cache.put(key=("main", "t"), columns=[{"name": "a"}])
+    schema_cache.invalidate()
+    assert len(schema_cache) == 0
+
+
+@pytest.mark.parametrize("ttl_seconds", [None, 0])
+def test_disabled_schema_cache_stores_nothing(ttl_seconds):
+    schema_cache = SchemaCache(ttl_seconds=ttl_seconds)
+    schema_cache.put(key=(None, "t"), columns=[{"name": "a"}])
+    assert schema_cache.get(key=(None, "t")) is None
+
+
+def test_schema_cache_raises_on_negative_ttl():
+    with pytest.raises(ValueError):
+        SchemaCache(ttl_seconds=-1)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "schema_cache_ttl,expected_reflection_count", [(300, 1), (None, 2)]
+)
+def test_table_column_types_of_batches_of_same_table_reflected_once(
+    sa, schema_cache_ttl, expected_reflection_count
+):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 4, 5]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, schema_cache_ttl=schema_cache_ttl
+    )
+
+    with mock.patch.object(
+        table_column_types,
+        "get_sqlalchemy_column_metadata",
+        wraps=table_column_types.get_sqlalchemy_column_metadata,
+    ) as mock_get_sqlalchemy_column_metadata:
+        splitter_value: int
+        for splitter_value in (4, 5):
+            batch_data, _ = engine.get_batch_data_and_markers(
+                batch_spec=SqlAlchemyDatasourceBatchSpec(
+                    table_name="test",
+                    splitter_method="split_on_column_value",
+                    splitter_kwargs={"column_name": "b"},
+                    batch_identifiers={"b": splitter_value},
+                    create_temp_table=False,
+                )
+            )
+            engine.load_batch_data(batch_id=str(splitter_value), batch_data=batch_data)
+            validator = Validator(execution_engine=engine)
+            assert validator.get_metric(
+                MetricConfiguration(
+                    metric_name="table.columns",
+                    metric_domain_kwargs={"batch_id": str(splitter_value)},
+                    metric_value_kwargs=None,
+                )
+            ) == ["a", "b"]
+
+    assert mock_get_sqlalchemy_column_metadata.call_count == expected_reflection_count
+    assert engine.config.get("schema_cache_ttl", 300) == schema_cache_ttl
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.arrow_compute import (
+    column_value_lengths,
+    column_values_match_regex,
+    is_arrow_string_column,
+)
+from great_expectations.util import is_library_loadable
+
+
+@pytest.mark.unit
+def test_string_functions_of_numpy_backed_column():
+    column = pd.Series(["abc", "de", 12], index=[3, 4, 5])
+
+    assert not is_arrow_string_column(column=column)
+    assert column_values_match_regex(column=column, regex="^[a-z]").tolist() == [
+        True,
+        True,
+        False,
+    ]
+    assert column_value_lengths(column=column).tolist() == [3, 2, 2]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"),
+    reason="pyarrow is not installed",
+)
+def test_string_functions_of_arrow_backed_column():
+    import pyarrow as pa
+
+    column = pd.Series(
+        ["abc", "dé", None, "aa"], index=[3, 4, 5, 6], dtype=pd.ArrowDtype(pa.string())
+    )
+
+    assert is_arrow_string_column(column=column)
+
+    matches: pd.Series = column_values_match_regex(column=column, regex="^a")
+    assert matches.dtype == bool
+    assert matches.index.tolist() == [3, 4, 5, 6]
+    assert matches.tolist() == [True, False, False, True]
+
+    # Backreferences are not supported by Arrow (RE2), so pandas evaluates such regular expressions.
+    assert column_values_match_regex(column=column, regex=r"(a)\1").tolist() == [
+        False,
+        False,
+        False,
+        True,
+    ]
+
+    lengths: pd.Series = column_value_lengths(column=column)
+    assert lengths.index.tolist() == [3, 4, 5, 6]
+    assert lengths.iloc[[0, 1, 3]].tolist() == [3, 2, 2]
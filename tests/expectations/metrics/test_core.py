@@ -10,6 +10,7 @@ import pytest
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import Batch
 from great_expectations.execution_engine import (
+    ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
@@ -53,12 +54,27 @@ def test_basic_metric_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
 
@@ -80,12 +96,27 @@ def test_mean_metric_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name="column.mean.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -106,12 +137,27 @@ def test_stdev_metric_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name="column.standard_deviation.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.standard_deviation",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -538,6 +584,146 @@ def test_quantiles_metric_pd():
     assert results == {desired_metric.id: [1.75, 2.5, 3.25]}
 
 
+def test_quantiles_metric_pd_with_numeric_relative_error():
+    engine = build_pandas_engine(pd.DataFrame({"a": list(range(1, 10001))}))
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [2.5e-1, 5.0e-1, 7.5e-1],
+            "allow_relative_error": 0.01,
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    for value, expected_value in zip(results[desired_metric.id], [2500, 5000, 7500]):
+        assert abs(value - expected_value) <= 0.01 * 10000
+
+
+def test_approx_quantiles_metric_pd():
+    _assert_approx_quantiles_metric(
+        engine=build_pandas_engine(
+            pd.DataFrame({"a": [float(value) for value in range(1, 10001)] + [None]})
+        )
+    )
+
+
+def test_approx_quantiles_metric_sa(sa):
+    # SQLite lacks approximate percentile function; exact quantiles are computed by database instead.
+    result: dict = _assert_approx_quantiles_metric(
+        engine=build_sa_engine(
+            pd.DataFrame({"a": [float(value) for value in range(1, 10001)] + [None]}),
+            sa,
+        )
+    )
+    assert result == {"values": [1.0, 5000.0, 10000.0], "rank_error": 0.0}
+
+
+def _assert_approx_quantiles_metric(engine: ExecutionEngine) -> dict:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approx_quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 5.0e-1, 1.0],
+            "allow_relative_error": 0.02,
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    result: dict = results[desired_metric.id]
+    assert result["rank_error"] <= 0.02
+    assert result["values"][0] == 1.0
+    assert abs(result["values"][1] - 5000.0) <= result["rank_error"] * 10000
+    assert result["values"][2] == 10000.0
+    return result
+
+
+def test_approx_distinct_values_count_metric_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": [value % 5000 for value in range(20000)] + [None]})
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.approx_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"relative_standard_error": 0.01},
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    result: dict = results[desired_metric.id]
+    assert result["relative_standard_error"] <= 0.01
+    # Estimate is well within three standard errors of true count.
+    assert abs(result["value"] - 5000) <= 3 * result["relative_standard_error"] * 5000
+
+
+def test_approx_heavy_hitters_metric_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": ["x"] * 500 + ["y"] * 300 + [str(i) for i in range(200)]})
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approx_heavy_hitters",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"min_frequency": 0.1},
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    result: dict = results[desired_metric.id]
+    assert [item["value"] for item in result["values"]] == ["x", "y"]
+    assert result["values"][0]["count"] - 500 <= result["count_error"]
+    assert result["values"][1]["count"] - 300 <= result["count_error"]
+    assert result["confidence"] == 0.99
+
+
 def test_quantiles_metric_sa(sa):
     engine = build_sa_engine(pd.DataFrame({"a": [1, 2, 3, 4]}), sa)
 
@@ -847,6 +1033,35 @@ def test_column_partition_metric_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    column_min_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.min.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": False,
+        },
+    )
+    column_min_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_max_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": False,
+        },
+    )
+    column_max_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_min_aggregate_fn_metric,
+            column_max_aggregate_fn_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     column_min_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.min",
         metric_domain_kwargs={"column": "a"},
@@ -855,6 +1070,7 @@ def test_column_partition_metric_pd():
         },
     )
     column_min_metric.metric_dependencies = {
+        "metric_partial_fn": column_min_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
@@ -865,6 +1081,7 @@ def test_column_partition_metric_pd():
         },
     )
     column_max_metric.metric_dependencies = {
+        "metric_partial_fn": column_max_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -907,6 +1124,35 @@ def test_column_partition_metric_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    column_min_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.min.aggregate_fn",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": True,
+        },
+    )
+    column_min_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_max_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": True,
+        },
+    )
+    column_max_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_min_aggregate_fn_metric,
+            column_max_aggregate_fn_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     column_min_metric: MetricConfiguration = MetricConfiguration(
         metric_name="column.min",
         metric_domain_kwargs={"column": "b"},
@@ -915,6 +1161,7 @@ def test_column_partition_metric_pd():
         },
     )
     column_min_metric.metric_dependencies = {
+        "metric_partial_fn": column_min_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     column_max_metric: MetricConfiguration = MetricConfiguration(
@@ -925,6 +1172,7 @@ def test_column_partition_metric_pd():
         },
     )
     column_max_metric.metric_dependencies = {
+        "metric_partial_fn": column_max_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -1457,12 +1705,27 @@ def test_max_metric_column_exists_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    partial_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(partial_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -1485,19 +1748,19 @@ def test_max_metric_column_does_not_exist_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
-    desired_metric = MetricConfiguration(
-        metric_name="column.max",
+    partial_metric = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
         metric_domain_kwargs={"column": "non_existent_column"},
         metric_value_kwargs=None,
     )
-    desired_metric.metric_dependencies = {
+    partial_metric.metric_dependencies = {
         "table.columns": table_columns_metric,
     }
 
     with pytest.raises(ge_exceptions.MetricResolutionError) as eee:
         # noinspection PyUnusedLocal
         results = engine.resolve_metrics(
-            metrics_to_resolve=(desired_metric,), metrics=metrics
+            metrics_to_resolve=(partial_metric,), metrics=metrics
         )
         metrics.update(results)
     assert (
@@ -1886,6 +2149,144 @@ def test_map_column_value_lengths_between_pd():
     assert ser_expected_lengths.equals(result_series)
 
 
+@pytest.mark.parametrize(
+    "values,condition_metric_name,metric_value_kwargs,expected_unexpected_values",
+    [
+        pytest.param(
+            [
+                "2021-01-01",
+                "20210101",
+                "2021-1-5",
+                "2021-02-30",
+                "0999-12-31",
+                "2021-01-01 10:00",
+            ],
+            "column_values.match_strftime_format",
+            {"strftime_format": "%Y-%m-%d"},
+            ["20210101", "2021-02-30", "2021-01-01 10:00"],
+            id="match_strftime_format",
+        ),
+        pytest.param(
+            ["2021-01-01", "Jan 5 2021", "not a date", "not a date", "2021-13-01"],
+            "column_values.dateutil_parseable",
+            {},
+            ["not a date", "not a date", "2021-13-01"],
+            id="dateutil_parseable",
+        ),
+        pytest.param(
+            ['{"a": 1}', "[1, 2]", "{a: 1}", "1,2", 3, '"text"'],
+            "column_values.json_parseable",
+            {},
+            ["{a: 1}", "1,2", 3],
+            id="json_parseable",
+        ),
+        pytest.param(
+            [b'{"a": 1}', bytearray(b"[1, 2]"), b"{a: 1}", "1,2"],
+            "column_values.json_parseable",
+            {},
+            [b"{a: 1}", "1,2"],
+            id="json_parseable_bytes",
+        ),
+        pytest.param(
+            ["a", 1, 2.5, True, "b"],
+            "column_values.of_type",
+            {"type_": "str"},
+            [1, 2.5, True],
+            id="of_type",
+        ),
+        pytest.param(
+            ["a", 1, 2.5, True, "b"],
+            "column_values.in_type_list",
+            {"type_list": ["int", "float"]},
+            ["a", "b"],
+            id="in_type_list",
+        ),
+        pytest.param(
+            ["apple", "kiwi", "banana", "cherry"],
+            "column_values.between",
+            {"min_value": "b", "max_value": "c"},
+            ["apple", "kiwi", "cherry"],
+            id="between_strings",
+        ),
+        pytest.param(
+            [1, 2.5, 7, 10],
+            "column_values.between",
+            {"min_value": 2, "max_value": 7, "strict_max": True},
+            [1, 7, 10],
+            id="between_numbers_of_object_column",
+        ),
+        pytest.param(
+            ["a", 1, 5],
+            "column_values.between",
+            {"min_value": 2, "max_value": 7, "allow_cross_type_comparisons": True},
+            ["a", 1],
+            id="between_mixed_types",
+        ),
+    ],
+)
+def test_map_column_condition_metrics_of_object_columns_pd(
+    values, condition_metric_name, metric_value_kwargs, expected_unexpected_values
+):
+    engine = build_pandas_engine(pd.DataFrame({"a": pd.Series(values, dtype=object)}))
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    condition_metric = MetricConfiguration(
+        metric_name=f"{condition_metric_name}.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+    )
+    condition_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,), metrics=metrics
+    )
+
+    unexpected_condition: pd.Series = results[condition_metric.id][0]
+    assert unexpected_condition.dtype == bool
+    assert engine.dataframe["a"][unexpected_condition].tolist() == (
+        expected_unexpected_values
+    )
+
+
+def test_map_column_condition_metrics_reject_non_string_values_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": ["2021-01-01", 5]}))
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    for condition_metric_name, metric_value_kwargs in (
+        ("column_values.match_strftime_format", {"strftime_format": "%Y-%m-%d"}),
+        ("column_values.dateutil_parseable", {}),
+    ):
+        condition_metric = MetricConfiguration(
+            metric_name=f"{condition_metric_name}.condition",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs=metric_value_kwargs,
+        )
+        condition_metric.metric_dependencies = {
+            "table.columns": table_columns_metric,
+        }
+        with pytest.raises(ge_exceptions.MetricResolutionError) as e:
+            engine.resolve_metrics(
+                metrics_to_resolve=(condition_metric,), metrics=metrics
+            )
+
+        assert "must be of type string" in str(e.value)
+
+
 @pytest.mark.filterwarnings(
     "ignore:pandas.Int64Index is deprecated*:FutureWarning:tests.expectations.metrics"
 )
@@ -2384,13 +2785,27 @@ def test_map_unique_column_exists_sa(sa):
     )
     metrics.update(results)
 
+    aggregate_partial = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    aggregate_partial.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(aggregate_partial,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column_values.unique.unexpected_count",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_partial,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -2510,13 +2925,27 @@ def test_map_unique_empty_query_sa(sa):
     )
     metrics.update(results)
 
+    aggregate_partial = MetricConfiguration(
+        metric_name="column_values.unique.unexpected_count.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    aggregate_partial.metric_dependencies = {
+        "unexpected_condition": condition_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(aggregate_partial,), metrics=metrics
+    )
+    metrics.update(results)
+
     desired_metric = MetricConfiguration(
         metric_name="column_values.unique.unexpected_count",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     desired_metric.metric_dependencies = {
-        "unexpected_condition": condition_metric,
+        "metric_partial_fn": aggregate_partial,
         "table.columns": table_columns_metric,
     }
     results = engine.resolve_metrics(
@@ -2680,12 +3109,38 @@ def test_z_score_under_threshold_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    column_mean_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.mean.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_mean_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    column_standard_deviation_aggregate_fn_metric = MetricConfiguration(
+        metric_name="column.standard_deviation.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    column_standard_deviation_aggregate_fn_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            column_mean_aggregate_fn_metric,
+            column_standard_deviation_aggregate_fn_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     mean = MetricConfiguration(
         metric_name="column.mean",
         metric_domain_kwargs={"column": "a"},
         metric_value_kwargs=None,
     )
     mean.metric_dependencies = {
+        "metric_partial_fn": column_mean_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     stdev = MetricConfiguration(
@@ -2694,6 +3149,7 @@ def test_z_score_under_threshold_pd():
         metric_value_kwargs=None,
     )
     stdev.metric_dependencies = {
+        "metric_partial_fn": column_standard_deviation_aggregate_fn_metric,
         "table.columns": table_columns_metric,
     }
     desired_metrics = (mean, stdev)
@@ -4614,6 +5070,57 @@ def test_batch_aggregate_metrics_pd():
     table_columns_metric, results = get_table_columns_metric(engine=engine)
     metrics.update(results)
 
+    desired_aggregate_fn_metric_1 = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": True,
+        },
+    )
+    desired_aggregate_fn_metric_1.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    desired_aggregate_fn_metric_2 = MetricConfiguration(
+        metric_name="column.min.aggregate_fn",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": True,
+        },
+    )
+    desired_aggregate_fn_metric_2.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    desired_aggregate_fn_metric_3 = MetricConfiguration(
+        metric_name="column.max.aggregate_fn",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": True,
+        },
+    )
+    desired_aggregate_fn_metric_3.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    desired_aggregate_fn_metric_4 = MetricConfiguration(
+        metric_name="column.min.aggregate_fn",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={
+            "parse_strings_as_datetimes": True,
+        },
+    )
+    desired_aggregate_fn_metric_4.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            desired_aggregate_fn_metric_1,
+            desired_aggregate_fn_metric_2,
+            desired_aggregate_fn_metric_3,
+            desired_aggregate_fn_metric_4,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
     desired_metric_1 = MetricConfiguration(
         metric_name="column.max",
         metric_domain_kwargs={"column": "a"},
@@ -4622,6 +5129,7 @@ def test_batch_aggregate_metrics_pd():
         },
     )
     desired_metric_1.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_1,
         "table.columns": table_columns_metric,
     }
     desired_metric_2 = MetricConfiguration(
@@ -4632,6 +5140,7 @@ def test_batch_aggregate_metrics_pd():
         },
     )
     desired_metric_2.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_2,
         "table.columns": table_columns_metric,
     }
     desired_metric_3 = MetricConfiguration(
@@ -4642,6 +5151,7 @@ def test_batch_aggregate_metrics_pd():
         },
     )
     desired_metric_3.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_3,
         "table.columns": table_columns_metric,
     }
     desired_metric_4 = MetricConfiguration(
@@ -4652,6 +5162,7 @@ def test_batch_aggregate_metrics_pd():
         },
     )
     desired_metric_4.metric_dependencies = {
+        "metric_partial_fn": desired_aggregate_fn_metric_4,
         "table.columns": table_columns_metric,
     }
 
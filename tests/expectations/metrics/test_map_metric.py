@@ -1,3 +1,5 @@
+import json
+
 import pandas
 import pandas as pd
 import pytest
@@ -290,10 +292,14 @@ def test_get_table_metric_provider_metric_dependencies(empty_sqlite_db):
         metric, execution_engine=PandasExecutionEngine()
     )
 
+    assert dependencies["metric_partial_fn"].id[0] == "column.max.aggregate_fn"
+
+    metric_partial_fn_metric: MetricConfiguration = dependencies["metric_partial_fn"]
     table_column_types_metric: MetricConfiguration = dependencies["table.column_types"]
     table_columns_metric: MetricConfiguration = dependencies["table.columns"]
     table_row_count_metric: MetricConfiguration = dependencies["table.row_count"]
     assert dependencies == {
+        "metric_partial_fn": metric_partial_fn_metric,
         "table.column_types": table_column_types_metric,
         "table.columns": table_columns_metric,
         "table.row_count": table_row_count_metric,
@@ -1169,6 +1175,63 @@ def test_sqlite_single_column_complete_result_format(
     }
 
 
+def test_sqlite_single_column_complete_result_format_with_max_unexpected_rows(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "max_unexpected_rows": 2,
+            },
+        },
+    )
+    result: ExpectationValidationResult = (
+        _expecation_configuration_to_validation_result_sql(
+            expectation_configuration=expectation_configuration,
+            context=in_memory_runtime_context,
+        )
+    )
+    assert result.result["unexpected_count"] == 3
+    assert result.result["unexpected_list"] == ["giraffe", "lion"]
+
+
+def test_sqlite_single_column_complete_result_format_with_unexpected_spill_directory(
+    sa,
+    in_memory_runtime_context,
+    sqlite_table_for_unexpected_rows_with_index,
+    tmp_path,
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "partial_unexpected_count": 1,
+                "unexpected_spill_directory": str(tmp_path),
+            },
+        },
+    )
+    result: ExpectationValidationResult = (
+        _expecation_configuration_to_validation_result_sql(
+            expectation_configuration=expectation_configuration,
+            context=in_memory_runtime_context,
+        )
+    )
+    assert result.result["unexpected_count"] == 3
+    assert result.result["unexpected_list"] == ["giraffe"]
+
+    with open(result.result["unexpected_list_spill_path"]) as f:
+        assert [json.loads(line) for line in f] == ["giraffe", "lion", "zebra"]
+
+
 def test_sqlite_single_column_summary_result_format(
     sa, in_memory_runtime_context, sqlite_table_for_unexpected_rows_with_index
 ):
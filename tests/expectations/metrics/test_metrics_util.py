@@ -20,6 +20,8 @@ except ImportError:
 
 from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 from great_expectations.expectations.metrics.util import (
+    SpilledUnexpectedList,
+    fetch_unexpected_sqlalchemy_query_results,
     sql_statement_with_post_compile_to_string,
 )
 from tests.test_utils import (
@@ -127,3 +129,101 @@ def test_sql_statement_conversion_to_string_bigquery(test_backends):
         )
     else:
         pytest.skip(f"skipping sql statement conversion test for : bigquery")
+
+
+@pytest.fixture
+def sqlite_engine_with_values() -> SqlAlchemyExecutionEngine:
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", create_temp_table=False
+    )
+    execution_engine.engine.execute("CREATE TABLE my_table (value VARCHAR)")
+    execution_engine.engine.execute(
+        "INSERT INTO my_table (value) VALUES ('aaaa'), ('bbbb'), ('cccc'), ('dddd')"
+    )
+    return execution_engine
+
+
+def _get_values(
+    execution_engine: SqlAlchemyExecutionEngine, result_format: dict
+) -> list:
+    return fetch_unexpected_sqlalchemy_query_results(
+        execution_engine=execution_engine,
+        query=select([sa.column("value")]).select_from(sa.table("my_table")),
+        result_format={"partial_unexpected_count": 20, **result_format},
+        row_fn=lambda row: row.value,
+    )
+
+
+@pytest.mark.unit
+def test_fetch_unexpected_sqlalchemy_query_results_budgets(
+    sa, sqlite_engine_with_values
+):
+    assert _get_values(sqlite_engine_with_values, {}) == [
+        "aaaa",
+        "bbbb",
+        "cccc",
+        "dddd",
+    ]
+    assert _get_values(sqlite_engine_with_values, {"max_unexpected_rows": 3}) == [
+        "aaaa",
+        "bbbb",
+        "cccc",
+    ]
+    # Every value takes 6 bytes (as JSON string).
+    assert _get_values(sqlite_engine_with_values, {"max_unexpected_bytes": 13}) == [
+        "aaaa",
+        "bbbb",
+    ]
+
+    with pytest.raises(ValueError):
+        _get_values(sqlite_engine_with_values, {"max_unexpected_rows": -1})
+
+
+@pytest.mark.unit
+def test_fetch_unexpected_sqlalchemy_query_results_keeps_lower_limit_of_query(
+    sa, sqlite_engine_with_values, caplog
+):
+    def _get_limited_values(limit: int, max_unexpected_rows: int) -> list:
+        return fetch_unexpected_sqlalchemy_query_results(
+            execution_engine=sqlite_engine_with_values,
+            query=select([sa.column("value")])
+            .select_from(sa.table("my_table"))
+            .limit(limit),
+            result_format={
+                "result_format": "SUMMARY",
+                "partial_unexpected_count": limit,
+                "max_unexpected_rows": max_unexpected_rows,
+            },
+            row_fn=lambda row: row.value,
+        )
+
+    # "LIMIT" of query (e.g., "partial_unexpected_count") is not replaced by (higher) budget.
+    assert _get_limited_values(limit=2, max_unexpected_rows=30) == ["aaaa", "bbbb"]
+    assert _get_limited_values(limit=3, max_unexpected_rows=3) == [
+        "aaaa",
+        "bbbb",
+        "cccc",
+    ]
+    assert "budget" not in caplog.text
+
+    # Lower budget still truncates results (with warning).
+    assert _get_limited_values(limit=3, max_unexpected_rows=1) == ["aaaa"]
+    assert "budget" in caplog.text
+
+
+@pytest.mark.unit
+def test_fetch_unexpected_sqlalchemy_query_results_spill(
+    sa, sqlite_engine_with_values, tmp_path
+):
+    values: list = _get_values(
+        sqlite_engine_with_values,
+        {
+            "partial_unexpected_count": 1,
+            "max_unexpected_rows": 3,
+            "unexpected_spill_directory": str(tmp_path / "spill"),
+        },
+    )
+    assert isinstance(values, SpilledUnexpectedList)
+    assert values == ["aaaa"]
+    with open(values.spill_path) as f:
+        assert f.read().splitlines() == ['"aaaa"', '"bbbb"', '"cccc"']
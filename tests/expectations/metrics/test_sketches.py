@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.sketches import (
+    CountMinSketch,
+    HyperLogLogSketch,
+    KllQuantileSketch,
+    _count_leading_zeros,
+)
+
+
+@pytest.mark.unit
+def test_kll_quantile_sketch_estimates_are_within_rank_error():
+    values: np.ndarray = np.random.default_rng(seed=1).normal(size=200000)
+    sketch = KllQuantileSketch(k=KllQuantileSketch.k_for_rank_error(rank_error=0.01))
+    sketch.update(values=values)
+
+    quantiles = [0.01, 0.25, 0.5, 0.75, 0.99]
+    for quantile, estimate in zip(quantiles, sketch.quantiles(quantiles=quantiles)):
+        assert abs(np.mean(values <= estimate) - quantile) <= sketch.rank_error
+
+    assert sketch.rank_error <= 0.01
+    assert sketch.count == 200000
+    # Memory is bounded by accuracy parameter, rather than by number of values.
+    assert sketch.num_retained < 3 * sketch.k
+
+
+@pytest.mark.unit
+def test_kll_quantile_sketch_merge_summarizes_both_sketches():
+    values: np.ndarray = np.arange(100000, dtype=np.float64)
+    sketch = KllQuantileSketch(k=200)
+    other_sketch = KllQuantileSketch(k=200)
+    sketch.update(values=values[:50000])
+    other_sketch.update(values=values[50000:])
+
+    sketch.merge(other=other_sketch)
+
+    assert sketch.count == 100000
+    assert sketch.quantiles(quantiles=[0.0, 1.0]) == [0.0, 99999.0]
+    assert abs(sketch.quantiles(quantiles=[0.5])[0] - 50000) <= (
+        sketch.rank_error * 100000
+    )
+
+
+@pytest.mark.unit
+def test_kll_quantile_sketch_without_values():
+    sketch = KllQuantileSketch()
+    sketch.update(values=[np.nan, None])
+
+    assert sketch.quantiles(quantiles=[0.5]) == [None]
+
+    with pytest.raises(ValueError):
+        KllQuantileSketch.k_for_rank_error(rank_error=1.5)
+
+
+@pytest.mark.unit
+def test_count_leading_zeros():
+    values = np.array([0, 1, 2**32, 2**63, 2**64 - 1], dtype=np.uint64)
+    assert _count_leading_zeros(values=values).tolist() == [64, 63, 31, 0, 0]
+
+
+@pytest.mark.unit
+def test_hyper_log_log_sketch_estimates_distinct_count():
+    values: np.ndarray = np.random.default_rng(seed=1).integers(0, 50000, 200000)
+    sketch = HyperLogLogSketch(
+        precision=HyperLogLogSketch.precision_for_relative_error(
+            relative_standard_error=0.01
+        )
+    )
+    sketch.update(values=pd.Series(values[:100000]))
+
+    other_sketch = HyperLogLogSketch(precision=sketch.precision)
+    other_sketch.update(values=pd.Series(values[100000:]))
+    sketch.merge(other=other_sketch)
+
+    distinct_count: int = len(np.unique(values))
+    assert abs(sketch.count() - distinct_count) <= (
+        3 * sketch.relative_standard_error * distinct_count
+    )
+
+    small_sketch = HyperLogLogSketch()
+    small_sketch.update(values=pd.Series(["a", "b", "c", "a", None]))
+    assert small_sketch.count() == 3
+
+
+@pytest.mark.unit
+def test_count_min_sketch_tracks_heavy_hitters():
+    values = pd.Series(["x"] * 5000 + ["y"] * 3000 + [str(i) for i in range(2000)])
+    sketch = CountMinSketch(relative_error=1.0e-3, max_candidates=20)
+    for chunk in np.array_split(values.sample(frac=1.0, random_state=1), 10):
+        sketch.update(values=chunk)
+
+    heavy_hitters = sketch.heavy_hitters(min_frequency=0.1)
+    assert [item["value"] for item in heavy_hitters] == ["x", "y"]
+
+    x_count: int
+    y_count: int
+    x_count, y_count = sketch.estimate(values=["x", "y"])
+    # Count-Min sketch never underestimates frequencies.
+    assert 5000 <= x_count <= 5000 + sketch.count_error
+    assert 3000 <= y_count <= 3000 + sketch.count_error
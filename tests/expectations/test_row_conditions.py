@@ -1,5 +1,6 @@
 from great_expectations.expectations.row_conditions import (
     _parse_great_expectations_condition,
+    get_row_condition_column_names,
     parse_condition_to_spark,
     parse_condition_to_sqlalchemy,
 )
@@ -22,6 +23,25 @@ def test_condition_parser():
     assert res["fnumber"] == "5"
 
 
+def test_get_row_condition_column_names():
+    assert get_row_condition_column_names(
+        row_condition="a > 5 & `b c`.notnull() and d in @values",
+        condition_parser="pandas",
+    ) == {"a", "b c", "d"}
+    assert get_row_condition_column_names(
+        row_condition='col("foo") > 5',
+        condition_parser="great_expectations__experimental__",
+    ) == {"foo"}
+    assert (
+        get_row_condition_column_names(row_condition="a >", condition_parser="python")
+        is None
+    )
+    assert (
+        get_row_condition_column_names(row_condition="a > 5", condition_parser=None)
+        is None
+    )
+
+
 def test_parse_condition_to_spark(spark_session):
     res = parse_condition_to_spark('col("foo") > 5')
     # This is mostly a demonstrative test; it may be brittle. I do not know how to test
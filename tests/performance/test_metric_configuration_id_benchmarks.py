@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark "Validator.graph_validate()" for suite of 500 expectations, counting how many "IDDict" identifiers are
+requested versus how many are actually computed (the rest are served by memoized identifiers).
+"""
+
+import sys
+from typing import List
+from unittest import mock
+
+import _pytest.config
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.id_dict import IDDict
+from great_expectations.self_check.util import build_pandas_validator_with_data
+from great_expectations.validator.validator import Validator
+
+NUMBER_OF_COLUMNS: int = 100
+NUMBER_OF_ROWS: int = 1000
+
+
+def _build_expectation_configurations() -> List[ExpectationConfiguration]:
+    """Five column expectations for each of "NUMBER_OF_COLUMNS" columns (500 expectations in total)."""
+    expectation_configurations: List[ExpectationConfiguration] = []
+
+    column_idx: int
+    column: str
+    for column_idx in range(NUMBER_OF_COLUMNS):
+        column = f"column_{column_idx}"
+        expectation_configurations.extend(
+            [
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_not_be_null",
+                    kwargs={"column": column},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_values_to_be_between",
+                    kwargs={"column": column, "min_value": 0, "max_value": 1},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_min_to_be_between",
+                    kwargs={"column": column, "min_value": 0},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_max_to_be_between",
+                    kwargs={"column": column, "max_value": 1},
+                ),
+                ExpectationConfiguration(
+                    expectation_type="expect_column_mean_to_be_between",
+                    kwargs={"column": column, "min_value": 0, "max_value": 1},
+                ),
+            ]
+        )
+
+    return expectation_configurations
+
+
+def test_graph_validate_id_computation_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+):
+    """Benchmark "Validator.graph_validate()" and report number of "IDDict.to_id()" calls and identifier computations.
+
+    Without memoization, every "IDDict.to_id()" call re-serializes and re-hashes its contents; the ratio between two
+    reported counts (stored in benchmark "extra_info") is number of such serializations saved.
+    """
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    df = pd.DataFrame(
+        np.random.default_rng(seed=42).random(size=(NUMBER_OF_ROWS, NUMBER_OF_COLUMNS)),
+        columns=[f"column_{column_idx}" for column_idx in range(NUMBER_OF_COLUMNS)],
+    )
+    validator: Validator = build_pandas_validator_with_data(df=df)
+    expectation_configurations: List[
+        ExpectationConfiguration
+    ] = _build_expectation_configurations()
+
+    original_to_id = IDDict.to_id
+    original_compute_id = IDDict._compute_id
+    with mock.patch.object(
+        IDDict, "to_id", autospec=True, side_effect=original_to_id
+    ) as mock_to_id, mock.patch.object(
+        IDDict, "_compute_id", autospec=True, side_effect=original_compute_id
+    ) as mock_compute_id:
+        results = benchmark.pedantic(
+            validator.graph_validate,
+            kwargs={
+                "configurations": expectation_configurations,
+                "runtime_configuration": {"result_format": "BASIC"},
+            },
+            iterations=1,
+            rounds=1,
+        )
+
+    benchmark.extra_info["number_of_to_id_calls"] = mock_to_id.call_count
+    benchmark.extra_info["number_of_id_computations"] = mock_compute_id.call_count
+
+    assert len(results) == len(expectation_configurations)
+    assert all(result.success for result in results)
+    assert mock_compute_id.call_count < mock_to_id.call_count
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark throughput of Spark string map conditions, evaluated by row-at-a-time Python UDF (former implementation) versus
+vectorized pandas implementation in Arrow batches ("pandas_udf"), on local Spark session.
+"""
+
+import datetime
+import functools
+import json
+import sys
+from typing import Callable, Dict, List
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.expectations.metrics.column_map_metrics.column_values_json_parseable import (
+    _is_json_parseable,
+)
+from great_expectations.expectations.metrics.column_map_metrics.column_values_match_strftime_format import (
+    _match_strftime_format,
+)
+from great_expectations.expectations.metrics.import_manager import F, sparktypes
+from great_expectations.expectations.metrics.util import (
+    get_spark_column_condition_from_pandas,
+)
+
+NUMBER_OF_ROWS: int = 1000000
+
+STRFTIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+
+def _build_values(number_of_rows: int, as_json: bool) -> List[str]:
+    """Timestamps in "STRFTIME_FORMAT" (optionally, as JSON documents); every tenth value is malformed."""
+    start = datetime.datetime(2020, 1, 1)
+    values: List[str] = []
+
+    idx: int
+    value: str
+    for idx in range(number_of_rows):
+        if idx % 10 == 0:
+            values.append(f"malformed-{idx}")
+        else:
+            value = (start + datetime.timedelta(seconds=idx)).strftime(STRFTIME_FORMAT)
+            values.append(json.dumps({"timestamp": value}) if as_json else value)
+
+    return values
+
+
+def _is_parseable_by_format(val) -> bool:
+    try:
+        datetime.datetime.strptime(val, STRFTIME_FORMAT)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _is_json(val) -> bool:
+    try:
+        json.loads(val)
+        return True
+    except:
+        return False
+
+
+# Per metric: row-at-a-time function (evaluated by "F.udf()") and vectorized function (evaluated by "pandas_udf").
+CONDITIONS: Dict[str, Dict[str, Callable]] = {
+    "match_strftime_format": {
+        "udf": _is_parseable_by_format,
+        "vectorized": functools.partial(
+            _match_strftime_format, strftime_format=STRFTIME_FORMAT
+        ),
+    },
+    "json_parseable": {
+        "udf": _is_json,
+        "vectorized": _is_json_parseable,
+    },
+}
+
+
+@pytest.mark.parametrize("implementation", ["udf", "vectorized"])
+@pytest.mark.parametrize("condition", sorted(CONDITIONS.keys()))
+def test_spark_map_condition_throughput_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    spark_session,
+    condition: str,
+    implementation: str,
+):
+    """Benchmark counting unexpected values of Spark column (throughput is "number_of_rows" per benchmark time)."""
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    values: List[str] = _build_values(
+        number_of_rows=NUMBER_OF_ROWS, as_json=condition == "json_parseable"
+    )
+    df = spark_session.createDataFrame(
+        [(value,) for value in values], schema=["a"]
+    ).cache()
+    df.count()
+
+    condition_fn: Callable = CONDITIONS[condition][implementation]
+    if implementation == "udf":
+        column_condition = F.udf(condition_fn, sparktypes.BooleanType())(F.col("a"))
+    else:
+        column_condition = get_spark_column_condition_from_pandas(
+            column=F.col("a"), condition_fn=condition_fn
+        )
+
+    unexpected_count: int = benchmark.pedantic(
+        lambda: df.filter(~column_condition).count(),
+        iterations=1,
+        rounds=3,
+    )
+
+    benchmark.extra_info["number_of_rows"] = NUMBER_OF_ROWS
+
+    df.unpersist()
+
+    assert unexpected_count == NUMBER_OF_ROWS // 10
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark overhead of "ValidationGraph" scheduling (independent of any actual metric computation) versus edge count.
+"""
+
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple, cast
+
+import _pytest.config
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+# Number of dependency levels per column (e.g., "column_values.nonnull.unexpected_count" -> ... -> "table.columns").
+NUMBER_OF_LEVELS: int = 5
+
+
+class NoOpExecutionEngine:
+    """Resolves every requested metric instantly, so that only "ValidationGraph" bookkeeping is measured."""
+
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def resolve_metrics(
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        return {metric.id: 0 for metric in metrics_to_resolve}
+
+
+def _build_validation_graph(number_of_columns: int) -> ValidationGraph:
+    """Each column contributes chain of "NUMBER_OF_LEVELS" metrics, each level also depending on shared table metric."""
+    execution_engine = cast(ExecutionEngine, NoOpExecutionEngine())
+
+    table_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+    )
+    edges: List[MetricEdge] = [MetricEdge(left=table_metric)]
+
+    column_idx: int
+    level: int
+    previous_metric: MetricConfiguration
+    metric: MetricConfiguration
+    for column_idx in range(number_of_columns):
+        previous_metric = MetricConfiguration(
+            metric_name="column.level_0",
+            metric_domain_kwargs={"column": f"column_{column_idx}"},
+        )
+        edges.append(MetricEdge(left=previous_metric, right=table_metric))
+        for level in range(1, NUMBER_OF_LEVELS):
+            metric = MetricConfiguration(
+                metric_name=f"column.level_{level}",
+                metric_domain_kwargs={"column": f"column_{column_idx}"},
+            )
+            edges.append(MetricEdge(left=metric, right=previous_metric))
+            edges.append(MetricEdge(left=metric, right=table_metric))
+            previous_metric = metric
+
+    return ValidationGraph(execution_engine=execution_engine, edges=edges)
+
+
+@pytest.mark.parametrize("number_of_columns", [10, 100, 1000])
+def test_validation_graph_resolve_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    number_of_columns: int,
+):
+    """Benchmark "ValidationGraph.resolve()" on synthetic graphs of growing edge count.
+
+    Since execution engine used here returns immediately, measured time is entirely graph scheduling overhead, which
+    should grow linearly (not quadratically) with number of edges.
+    """
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+    graph: ValidationGraph = _build_validation_graph(
+        number_of_columns=number_of_columns
+    )
+    benchmark.extra_info["number_of_edges"] = len(graph.edges)
+
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
+    resolved_metrics, _ = benchmark.pedantic(
+        graph.resolve,
+        kwargs={"show_progress_bars": False},
+        iterations=1,
+        rounds=3,
+    )
+
+    assert len(resolved_metrics) == number_of_columns * NUMBER_OF_LEVELS + 1
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.
+    sys.exit(pytest.main(sys.argv))
@@ -14,6 +14,7 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 from great_expectations.validator.validation_graph import (
     MAX_METRIC_COMPUTATION_RETRIES,
     ExpectationValidationGraph,
+    MetricDependencyIndex,
     MetricEdge,
     ValidationGraph,
 )
@@ -254,31 +255,112 @@ def test_ExpectationValidationGraph_get_exception_info(
     assert right_exception in exception_info
 
 
+def _traverse_validation_graph(
+    graph: ValidationGraph,
+    metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> Tuple[Set[Tuple[str, str, str]], Set[Tuple[str, str, str]]]:
+    """Returns ids of ready and needed metrics by full traversal of "ValidationGraph" edges (reference behavior)."""
+    ready_metric_ids: Set[Tuple[str, str, str]] = set()
+    needed_metric_ids: Set[Tuple[str, str, str]] = set()
+
+    edge: MetricEdge
+    for edge in graph.edges:
+        if edge.left.id not in metrics:
+            if edge.right is None or edge.right.id in metrics:
+                ready_metric_ids.add(edge.left.id)
+            else:
+                needed_metric_ids.add(edge.left.id)
+
+    return ready_metric_ids - needed_metric_ids, needed_metric_ids
+
+
 @pytest.mark.unit
-def test_parse_validation_graph(
+def test_metric_dependency_index_initial_state(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
 ):
-    available_metrics: Dict[Tuple[str, str, str], MetricValue]
-
-    # Parse input "ValidationGraph" object and confirm the numbers of ready and still needed metrics.
-    available_metrics = {}
-    (
-        ready_metrics,
-        needed_metrics,
-    ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
-        metrics=available_metrics
+    graph: ValidationGraph = (
+        expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+
+    # Build "MetricDependencyIndex" and confirm the numbers of ready and still needed metrics.
+    dependency_index = graph._build_dependency_index(metrics={})
+    assert len(dependency_index.ready_metrics) == 2
+    assert dependency_index.num_needed_metrics == 11
 
     # Show that including "nonexistent" metric in dictionary of resolved metrics does not increase ready_metrics count.
-    available_metrics = {("nonexistent", "nonexistent", "nonexistent"): "NONE"}
-    (
-        ready_metrics,
-        needed_metrics,
-    ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
-        metrics=available_metrics
+    dependency_index = graph._build_dependency_index(
+        metrics={("nonexistent", "nonexistent", "nonexistent"): "NONE"}
+    )
+    assert len(dependency_index.ready_metrics) == 2
+    assert dependency_index.num_needed_metrics == 11
+
+
+@pytest.mark.unit
+def test_metric_dependency_index_releases_metrics_as_dependencies_resolve(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph: ValidationGraph = (
+        expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    )
+
+    # Initial state of "MetricDependencyIndex" must agree with full traversal of "ValidationGraph" edges.
+    ready_metric_ids: Set[Tuple[str, str, str]]
+    needed_metric_ids: Set[Tuple[str, str, str]]
+    ready_metric_ids, needed_metric_ids = _traverse_validation_graph(
+        graph=graph, metrics={}
+    )
+
+    dependency_index = MetricDependencyIndex(edges=graph.edges, metrics={})
+    assert {metric.id for metric in dependency_index.ready_metrics} == ready_metric_ids
+    assert dependency_index.num_needed_metrics == len(needed_metric_ids) == 11
+
+    # Resolving metrics round by round must release exactly the same metrics as re-traversing entire "ValidationGraph".
+    available_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    num_rounds: int = 0
+    while dependency_index.ready_metrics:
+        newly_resolved_metrics = {
+            metric.id: "my_value" for metric in dependency_index.ready_metrics
+        }
+        available_metrics.update(newly_resolved_metrics)
+        dependency_index.mark_resolved(metric_ids=newly_resolved_metrics.keys())
+        num_rounds += 1
+
+        ready_metric_ids, needed_metric_ids = _traverse_validation_graph(
+            graph=graph, metrics=available_metrics
+        )
+        assert {
+            metric.id for metric in dependency_index.ready_metrics
+        } == ready_metric_ids
+        assert dependency_index.num_needed_metrics == len(needed_metric_ids)
+
+    assert dependency_index.num_needed_metrics == 0
+    assert num_rounds > 1
+
+
+@pytest.mark.unit
+def test_metric_dependency_index_treats_supplied_metrics_as_resolved(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph: ValidationGraph = (
+        expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+    )
+
+    available_metrics: Dict[Tuple[str, str, str], MetricValue] = {
+        metric_id: "my_value"
+        for metric_id in _traverse_validation_graph(graph=graph, metrics={})[0]
+    }
+
+    ready_metric_ids: Set[Tuple[str, str, str]]
+    needed_metric_ids: Set[Tuple[str, str, str]]
+    ready_metric_ids, needed_metric_ids = _traverse_validation_graph(
+        graph=graph, metrics=available_metrics
+    )
+
+    dependency_index = MetricDependencyIndex(
+        edges=graph.edges, metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert {metric.id for metric in dependency_index.ready_metrics} == ready_metric_ids
+    assert dependency_index.num_needed_metrics == len(needed_metric_ids)
 
 
 @pytest.mark.unit
@@ -289,7 +371,7 @@ def test_populate_dependencies(
         len(
             expect_column_value_z_scores_to_be_less_than_expectation_validation_graph.edges
         )
-        == 33
+        == 41
     )
 
 
@@ -431,10 +513,10 @@ def test_progress_bar_config(
 
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with mock.patch(
-        "great_expectations.validator.validation_graph.ValidationGraph._parse",
-        return_value=(
-            {},
-            {},
+        "great_expectations.validator.validation_graph.ValidationGraph._build_dependency_index",
+        return_value=mock.MagicMock(
+            ready_metrics=[],
+            num_needed_metrics=0,
         ),
     ), mock.patch(
         "great_expectations.validator.validation_graph.ValidationGraph.edges",
@@ -11,6 +11,7 @@ import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.batch import (
+    Batch,
     BatchDefinition,
     BatchMarkers,
     BatchRequest,
@@ -719,6 +720,74 @@ def test_graph_validate(in_memory_runtime_context, basic_datasource):
     ]
 
 
+@pytest.mark.integration
+def test_graph_validate_batches(in_memory_runtime_context, basic_datasource):
+    in_memory_runtime_context.datasources["my_datasource"] = basic_datasource
+
+    batches: List[Batch] = [
+        basic_datasource.get_single_batch_from_batch_request(
+            RuntimeBatchRequest(
+                **{
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "test_runtime_data_connector",
+                    "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                    "runtime_parameters": {
+                        "batch_data": df,
+                    },
+                    "batch_identifiers": {
+                        "pipeline_stage_name": 0,
+                        "airflow_run_id": airflow_run_id,
+                        "custom_key_0": 0,
+                    },
+                }
+            )
+        )
+        for airflow_run_id, df in enumerate(
+            (
+                pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]}),
+                pd.DataFrame({"a": [1, 5, 2, 3, 5, 10]}),
+            )
+        )
+    ]
+
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_max_to_be_between",
+        kwargs={"column": "a", "min_value": 0, "max_value": 20},
+    )
+    validator = Validator(
+        execution_engine=basic_datasource.execution_engine,
+        data_context=in_memory_runtime_context,
+        batches=batches,
+    )
+
+    with mock.patch.object(
+        ValidationGraph,
+        "resolve",
+        autospec=True,
+        side_effect=ValidationGraph.resolve,
+    ) as mock_resolve:
+        results = validator.graph_validate_batches(
+            configurations=[expectation_configuration]
+        )
+
+    # All Batch objects are validated by resolving single suite-level graph.
+    assert mock_resolve.call_count == 1
+    assert list(results.keys()) == [batch.id for batch in batches]
+    assert [
+        (result.success, result.result["observed_value"])
+        for batch_results in results.values()
+        for result in batch_results
+    ] == [(False, 22), (True, 10)]
+    assert results[batches[1].id][0].expectation_config.kwargs["batch_id"] == (
+        batches[1].id
+    )
+
+    with pytest.raises(ValueError):
+        validator.graph_validate_batches(
+            configurations=[expectation_configuration], batch_ids=["unknown"]
+        )
+
+
 # Tests that runtime configuration actually works during graph validation
 @pytest.mark.integration
 def test_graph_validate_with_runtime_config(